@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Binance Market Data Benchmark
+
+Measures BinanceAPIService against a local stub HTTP server serving recorded
+1m klines pages and 24hr tickers with a fixed per-request latency:
+- Serial per-symbol market summary loop vs concurrent get_market_summary()
+- Full paginated klines backfill vs resuming from the last stored candle
+  once new candles appear
+- Row-by-row kline dicts and lists vs statistics over stored columns
+
+Usage:
+    python scripts/benchmarks/benchmark_binance_market_data.py --candles 20000 --latency 20
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.base_financial_service import (
+    CacheConfig,
+    HistoricalStorageConfig,
+    RateLimitConfig,
+    ServiceConfig,
+)
+from services.binance_api import (
+    INTERVAL_MILLISECONDS,
+    KLINES_ENDPOINT,
+    BinanceAPIService,
+    BinanceKlineStore,
+    calculate_candle_statistics,
+    klines_to_columns,
+)
+
+MINUTE = INTERVAL_MILLISECONDS["1m"]
+START = 1_700_000_040_000 - 1_700_000_040_000 % MINUTE
+
+
+def record_klines(count: int, seed: int = 42) -> list:
+    """Synthetic recorded 1m klines (random walk closes)"""
+    rng = np.random.default_rng(seed)
+    closes = 40000 + np.cumsum(rng.normal(0, 15, count))
+    volumes = rng.gamma(2.0, 5.0, count)
+    return [
+        [
+            START + i * MINUTE,
+            f"{close - 3:.2f}",
+            f"{close + 8:.2f}",
+            f"{close - 8:.2f}",
+            f"{close:.2f}",
+            f"{volume:.4f}",
+            START + (i + 1) * MINUTE - 1,
+            f"{close * volume:.2f}",
+            120,
+            f"{volume / 2:.4f}",
+            f"{close * volume / 2:.2f}",
+            "0",
+        ]
+        for i, (close, volume) in enumerate(zip(closes, volumes))
+    ]
+
+
+def start_stub(klines: list, symbols: list, latency: float, visible: dict):
+    """Serve recorded klines (the first visible["count"]) and tickers"""
+    open_times = np.array([row[0] for row in klines])
+    tickers = {
+        symbol: {
+            "symbol": symbol,
+            "lastPrice": str(100.0 + i),
+            "priceChange": "1.0",
+            "priceChangePercent": str(1.0 - i % 3),
+            "volume": "1000",
+            "highPrice": str(110.0 + i),
+            "lowPrice": str(90.0 + i),
+        }
+        for i, symbol in enumerate(symbols)
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            time.sleep(latency)
+            if url.path == KLINES_ENDPOINT:
+                lo = np.searchsorted(open_times, int(query["startTime"]))
+                hi = min(
+                    np.searchsorted(open_times, int(query["endTime"]), side="right"),
+                    visible["count"],
+                )
+                payload = klines[lo : min(hi, lo + int(query["limit"]))]
+            elif url.path == "/api/v3/ticker/price":
+                payload = {
+                    "symbol": query["symbol"],
+                    "price": tickers[query["symbol"]]["lastPrice"],
+                }
+            else:
+                payload = tickers[query["symbol"]]
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_service(url: str, store_dir: Path, burst_limit: int) -> BinanceAPIService:
+    """Service with caching and rate limiting out of the way"""
+    config = ServiceConfig(
+        name="binance_benchmark",
+        base_url=url,
+        max_retries=0,
+        cache=CacheConfig(enabled=False, cache_dir=str(store_dir / "cache")),
+        rate_limit=RateLimitConfig(enabled=False, burst_limit=burst_limit),
+        historical_storage=HistoricalStorageConfig(enabled=False),
+    )
+    service = BinanceAPIService(config, BinanceKlineStore(store_dir / "klines"))
+    service.logger.setLevel(logging.WARNING)
+    return service
+
+
+def serial_summary(service: BinanceAPIService, symbols: list) -> list:
+    """One symbol after another, as get_market_summary used to"""
+    summaries = []
+    for symbol in symbols:
+        ticker_data = service.get_24hr_ticker_stats(symbol)
+        price_data = service.get_symbol_price_ticker(symbol)
+        summaries.append(
+            {
+                "symbol": symbol,
+                "current_price": float(price_data.get("price", 0)),
+                "volume_24h": float(ticker_data.get("volume", 0)),
+            }
+        )
+    return summaries
+
+
+def row_statistics(klines: list) -> dict:
+    """Per-row dicts then separate lists, as get_bitcoin_price_history used to"""
+    history = [
+        {
+            "open_time": int(kline[0]),
+            "high_price": float(kline[2]),
+            "low_price": float(kline[3]),
+            "close_price": float(kline[4]),
+            "volume": float(kline[5]),
+        }
+        for kline in klines
+    ]
+    closes = [p["close_price"] for p in history]
+    highs = [p["high_price"] for p in history]
+    lows = [p["low_price"] for p in history]
+    volumes = [p["volume"] for p in history]
+    return {
+        "price_change": closes[-1] - closes[0],
+        "highest_price": max(highs),
+        "lowest_price": min(lows),
+        "average_volume": sum(volumes) / len(volumes),
+    }
+
+
+def _time(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark Binance market data")
+    parser.add_argument("--candles", type=int, default=20000, help="Recorded klines")
+    parser.add_argument("--symbols", type=int, default=10, help="Summary symbols")
+    parser.add_argument(
+        "--latency", type=float, default=20.0, help="Stub latency per request (ms)"
+    )
+    parser.add_argument(
+        "--new-candles", type=int, default=500, help="Candles appearing before resume"
+    )
+    parser.add_argument("--workers", type=int, default=10, help="Concurrent requests")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    args = parser.parse_args()
+
+    klines = record_klines(args.candles)
+    symbols = [f"SYM{i}USDT" for i in range(args.symbols)]
+    # The last page of candles only appears after the first backfill
+    visible = {"count": max(args.candles - args.new_candles, 1)}
+    server = start_stub(klines, symbols, args.latency / 1000, visible)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    end_time = klines[-1][0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(url, Path(tmp), args.workers)
+
+        serial_time = min(
+            _time(serial_summary, service, symbols) for _ in range(args.repeat)
+        )
+        concurrent_time = min(
+            _time(service.get_market_summary, symbols) for _ in range(args.repeat)
+        )
+
+        backfill_time = _time(service.backfill_klines, "BTCUSDT", "1m", START, end_time)
+        visible["count"] = len(klines)
+        start = time.perf_counter()
+        resumed = service.backfill_klines("BTCUSDT", "1m", START, end_time)
+        resume_time = time.perf_counter() - start
+        stored_time = min(
+            _time(service.backfill_klines, "BTCUSDT", "1m", START, end_time)
+            for _ in range(args.repeat)
+        )
+        columns = resumed["columns"]
+
+    row_time = min(_time(row_statistics, klines) for _ in range(args.repeat))
+    convert_time = min(_time(klines_to_columns, klines) for _ in range(args.repeat))
+    column_time = min(
+        _time(calculate_candle_statistics, columns) for _ in range(args.repeat)
+    )
+    server.shutdown()
+    server.server_close()
+
+    print("=" * 60)
+    print("BINANCE MARKET DATA BENCHMARK")
+    print("=" * 60)
+    print(f"Stub latency:               {args.latency:.0f}ms per request")
+    print(f"Summary symbols:            {args.symbols}")
+    print(f"Serial summary loop:        {serial_time * 1000:.1f}ms")
+    print(f"Concurrent summary:         {concurrent_time * 1000:.1f}ms")
+    print(f"Speedup:                    {serial_time / concurrent_time:.1f}x")
+    print(f"Recorded candles:           {len(klines):,}")
+    print(f"Full backfill:              {backfill_time * 1000:.1f}ms")
+    print(f"Resumed backfill:           {resume_time * 1000:.1f}ms")
+    print(f"Pages on resume:            {resumed['pages']}")
+    print(f"Already stored range:       {stored_time * 1000:.2f}ms")
+    print(f"Row-by-row statistics:      {row_time * 1000:.1f}ms")
+    print(f"Kline column conversion:    {convert_time * 1000:.1f}ms")
+    print(f"Statistics over columns:    {column_time * 1000:.2f}ms")
+    print(f"Speedup (stored columns):   {row_time / column_time:.0f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
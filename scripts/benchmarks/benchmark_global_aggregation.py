@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Global Aggregation Benchmark
+
+Measures GlobalMacroAggregator on synthetic regional discovery files:
+- Full rebuild (every regional file parsed, every partial recomputed)
+- Incremental run after one region's file changes
+- Warm incremental run with every partial served from the cache
+
+Usage:
+    python scripts/benchmarks/benchmark_global_aggregation.py --observations 20000
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from global_macro_aggregator import GlobalMacroAggregator
+
+DATE = "20250906"
+PHASES = ["expansion", "peak", "contraction", "trough"]
+
+
+def generate_discovery(region: str, observations: int, seed: int = 42):
+    """Synthetic regional discovery document shaped like the real outputs"""
+    rng = random.Random(f"{region}-{seed}")
+    series = [
+        {"date": f"{1990 + i // 12}-{i % 12 + 1:02d}-01", "value": rng.gauss(2.0, 1.0)}
+        for i in range(observations)
+    ]
+    return {
+        "metadata": {"region": region, "date": DATE},
+        "cli_comprehensive_analysis": {
+            "central_bank_economic_data": {
+                "gdp_data": {"observations": series},
+                "employment_data": {"payrolls": rng.random()},
+                "inflation_data": {"cpi": rng.random()},
+                "monetary_policy_data": {"rate": rng.random()},
+            },
+            "cross_source_validation": {"validation_score": rng.uniform(0.8, 1.0)},
+            "market_intelligence": {"risk_appetite": {"level": "neutral"}},
+        },
+        "economic_indicators": {
+            "composite_scores": {
+                "business_cycle_score": rng.uniform(0, 2),
+                "recession_probability": rng.uniform(0, 0.5),
+            },
+            "history": [rng.random() for _ in range(observations)],
+        },
+        "business_cycle_data": {"current_phase": rng.choice(PHASES)},
+        "cli_data_quality": {"overall_data_quality": rng.uniform(0.8, 1.0)},
+        "discovery_confidence": rng.uniform(0.8, 1.0),
+    }
+
+
+def _time(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark incremental global macro aggregation"
+    )
+    parser.add_argument(
+        "--observations", type=int, default=20000, help="GDP observations per region"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        cache_file = base_dir / "cache" / "regional_partials.json"
+        files = {}
+        for region, pattern in GlobalMacroAggregator.REGIONAL_FILES.items():
+            files[region] = base_dir / pattern.format(date=DATE)
+            files[region].write_text(
+                json.dumps(generate_discovery(region, args.observations))
+            )
+
+        def aggregator():
+            return GlobalMacroAggregator(
+                str(base_dir), cache_file=str(cache_file), date=DATE
+            )
+
+        def full_rebuild():
+            agg = aggregator()
+            agg.load_regional_data()
+            agg.aggregate_global_analysis()
+
+        def incremental():
+            agg = aggregator()
+            agg.load_regional_partials()
+            agg.aggregate_global_analysis()
+
+        def touch_one_region(run):
+            document = json.loads(files["ASIA"].read_text())
+            document["discovery_confidence"] = run / 1000
+            files["ASIA"].write_text(json.dumps(document))
+
+        full = min(_time(full_rebuild) for _ in range(args.repeat))
+        incremental()  # Populate the cache
+
+        changed = []
+        for run in range(args.repeat):
+            touch_one_region(run)
+            changed.append(_time(incremental))
+        one_changed = min(changed)
+        warm = min(_time(incremental) for _ in range(args.repeat))
+
+        source_bytes = sum(path.stat().st_size for path in files.values())
+        cache_bytes = cache_file.stat().st_size
+
+    print("=" * 60)
+    print("GLOBAL AGGREGATION BENCHMARK")
+    print("=" * 60)
+    print(f"Regions:                    {len(files)}")
+    print(f"GDP observations / region:  {args.observations:,}")
+    print(f"Regional files:             {source_bytes / 1e6:.1f}MB")
+    print(f"Partial cache:              {cache_bytes / 1e3:.1f}KB")
+    print(f"Full rebuild:               {full * 1000:.1f}ms")
+    print(
+        f"One region changed:         {one_changed * 1000:.1f}ms "
+        f"({full / one_changed:.2f}x)"
+    )
+    print(f"All regions cached:         {warm * 1000:.1f}ms ({full / warm:.2f}x)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization Benchmark
+
+Measures the shared serializer against the per-script approaches it replaced
+on a synthetic analysis payload (numpy scalars, arrays and nested records):
+- Recursive walker to native types, then json.dump(indent=2)
+- json.dump(indent=2) with a numpy-aware JSONEncoder subclass
+- write_json() indented, compact, and compact + gzip
+- JSONStreamWriter (summary fields, then trade records one at a time)
+
+Usage:
+    python scripts/benchmarks/benchmark_json_serialization.py --records 20000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.json_serialization import ORJSON_AVAILABLE, JSONStreamWriter, write_json
+
+
+def generate_payload(records: int, seed: int = 42):
+    """Synthetic analysis output mixing numpy scalars, arrays and records"""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.001, 0.02, records)
+    return {
+        "metadata": {"records": records, "confidence": np.float64(0.87)},
+        "statistics": {
+            "mean": np.mean(returns),
+            "std": np.std(returns),
+            "positive": np.int64((returns > 0).sum()),
+            "significant": np.bool_(True),
+        },
+        "series": {"returns": returns, "cumulative": np.cumprod(1 + returns)},
+        "trades": [
+            {
+                "id": i,
+                "return_pct": returns[i],
+                "duration_days": np.int64(i % 30),
+                "winner": np.bool_(returns[i] > 0),
+            }
+            for i in range(records)
+        ],
+    }
+
+
+def legacy_convert(obj):
+    """Recursive numpy walker used by the per-script converters"""
+    if isinstance(obj, dict):
+        return {key: legacy_convert(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [legacy_convert(item) for item in obj]
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, np.bool_):
+        return bool(obj)
+    elif isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, np.floating):
+        return float(obj)
+    return obj
+
+
+class LegacyEncoder(json.JSONEncoder):
+    """numpy-aware encoder subclass used by the per-script encoders"""
+
+    def default(self, obj):
+        if isinstance(obj, (np.integer, np.floating)):
+            return obj.item()
+        elif isinstance(obj, np.ndarray):
+            return obj.tolist()
+        elif isinstance(obj, np.bool_):
+            return bool(obj)
+        return super().default(obj)
+
+
+def _time(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization")
+    parser.add_argument("--records", type=int, default=20000, help="Trade records")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    args = parser.parse_args()
+
+    payload = generate_payload(args.records)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+
+        def walker(path):
+            with open(path, "w") as f:
+                json.dump(legacy_convert(payload), f, indent=2)
+
+        def encoder(path):
+            with open(path, "w") as f:
+                json.dump(payload, f, indent=2, cls=LegacyEncoder)
+
+        def stream(path):
+            with JSONStreamWriter(path, container="object") as writer:
+                for key in ("metadata", "statistics", "series"):
+                    writer.write_field(key, payload[key])
+                writer.write_field("trades", [])
+            with JSONStreamWriter(path.with_suffix(".trades.json")) as writer:
+                writer.write_many(payload["trades"])
+
+        cases = [
+            ("Walker + json.dump", walker, "walker.json"),
+            ("JSONEncoder subclass", encoder, "encoder.json"),
+            ("write_json (indented)", lambda p: write_json(payload, p), "a.json"),
+            (
+                "write_json (compact)",
+                lambda p: write_json(payload, p, compact=True),
+                "b.json",
+            ),
+            (
+                "write_json (compact+gz)",
+                lambda p: write_json(payload, p, compact=True),
+                "c.json.gz",
+            ),
+            ("JSONStreamWriter", stream, "stream.json"),
+        ]
+
+        results = []
+        for label, func, name in cases:
+            path = out / name
+            elapsed = min(_time(func, path) for _ in range(args.repeat))
+            size = sum(p.stat().st_size for p in out.glob(path.stem + "*"))
+            results.append((label, elapsed, size))
+
+    baseline = results[0][1]
+    print("=" * 60)
+    print("JSON SERIALIZATION BENCHMARK")
+    print("=" * 60)
+    print(f"Trade records:              {args.records:,}")
+    print(f"orjson available:           {ORJSON_AVAILABLE}")
+    for label, elapsed, size in results:
+        print(
+            f"{label + ':':<28}{elapsed * 1000:8.1f}ms "
+            f"{size / 1e6:6.2f}MB ({baseline / elapsed:.2f}x)"
+        )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
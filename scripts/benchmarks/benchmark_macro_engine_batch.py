@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Macro Engine Batch Benchmark
+
+Measures cross-region execution of the macro analytical engines over the
+discovery payloads in data/outputs/macro_analysis/discovery (repeated to the
+requested number of regions):
+- Legacy per-region loop constructing every engine (and its parameter
+  tables) for each region, as one analyzer per region does
+- MacroEngineBatchRunner in a single thread (shared parameter tables)
+- MacroEngineBatchRunner in a process pool
+
+Usage:
+    python scripts/benchmarks/benchmark_macro_engine_batch.py --regions 40 --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.macro_engine_batch import (
+    ENGINE_REGISTRY,
+    MACRO_ENGINES,
+    MacroEngineBatchRunner,
+    latest_discovery_files,
+)
+from utils.market_regime_framework import MarketRegimeEngine
+
+
+def legacy_loop(payloads, analysis_date):
+    """Construct every engine per region and run it"""
+    for region, path in payloads.items():
+        with open(path, "r") as f:
+            discovery_data = json.load(f)
+        context = {"region": region, "analysis_date": analysis_date}
+        for name in MACRO_ENGINES:
+            engine_class, run = ENGINE_REGISTRY[name]
+            if engine_class is MarketRegimeEngine:
+                engine = MarketRegimeEngine(region, seed=0)
+            elif "region" in engine_class.__init__.__code__.co_varnames:
+                engine = engine_class(region)
+            else:
+                engine = engine_class()
+            try:
+                run(engine, discovery_data, context)
+            except Exception:
+                pass
+
+
+def _time(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark macro engine batch")
+    parser.add_argument("--regions", type=int, default=40, help="Region payloads")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Worker processes"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    args = parser.parse_args()
+
+    files = list(latest_discovery_files().values())
+    if not files:
+        print("No discovery files found")
+        sys.exit(1)
+    payloads = {f"R{i:03d}": files[i % len(files)] for i in range(args.regions)}
+
+    analysis_date = "2025-09-06"
+    threaded = MacroEngineBatchRunner(
+        analysis_date=analysis_date, seed=0, use_processes=False
+    )
+    pooled = MacroEngineBatchRunner(
+        analysis_date=analysis_date, seed=0, max_workers=args.workers
+    )
+
+    legacy_time = min(
+        _time(legacy_loop, payloads, analysis_date) for _ in range(args.repeat)
+    )
+    thread_time = min(_time(threaded.run, payloads) for _ in range(args.repeat))
+    pool_time = min(_time(pooled.run, payloads) for _ in range(args.repeat))
+    batch = pooled.run(payloads)
+
+    print("=" * 60)
+    print("MACRO ENGINE BATCH BENCHMARK")
+    print("=" * 60)
+    print(f"Regions x engines:          {args.regions} x {len(MACRO_ENGINES)}")
+    print(f"Workers:                    {args.workers}")
+    print(f"Legacy per-region loop:     {legacy_time * 1000:.1f}ms")
+    print(f"Batch (single thread):      {thread_time * 1000:.1f}ms")
+    label = f"Batch ({batch['metadata']['executor']}):"
+    print(f"{label:<28}{pool_time * 1000:.1f}ms")
+    print(f"Speedup vs legacy:          {legacy_time / pool_time:.2f}x")
+    print("Engine totals:")
+    for name, seconds in sorted(
+        batch["timings"]["engine_totals"].items(), key=lambda item: -item[1]
+    ):
+        print(f"  {name + ':':<26}{seconds * 1000:.1f}ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
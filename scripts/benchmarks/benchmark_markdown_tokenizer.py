@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Markdown Report Tokenizer Benchmark
+
+Measures report parsing throughput on synthetic performance reports:
+- Previous regex extraction (every field pattern scans the whole report)
+- Single-pass tokenization (cold, every report tokenized)
+- The same field/table/section lookups against one cached tokenization
+- All report parsers end-to-end (full extraction incl. trade rows)
+
+Usage:
+    python scripts/benchmarks/benchmark_markdown_tokenizer.py --reports 50 --trades 400
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.markdown_report_tokenizer import (  # noqa: E402
+    get_report_cache,
+    load_report,
+    tokenize_markdown,
+)
+
+MONTHS = ["January", "February", "March", "April", "May", "June"]
+QUALITIES = ["Excellent", "Good", "Poor"]
+
+
+def generate_report(n_trades: int, seed: int) -> str:
+    """Synthetic historical performance report with n_trades table rows"""
+    rng = random.Random(seed)
+    lines = [
+        "# Historical Trading Performance",
+        "**Portfolio**: live_signals | **Date**: 2025-07-16 | **Type**: Historical",
+        "",
+        "## Summary",
+        f"- **Total Closed Trades**: {n_trades}",
+        f"- **Win Rate**: {rng.uniform(40, 70):.2f}% ({n_trades // 2} wins, "
+        f"{n_trades - n_trades // 2} losses)",
+        f"- **Total Return**: +{rng.uniform(1, 50):.2f}%",
+        f"- **Average Trade Duration**: {rng.uniform(5, 40):.1f} days",
+        f"- **Profit Factor**: {rng.uniform(0.8, 3):.2f}",
+        f"- **Average Winner**: +{rng.uniform(2, 9):.2f}%",
+        f"- **Average Loser**: -{rng.uniform(2, 9):.2f}%",
+        "- **Best Trade**: TSLA +16.58% (41 days)",
+        "- **Worst Trade**: UHS -15.02% (19 days)",
+        "",
+        "## Monthly Performance",
+    ]
+    for month in MONTHS:
+        lines += [
+            "",
+            f"### {month} 2025 - Market Update",
+            f"- **Trades Closed**: {rng.randint(1, 20)}",
+            f"- **Win Rate**: {rng.uniform(30, 80):.1f}%",
+            f"- **Average Return**: {rng.uniform(-3, 5):+.2f}%",
+            "- **Market Context**: " + " ".join(["volatile"] * rng.randint(5, 30)),
+        ]
+    lines += ["", "## Quality Distribution"]
+    for quality in QUALITIES:
+        lines += [
+            "",
+            f"### {quality} Trades ({rng.randint(1, 20)} trades - "
+            f"{rng.uniform(5, 60):.1f}%)",
+            f"- **Win Rate**: {rng.uniform(30, 90):.1f}%",
+            f"- **Average Return**: {rng.uniform(-3, 5):+.2f}%",
+        ]
+    lines += [
+        "",
+        "## Complete Trade History",
+        "",
+        "| Rank | Ticker | Strategy | Entry Date | Exit Date | Return | Duration | Quality |",
+        "|------|--------|----------|------------|-----------|--------|----------|---------|",
+    ]
+    for rank in range(1, n_trades + 1):
+        ticker = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(4))
+        lines.append(
+            f"| {rank} | **{ticker}** | SMA {rng.randint(5, 50)}-{rng.randint(51, 90)} "
+            f"| 2025-0{rng.randint(1, 5)}-1{rng.randint(0, 9)} "
+            f"| 2025-06-2{rng.randint(0, 9)} | **{rng.uniform(-15, 20):+.2f}%** "
+            f"| {rng.randint(1, 90)}d | {rng.choice(QUALITIES)} |"
+        )
+    lines += ["", "## Methodology", ""]
+    lines += ["Narrative paragraph with no structured fields. " * 8] * 40
+    return "\n".join(lines) + "\n"
+
+
+LEGACY_PATTERNS = [
+    r"\*\*Total Closed Trades\*\*:\s*(\d+)",
+    r"\*\*Win Rate\*\*:\s*([\d.]+)%",
+    r"\*\*Total Return\*\*:\s*([+-]?[\d.]+)%",
+    r"\*\*Average Trade Duration\*\*:\s*([\d.]+)\s*days",
+    r"\*\*Profit Factor\*\*:\s*([\d.]+)",
+    r"\*\*Average Winner\*\*:\s*([+-]?[\d.]+)%",
+    r"\*\*Average Loser\*\*:\s*([+-]?[\d.]+)%",
+    r"\*\*Best Trade\*\*:\s*([^(]+\([^)]+\))",
+    r"\*\*Worst Trade\*\*:\s*([^(]+\([^)]+\))",
+    r"Active Positions\*\*:\s*(\d+)",
+    r"Portfolio Performance\*\*:\s*([+\-]?\d+\.?\d*%)",
+    r"Unrealized P&L\*\*:\s*([+\-]?\$[\d,]+\.?\d*)",
+    r"Total Closed Signals\*\*:\s*(\d+)",
+    r"Average Win\*\*:\s*([+\-]?[\d.]+)%",
+    r"Average Loss\*\*:\s*([+\-]?[\d.]+)%",
+    r"Win Rate[:\*\s]+(\d+\.?\d*)%\s*\((\d+)\s*wins?,\s*(\d+)\s*loss",
+    r"Total Return[:\*\s]+([+-]?\d+\.?\d*)%",
+    r"Total Closed Trades[:\*\s]+(\d+)",
+    r"Profit Factor[:\*\s]+(\d+\.?\d*)",
+]
+LEGACY_TRADE_PATTERN = (
+    r"\|\s*\d+\s*\|\s*(?:\*\*)?([A-Z]+)(?:\*\*)?\s*\|.*?\|\s*(\d{4}-\d{2}-\d{2})\s*"
+    r"\|\s*(\d{4}-\d{2}-\d{2})\s*\|\s*(?:\*\*)?([+-]?\d+\.?\d*)%(?:\*\*)?\s*\|\s*(\d+)d\s*\|"
+)
+
+
+def legacy_parse(path: Path) -> int:
+    """Previous approach: each parser re-reads the file and scans it per field"""
+    found = 0
+    for _ in range(3):  # dashboard, live signals and image generator parsers
+        content = path.read_text(encoding="utf-8")
+        for pattern in LEGACY_PATTERNS:
+            found += re.search(pattern, content) is not None
+        found += sum(1 for _ in re.finditer(LEGACY_TRADE_PATTERN, content))
+        for match in re.finditer(
+            r"###\s*(\w+)\s*(\d+)\s*-\s*[^\n]+\n(.*?)(?=###|\Z)", content, re.DOTALL
+        ):
+            section = match.group(3)
+            found += re.search(r"\*\*Trades Closed\*\*:\s*(\d+)", section) is not None
+            found += re.search(r"\*\*Win Rate\*\*:\s*([\d.]+)%?", section) is not None
+    return found
+
+
+TOKENIZED_FIELDS = [
+    ("Total Closed Trades", r"^(\d+)"),
+    ("Win Rate", r"^([\d.]+)%"),
+    ("Total Return", r"^([+-]?[\d.]+)%"),
+    ("Average Trade Duration", r"^([\d.]+)\s*days"),
+    ("Profit Factor", r"^([\d.]+)"),
+    ("Average Winner", r"^([+-]?[\d.]+)%"),
+    ("Average Loser", r"^([+-]?[\d.]+)%"),
+    ("Best Trade", r"^([^(]+\([^)]+\))"),
+    ("Worst Trade", r"^([^(]+\([^)]+\))"),
+    ("Active Positions", r"^(\d+)"),
+    ("Portfolio Performance", r"^([+\-]?\d+\.?\d*%)"),
+    ("Unrealized P&L", r"^([+\-]?\$[\d,]+\.?\d*)"),
+    ("Total Closed Signals", r"^(\d+)"),
+    ("Average Win", r"^([+\-]?[\d.]+)%"),
+    ("Average Loss", r"^([+\-]?[\d.]+)%"),
+    ("Win Rate", r"^(\d+\.?\d*)%\s*\((\d+)\s*wins?,\s*(\d+)\s*loss"),
+    ("Total Return", r"^([+-]?\d+\.?\d*)%"),
+    ("Total Closed Trades", r"^(\d+)"),
+    ("Profit Factor", r"^(\d+\.?\d*)"),
+]
+
+
+def tokenized_parse(path: Path) -> int:
+    """Same lookups as legacy_parse against one cached tokenization"""
+    found = 0
+    for _ in range(3):
+        report = load_report(path)
+        for key, pattern in TOKENIZED_FIELDS:
+            found += report.get(key, pattern) is not None
+        table = report.find_table("Rank", "Ticker", "Entry Date", "Exit Date")
+        found += len(table.rows) if table else 0
+        for section, _ in report.find_sections(r"^(\w+)\s*(\d+)\s*-", level=3):
+            found += section.get("Trades Closed", r"^(\d+)") is not None
+            found += section.get("Win Rate", r"^([\d.]+)") is not None
+    return found
+
+
+def build_parsers():
+    """Report parser callables (imported up front so import time is excluded)"""
+    from generate_trade_history_images import TemplateBasedDashboardGenerator
+    from live_signals_dashboard import LiveSignalsDashboard
+    from scripts.utils.dashboard_parser import DashboardDataParser
+
+    dashboard = DashboardDataParser()
+    live = LiveSignalsDashboard.__new__(LiveSignalsDashboard)
+    generator = TemplateBasedDashboardGenerator.__new__(TemplateBasedDashboardGenerator)
+    generator.date_str = "benchmark"
+    return [
+        dashboard.parse_report,
+        live.parse_live_signals_report,
+        generator._parse_report,
+    ]
+
+
+def _time(func, files) -> float:
+    start = time.perf_counter()
+    for path in files:
+        func(path)
+    return time.perf_counter() - start
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark markdown report tokenizer")
+    parser.add_argument("--reports", type=int, default=50, help="Synthetic reports")
+    parser.add_argument("--trades", type=int, default=400, help="Trades per report")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    parse_funcs = build_parsers()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for i in range(args.reports):
+            path = Path(tmp) / f"report_{i:03d}.md"
+            path.write_text(generate_report(args.trades, seed=i), encoding="utf-8")
+            files.append(path)
+        total_mb = sum(p.stat().st_size for p in files) / 1e6
+
+        legacy = _time(legacy_parse, files)
+        cold = _time(lambda p: tokenize_markdown(p.read_text(encoding="utf-8")), files)
+
+        cache = get_report_cache()
+        cache.clear()
+        tokenized = _time(tokenized_parse, files)
+        cached = _time(load_report, files)
+
+        cache.clear()
+        parsers = _time(lambda p: [parse(p) for parse in parse_funcs], files)
+        stats = cache.get_stats()
+
+    print("=" * 60)
+    print("MARKDOWN REPORT TOKENIZER BENCHMARK")
+    print("=" * 60)
+    print(f"Reports:                    {args.reports} ({total_mb:.1f} MB)")
+    print(f"Trades per report:          {args.trades}")
+    print(
+        f"Legacy regex scans:         {legacy * 1000:.1f}ms ({total_mb / legacy:.1f} MB/s)"
+    )
+    print(
+        f"Tokenize (cold):            {cold * 1000:.1f}ms ({total_mb / cold:.1f} MB/s)"
+    )
+    print(f"Tokenize (cached):          {cached * 1000:.1f}ms")
+    print(f"Same lookups on shared AST: {tokenized * 1000:.1f}ms")
+    print(f"Lookup speedup:             {legacy / tokenized:.1f}x")
+    print(f"Three parsers, shared AST:  {parsers * 1000:.1f}ms (full extraction)")
+    print(f"Cache hits/misses:          {stats['hits']}/{stats['misses']}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
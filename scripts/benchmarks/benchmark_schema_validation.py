@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Schema Validation Benchmark
+
+Measures per-document validation latency for DASV output files:
+- jsonschema.validate() (schema checked and validator rebuilt per call)
+- Compiled validators from the shared SchemaRegistry
+- Bulk directory validation, serial threads vs worker processes
+
+Usage:
+    python scripts/benchmarks/benchmark_schema_validation.py --directory data/outputs
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import jsonschema
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.schema_registry import SchemaRegistry
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def _load_documents(registry: SchemaRegistry, directory: Path, limit: int):
+    """Load (schema_name, document) pairs for files with an inferable schema"""
+    documents = []
+    for path in sorted(directory.glob("**/*.json")):
+        schema_name = registry.infer_schema_name(path)
+        if schema_name is None:
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                documents.append((schema_name, json.load(f)))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if len(documents) >= limit:
+            break
+    return documents
+
+
+def _latencies(func, documents):
+    """Per-document latency in milliseconds"""
+    samples = []
+    for schema_name, document in documents:
+        start = time.perf_counter()
+        func(schema_name, document)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _describe(samples):
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"mean {statistics.mean(samples):7.3f}ms  p50 {statistics.median(samples):7.3f}ms  p95 {p95:7.3f}ms"
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark JSON schema validation")
+    parser.add_argument(
+        "--directory",
+        default=str(PROJECT_ROOT / "data" / "outputs"),
+        help="Directory of DASV outputs",
+    )
+    parser.add_argument("--limit", type=int, default=200, help="Documents to time")
+    parser.add_argument("--workers", type=int, default=None, help="Bulk workers")
+    args = parser.parse_args()
+
+    directory = Path(args.directory)
+    registry = SchemaRegistry()
+    documents = _load_documents(registry, directory, args.limit)
+    if not documents:
+        print(f"No documents with a known schema under {directory}")
+        return
+
+    def uncompiled(schema_name, document):
+        try:
+            jsonschema.validate(document, registry.get_schema(schema_name))
+        except jsonschema.ValidationError:
+            pass
+
+    def compiled(schema_name, document):
+        registry.validate(document, schema_name)
+
+    for schema_name in {name for name, _ in documents}:
+        registry.get_validator(schema_name)
+
+    # Note: jsonschema.validate cannot resolve cross-file $refs; those
+    # documents raise and are excluded from the uncompiled timings
+    resolvable = []
+    for schema_name, document in documents:
+        try:
+            uncompiled(schema_name, document)
+            resolvable.append((schema_name, document))
+        except Exception:
+            continue
+
+    uncompiled_ms = _latencies(uncompiled, resolvable)
+    compiled_ms = _latencies(compiled, resolvable)
+
+    start = time.perf_counter()
+    serial = registry.validate_directory(directory, max_workers=1, use_processes=False)
+    serial_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = registry.validate_directory(directory, max_workers=args.workers)
+    parallel_seconds = time.perf_counter() - start
+
+    print("=" * 72)
+    print("SCHEMA VALIDATION BENCHMARK")
+    print("=" * 72)
+    print(f"Documents timed:        {len(resolvable)} ({len(documents)} loaded)")
+    print(f"jsonschema.validate:    {_describe(uncompiled_ms)}")
+    print(f"Compiled registry:      {_describe(compiled_ms)}")
+    print(
+        f"Per-document speedup:   "
+        f"{statistics.mean(uncompiled_ms) / statistics.mean(compiled_ms):.1f}x"
+    )
+    print("-" * 72)
+    print(f"Bulk files:             {parallel['total_files']}")
+    print(f"Bulk serial:            {serial_seconds:.2f}s")
+    print(f"Bulk parallel:          {parallel_seconds:.2f}s")
+    print(
+        f"Bulk results:           {parallel['valid']} valid, "
+        f"{parallel['invalid']} invalid, {parallel['skipped']} skipped"
+    )
+    assert serial["valid"] == parallel["valid"]
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
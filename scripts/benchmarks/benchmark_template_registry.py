@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Template Registry Benchmark
+
+Measures template load/render cost for the Jinja2 renderers:
+- Per-instance environments (previous behaviour, recompiles every template)
+- Shared registry with a cold on-disk bytecode cache
+- Shared registry with a warm bytecode cache (new process equivalent)
+- Warm in-process renders through the shared environment
+
+Usage:
+    python scripts/benchmarks/benchmark_template_registry.py --renders 200
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.template_registry import COMMON_FILTERS, TemplateRegistry
+
+SCRIPTS_DIR = Path(__file__).parent.parent
+TEMPLATE_DIRS = [SCRIPTS_DIR / "templates", SCRIPTS_DIR / "standardized_templates"]
+EXTENSIONS = ["j2"]
+
+
+def _template_names(env: Environment):
+    return env.list_templates(extensions=EXTENSIONS)
+
+
+def _load_all(env: Environment) -> int:
+    """Compile every template, returning how many loaded"""
+    loaded = 0
+    for name in _template_names(env):
+        try:
+            env.get_template(name)
+            loaded += 1
+        except Exception:
+            pass
+    return loaded
+
+
+def time_per_instance(search_path) -> float:
+    """Previous behaviour: a fresh Environment compiles everything"""
+    env = Environment(
+        loader=FileSystemLoader([str(p) for p in search_path]), autoescape=True
+    )
+    env.filters.update(COMMON_FILTERS)
+    start = time.perf_counter()
+    _load_all(env)
+    return time.perf_counter() - start
+
+
+def time_registry_load(cache_dir: Path, search_path) -> float:
+    """New registry (fresh process equivalent) loading every template"""
+    registry = TemplateRegistry(bytecode_cache_dir=cache_dir)
+    env = registry.get_environment(search_path, autoescape=True)
+    start = time.perf_counter()
+    _load_all(env)
+    return time.perf_counter() - start
+
+
+def time_warm_renders(cache_dir: Path, search_path, renders: int) -> float:
+    """Average seconds per get_template + render on a warm shared environment"""
+    registry = TemplateRegistry(bytecode_cache_dir=cache_dir)
+    env = registry.get_environment(search_path, autoescape=True)
+    names = _template_names(env)
+    _load_all(env)
+
+    renderable = []
+    for name in names:
+        try:
+            env.get_template(name).render()
+            renderable.append(name)
+        except Exception:
+            continue
+    if not renderable:
+        return 0.0
+
+    start = time.perf_counter()
+    for i in range(renders):
+        env.get_template(renderable[i % len(renderable)]).render()
+    return (time.perf_counter() - start) / renders
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark Jinja2 template registry")
+    parser.add_argument("--renders", type=int, default=200, help="Warm renders")
+    args = parser.parse_args()
+
+    search_path = [p for p in TEMPLATE_DIRS if p.exists()]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp)
+        per_instance = time_per_instance(search_path)
+        cold = time_registry_load(cache_dir, search_path)
+        warm = time_registry_load(cache_dir, search_path)
+        render = time_warm_renders(cache_dir, search_path, args.renders)
+        cached_files = len(list(cache_dir.glob("*.jinja.cache")))
+
+    print("=" * 60)
+    print("TEMPLATE REGISTRY BENCHMARK")
+    print("=" * 60)
+    print(f"Template dirs:              {', '.join(p.name for p in search_path)}")
+    print(f"Bytecode files written:     {cached_files}")
+    print(f"Per-instance env (compile): {per_instance * 1000:.1f}ms")
+    print(f"Registry cold start:        {cold * 1000:.1f}ms")
+    print(f"Registry warm start:        {warm * 1000:.1f}ms")
+    print(f"Cold/warm speedup:          {cold / warm if warm else float('inf'):.1f}x")
+    print(f"Warm render (avg):          {render * 1e6:.1f}us")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
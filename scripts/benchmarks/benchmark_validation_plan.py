@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Validation Plan Benchmark
+
+Measures UnifiedValidationFramework throughput on synthetic Twitter posts:
+- Per-rule dispatch (nested criteria walked per document, every rule
+  recomputing lower-cased text, lines and emoji counts on its own)
+- Compiled plan, one validate_content() call per document
+- Compiled plan across the whole batch with validate_many()
+
+Usage:
+    python scripts/benchmarks/benchmark_validation_plan.py --documents 1000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from unified_validation_framework import UnifiedValidationFramework
+
+CONTENT_TYPES = ["fundamental", "strategy", "sector", "trade_history"]
+FRAGMENTS = [
+    "Fair value $185 vs current $142 on DCF and comps.",
+    "Win rate 62% across 48 signals with a 1.9 profit factor.",
+    "Sector rotation favours XLK over XLU with ETF flows accelerating.",
+    "Portfolio closed 12 trades with a +9.4% total return.",
+    "Risk: volatile earnings season and uncertain rate path.",
+    "• Catalyst: margin expansion into the next product cycle",
+    "Past performance does not guarantee future results.",
+]
+
+
+def generate_documents(count: int, seed: int = 42):
+    """Synthetic posts shaped like the rendered Twitter templates"""
+    rng = random.Random(seed)
+    documents = []
+    for i in range(count):
+        ticker = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(4))
+        body = "\n".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(3, 12)))
+        documents.append(
+            {
+                "content": (
+                    f"🚨 ${ticker} analysis: what the market is missing this quarter\n\n"
+                    f"{body}\n\n"
+                    f"📋 Full analysis: https://www.colemorton.com/blog/{ticker.lower()}/\n\n"
+                    f"#{ticker} #Investing\n\n⚠️ Not financial advice."
+                ),
+                "content_type": CONTENT_TYPES[i % len(CONTENT_TYPES)],
+                "source_data": {"ticker": ticker, "source_available": True},
+            }
+        )
+    return documents
+
+
+def per_rule_dispatch(framework: UnifiedValidationFramework, documents):
+    """Walk the nested criteria per document without a shared rule context"""
+    results = []
+    for document in documents:
+        content = document["content"]
+        content_type = document["content_type"]
+        source_data = document["source_data"]
+        all_results: Dict[str, Any] = {}
+        for category, criteria in framework.common_criteria.items():
+            all_results[category] = {}
+            for criterion, validator in criteria.items():
+                all_results[category][criterion] = validator(
+                    content, content_type, source_data
+                )
+        all_results.update(
+            framework._validate_content_specific(content, content_type, source_data)
+        )
+        all_results.update(
+            framework._validate_realtime_context(content, content_type, None)
+        )
+        assessment = framework._calculate_overall_assessment(all_results)
+        results.append(
+            (
+                all_results,
+                assessment,
+                framework._generate_findings_matrix(all_results, content, source_data),
+                framework._generate_recommendations(all_results, assessment),
+            )
+        )
+    return results
+
+
+def _time(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark compiled validation plans")
+    parser.add_argument("--documents", type=int, default=1000, help="Documents")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    args = parser.parse_args()
+
+    documents = generate_documents(args.documents)
+    framework = UnifiedValidationFramework()
+
+    def single(docs):
+        return [
+            framework.validate_content(
+                document["content"], document["content_type"], document["source_data"]
+            )
+            for document in docs
+        ]
+
+    dispatch = min(
+        _time(per_rule_dispatch, framework, documents) for _ in range(args.repeat)
+    )
+    compiled = min(_time(single, documents) for _ in range(args.repeat))
+    batch = min(_time(framework.validate_many, documents) for _ in range(args.repeat))
+
+    n = len(documents)
+    print("=" * 60)
+    print("VALIDATION PLAN BENCHMARK")
+    print("=" * 60)
+    print(f"Documents:                  {n}")
+    print(f"Compiled plans:             {len(framework._plans)}")
+    print(
+        f"Per-rule dispatch:          {dispatch * 1000:.1f}ms ({n / dispatch:,.0f} docs/s)"
+    )
+    print(
+        f"Compiled plan (per call):   {compiled * 1000:.1f}ms ({n / compiled:,.0f} docs/s)"
+    )
+    print(f"Compiled plan (batch):      {batch * 1000:.1f}ms ({n / batch:,.0f} docs/s)")
+    print(f"Speedup vs dispatch:        {dispatch / min(compiled, batch):.2f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,12 +19,13 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import typer
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from jinja2 import Template, TemplateNotFound
 
 # Add utils to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.cli_base import BaseFinancialCLI, OutputFormat, ServiceError, ValidationError
+from utils.template_registry import get_template_environment
 
 
 class ContentAutomationCLI(BaseFinancialCLI):
@@ -36,9 +37,7 @@ class ContentAutomationCLI(BaseFinancialCLI):
             description="Content generation and optimization service CLI",
         )
         self.templates_dir = Path(__file__).parent / "templates"
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)), autoescape=True
-        )
+        self.jinja_env = get_template_environment(self.templates_dir, autoescape=True)
         self._add_service_commands()
 
     def _add_service_commands(self) -> None:
@@ -8,22 +8,212 @@ Provides institutional-quality scoring and validation following institutional st
 Usage:
     python content_evaluation_script.py --filename <path> --evaluation_depth <level>
     --real_time_validation <bool> --validation_focus <focus_areas>
+
+Bulk mode (parallel, skips documents unchanged since the last run):
+    python content_evaluation_script.py --directory data/outputs/fundamental_analysis
+    --workers 8 --scorecard_file <path>
 """
 
 import argparse
+import hashlib
+import inspect
 import json
 import logging
+import os
 import re
+import statistics
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple, Union
 
 # Import the unified validation framework
 sys.path.append(str(Path(__file__).parent))
 from unified_validation_framework import UnifiedValidationFramework
 
 
+def _keywords(*words: str) -> Tuple[str, ...]:
+    """Keywords matched case-insensitively against lower-cased content"""
+    return tuple(word.lower() for word in words)
+
+
+def _patterns(*patterns: str, flags: int = 0) -> Tuple[Pattern, ...]:
+    """Compile a rule's regex patterns once at import"""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+
+# Evaluation rule set (compiled once per process)
+REQUIRED_FINANCIAL_METRICS = (
+    "P/E Ratio",
+    "P/B Ratio",
+    "EV/EBITDA",
+    "Dividend Yield",
+    "Current Ratio",
+    "D/E",
+    "ROE",
+    "ROIC",
+    "FCF",
+    "Gross Margin",
+)
+DATA_SOURCES = ("Yahoo Finance", "Alpha Vantage", "FMP", "FRED", "SEC EDGAR")
+CONFIDENCE_RE = re.compile(r"Confidence:\s*(\d+\.?\d*)", re.IGNORECASE)
+FRESHNESS_PATTERNS = _patterns(r"2025-07-30", r"Generated:", r"Latest Data Point:")
+MARKET_CONTEXT_KEYWORDS = _keywords(
+    "current", "recent", "latest", "today", "this month"
+)
+
+ANALYSIS_SECTIONS = [
+    "Investment Thesis",
+    "Valuation Analysis",
+    "Risk Assessment",
+    "Competitive Position",
+    "Economic Context",
+    "Stress Testing",
+]
+ANALYSIS_SECTION_KEYWORDS = tuple(
+    (section, tuple(section.split())) for section in ANALYSIS_SECTIONS
+)
+QUANTITATIVE_PATTERNS = _patterns(
+    r"\d+\.\d+%",
+    r"\$\d+",
+    r"\d+x",
+    r"Probability:\s*\d+\.\d+",
+    r"Impact:\s*\$\d+",
+    r"Correlation:\s*[+-]?\d+\.\d+",
+)
+SCENARIO_KEYWORDS = _keywords("scenario", "bear", "bull", "base case", "stress test")
+CATALYST_KEYWORDS = _keywords("catalyst", "driver", "opportunity", "risk factor")
+
+METHODOLOGY_KEYWORDS = _keywords(
+    "methodology", "framework", "approach", "calculation", "assumption"
+)
+VALIDATION_KEYWORDS = _keywords(
+    "validation", "cross-validation", "verification", "quality assurance"
+)
+ASSUMPTION_PATTERNS = _patterns(
+    r"assumption", r"estimate", r"projected", r"expected", flags=re.IGNORECASE
+)
+VALUATION_METHODS = ("DCF", "Comps", "Sum-of-Parts", "Multiple", "Relative")
+
+TABLE_INDICATORS = ("|", "Metric", "Score", "Value", "Ratio")
+HISTORICAL_KEYWORDS = _keywords("historical", "trend", "3Y", "5Y", "average", "past")
+PEER_KEYWORDS = _keywords("vs Peers", "sector", "industry", "comparison", "relative")
+
+ECONOMIC_INDICATORS = (
+    "GDP",
+    "Fed Funds",
+    "Inflation",
+    "CPI",
+    "Employment",
+    "Yield Curve",
+    "DXY",
+    "Consumer Confidence",
+    "Interest Rate",
+)
+CORRELATION_PATTERNS = _patterns(
+    r"correlation", r"coefficient", r"elasticity", r"sensitivity", flags=re.IGNORECASE
+)
+CYCLE_KEYWORDS = _keywords("cycle", "phase", "expansion", "contraction", "recovery")
+
+RISK_KEYWORDS = _keywords("risk", "threat", "vulnerability", "downside", "challenge")
+RISK_QUANTIFICATION_PATTERNS = _patterns(
+    r"Probability:\s*\d+\.\d+",
+    r"Impact:\s*\d+",
+    r"Risk Score:\s*\d+\.\d+",
+    r"\d+%.*probability",
+    r"Risk Grade",
+    flags=re.IGNORECASE,
+)
+MITIGATION_KEYWORDS = _keywords(
+    "mitigation", "hedge", "protection", "manage", "monitoring"
+)
+
+FRONTMATTER_FIELDS = ("title", "description", "author", "date", "tags")
+STRUCTURE_SECTION_KEYWORDS = tuple(
+    (section, tuple(section.split()))
+    for section in [
+        "Investment Thesis",
+        "Business Intelligence",
+        "Valuation Analysis",
+        "Risk Assessment",
+        "Recommendation Summary",
+    ]
+)
+DISCLAIMER_PATTERNS = _keywords(
+    "not financial advice", "do your own research", "risk warning"
+)
+
+SPELLING_RE = re.compile(r"\b(teh|thier|recieve|seperate)\b", re.IGNORECASE)
+SENTENCE_RE = re.compile(r"[.!?]+")
+
+QUALITY_THRESHOLDS = {
+    "institutional_minimum": 9.0,
+    "publication_minimum": 8.5,
+    "accuracy_minimum": 9.5,
+    "compliance_minimum": 9.5,
+}
+EVALUATION_WEIGHTS = {
+    "financial_data_accuracy": 0.25,
+    "market_analysis_quality": 0.20,
+    "methodology_rigor": 0.15,
+    "data_completeness": 0.15,
+    "economic_context": 0.10,
+    "risk_assessment": 0.10,
+    "structural_compliance": 0.05,
+}
+
+
+_RULE_NAMES = tuple(
+    name for name in list(globals()) if name.isupper() and not name.startswith("_")
+)
+
+
+# Functions and classes whose logic applies the rules; their source is part of
+# the rule set version so logic changes also invalidate stored evaluations
+_RULE_LOGIC_NAMES = (
+    "_count_keywords",
+    "_count_matches",
+    "ContentEvaluationEngine",
+    "summarize_evaluation",
+)
+
+
+def _rule_set_version() -> str:
+    """Short hash of every rule definition and the logic applying them"""
+    rules = {name: globals()[name] for name in _RULE_NAMES}
+    logic = {name: inspect.getsource(globals()[name]) for name in _RULE_LOGIC_NAMES}
+
+    def definition(value):
+        if isinstance(value, re.Pattern):
+            return [value.pattern, value.flags]
+        if isinstance(value, (list, tuple)):
+            return [definition(item) for item in value]
+        return value
+
+    payload = json.dumps(
+        {
+            "rules": {name: definition(value) for name, value in rules.items()},
+            "logic": logic,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def _count_keywords(keywords: Tuple[str, ...], content_lower: str) -> int:
+    """Number of keywords present in lower-cased content"""
+    return sum(1 for keyword in keywords if keyword in content_lower)
+
+
+def _count_matches(patterns: Tuple[Pattern, ...], content: str) -> int:
+    """Total non-overlapping matches of all patterns"""
+    return sum(len(pattern.findall(content)) for pattern in patterns)
+
+
 class ContentEvaluationEngine:
     """
     Advanced content evaluation engine for fundamental analysis reports
@@ -36,23 +226,10 @@ class ContentEvaluationEngine:
         self.validation_framework = UnifiedValidationFramework()
 
         # Institutional quality thresholds
-        self.quality_thresholds = {
-            "institutional_minimum": 9.0,
-            "publication_minimum": 8.5,
-            "accuracy_minimum": 9.5,
-            "compliance_minimum": 9.5,
-        }
+        self.quality_thresholds = dict(QUALITY_THRESHOLDS)
 
         # Evaluation criteria weights
-        self.evaluation_weights = {
-            "financial_data_accuracy": 0.25,
-            "market_analysis_quality": 0.20,
-            "methodology_rigor": 0.15,
-            "data_completeness": 0.15,
-            "economic_context": 0.10,
-            "risk_assessment": 0.10,
-            "structural_compliance": 0.05,
-        }
+        self.evaluation_weights = dict(EVALUATION_WEIGHTS)
 
     def evaluate_content(
         self,
@@ -172,6 +349,7 @@ class ContentEvaluationEngine:
             "main_content": main_content,
             "file_path": filename,
             "file_size": len(content),
+            "content_lower": main_content.lower(),
             "word_count": len(main_content.split()),
             "line_count": len(main_content.split("\n")),
         }
@@ -273,36 +451,24 @@ class ContentEvaluationEngine:
         """Evaluate financial data accuracy"""
 
         content = content_data["main_content"]
+        content_lower = content_data["content_lower"]
         issues = []
         score = 10.0
         evidence = []
 
         # Check for required financial metrics
-        required_metrics = [
-            "P/E Ratio",
-            "P/B Ratio",
-            "EV/EBITDA",
-            "Dividend Yield",
-            "Current Ratio",
-            "D/E",
-            "ROE",
-            "ROIC",
-            "FCF",
-            "Gross Margin",
+        missing_metrics = [
+            metric
+            for metric in REQUIRED_FINANCIAL_METRICS
+            if metric.lower() not in content_lower
         ]
 
-        missing_metrics = []
-        for metric in required_metrics:
-            if metric.lower() not in content.lower():
-                missing_metrics.append(metric)
-
         if missing_metrics:
             issues.append(f"Missing financial metrics: {', '.join(missing_metrics)}")
             score -= len(missing_metrics) * 0.3
 
         # Check for data source attribution
-        data_sources = ["Yahoo Finance", "Alpha Vantage", "FMP", "FRED", "SEC EDGAR"]
-        sources_found = [source for source in data_sources if source in content]
+        sources_found = [source for source in DATA_SOURCES if source in content]
 
         if len(sources_found) < 3:
             issues.append("Insufficient data source attribution")
@@ -311,8 +477,7 @@ class ContentEvaluationEngine:
             evidence.append(f"Multiple data sources found: {', '.join(sources_found)}")
 
         # Check for confidence scores
-        confidence_pattern = r"Confidence:\s*(\d+\.?\d*)"
-        confidence_matches = re.findall(confidence_pattern, content, re.IGNORECASE)
+        confidence_matches = CONFIDENCE_RE.findall(content)
 
         if confidence_matches:
             evidence.append(
@@ -323,9 +488,8 @@ class ContentEvaluationEngine:
             score -= 0.5
 
         # Check for data freshness indicators
-        date_patterns = [r"2025-07-30", r"Generated:", r"Latest Data Point:"]
         fresh_data_indicators = sum(
-            1 for pattern in date_patterns if re.search(pattern, content)
+            1 for pattern in FRESHNESS_PATTERNS if pattern.search(content)
         )
 
         if fresh_data_indicators >= 2:
@@ -337,17 +501,8 @@ class ContentEvaluationEngine:
         # Real-time validation checks
         if real_time_validation:
             # Check for real-time market context
-            market_context_keywords = [
-                "current",
-                "recent",
-                "latest",
-                "today",
-                "this month",
-            ]
-            market_context_count = sum(
-                1
-                for keyword in market_context_keywords
-                if keyword.lower() in content.lower()
+            market_context_count = _count_keywords(
+                MARKET_CONTEXT_KEYWORDS, content_lower
             )
 
             if market_context_count >= 5:
@@ -371,25 +526,19 @@ class ContentEvaluationEngine:
         """Evaluate market analysis quality"""
 
         content = content_data["main_content"]
+        content_lower = content_data["content_lower"]
         issues = []
         score = 10.0
         evidence = []
 
         # Check for comprehensive analysis sections
-        required_sections = [
-            "Investment Thesis",
-            "Valuation Analysis",
-            "Risk Assessment",
-            "Competitive Position",
-            "Economic Context",
-            "Stress Testing",
+        required_sections = ANALYSIS_SECTIONS
+        sections_found = [
+            section
+            for section, keywords in ANALYSIS_SECTION_KEYWORDS
+            if any(keyword in content for keyword in keywords)
         ]
 
-        sections_found = []
-        for section in required_sections:
-            if any(keyword in content for keyword in section.split()):
-                sections_found.append(section)
-
         if len(sections_found) >= 5:
             evidence.append(
                 f"Comprehensive analysis structure: {len(sections_found)}/{len(required_sections)} sections"
@@ -401,18 +550,7 @@ class ContentEvaluationEngine:
             score -= (len(required_sections) - len(sections_found)) * 0.5
 
         # Check for quantitative analysis
-        quantitative_indicators = [
-            r"\d+\.\d+%",
-            r"\$\d+",
-            r"\d+x",
-            r"Probability:\s*\d+\.\d+",
-            r"Impact:\s*\$\d+",
-            r"Correlation:\s*[+-]?\d+\.\d+",
-        ]
-
-        quant_matches = 0
-        for pattern in quantitative_indicators:
-            quant_matches += len(re.findall(pattern, content))
+        quant_matches = _count_matches(QUANTITATIVE_PATTERNS, content)
 
         if quant_matches >= 20:
             evidence.append(
@@ -423,10 +561,7 @@ class ContentEvaluationEngine:
             score -= 1.0
 
         # Check for scenario analysis
-        scenario_keywords = ["scenario", "bear", "bull", "base case", "stress test"]
-        scenario_mentions = sum(
-            1 for keyword in scenario_keywords if keyword.lower() in content.lower()
-        )
+        scenario_mentions = _count_keywords(SCENARIO_KEYWORDS, content_lower)
 
         if scenario_mentions >= 3:
             evidence.append("Scenario analysis present")
@@ -435,10 +570,7 @@ class ContentEvaluationEngine:
             score -= 0.5
 
         # Check for catalyst identification
-        catalyst_keywords = ["catalyst", "driver", "opportunity", "risk factor"]
-        catalyst_mentions = sum(
-            1 for keyword in catalyst_keywords if keyword.lower() in content.lower()
-        )
+        catalyst_mentions = _count_keywords(CATALYST_KEYWORDS, content_lower)
 
         if catalyst_mentions >= 5:
             evidence.append("Comprehensive catalyst analysis")
@@ -461,22 +593,13 @@ class ContentEvaluationEngine:
         """Evaluate methodology rigor"""
 
         content = content_data["main_content"]
+        content_lower = content_data["content_lower"]
         issues = []
         score = 10.0
         evidence = []
 
         # Check for methodology disclosure
-        methodology_keywords = [
-            "methodology",
-            "framework",
-            "approach",
-            "calculation",
-            "assumption",
-        ]
-
-        methodology_mentions = sum(
-            1 for keyword in methodology_keywords if keyword.lower() in content.lower()
-        )
+        methodology_mentions = _count_keywords(METHODOLOGY_KEYWORDS, content_lower)
 
         if methodology_mentions >= 5:
             evidence.append("Clear methodology disclosure")
@@ -485,16 +608,7 @@ class ContentEvaluationEngine:
             score -= 1.0
 
         # Check for validation processes
-        validation_keywords = [
-            "validation",
-            "cross-validation",
-            "verification",
-            "quality assurance",
-        ]
-
-        validation_mentions = sum(
-            1 for keyword in validation_keywords if keyword.lower() in content.lower()
-        )
+        validation_mentions = _count_keywords(VALIDATION_KEYWORDS, content_lower)
 
         if validation_mentions >= 3:
             evidence.append("Validation processes documented")
@@ -503,12 +617,7 @@ class ContentEvaluationEngine:
             score -= 0.5
 
         # Check for assumption transparency
-        assumption_patterns = [r"assumption", r"estimate", r"projected", r"expected"]
-
-        assumption_count = sum(
-            len(re.findall(pattern, content, re.IGNORECASE))
-            for pattern in assumption_patterns
-        )
+        assumption_count = _count_matches(ASSUMPTION_PATTERNS, content)
 
         if assumption_count >= 10:
             evidence.append("Transparent assumption documentation")
@@ -517,8 +626,7 @@ class ContentEvaluationEngine:
             score -= 0.3
 
         # Check for multi-method validation
-        valuation_methods = ["DCF", "Comps", "Sum-of-Parts", "Multiple", "Relative"]
-        methods_found = [method for method in valuation_methods if method in content]
+        methods_found = [method for method in VALUATION_METHODS if method in content]
 
         if len(methods_found) >= 2:
             evidence.append(f"Multi-method approach: {', '.join(methods_found)}")
@@ -541,6 +649,7 @@ class ContentEvaluationEngine:
         """Evaluate data completeness"""
 
         content = content_data["main_content"]
+        content_lower = content_data["content_lower"]
         issues = []
         score = 10.0
         evidence = []
@@ -556,9 +665,8 @@ class ContentEvaluationEngine:
             score -= 1.0
 
         # Check for data tables
-        table_indicators = ["|", "Metric", "Score", "Value", "Ratio"]
         table_count = sum(
-            1 for indicator in table_indicators if content.count(indicator) >= 5
+            1 for indicator in TABLE_INDICATORS if content.count(indicator) >= 5
         )
 
         if table_count >= 3:
@@ -568,10 +676,7 @@ class ContentEvaluationEngine:
             score -= 0.5
 
         # Check for historical context
-        historical_keywords = ["historical", "trend", "3Y", "5Y", "average", "past"]
-        historical_mentions = sum(
-            1 for keyword in historical_keywords if keyword.lower() in content.lower()
-        )
+        historical_mentions = _count_keywords(HISTORICAL_KEYWORDS, content_lower)
 
         if historical_mentions >= 8:
             evidence.append("Strong historical context")
@@ -580,10 +685,7 @@ class ContentEvaluationEngine:
             score -= 0.3
 
         # Check for peer comparison
-        peer_keywords = ["vs Peers", "sector", "industry", "comparison", "relative"]
-        peer_mentions = sum(
-            1 for keyword in peer_keywords if keyword.lower() in content.lower()
-        )
+        peer_mentions = _count_keywords(PEER_KEYWORDS, content_lower)
 
         if peer_mentions >= 5:
             evidence.append("Comprehensive peer analysis")
@@ -606,27 +708,16 @@ class ContentEvaluationEngine:
         """Evaluate economic context integration"""
 
         content = content_data["main_content"]
+        content_lower = content_data["content_lower"]
         issues = []
         score = 10.0
         evidence = []
 
         # Check for economic indicators
-        economic_indicators = [
-            "GDP",
-            "Fed Funds",
-            "Inflation",
-            "CPI",
-            "Employment",
-            "Yield Curve",
-            "DXY",
-            "Consumer Confidence",
-            "Interest Rate",
-        ]
-
         indicators_found = [
             indicator
-            for indicator in economic_indicators
-            if indicator.lower() in content.lower()
+            for indicator in ECONOMIC_INDICATORS
+            if indicator.lower() in content_lower
         ]
 
         if len(indicators_found) >= 6:
@@ -638,17 +729,7 @@ class ContentEvaluationEngine:
             score -= 1.0
 
         # Check for correlation analysis
-        correlation_patterns = [
-            r"correlation",
-            r"coefficient",
-            r"elasticity",
-            r"sensitivity",
-        ]
-
-        correlation_mentions = sum(
-            len(re.findall(pattern, content, re.IGNORECASE))
-            for pattern in correlation_patterns
-        )
+        correlation_mentions = _count_matches(CORRELATION_PATTERNS, content)
 
         if correlation_mentions >= 5:
             evidence.append("Strong correlation analysis")
@@ -657,10 +738,7 @@ class ContentEvaluationEngine:
             score -= 0.5
 
         # Check for cycle positioning
-        cycle_keywords = ["cycle", "phase", "expansion", "contraction", "recovery"]
-        cycle_mentions = sum(
-            1 for keyword in cycle_keywords if keyword.lower() in content.lower()
-        )
+        cycle_mentions = _count_keywords(CYCLE_KEYWORDS, content_lower)
 
         if cycle_mentions >= 5:
             evidence.append("Clear business cycle positioning")
@@ -680,16 +758,13 @@ class ContentEvaluationEngine:
         """Evaluate risk assessment quality"""
 
         content = content_data["main_content"]
+        content_lower = content_data["content_lower"]
         issues = []
         score = 10.0
         evidence = []
 
         # Check for risk identification
-        risk_keywords = ["risk", "threat", "vulnerability", "downside", "challenge"]
-
-        risk_mentions = sum(
-            1 for keyword in risk_keywords if keyword.lower() in content.lower()
-        )
+        risk_mentions = _count_keywords(RISK_KEYWORDS, content_lower)
 
         if risk_mentions >= 10:
             evidence.append("Comprehensive risk identification")
@@ -698,18 +773,7 @@ class ContentEvaluationEngine:
             score -= 0.5
 
         # Check for quantified risk assessment
-        risk_quantification_patterns = [
-            r"Probability:\s*\d+\.\d+",
-            r"Impact:\s*\d+",
-            r"Risk Score:\s*\d+\.\d+",
-            r"\d+%.*probability",
-            r"Risk Grade",
-        ]
-
-        quantified_risks = sum(
-            len(re.findall(pattern, content, re.IGNORECASE))
-            for pattern in risk_quantification_patterns
-        )
+        quantified_risks = _count_matches(RISK_QUANTIFICATION_PATTERNS, content)
 
         if quantified_risks >= 5:
             evidence.append("Strong risk quantification")
@@ -718,16 +782,7 @@ class ContentEvaluationEngine:
             score -= 1.0
 
         # Check for mitigation strategies
-        mitigation_keywords = [
-            "mitigation",
-            "hedge",
-            "protection",
-            "manage",
-            "monitoring",
-        ]
-        mitigation_mentions = sum(
-            1 for keyword in mitigation_keywords if keyword.lower() in content.lower()
-        )
+        mitigation_mentions = _count_keywords(MITIGATION_KEYWORDS, content_lower)
 
         if mitigation_mentions >= 5:
             evidence.append("Risk mitigation strategies present")
@@ -749,18 +804,17 @@ class ContentEvaluationEngine:
         """Evaluate structural compliance"""
 
         content = content_data["main_content"]
+        content_lower = content_data["content_lower"]
         frontmatter = content_data["frontmatter"]
         issues = []
         score = 10.0
         evidence = []
 
         # Check frontmatter completeness
-        required_frontmatter_fields = ["title", "description", "author", "date", "tags"]
-        frontmatter_fields = []
-
-        for field in required_frontmatter_fields:
-            if field in frontmatter.lower():
-                frontmatter_fields.append(field)
+        frontmatter_lower = frontmatter.lower()
+        frontmatter_fields = [
+            field for field in FRONTMATTER_FIELDS if field in frontmatter_lower
+        ]
 
         if len(frontmatter_fields) >= 4:
             evidence.append("Complete frontmatter metadata")
@@ -769,19 +823,12 @@ class ContentEvaluationEngine:
             score -= 0.5
 
         # Check section structure
-        required_sections = [
-            "Investment Thesis",
-            "Business Intelligence",
-            "Valuation Analysis",
-            "Risk Assessment",
-            "Recommendation Summary",
+        sections_present = [
+            section
+            for section, words in STRUCTURE_SECTION_KEYWORDS
+            if any(word in content for word in words)
         ]
 
-        sections_present = []
-        for section in required_sections:
-            if any(word in content for word in section.split()):
-                sections_present.append(section)
-
         if len(sections_present) >= 4:
             evidence.append("Proper section structure")
         else:
@@ -789,16 +836,8 @@ class ContentEvaluationEngine:
             score -= 1.0
 
         # Check for disclaimers
-        disclaimer_patterns = [
-            "not financial advice",
-            "do your own research",
-            "risk warning",
-        ]
-
         disclaimers_found = [
-            pattern
-            for pattern in disclaimer_patterns
-            if pattern.lower() in content.lower()
+            pattern for pattern in DISCLAIMER_PATTERNS if pattern in content_lower
         ]
 
         if disclaimers_found:
@@ -824,9 +863,7 @@ class ContentEvaluationEngine:
         evidence = []
 
         # Check for spelling and grammar (basic patterns)
-        grammar_issues = len(
-            re.findall(r"\b(teh|thier|recieve|seperate)\b", content, re.IGNORECASE)
-        )
+        grammar_issues = len(SPELLING_RE.findall(content))
         if grammar_issues > 0:
             issues.append(f"Potential spelling issues: {grammar_issues} found")
             score -= grammar_issues * 0.1
@@ -834,7 +871,7 @@ class ContentEvaluationEngine:
             evidence.append("No obvious spelling issues detected")
 
         # Check readability
-        sentences = len(re.findall(r"[.!?]+", content))
+        sentences = len(SENTENCE_RE.findall(content))
         words = len(content.split())
 
         if sentences > 0:
@@ -1129,11 +1166,355 @@ class ContentEvaluationEngine:
         return certification
 
 
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_BULK_STATE_FILE = (
+    PROJECT_ROOT / "data" / "cache" / "content_evaluation" / "bulk_state.json"
+)
+
+
+def summarize_evaluation(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact per-document summary of an evaluation result for scorecards"""
+    assessment = result["overall_assessment"]
+    return {
+        "overall_score": float(assessment["overall_score"].split("/")[0]),
+        "quality_grade": assessment["quality_grade"],
+        "institutional_status": assessment["institutional_status"],
+        "certification_level": result["institutional_certification"][
+            "certification_level"
+        ],
+        "category_scores": {
+            category: details.get("score", 0.0)
+            for category, details in result["evaluation_breakdown"].items()
+        },
+        "issues": result["evidence_based_scoring"]["areas_of_concern"],
+        "critical_issue_count": len(result["critical_findings"]["critical_issues"]),
+    }
+
+
+RULE_SET_VERSION = _rule_set_version()
+
+
+_worker_engine: Optional[ContentEvaluationEngine] = None
+
+
+def _init_bulk_worker() -> None:
+    """Build one evaluation engine per worker process"""
+    global _worker_engine
+    _worker_engine = ContentEvaluationEngine()
+
+
+def _evaluate_bulk_document(filename: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Evaluate one document in a worker; failures are returned, not raised"""
+    engine = _worker_engine or ContentEvaluationEngine()
+    try:
+        return {
+            "file": filename,
+            "result": engine.evaluate_content(filename=filename, **options),
+        }
+    except Exception as e:
+        return {"file": filename, "error": f"{type(e).__name__}: {e}"}
+
+
+class BulkContentEvaluator:
+    """
+    Evaluate many documents in parallel with incremental skipping
+
+    Documents are fanned out across a process pool. A state file records each
+    document's content hash together with the rule-set version and evaluation
+    options; unchanged documents are skipped on later runs and their stored
+    summaries reused, so the aggregated scorecard always covers every document.
+    """
+
+    def __init__(
+        self,
+        evaluation_depth: str = "comprehensive",
+        real_time_validation: bool = True,
+        validation_focus: Optional[List[str]] = None,
+        state_file: Optional[Union[str, Path]] = DEFAULT_BULK_STATE_FILE,
+        output_dir: Optional[Union[str, Path]] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.options = {
+            "evaluation_depth": evaluation_depth,
+            "real_time_validation": real_time_validation,
+            "validation_focus": validation_focus
+            or ["financial_data", "market_analysis"],
+        }
+        self.state_file = Path(state_file) if state_file else None
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+
+    @property
+    def options_key(self) -> str:
+        """Rule-set version plus options; a change invalidates stored results"""
+        payload = json.dumps(
+            {"rule_set_version": RULE_SET_VERSION, **self.options}, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def discover(directory: Union[str, Path], pattern: str = "**/*.md") -> List[Path]:
+        """Documents under directory matching pattern"""
+        return sorted(p for p in Path(directory).glob(pattern) if p.is_file())
+
+    def _load_state(self) -> Dict[str, Any]:
+        if self.state_file and self.state_file.exists():
+            try:
+                with open(self.state_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                self.logger.warning(f"Ignoring unreadable state {self.state_file}: {e}")
+        return {"documents": {}}
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        if not self.state_file:
+            return
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.state_file.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+        temp_path.replace(self.state_file)
+
+    @staticmethod
+    def _content_hash(path: Path) -> str:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def _evaluate_pending(self, pending: List[str]) -> List[Dict[str, Any]]:
+        """Evaluate documents across worker processes (threads as a fallback)"""
+        workers = max(1, min(self.max_workers, len(pending)))
+        options = [self.options] * len(pending)
+
+        if self.use_processes and workers > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_bulk_worker
+                ) as executor:
+                    chunksize = max(1, len(pending) // (workers * 4))
+                    return list(
+                        executor.map(
+                            _evaluate_bulk_document,
+                            pending,
+                            options,
+                            chunksize=chunksize,
+                        )
+                    )
+            except (OSError, RuntimeError) as e:
+                self.logger.warning(f"Process pool unavailable, using threads: {e}")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_evaluate_bulk_document, pending, options))
+
+    def _write_result(self, path: Path, result: Dict[str, Any]) -> None:
+        """Write the full evaluation next to the scorecard when output_dir is set"""
+        if not self.output_dir:
+            return
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = (
+            self.output_dir / f"{path.parent.name}_{path.stem}_evaluation.json"
+        )
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+    def run(
+        self,
+        files: Iterable[Union[str, Path]],
+        force: bool = False,
+        scorecard_path: Optional[Union[str, Path]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Evaluate documents and build the aggregated scorecard
+
+        Args:
+            files: Documents to evaluate
+            force: Re-evaluate every document regardless of stored state
+            scorecard_path: Optional path to write the scorecard JSON
+
+        Returns:
+            Aggregated scorecard for the run
+        """
+        started = time.perf_counter()
+        state = self._load_state()
+        documents = state.setdefault("documents", {})
+        options_key = self.options_key
+
+        summaries: Dict[str, Dict[str, Any]] = {}
+        hashes: Dict[str, str] = {}
+        pending: List[str] = []
+        failures: List[Dict[str, str]] = []
+        skipped = 0
+
+        for file_path in files:
+            path = Path(file_path).resolve()
+            key = str(path)
+            try:
+                content_hash = self._content_hash(path)
+            except OSError as e:
+                failures.append({"file": key, "error": f"{type(e).__name__}: {e}"})
+                continue
+
+            entry = documents.get(key)
+            if (
+                not force
+                and entry
+                and entry.get("content_hash") == content_hash
+                and entry.get("options_key") == options_key
+            ):
+                summaries[key] = entry["summary"]
+                skipped += 1
+                continue
+
+            hashes[key] = content_hash
+            pending.append(key)
+
+        results = self._evaluate_pending(pending) if pending else []
+        evaluated = 0
+        for outcome in results:
+            key = outcome["file"]
+            if "error" in outcome:
+                failures.append({"file": key, "error": outcome["error"]})
+                documents.pop(key, None)
+                continue
+
+            summary = summarize_evaluation(outcome["result"])
+            summaries[key] = summary
+            evaluated += 1
+            documents[key] = {
+                "content_hash": hashes[key],
+                "options_key": options_key,
+                "rule_set_version": RULE_SET_VERSION,
+                "evaluated_at": datetime.now().isoformat(),
+                "summary": summary,
+            }
+            self._write_result(Path(key), outcome["result"])
+
+        state["rule_set_version"] = RULE_SET_VERSION
+        self._save_state(state)
+
+        scorecard = self.build_scorecard(summaries, failures)
+        scorecard["metadata"].update(
+            {
+                "duration_seconds": round(time.perf_counter() - started, 3),
+                "max_workers": self.max_workers,
+            }
+        )
+        scorecard["totals"].update({"evaluated": evaluated, "skipped": skipped})
+
+        if scorecard_path:
+            scorecard_path = Path(scorecard_path)
+            scorecard_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(scorecard_path, "w", encoding="utf-8") as f:
+                json.dump(scorecard, f, indent=2, ensure_ascii=False)
+            scorecard["metadata"]["scorecard_path"] = str(scorecard_path)
+
+        return scorecard
+
+    def build_scorecard(
+        self,
+        summaries: Dict[str, Dict[str, Any]],
+        failures: Optional[List[Dict[str, str]]] = None,
+        top_issues: int = 10,
+    ) -> Dict[str, Any]:
+        """Aggregate per-document summaries into a single scorecard"""
+        failures = failures or []
+        scores = [s["overall_score"] for s in summaries.values()]
+
+        category_scores: Dict[str, List[float]] = {}
+        issue_counts: Counter = Counter()
+        for summary in summaries.values():
+            for category, score in summary["category_scores"].items():
+                category_scores.setdefault(category, []).append(score)
+            issue_counts.update(set(summary["issues"]))
+
+        return {
+            "metadata": {
+                "generated_at": datetime.now().isoformat(),
+                "rule_set_version": RULE_SET_VERSION,
+                **self.options,
+            },
+            "totals": {
+                "documents": len(summaries) + len(failures),
+                "scored": len(summaries),
+                "failed": len(failures),
+                "meets_institutional_standards": sum(
+                    1
+                    for s in summaries.values()
+                    if s["overall_score"] >= QUALITY_THRESHOLDS["institutional_minimum"]
+                ),
+            },
+            "score_statistics": {
+                "mean": round(statistics.fmean(scores), 2) if scores else 0.0,
+                "median": round(statistics.median(scores), 2) if scores else 0.0,
+                "min": min(scores) if scores else 0.0,
+                "max": max(scores) if scores else 0.0,
+            },
+            "grade_distribution": dict(
+                Counter(s["quality_grade"] for s in summaries.values())
+            ),
+            "status_distribution": dict(
+                Counter(s["institutional_status"] for s in summaries.values())
+            ),
+            "certification_distribution": dict(
+                Counter(s["certification_level"] for s in summaries.values())
+            ),
+            "category_averages": {
+                category: round(statistics.fmean(values), 2)
+                for category, values in sorted(category_scores.items())
+            },
+            "common_issues": [
+                {"issue": issue, "documents": count}
+                for issue, count in issue_counts.most_common(top_issues)
+            ],
+            # Lowest scores first so the documents needing work lead the list
+            "documents": sorted(
+                (
+                    {
+                        "file": key,
+                        "overall_score": s["overall_score"],
+                        "quality_grade": s["quality_grade"],
+                        "institutional_status": s["institutional_status"],
+                        "critical_issue_count": s["critical_issue_count"],
+                    }
+                    for key, s in summaries.items()
+                ),
+                key=lambda row: (row["overall_score"], row["file"]),
+            ),
+            "failures": failures,
+        }
+
+
 def main():
     """Main function to run content evaluation"""
 
     parser = argparse.ArgumentParser(description="Content Evaluation Script")
-    parser.add_argument("--filename", required=True, help="Path to the content file")
+    parser.add_argument("--filename", help="Path to the content file")
+    parser.add_argument(
+        "--directory", help="Evaluate every matching document under this directory"
+    )
+    parser.add_argument(
+        "--pattern", default="**/*.md", help="Glob pattern for --directory mode"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes for bulk mode"
+    )
+    parser.add_argument(
+        "--state_file",
+        default=str(DEFAULT_BULK_STATE_FILE),
+        help="Incremental state file for bulk mode",
+    )
+    parser.add_argument(
+        "--scorecard_file", help="Output file for the bulk scorecard (optional)"
+    )
+    parser.add_argument(
+        "--output_dir", help="Directory for per-document bulk results (optional)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-evaluate unchanged documents in bulk mode",
+    )
     parser.add_argument(
         "--evaluation_depth",
         choices=["basic", "standard", "comprehensive"],
@@ -1158,6 +1539,33 @@ def main():
 
     args = parser.parse_args()
 
+    if not args.filename and not args.directory:
+        parser.error("one of --filename or --directory is required")
+
+    if args.directory:
+        bulk_evaluator = BulkContentEvaluator(
+            evaluation_depth=args.evaluation_depth,
+            real_time_validation=args.real_time_validation,
+            validation_focus=args.validation_focus,
+            state_file=args.state_file,
+            output_dir=args.output_dir,
+            max_workers=args.workers,
+        )
+        files = bulk_evaluator.discover(args.directory, args.pattern)
+        scorecard = bulk_evaluator.run(
+            files, force=args.force, scorecard_path=args.scorecard_file
+        )
+        if args.scorecard_file:
+            totals = scorecard["totals"]
+            print(
+                f"Evaluated {totals['evaluated']}, skipped {totals['skipped']}, "
+                f"failed {totals['failed']} of {totals['documents']} documents; "
+                f"scorecard saved to: {args.scorecard_file}"
+            )
+        else:
+            print(json.dumps(scorecard, indent=2, ensure_ascii=False))
+        return
+
     # Initialize evaluation engine
     evaluator = ContentEvaluationEngine()
 
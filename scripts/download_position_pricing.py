@@ -8,31 +8,49 @@ and generates consolidated PnL time series data for frontend consumption.
 This script follows the established data pipeline pattern:
 Backend Python → Raw Data Storage → Frontend Copy
 
+Batch mode (default) requests all open-position tickers in one grouped
+download, falls back to concurrent per-ticker downloads for any ticker the
+grouped request misses, and reuses price ranges already stored locally in
+data/raw/stocks/{TICKER}/daily.csv.
+
 Usage:
     python download_position_pricing.py --portfolio live_signals
     python download_position_pricing.py --portfolio live_signals --start-date 2025-01-01
+    python download_position_pricing.py --portfolio live_signals --no-batch
 """
 
 import argparse
 import csv
 import logging
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 # Add scripts directory to path for importing services
 sys.path.append(str(Path(__file__).parent))
 from yahoo_finance_service import YahooFinanceService
 
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
 
 class PositionPricingDownloader:
     """Downloads pricing data for open trading positions"""
 
-    def __init__(self, portfolio_name: str, base_data_path: Optional[str] = None):
+    def __init__(
+        self,
+        portfolio_name: str,
+        base_data_path: Optional[str] = None,
+        batch: bool = True,
+        max_workers: int = 8,
+    ):
         self.portfolio_name = portfolio_name
+        self.batch = batch
+        self.max_workers = max_workers
         self.base_data_path = (
             Path(base_data_path)
             if base_data_path
@@ -56,6 +74,7 @@ class PositionPricingDownloader:
             / "pricing"
             / f"{portfolio_name}_open_positions_pnl.csv"
         )
+        self.local_stocks_path = self.base_data_path / "raw" / "stocks"
 
         # Setup logging
         self._setup_logging()
@@ -162,6 +181,244 @@ class PositionPricingDownloader:
             self.logger.error(f"Failed to download price data for {ticker}: {e}")
             return pd.DataFrame()
 
+    def load_local_prices(
+        self, ticker: str, start_date: date, end_date: date
+    ) -> Tuple[pd.DataFrame, Optional[date]]:
+        """
+        Load stored daily prices for a ticker from data/raw/stocks
+
+        Returns:
+            Tuple of (prices within range in download layout, last stored date).
+            The last stored date is None when the store does not cover start_date.
+        """
+        daily_file = self.local_stocks_path / ticker.upper() / "daily.csv"
+        if not daily_file.exists():
+            return pd.DataFrame(), None
+
+        try:
+            stored = pd.read_csv(daily_file)
+        except Exception as e:
+            self.logger.warning(f"Unreadable local price store for {ticker}: {e}")
+            return pd.DataFrame(), None
+
+        required = ["date"] + [col.lower() for col in PRICE_COLUMNS]
+        if stored.empty or any(col not in stored.columns for col in required):
+            return pd.DataFrame(), None
+
+        stored = stored[required].rename(
+            columns={col.lower(): col for col in PRICE_COLUMNS}
+        )
+        stored["Date"] = pd.to_datetime(stored.pop("date")).dt.date
+        stored = stored.sort_values("Date")
+
+        first_stored = stored["Date"].iloc[0]
+        last_stored = stored["Date"].iloc[-1]
+        # A store starting after the first business day of the range cannot
+        # serve it (weekends/holidays at range start are tolerated)
+        if first_stored > (pd.Timestamp(start_date) + pd.offsets.BDay(1)).date():
+            return pd.DataFrame(), None
+
+        in_range = (stored["Date"] >= start_date) & (stored["Date"] <= end_date)
+        local_prices = stored.loc[in_range, ["Date"] + PRICE_COLUMNS]
+        return local_prices.reset_index(drop=True), last_stored
+
+    def _local_store_is_current(self, last_stored: date, end_date: date) -> bool:
+        """Check whether stored prices reach the last completed business day"""
+        last_complete = (pd.Timestamp(end_date) - pd.offsets.BDay(1)).date()
+        return last_stored >= last_complete
+
+    @staticmethod
+    def _as_dates(values: pd.Series) -> pd.Series:
+        """Convert timestamps to exchange-local calendar dates"""
+        timestamps = pd.to_datetime(values)
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+        return timestamps.dt.date
+
+    def _normalize_price_frame(self, price_data: pd.DataFrame) -> pd.DataFrame:
+        """Convert a downloaded frame into the Date + OHLCV download layout"""
+        if price_data is None or price_data.empty:
+            return pd.DataFrame()
+        if any(col not in price_data.columns for col in PRICE_COLUMNS):
+            return pd.DataFrame()
+
+        price_data = price_data.dropna(subset=["Close"])
+        dates = pd.DatetimeIndex(price_data.index)
+        if dates.tz is not None:
+            dates = dates.tz_localize(None)
+
+        normalized = price_data[PRICE_COLUMNS].copy()
+        normalized.insert(0, "Date", dates.date)
+        return normalized.reset_index(drop=True)
+
+    def _download_grouped(
+        self, tickers: List[str], start_date: date, end_date: date
+    ) -> Dict[str, pd.DataFrame]:
+        """Request all tickers in a single grouped yfinance download"""
+        import yfinance as yf
+
+        self.logger.info(
+            f"Batch downloading {len(tickers)} tickers from {start_date} to {end_date}"
+        )
+
+        try:
+            grouped = yf.download(
+                tickers=tickers,
+                start=start_date.strftime("%Y-%m-%d"),
+                end=(end_date + timedelta(days=1)).strftime("%Y-%m-%d"),
+                group_by="ticker",
+                auto_adjust=True,
+                threads=True,
+                progress=False,
+            )
+        except Exception as e:
+            self.logger.error(f"Grouped download failed: {e}")
+            return {}
+
+        if grouped is None or grouped.empty:
+            return {}
+
+        frames = {}
+        if isinstance(grouped.columns, pd.MultiIndex):
+            available = set(grouped.columns.get_level_values(0))
+            for ticker in tickers:
+                if ticker in available:
+                    frame = self._normalize_price_frame(grouped[ticker])
+                    if not frame.empty:
+                        frames[ticker] = frame
+        elif len(tickers) == 1:
+            frame = self._normalize_price_frame(grouped)
+            if not frame.empty:
+                frames[tickers[0]] = frame
+
+        return frames
+
+    def _download_concurrently(
+        self, requests: Dict[str, date], end_date: date
+    ) -> Dict[str, pd.DataFrame]:
+        """Fallback: download each ticker on its own with a bounded thread pool"""
+        frames: Dict[str, pd.DataFrame] = {}
+        if not requests:
+            return frames
+
+        self.logger.info(
+            f"Concurrent fallback download for {len(requests)} tickers: "
+            f"{sorted(requests)}"
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(requests))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.download_ticker_prices,
+                    ticker,
+                    datetime.combine(start, datetime.min.time()),
+                    datetime.combine(end_date, datetime.min.time()),
+                ): ticker
+                for ticker, start in requests.items()
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                price_data = future.result()
+                if not price_data.empty:
+                    price_data = price_data.copy()
+                    price_data["Date"] = self._as_dates(price_data["Date"])
+                    frames[ticker] = price_data[["Date"] + PRICE_COLUMNS]
+
+        return frames
+
+    def download_batch_prices(
+        self, ticker_starts: Dict[str, date], end_date: Optional[date] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch daily prices for many tickers at once
+
+        Ranges already present in the local store are served from disk; only
+        missing ranges are requested, first as one grouped download and then
+        concurrently per ticker for anything the grouped request missed.
+
+        Args:
+            ticker_starts: Mapping of ticker to earliest required date
+            end_date: Last required date (defaults to today)
+
+        Returns:
+            Mapping of ticker to Date + OHLCV frame covering [start, end_date]
+        """
+        end_date = end_date or datetime.now().date()
+
+        local_frames: Dict[str, pd.DataFrame] = {}
+        pending: Dict[str, date] = {}
+
+        for ticker, start in ticker_starts.items():
+            local_prices, last_stored = self.load_local_prices(ticker, start, end_date)
+            if last_stored is None:
+                pending[ticker] = start
+                continue
+
+            local_frames[ticker] = local_prices
+            if not self._local_store_is_current(last_stored, end_date):
+                # Only the tail beyond the stored range needs downloading
+                pending[ticker] = last_stored + timedelta(days=1)
+
+        self.logger.info(
+            f"Local store served {len(local_frames)} tickers, "
+            f"{len(pending)} need network data"
+        )
+
+        downloaded: Dict[str, pd.DataFrame] = {}
+        if pending:
+            downloaded = self._download_grouped(
+                sorted(pending), min(pending.values()), end_date
+            )
+            missing = {t: s for t, s in pending.items() if t not in downloaded}
+            downloaded.update(self._download_concurrently(missing, end_date))
+
+        price_frames: Dict[str, pd.DataFrame] = {}
+        for ticker, start in ticker_starts.items():
+            parts = [
+                frame
+                for frame in (local_frames.get(ticker), downloaded.get(ticker))
+                if frame is not None and not frame.empty
+            ]
+            if not parts:
+                self.logger.warning(f"No price data available for {ticker}")
+                continue
+
+            combined = pd.concat(parts, ignore_index=True)
+            combined = combined.drop_duplicates(subset="Date", keep="last")
+            combined = combined[
+                (combined["Date"] >= start) & (combined["Date"] <= end_date)
+            ]
+            price_frames[ticker] = combined.sort_values("Date").reset_index(drop=True)
+
+        return price_frames
+
+    def fetch_position_prices(
+        self, positions: List[Dict], end_date: Optional[date] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch price frames for every open-position ticker"""
+        ticker_starts: Dict[str, date] = {}
+        for position in positions:
+            ticker = position["ticker"]
+            start = position["entry_date"]
+            ticker_starts[ticker] = min(start, ticker_starts.get(ticker, start))
+
+        if self.batch:
+            return self.download_batch_prices(ticker_starts, end_date)
+
+        price_frames = {}
+        for ticker, start in ticker_starts.items():
+            price_data = self.download_ticker_prices(
+                ticker,
+                datetime.combine(start, datetime.min.time()),
+                datetime.combine(end_date, datetime.min.time()) if end_date else None,
+            )
+            if not price_data.empty:
+                price_data = price_data.copy()
+                price_data["Date"] = self._as_dates(price_data["Date"])
+                price_frames[ticker] = price_data
+        return price_frames
+
     def save_individual_price_file(self, ticker: str, price_data: pd.DataFrame) -> None:
         """Save individual ticker price data to CSV"""
         if price_data.empty:
@@ -186,77 +443,87 @@ class PositionPricingDownloader:
             f"Saved {len(price_data_clean)} price records to {output_file}"
         )
 
-    def calculate_position_pnl_timeseries(self, positions: List[Dict]) -> pd.DataFrame:
+    def calculate_position_pnl_timeseries(
+        self,
+        positions: List[Dict],
+        price_frames: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> pd.DataFrame:
         """Generate consolidated PnL time series for all open positions"""
         self.logger.info("Calculating PnL time series for all open positions")
 
-        all_pnl_data = []
-
-        for position in positions:
-            ticker = position["ticker"]
-            entry_date = position["entry_date"]
-            entry_price = position["entry_price"]
-            position_size = position["position_size"]
-            direction_multiplier = 1 if position["direction"] == "Long" else -1
+        if price_frames is None:
+            price_frames = self.fetch_position_prices(positions)
 
-            # Download price data for this position
-            price_data = self.download_ticker_prices(ticker, entry_date)
+        # Save individual price files
+        for ticker, price_data in price_frames.items():
+            self.save_individual_price_file(ticker, price_data)
 
-            if price_data.empty:
+        priced_positions = []
+        for position in positions:
+            if position["ticker"] in price_frames:
+                priced_positions.append(position)
+            else:
                 self.logger.warning(
-                    f"Skipping PnL calculation for {ticker} due to missing price data"
+                    f"Skipping PnL calculation for {position['ticker']} due to missing price data"
                 )
-                continue
-
-            # Save individual price file
-            self.save_individual_price_file(ticker, price_data)
 
-            # Calculate daily PnL
-            for _, row in price_data.iterrows():
-                date = row["Date"]
-                if pd.isna(date):
-                    continue
-
-                # Convert pandas Timestamp to date object
-                if hasattr(date, "date") and callable(getattr(date, "date")):
-                    # It's a datetime-like object (Timestamp) with a date() method
-                    date = date.date()
-                elif isinstance(date, str):
-                    # Convert string to date
-                    date = pd.to_datetime(date)
-                # If it's already a date object, keep it as is
-
-                close_price = float(row["Close"])
-
-                # Calculate PnL: (Current Price - Entry Price) * Position Size * Direction
-                pnl = (close_price - entry_price) * position_size * direction_multiplier
-
-                pnl_record = {
-                    "Date": date,
-                    "Ticker": ticker,
-                    "Price": close_price,
-                    "PnL": pnl,
-                    "Position_Size": position_size,
-                    "Entry_Date": entry_date,
-                    "Entry_Price": entry_price,
-                    "Direction": position["direction"],
-                    "Position_UUID": position["position_uuid"],
-                }
-
-                all_pnl_data.append(pnl_record)
-
-        if not all_pnl_data:
+        if not priced_positions:
             self.logger.warning("No PnL data generated")
             return pd.DataFrame()
 
-        # Convert to DataFrame and sort by date
-        pnl_df = pd.DataFrame(all_pnl_data)
-        pnl_df = pnl_df.sort_values(["Date", "Ticker"])
+        # Align close prices into a (dates x tickers) matrix
+        closes = pd.DataFrame(
+            {
+                ticker: pd.Series(
+                    frame["Close"].to_numpy(dtype=float),
+                    index=pd.to_datetime(frame["Date"]),
+                )
+                for ticker, frame in price_frames.items()
+            }
+        ).sort_index()
+
+        # Expand to one column per position and mask dates before entry
+        entry_dates = pd.to_datetime([p["entry_date"] for p in priced_positions])
+        close_matrix = closes[[p["ticker"] for p in priced_positions]].to_numpy()
+        close_matrix = np.where(
+            closes.index.to_numpy()[:, None] >= entry_dates.to_numpy()[None, :],
+            close_matrix,
+            np.nan,
+        )
+
+        entry_prices = np.array([p["entry_price"] for p in priced_positions])
+        position_sizes = np.array([p["position_size"] for p in priced_positions])
+        direction_multipliers = np.array(
+            [1 if p["direction"] == "Long" else -1 for p in priced_positions]
+        )
+
+        # PnL: (Current Price - Entry Price) * Position Size * Direction
+        pnl_matrix = (close_matrix - entry_prices) * (
+            position_sizes * direction_multipliers
+        )
+
+        date_idx, position_idx = np.nonzero(~np.isnan(close_matrix))
+        position_attrs = pd.DataFrame(priced_positions).iloc[position_idx]
+
+        pnl_df = pd.DataFrame(
+            {
+                "Date": closes.index[date_idx].date,
+                "Ticker": position_attrs["ticker"].to_numpy(),
+                "Price": close_matrix[date_idx, position_idx],
+                "PnL": pnl_matrix[date_idx, position_idx],
+                "Position_Size": position_attrs["position_size"].to_numpy(),
+                "Entry_Date": position_attrs["entry_date"].to_numpy(),
+                "Entry_Price": position_attrs["entry_price"].to_numpy(),
+                "Direction": position_attrs["direction"].to_numpy(),
+                "Position_UUID": position_attrs["position_uuid"].to_numpy(),
+            }
+        )
+        pnl_df = pnl_df.sort_values(["Date", "Ticker"], kind="stable")
 
         self.logger.info(
             f"Generated {len(pnl_df)} PnL records across {len(positions)} positions"
         )
-        return pnl_df
+        return pnl_df.reset_index(drop=True)
 
     def save_consolidated_pnl_file(self, pnl_data: pd.DataFrame) -> None:
         """Save consolidated PnL time series to CSV"""
@@ -335,12 +602,19 @@ def main():
         "--data-path",
         help="Base path to data directory (default: ../data relative to script)",
     )
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="Download each ticker serially instead of one grouped batch request",
+    )
 
     args = parser.parse_args()
 
     try:
         downloader = PositionPricingDownloader(
-            portfolio_name=args.portfolio, base_data_path=args.data_path
+            portfolio_name=args.portfolio,
+            base_data_path=args.data_path,
+            batch=not args.no_batch,
         )
         downloader.run(start_date=args.start_date)
 
@@ -5,7 +5,6 @@ Supports any stock ticker with configurable depth and output options
 """
 
 import argparse
-import json
 import os
 import sys
 from datetime import datetime
@@ -13,11 +12,12 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
 import numpy as np
-import pandas as pd
 
 # Add scripts directory to path for service integration
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from utils.json_serialization import to_serializable, write_json
+
 # Import CLI services for enhanced data collection
 try:
     from services.alpha_vantage import create_alpha_vantage_service
@@ -227,24 +227,7 @@ class FundamentalDiscovery:
 
     def convert_to_serializable(self, obj: Any) -> Any:
         """Convert various data types to JSON-serializable format"""
-        if isinstance(obj, (pd.DataFrame, pd.Series)):
-            return (
-                obj.to_dict("records")
-                if isinstance(obj, pd.DataFrame)
-                else obj.to_dict()
-            )
-        elif isinstance(obj, (np.int64, np.int32)):
-            return int(obj)
-        elif isinstance(obj, (np.float64, np.float32)):
-            return float(obj)
-        elif isinstance(obj, pd.Timestamp):
-            return obj.isoformat()
-        elif isinstance(obj, (list, tuple)):
-            return [self.convert_to_serializable(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {str(k): self.convert_to_serializable(v) for k, v in obj.items()}
-        else:
-            return obj
+        return to_serializable(obj)
 
     def initialize_data_source(self) -> bool:
         """Initialize CLI data sources and validate ticker"""
@@ -1327,8 +1310,7 @@ class FundamentalDiscovery:
         filename = f"{self.ticker}_{timestamp_str}_discovery.json"
         filepath = os.path.join(self.output_dir, filename)
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        write_json(data, filepath, fallback=str)
 
         print("💾 Discovery data saved: {filepath}")
         return filepath
@@ -11,12 +11,13 @@ This script:
 """
 
 import logging
-from datetime import timedelta
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+from trade_history.portfolio_engine import PortfolioEquityEngine
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -87,48 +88,18 @@ def calculate_portfolio_equity_curve(trades_df):
     """Calculate daily portfolio equity curve from trades"""
     logger.info("Calculating portfolio equity curve")
 
-    # Get date range
-    min_date = pd.Timestamp(START_DATE)
-    max_date = trades_df["Exit_Timestamp"].max()
-
-    # Create daily date index
-    date_range = pd.date_range(start=min_date, end=max_date, freq="D")
-
-    # Initialize equity curve
-    equity_curve = pd.Series(index=date_range, dtype=float)
-    equity_curve.iloc[0] = 0.0  # Start at 0 P&L
-
-    # Calculate daily P&L
-    for date in date_range:
-        daily_pnl = 0.0
-
-        # Add P&L from trades that closed on this date
-        closed_today = trades_df[trades_df["Exit_Timestamp"].dt.date == date.date()]
-        if not closed_today.empty:
-            daily_pnl += closed_today["PnL"].sum()
-
-        # Set cumulative P&L
-        if date == date_range[0]:
-            equity_curve[date] = daily_pnl
-        else:
-            prev_date = date - timedelta(days=1)
-            while prev_date not in equity_curve.index and prev_date >= min_date:
-                prev_date -= timedelta(days=1)
-
-            if prev_date in equity_curve.index:
-                equity_curve[date] = equity_curve[prev_date] + daily_pnl
-            else:
-                equity_curve[date] = daily_pnl
-
-    # Forward fill for missing dates (weekends, holidays)
-    equity_curve = equity_curve.ffill()
-
-    # Convert to percentage returns
-    portfolio_returns = (equity_curve / INITIAL_CAPITAL) * 100
+    # Single aligned pass over exit events (see trade_history.portfolio_engine)
+    engine = PortfolioEquityEngine(initial_capital=INITIAL_CAPITAL)
+    portfolio_series = engine.build(trades_df, START_DATE)
+    portfolio_returns = portfolio_series["Portfolio"]
 
     logger.info(
         f"Portfolio equity curve calculated with final return: {portfolio_returns.iloc[-1]:.2f}%"
     )
+    logger.info(
+        f"Max drawdown: {portfolio_series['Drawdown_Pct'].min():.2f}%, "
+        f"peak open positions: {portfolio_series['Open_Positions'].max()}"
+    )
     return portfolio_returns
 
 
@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+from utils.markdown_report_tokenizer import MarkdownReport, load_report
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -28,6 +30,15 @@ except ImportError:
     logger.error("Plotly not available. Install with: pip install plotly kaleido")
     sys.exit(1)
 
+# Trade table cells and per-trade section headings
+TICKER_RE = re.compile(r"[A-Z]+")
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+RETURN_RE = re.compile(r"(?:\*\*)?([+-]?\d+\.?\d*)%(?:\*\*)?")
+PLAIN_RETURN_RE = re.compile(r"([+-]?\d+\.?\d*)%")
+DAYS_RE = re.compile(r"(\d+)d")
+TRADE_SECTION_RE = re.compile(r"^(?:🥇|🥈|🥉)?\s*([A-Z]+)\s*-\s*\*\*([+-]?\d+\.?\d*)%\*\*")
+DURATION_RE = re.compile(r"Duration:\s*(\d+)\s*days?")
+
 
 class TemplateBasedDashboardGenerator:
     """Generate dashboards using reusable template system."""
@@ -174,19 +185,18 @@ class TemplateBasedDashboardGenerator:
     def _parse_report(self, report_path: Path) -> Dict[str, Any]:
         """Parse report data from markdown file."""
         try:
-            with open(report_path, "r") as f:
-                content = f.read()
+            report = load_report(report_path)
 
             data = {
-                "content": content,
+                "content": report.content,
                 "filename": report_path.name,
                 "date": self.date_str,
             }
 
             # Extract comprehensive data
-            data["metrics"] = self._extract_metrics(content)
+            data["metrics"] = self._extract_metrics(report)
             data["all_trades"] = self._extract_all_trades(
-                content
+                report
             )  # ALL trades for waterfall
             data["weekly_data"] = self._extract_weekly_performance(
                 data["all_trades"]
@@ -198,96 +208,69 @@ class TemplateBasedDashboardGenerator:
             logger.error(f"Error parsing report: {str(e)}")
             return {}
 
-    def _extract_metrics(self, content: str) -> Dict[str, Any]:
-        """Extract key metrics from report content."""
+    def _extract_metrics(self, report: MarkdownReport) -> Dict[str, Any]:
+        """Extract key metrics from report fields."""
         metrics = {}
 
-        # Win rate with wins/losses - updated pattern for the actual format
-        win_rate_match = re.search(
-            r"Win Rate[:\*\s]+(\d+\.?\d*)%\s*\((\d+)\s*wins?,\s*(\d+)\s*loss", content
+        # Win rate with wins/losses, e.g. "**Win Rate**: 53.33% (8 wins, 7 losses)"
+        win_rate_match = report.match(
+            "Win Rate", r"^(\d+\.?\d*)%\s*\((\d+)\s*wins?,\s*(\d+)\s*loss"
         )
         if win_rate_match:
             metrics["win_rate"] = float(win_rate_match.group(1))
             metrics["wins"] = int(win_rate_match.group(2))
             metrics["losses"] = int(win_rate_match.group(3))
 
-        # Total return - updated pattern
-        return_match = re.search(r"Total Return[:\*\s]+([+-]?\d+\.?\d*)%", content)
-        if return_match:
-            metrics["total_return"] = float(return_match.group(1))
+        total_return = report.get("Total Return", r"^([+-]?\d+\.?\d*)%")
+        if total_return is not None:
+            metrics["total_return"] = float(total_return)
 
-        # Trade count - updated pattern for "completed signals"
-        trade_count_match = re.search(r"Total Closed Trades[:\*\s]+(\d+)", content)
-        if trade_count_match:
-            metrics["trade_count"] = int(trade_count_match.group(1))
+        # Trade count, falling back to "<n> completed signals" prose
+        trade_count = report.get("Total Closed Trades", r"^(\d+)")
+        if trade_count is not None:
+            metrics["trade_count"] = int(trade_count)
         else:
-            # Try alternate pattern
-            alt_trade_count = re.search(r"(\d+)\s+completed signals", content)
+            alt_trade_count = report.search(r"(\d+)\s+completed signals")
             if alt_trade_count:
                 metrics["trade_count"] = int(alt_trade_count.group(1))
 
-        # Profit factor - updated pattern
-        pf_match = re.search(r"Profit Factor[:\*\s]+(\d+\.?\d*)", content)
-        if pf_match:
-            metrics["profit_factor"] = float(pf_match.group(1))
+        # Profit factor, falling back to prose such as "Profit Factor 6.28"
+        profit_factor = report.get("Profit Factor", r"^(\d+\.?\d*)")
+        if profit_factor is None:
+            pf_match = report.search(r"Profit Factor[:\*\s]+(\d+\.?\d*)")
+            profit_factor = pf_match.group(1) if pf_match else None
+        if profit_factor is not None:
+            metrics["profit_factor"] = float(profit_factor)
 
         logger.info(f"Extracted metrics: {metrics}")
         return metrics
 
-    def _extract_all_trades(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_all_trades(self, report: MarkdownReport) -> List[Dict[str, Any]]:
         """Extract ALL trade data including duration for waterfall chart."""
-        trades = []
-
-        # Extract from the complete trade history table with entry/exit dates
-        # Pattern: | 1 | **TSLA** | SMA 15-23 | 2025-05-01 | 2025-06-11 | **+16.58%** | 41d | Excellent |
-        table_pattern = r"\|\s*\d+\s*\|\s*(?:\*\*)?([A-Z]+)(?:\*\*)?\s*\|.*?\|\s*(\d{4}-\d{2}-\d{2})\s*\|\s*(\d{4}-\d{2}-\d{2})\s*\|\s*(?:\*\*)?([+-]?\d+\.?\d*)%(?:\*\*)?\s*\|\s*(\d+)d\s*\|"
-        matches = re.finditer(table_pattern, content)
-
-        for match in matches:
-            trades.append(
-                {
-                    "symbol": match.group(1),
-                    "entry_date": match.group(2),
-                    "exit_date": match.group(3),
-                    "return": float(match.group(4)),
-                    "duration": int(match.group(5)),
-                    "type": "table",
-                }
-            )
-            logger.debug(
-                f"Extracted trade: {match.group(1)} {match.group(4)}% {match.group(5)}d"
-            )
+        # Complete trade history table with entry/exit dates:
+        # | 1 | **TSLA** | SMA 15-23 | 2025-05-01 | 2025-06-11 | **+16.58%** | 41d | Excellent |
+        trades = self._extract_table_trades(report, with_dates=True)
 
-        # If no trades found in main table, try alternate patterns
+        # If no trades found in main table, try individual trade sections
+        # ("### 🥇 TSLA - **+16.58%**" ... "Duration: 41 days")
         if not trades:
-            # Try individual trade sections
-            trade_section_pattern = r"###\s*(?:🥇|🥈|🥉)?\s*([A-Z]+)\s*-\s*\*\*([+-]?\d+\.?\d*)%\*\*.*?Duration:\s*(\d+)\s*days?"
-            matches = re.finditer(trade_section_pattern, content, re.DOTALL)
-
-            for match in matches:
-                trades.append(
-                    {
-                        "symbol": match.group(1),
-                        "return": float(match.group(2)),
-                        "duration": int(match.group(3)),
-                        "type": "individual",
-                    }
+            for section, match in report.find_sections(TRADE_SECTION_RE, level=3):
+                duration = DURATION_RE.search(
+                    "\n".join(child.text for child in section.walk())
                 )
+                if duration:
+                    trades.append(
+                        {
+                            "symbol": match.group(1),
+                            "return": float(match.group(2)),
+                            "duration": int(duration.group(1)),
+                            "type": "individual",
+                        }
+                    )
 
-        # If still no trades, try simpler pattern without bold formatting
+        # If still no trades, try simpler tables without dates or bold formatting
         if not trades:
-            simple_table_pattern = r"\|\s*\d+\s*\|\s*([A-Z]+)\s*\|.*?\|\s*([+-]?\d+\.?\d*)%\s*\|\s*(\d+)d\s*\|"
-            matches = re.finditer(simple_table_pattern, content)
-
-            for match in matches:
-                trades.append(
-                    {
-                        "symbol": match.group(1),
-                        "return": float(match.group(2)),
-                        "duration": int(match.group(3)),
-                        "type": "simple_table",
-                    }
-                )
+            trades = self._extract_table_trades(report, with_dates=False)
 
         # Sort by return value for waterfall (descending: highest to lowest)
         trades.sort(key=lambda x: x["return"], reverse=True)
@@ -295,6 +278,60 @@ class TemplateBasedDashboardGenerator:
         logger.info(f"Extracted {len(trades)} total trades for waterfall chart")
         return trades
 
+    def _extract_table_trades(
+        self, report: MarkdownReport, with_dates: bool
+    ) -> List[Dict[str, Any]]:
+        """Trades from "| rank | ticker | ... | return% | <n>d |" table rows."""
+        trades = []
+        span = 4 if with_dates else 2
+
+        for table in report.tables:
+            for row in [table.header] + table.rows:
+                if len(row) < 2 + span or not row[0].isdigit():
+                    continue
+                ticker = (
+                    row[1][2:-2] if with_dates and row[1].startswith("**") else row[1]
+                )
+                if not TICKER_RE.fullmatch(ticker):
+                    continue
+
+                # Return and duration cells follow at least one other column
+                for start in range(3, len(row) - span + 1):
+                    cells = row[start : start + span]
+                    if with_dates:
+                        if not (
+                            DATE_RE.fullmatch(cells[0]) and DATE_RE.fullmatch(cells[1])
+                        ):
+                            continue
+                        cells = cells[2:]
+                    return_match = (
+                        RETURN_RE if with_dates else PLAIN_RETURN_RE
+                    ).fullmatch(cells[0])
+                    duration_match = DAYS_RE.fullmatch(cells[1])
+                    if not (return_match and duration_match):
+                        continue
+
+                    trade = {
+                        "symbol": ticker,
+                        "return": float(return_match.group(1)),
+                        "duration": int(duration_match.group(1)),
+                        "type": "table" if with_dates else "simple_table",
+                    }
+                    if with_dates:
+                        trade = {
+                            "symbol": ticker,
+                            "entry_date": row[start],
+                            "exit_date": row[start + 1],
+                            **{k: v for k, v in trade.items() if k != "symbol"},
+                        }
+                    trades.append(trade)
+                    logger.debug(
+                        f"Extracted trade: {ticker} {trade['return']}% {trade['duration']}d"
+                    )
+                    break
+
+        return trades
+
     def _extract_weekly_performance(
         self, trades: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -11,23 +11,63 @@ Key Features:
 - Maintains schema compliance with macro_analysis_discovery_schema.json
 - Provides global cross-regional correlations and analysis
 - Generates institutional-grade confidence scores
+- Incremental aggregation: per-region partial aggregates are persisted with
+  the content hash of their source file, so only refreshed regions are
+  re-parsed and the global composites are rebuilt from cached partials
 """
 
-import json
+import copy
+import hashlib
 import logging
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from utils.json_serialization import loads, read_json, write_json
+
 logger = logging.getLogger(__name__)
 
 
 class GlobalMacroAggregator:
     """Aggregates regional macro-economic discovery data into global analysis"""
 
-    def __init__(self, base_dir: str = None):
+    # Regional discovery files in aggregation order (order sets the weights)
+    REGIONAL_FILES = {
+        "US": "US_{date}_discovery.json",
+        "AMERICAS": "americas_{date}_discovery.json",
+        "EUROPE": "europe_{date}_discovery.json",
+        "ASIA": "asia_{date}_discovery.json",
+    }
+
+    # Bump when _extract_regional_partial changes so cached partials are rebuilt
+    PARTIAL_VERSION = 1
+
+    # Global GDP observations kept (across regions, in region order)
+    GDP_OBSERVATION_LIMIT = 50
+
+    # CLI analysis sections rebuilt globally rather than taken from the US base
+    REPLACED_CLI_SECTIONS = (
+        "central_bank_economic_data",
+        "imf_global_data",
+        "cross_source_validation",
+    )
+
+    # Regional economy summaries taken from each region's own analysis
+    REGIONAL_SUMMARY_KEYS = {
+        "US": "us_economy",
+        "EUROPE": "european_economy",
+        "ASIA": "asian_economies",
+    }
+
+    def __init__(
+        self,
+        base_dir: str = None,
+        cache_file: Optional[str] = None,
+        date: Optional[str] = None,
+    ):
         """Initialize aggregator with discovery data directory"""
         if base_dir is None:
             self.base_dir = (
@@ -40,32 +80,328 @@ class GlobalMacroAggregator:
         else:
             self.base_dir = Path(base_dir)
 
+        if cache_file is None:
+            self.cache_file = (
+                Path(__file__).parent.parent
+                / "data"
+                / "cache"
+                / "global_macro_aggregator"
+                / "regional_partials.json"
+            )
+        else:
+            self.cache_file = Path(cache_file)
+
         self.regional_data = {}
-        self.today = datetime.now().strftime("%Y%m%d")
+        self.regional_partials: Dict[str, Dict[str, Any]] = {}
+        # Regional document each partial was derived from (absent for partials
+        # read from the cache), so replaced documents are re-extracted
+        self._partial_sources: Dict[str, Any] = {}
+        self.today = date or datetime.now().strftime("%Y%m%d")
+
+    def _regional_files(self) -> Dict[str, str]:
+        """Regional discovery file names for the aggregation date"""
+        return {
+            region: pattern.format(date=self.today)
+            for region, pattern in self.REGIONAL_FILES.items()
+        }
 
     def load_regional_data(self) -> None:
         """Load existing regional discovery files"""
-        regional_files = {
-            "US": f"US_{self.today}_discovery.json",
-            "AMERICAS": f"americas_{self.today}_discovery.json",
-            "EUROPE": f"europe_{self.today}_discovery.json",
-            "ASIA": f"asia_{self.today}_discovery.json",
-        }
-
-        for region, filename in regional_files.items():
+        for region, filename in self._regional_files().items():
             filepath = self.base_dir / filename
             if filepath.exists():
                 try:
-                    with open(filepath, "r") as f:
-                        self.regional_data[region] = json.load(f)
+                    self.regional_data[region] = read_json(filepath)
+                    self.regional_partials[region] = self._extract_regional_partial(
+                        region, self.regional_data[region]
+                    )
+                    self._partial_sources[region] = self.regional_data[region]
                     logger.info(f"✓ Loaded regional data: {region}")
                 except Exception as e:
                     logger.warning(f"Failed to load {region} data: {e}")
             else:
                 logger.warning(f"Regional file not found: {filepath}")
 
+    def load_regional_partials(self, force: bool = False) -> Dict[str, str]:
+        """
+        Load per-region partial aggregates, re-parsing only changed regions
+
+        A region's cached partial is reused when the SHA-256 of its discovery
+        file matches the hash stored with the partial. Changed or new files
+        are parsed and their partials recomputed and persisted. Cache entries
+        for files other than this date's regional files are pruned.
+
+        Args:
+            force: Recompute every region regardless of the cache
+
+        Returns:
+            Region -> "cached", "recomputed", "missing" or "failed"
+        """
+        regional_files = self._regional_files()
+        cache = self._load_partial_cache()
+        entries = cache["files"]
+        statuses = {}
+        partials = {}
+        sources = {}
+        self.regional_data = {}
+
+        stale = [name for name in entries if name not in regional_files.values()]
+        for name in stale:
+            del entries[name]
+        changed = bool(stale)
+
+        for region, filename in regional_files.items():
+            filepath = self.base_dir / filename
+            if not filepath.exists():
+                logger.warning(f"Regional file not found: {filepath}")
+                statuses[region] = "missing"
+                continue
+
+            try:
+                raw = filepath.read_bytes()
+                content_hash = hashlib.sha256(raw).hexdigest()
+                entry = entries.get(filename)
+                if (
+                    not force
+                    and entry is not None
+                    and entry.get("region") == region
+                    and entry.get("content_hash") == content_hash
+                ):
+                    partials[region] = entry["partial"]
+                    statuses[region] = "cached"
+                    continue
+
+                self.regional_data[region] = loads(raw)
+                partials[region] = self._extract_regional_partial(
+                    region, self.regional_data[region]
+                )
+                sources[region] = self.regional_data[region]
+                entries[filename] = {
+                    "region": region,
+                    "content_hash": content_hash,
+                    "computed_at": datetime.now().isoformat(),
+                    "partial": partials[region],
+                }
+                statuses[region] = "recomputed"
+                changed = True
+                logger.info(f"✓ Recomputed regional partial: {region}")
+            except Exception as e:
+                logger.warning(f"Failed to load {region} data: {e}")
+                statuses[region] = "failed"
+
+        self.regional_partials = partials
+        self._partial_sources = sources
+        if changed:
+            self._save_partial_cache(cache)
+        return statuses
+
+    def _load_partial_cache(self) -> Dict[str, Any]:
+        """Read persisted partials (empty cache on version mismatch or error)"""
+        empty = {"version": self.PARTIAL_VERSION, "files": {}}
+        if not self.cache_file.exists():
+            return empty
+        try:
+            cache = read_json(self.cache_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable partial cache {self.cache_file}: {e}")
+            return empty
+        if cache.get("version") != self.PARTIAL_VERSION:
+            return empty
+        cache.setdefault("files", {})
+        return cache
+
+    def _save_partial_cache(self, cache: Dict[str, Any]) -> None:
+        """Persist partials atomically next to their content hashes"""
+        write_json(cache, self.cache_file, compact=True)
+
+    def _extract_regional_partial(
+        self, region: str, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Reduce one regional discovery document to what the composites need
+
+        Keys are only present when the regional document provides them, so
+        composites treat a missing key exactly like a missing source field.
+        """
+        partial: Dict[str, Any] = {}
+
+        def lookup(*keys):
+            value = data
+            for key in keys:
+                value = value[key]
+            return value
+
+        def capture(name, *keys, errors=(KeyError,)):
+            try:
+                partial[name] = lookup(*keys)
+                return True
+            except errors:
+                return False
+
+        # Base documents taken from the benchmark region (sections the global
+        # composites replace are dropped to keep partials small)
+        if region == "US":
+            if capture("cli_comprehensive_analysis", "cli_comprehensive_analysis"):
+                partial["cli_comprehensive_analysis"] = {
+                    key: value
+                    for key, value in partial["cli_comprehensive_analysis"].items()
+                    if key not in self.REPLACED_CLI_SECTIONS
+                }
+            capture("economic_indicators", "economic_indicators")
+            capture("monetary_policy_context", "monetary_policy_context")
+
+        # Central bank data: GDP from every region, the rest from the US
+        try:
+            cb_data = lookup("cli_comprehensive_analysis", "central_bank_economic_data")
+            gdp_obs = []
+            if "gdp_data" in cb_data:
+                gdp_obs = cb_data["gdp_data"].get("observations", [])
+            partial["gdp_observations"] = (
+                gdp_obs[: self.GDP_OBSERVATION_LIMIT]
+                if isinstance(gdp_obs, list)
+                else []
+            )
+            if region == "US":
+                for key in (
+                    "employment_data",
+                    "inflation_data",
+                    "monetary_policy_data",
+                ):
+                    if key in cb_data:
+                        partial[key] = cb_data[key]
+        except (KeyError, TypeError) as e:
+            partial["central_bank_error"] = str(e)
+
+        capture(
+            "validation_score",
+            "cli_comprehensive_analysis",
+            "cross_source_validation",
+            "validation_score",
+        )
+        capture(
+            "business_cycle_score",
+            "economic_indicators",
+            "composite_scores",
+            "business_cycle_score",
+        )
+        capture(
+            "recession_probability",
+            "economic_indicators",
+            "composite_scores",
+            "recession_probability",
+        )
+        capture("business_cycle_data", "business_cycle_data")
+        capture("current_phase", "business_cycle_data", "current_phase")
+
+        try:
+            market_data = lookup("cli_market_intelligence")
+            if "risk_appetite" in market_data:
+                partial["cli_market_intelligence"] = market_data
+        except KeyError:
+            pass
+        capture(
+            "risk_appetite_level",
+            "cli_market_intelligence",
+            "risk_appetite",
+            "current_level",
+        )
+
+        summary_key = self.REGIONAL_SUMMARY_KEYS.get(region)
+        if summary_key:
+            try:
+                regional_context = data.get("global_economic_context", {}).get(
+                    "regional_analysis", {}
+                )
+                if summary_key in regional_context:
+                    partial["regional_summary"] = regional_context[summary_key]
+            except (KeyError, TypeError, AttributeError):
+                pass
+
+        capture("energy_market_integration", "energy_market_integration")
+
+        try:
+            service_data = lookup("cli_service_validation")
+            partial["service_health_scores"] = dict(
+                service_data["service_health_scores"]
+            )
+            partial["api_response_times"] = dict(
+                service_data.get("api_response_times", {})
+            )
+        except (KeyError, TypeError, AttributeError):
+            partial.pop("service_health_scores", None)
+
+        # Quality scores are collected in order and stop at the first gap
+        for name, keys in (
+            ("quality_score", ("cli_data_quality", "overall_quality_score")),
+            (
+                "completeness_score",
+                (
+                    "cli_data_quality",
+                    "completeness_metrics",
+                    "required_indicators_coverage",
+                ),
+            ),
+            (
+                "consistency_score",
+                (
+                    "cli_data_quality",
+                    "consistency_validation",
+                    "cross_source_consistency",
+                ),
+            ),
+        ):
+            if not capture(name, *keys, errors=(KeyError, TypeError)):
+                break
+
+        try:
+            insights_data = lookup("cli_insights")
+            partial["risk_alerts"] = insights_data.get("risk_alerts", [])
+            partial["opportunity_identification"] = insights_data.get(
+                "opportunity_identification", []
+            )
+        except (KeyError, TypeError, AttributeError):
+            pass
+
+        capture(
+            "discovery_confidence",
+            "data_quality_assessment",
+            "confidence_scores",
+            "discovery_confidence",
+            errors=(KeyError, TypeError),
+        )
+
+        return partial
+
+    def _sync_partials(self) -> None:
+        """
+        Keep partials in step with regional documents assigned without loading
+
+        Partials are derived for new or replaced documents and dropped when
+        their document is removed from regional_data.
+        """
+        for region in list(self._partial_sources):
+            if region not in self.regional_data:
+                del self._partial_sources[region]
+                self.regional_partials.pop(region, None)
+
+        for region, data in self.regional_data.items():
+            if self._partial_sources.get(region) is not data:
+                self.regional_partials[region] = self._extract_regional_partial(
+                    region, data
+                )
+                self._partial_sources[region] = data
+
+    def _partial_values(self, name: str) -> List[Any]:
+        """One field across every region that provides it, in region order"""
+        return [
+            partial[name]
+            for partial in self.regional_partials.values()
+            if name in partial
+        ]
+
     def aggregate_global_analysis(self) -> Dict[str, Any]:
         """Create comprehensive global macro-economic discovery analysis"""
+        self._sync_partials()
         global_analysis = {
             "metadata": self._create_global_metadata(),
             "cli_comprehensive_analysis": self._aggregate_cli_analysis(),
@@ -111,8 +447,9 @@ class GlobalMacroAggregator:
     def _aggregate_cli_analysis(self) -> Dict[str, Any]:
         """Aggregate CLI analysis from all regions"""
         # Start with US data as the base and supplement with global context
-        if "US" in self.regional_data:
-            base_data = self.regional_data["US"]["cli_comprehensive_analysis"].copy()
+        us_partial = self.regional_partials.get("US", {})
+        if "cli_comprehensive_analysis" in us_partial:
+            base_data = us_partial["cli_comprehensive_analysis"].copy()
         else:
             # Create base structure
             base_data = {
@@ -133,40 +470,32 @@ class GlobalMacroAggregator:
         """Aggregate central bank data across regions"""
         # Collect GDP data from all regions
         gdp_observations = []
-        employment_data = {}
-        inflation_data = {}
-        monetary_data = {}
-
-        for region, data in self.regional_data.items():
-            try:
-                cb_data = data["cli_comprehensive_analysis"][
-                    "central_bank_economic_data"
-                ]
-
-                # Aggregate GDP data
-                if "gdp_data" in cb_data:
-                    gdp_obs = cb_data["gdp_data"].get("observations", [])
-                    if isinstance(gdp_obs, list):
-                        gdp_observations.extend(gdp_obs)
-
-                # Get representative employment data (use US if available)
-                if region == "US" and "employment_data" in cb_data:
-                    employment_data = cb_data["employment_data"]
-
-                # Get representative inflation data (use US if available)
-                if region == "US" and "inflation_data" in cb_data:
-                    inflation_data = cb_data["inflation_data"]
+        employment_data: Dict[str, Any] = {}
+        inflation_data: Dict[str, Any] = {}
+        monetary_data: Dict[str, Any] = {}
+
+        for region, partial in self.regional_partials.items():
+            if "central_bank_error" in partial:
+                logger.warning(
+                    f"Could not aggregate data from {region}: "
+                    f"{partial['central_bank_error']}"
+                )
+                continue
 
-                # Get representative monetary policy data (use US Fed data)
-                if region == "US" and "monetary_policy_data" in cb_data:
-                    monetary_data = cb_data["monetary_policy_data"]
+            # Aggregate GDP data
+            gdp_observations.extend(partial.get("gdp_observations", []))
 
-            except (KeyError, TypeError) as e:
-                logger.warning(f"Could not aggregate data from {region}: {e}")
+            # Representative employment, inflation and monetary policy data
+            # (US Fed data, present only in the US partial)
+            employment_data = partial.get("employment_data", employment_data)
+            inflation_data = partial.get("inflation_data", inflation_data)
+            monetary_data = partial.get("monetary_policy_data", monetary_data)
 
         return {
             "gdp_data": {
-                "observations": gdp_observations[:50],  # Limit to recent observations
+                "observations": gdp_observations[
+                    : self.GDP_OBSERVATION_LIMIT
+                ],  # Limit to recent observations
                 "analysis": "Global GDP growth showing regional divergence with developed markets moderating while emerging markets show resilience",
                 "confidence": 0.89,
             },
@@ -268,15 +597,7 @@ class GlobalMacroAggregator:
     def _calculate_global_validation(self) -> Dict[str, Any]:
         """Calculate cross-source validation for global data"""
         # Aggregate validation scores from regions
-        validation_scores = []
-        for data in self.regional_data.values():
-            try:
-                score = data["cli_comprehensive_analysis"]["cross_source_validation"][
-                    "validation_score"
-                ]
-                validation_scores.append(score)
-            except KeyError:
-                continue
+        validation_scores = self._partial_values("validation_score")
 
         avg_score = np.mean(validation_scores) if validation_scores else 0.85
 
@@ -289,8 +610,9 @@ class GlobalMacroAggregator:
     def _aggregate_economic_indicators(self) -> Dict[str, Any]:
         """Aggregate economic indicators across regions"""
         # Use US data as base and enhance with global context
-        if "US" in self.regional_data:
-            indicators = self.regional_data["US"]["economic_indicators"].copy()
+        us_partial = self.regional_partials.get("US", {})
+        if "economic_indicators" in us_partial:
+            indicators = us_partial["economic_indicators"].copy()
         else:
             indicators = self._create_default_indicators()
 
@@ -369,15 +691,7 @@ class GlobalMacroAggregator:
     def _calculate_global_business_cycle_score(self) -> float:
         """Calculate global business cycle score"""
         # Aggregate scores from regions if available
-        scores = []
-        for data in self.regional_data.values():
-            try:
-                score = data["economic_indicators"]["composite_scores"][
-                    "business_cycle_score"
-                ]
-                scores.append(score)
-            except KeyError:
-                continue
+        scores = self._partial_values("business_cycle_score")
 
         if scores:
             # Weight by economic size (simplified)
@@ -390,15 +704,7 @@ class GlobalMacroAggregator:
     def _calculate_global_recession_probability(self) -> float:
         """Calculate global recession probability"""
         # Aggregate probabilities from regions
-        probabilities = []
-        for data in self.regional_data.values():
-            try:
-                prob = data["economic_indicators"]["composite_scores"][
-                    "recession_probability"
-                ]
-                probabilities.append(prob)
-            except KeyError:
-                continue
+        probabilities = self._partial_values("recession_probability")
 
         if probabilities:
             # Use maximum probability (most pessimistic view)
@@ -410,16 +716,12 @@ class GlobalMacroAggregator:
         """Aggregate business cycle analysis"""
         # Use most representative regional data (US preferred)
         for region in ["US", "AMERICAS", "EUROPE", "ASIA"]:
-            if region in self.regional_data:
-                try:
-                    cycle_data = self.regional_data[region][
-                        "business_cycle_data"
-                    ].copy()
-                    # Enhance with global perspective
-                    cycle_data["current_phase"] = self._determine_global_cycle_phase()
-                    return cycle_data
-                except KeyError:
-                    continue
+            partial = self.regional_partials.get(region, {})
+            if "business_cycle_data" in partial:
+                cycle_data = partial["business_cycle_data"].copy()
+                # Enhance with global perspective
+                cycle_data["current_phase"] = self._determine_global_cycle_phase()
+                return cycle_data
 
         # Default business cycle data
         return {
@@ -439,18 +741,10 @@ class GlobalMacroAggregator:
 
     def _determine_global_cycle_phase(self) -> str:
         """Determine global business cycle phase"""
-        phases = []
-        for data in self.regional_data.values():
-            try:
-                phase = data["business_cycle_data"]["current_phase"]
-                phases.append(phase)
-            except KeyError:
-                continue
+        phases = self._partial_values("current_phase")
 
         if phases:
             # Return most common phase or 'expansion' if tied
-            from collections import Counter
-
             phase_counts = Counter(phases)
             return phase_counts.most_common(1)[0][0]
 
@@ -459,11 +753,9 @@ class GlobalMacroAggregator:
     def _aggregate_monetary_policy(self) -> Dict[str, Any]:
         """Aggregate monetary policy context"""
         # Use US Fed data as global benchmark
-        if "US" in self.regional_data:
-            try:
-                return self.regional_data["US"]["monetary_policy_context"].copy()
-            except KeyError:
-                pass
+        us_partial = self.regional_partials.get("US", {})
+        if "monetary_policy_context" in us_partial:
+            return us_partial["monetary_policy_context"].copy()
 
         # Default monetary policy context
         return {
@@ -514,18 +806,15 @@ class GlobalMacroAggregator:
         """Aggregate market intelligence"""
         # Use most comprehensive regional data
         for region in ["US", "AMERICAS", "EUROPE"]:
-            if region in self.regional_data:
-                try:
-                    market_data = self.regional_data[region][
-                        "cli_market_intelligence"
-                    ].copy()
-                    # Enhance with global perspective
-                    market_data["risk_appetite"][
-                        "current_level"
-                    ] = self._assess_global_risk_appetite()
-                    return market_data
-                except KeyError:
-                    continue
+            partial = self.regional_partials.get(region, {})
+            if "cli_market_intelligence" in partial:
+                # Deep copy so the cached partial is not modified
+                market_data = copy.deepcopy(partial["cli_market_intelligence"])
+                # Enhance with global perspective
+                market_data["risk_appetite"][
+                    "current_level"
+                ] = self._assess_global_risk_appetite()
+                return market_data
 
         # Default market intelligence
         return {
@@ -562,15 +851,7 @@ class GlobalMacroAggregator:
 
     def _assess_global_risk_appetite(self) -> str:
         """Assess global risk appetite"""
-        risk_levels = []
-        for data in self.regional_data.values():
-            try:
-                level = data["cli_market_intelligence"]["risk_appetite"][
-                    "current_level"
-                ]
-                risk_levels.append(level)
-            except KeyError:
-                continue
+        risk_levels = self._partial_values("risk_appetite_level")
 
         if risk_levels:
             # Convert to numerical and average
@@ -622,45 +903,33 @@ class GlobalMacroAggregator:
         """Create summary of regional economies"""
         summary = {}
 
-        for region, data in self.regional_data.items():
-            try:
-                regional_context = data.get("global_economic_context", {}).get(
-                    "regional_analysis", {}
-                )
-
-                if region == "US":
-                    summary["us_economy"] = regional_context.get(
-                        "us_economy",
-                        {
-                            "growth_outlook": "moderate_expansion",
-                            "policy_stance": "neutral_with_easing_bias",
-                            "key_risks": [
-                                "inflation_persistence",
-                                "labor_market_tightness",
-                            ],
-                        },
-                    )
-                elif region == "EUROPE":
-                    summary["european_economy"] = regional_context.get(
-                        "european_economy",
-                        {
-                            "growth_outlook": "below_trend",
-                            "policy_stance": "accommodative",
-                            "key_risks": ["energy_prices", "geopolitical_tensions"],
-                        },
-                    )
-                elif region == "ASIA":
-                    summary["asian_economies"] = regional_context.get(
-                        "asian_economies",
-                        {
-                            "growth_outlook": "resilient",
-                            "policy_stance": "mixed_across_countries",
-                            "key_risks": ["china_slowdown", "property_sector"],
-                        },
-                    )
+        default_summaries = {
+            "us_economy": {
+                "growth_outlook": "moderate_expansion",
+                "policy_stance": "neutral_with_easing_bias",
+                "key_risks": [
+                    "inflation_persistence",
+                    "labor_market_tightness",
+                ],
+            },
+            "european_economy": {
+                "growth_outlook": "below_trend",
+                "policy_stance": "accommodative",
+                "key_risks": ["energy_prices", "geopolitical_tensions"],
+            },
+            "asian_economies": {
+                "growth_outlook": "resilient",
+                "policy_stance": "mixed_across_countries",
+                "key_risks": ["china_slowdown", "property_sector"],
+            },
+        }
 
-            except (KeyError, TypeError):
-                continue
+        for region, partial in self.regional_partials.items():
+            summary_key = self.REGIONAL_SUMMARY_KEYS.get(region)
+            if summary_key:
+                summary[summary_key] = partial.get(
+                    "regional_summary", default_summaries[summary_key]
+                )
 
         # Add emerging markets summary
         summary["emerging_markets"] = {
@@ -678,12 +947,9 @@ class GlobalMacroAggregator:
     def _aggregate_energy_markets(self) -> Dict[str, Any]:
         """Aggregate energy market analysis"""
         # Use any available regional energy data
-        for region in self.regional_data.values():
-            try:
-                energy_data = region["energy_market_integration"]
-                return energy_data.copy()
-            except KeyError:
-                continue
+        energy_data = self._partial_values("energy_market_integration")
+        if energy_data:
+            return energy_data[0].copy()
 
         # Default energy market data
         return {
@@ -751,24 +1017,17 @@ class GlobalMacroAggregator:
         health_scores = {}
         response_times = {}
 
-        for region, data in self.regional_data.items():
-            try:
-                service_data = data["cli_service_validation"]
-
-                # Aggregate health scores
-                for service, score in service_data["service_health_scores"].items():
-                    if service not in health_scores:
-                        health_scores[service] = []
-                    health_scores[service].append(score)
+        for partial in self.regional_partials.values():
+            if "service_health_scores" not in partial:
+                continue
 
-                # Aggregate response times
-                for service, time in service_data.get("api_response_times", {}).items():
-                    if service not in response_times:
-                        response_times[service] = []
-                    response_times[service].append(time)
+            # Aggregate health scores
+            for service, score in partial["service_health_scores"].items():
+                health_scores.setdefault(service, []).append(score)
 
-            except (KeyError, TypeError):
-                continue
+            # Aggregate response times
+            for service, time in partial["api_response_times"].items():
+                response_times.setdefault(service, []).append(time)
 
         # Calculate averages
         avg_health_scores = {
@@ -799,22 +1058,9 @@ class GlobalMacroAggregator:
 
     def _aggregate_data_quality(self) -> Dict[str, Any]:
         """Aggregate data quality metrics"""
-        quality_scores = []
-        completeness_scores = []
-        consistency_scores = []
-
-        for data in self.regional_data.values():
-            try:
-                quality_data = data["cli_data_quality"]
-                quality_scores.append(quality_data["overall_quality_score"])
-                completeness_scores.append(
-                    quality_data["completeness_metrics"]["required_indicators_coverage"]
-                )
-                consistency_scores.append(
-                    quality_data["consistency_validation"]["cross_source_consistency"]
-                )
-            except (KeyError, TypeError):
-                continue
+        quality_scores = self._partial_values("quality_score")
+        completeness_scores = self._partial_values("completeness_score")
+        consistency_scores = self._partial_values("consistency_score")
 
         return {
             "overall_quality_score": round(
@@ -837,20 +1083,12 @@ class GlobalMacroAggregator:
 
     def _aggregate_insights(self) -> Dict[str, Any]:
         """Aggregate insights from regional analyses"""
-        all_insights = []
         all_risks = []
         all_opportunities = []
 
-        for data in self.regional_data.values():
-            try:
-                insights_data = data["cli_insights"]
-                all_insights.extend(insights_data.get("primary_insights", []))
-                all_risks.extend(insights_data.get("risk_alerts", []))
-                all_opportunities.extend(
-                    insights_data.get("opportunity_identification", [])
-                )
-            except (KeyError, TypeError):
-                continue
+        for partial in self.regional_partials.values():
+            all_risks.extend(partial.get("risk_alerts", []))
+            all_opportunities.extend(partial.get("opportunity_identification", []))
 
         # Create global insights
         global_insights = [
@@ -1007,15 +1245,7 @@ class GlobalMacroAggregator:
     def _assess_global_quality(self) -> Dict[str, Any]:
         """Assess overall global data quality"""
         # Calculate quality metrics from regional aggregation
-        quality_scores = []
-        for data in self.regional_data.values():
-            try:
-                quality_data = data["data_quality_assessment"]
-                quality_scores.append(
-                    quality_data["confidence_scores"]["discovery_confidence"]
-                )
-            except (KeyError, TypeError):
-                continue
+        quality_scores = self._partial_values("discovery_confidence")
 
         discovery_confidence = np.mean(quality_scores) if quality_scores else 0.88
 
@@ -1041,7 +1271,7 @@ class GlobalMacroAggregator:
         cached_data = {}
 
         # Reference the regional files used
-        for region in self.regional_data.keys():
+        for region in self.regional_partials.keys():
             cached_data[f"{region}_DISCOVERY"] = {
                 "file_path": f"./data/outputs/macro_analysis/discovery/{region.lower()}_{self.today}_discovery.json",
                 "last_updated": datetime.now().isoformat(),
@@ -1065,8 +1295,10 @@ class GlobalMacroAggregator:
     def _validate_global_quality(self) -> Dict[str, Any]:
         """Validate global analysis quality"""
         # Calculate scores based on regional data availability and quality
-        service_availability = len(self.regional_data) >= 3  # Need at least 3 regions
-        data_completeness = len(self.regional_data) >= 3
+        service_availability = (
+            len(self.regional_partials) >= 3
+        )  # Need at least 3 regions
+        data_completeness = len(self.regional_partials) >= 3
         cross_source_consistency = (
             True  # Based on aggregation from validated regional data
         )
@@ -1121,19 +1353,8 @@ class GlobalMacroAggregator:
         # Generate the analysis
         global_analysis = self.aggregate_global_analysis()
 
-        # Save to file with custom JSON encoder for numpy types
-        class NumpyEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, (np.integer, np.floating)):
-                    return obj.item()
-                elif isinstance(obj, np.ndarray):
-                    return obj.tolist()
-                elif isinstance(obj, np.bool_):
-                    return bool(obj)
-                return super(NumpyEncoder, self).default(obj)
-
-        with open(output_path, "w") as f:
-            json.dump(global_analysis, f, indent=2, cls=NumpyEncoder)
+        # numpy values are encoded natively by the shared serializer
+        write_json(global_analysis, output_path)
 
         logger.info(f"✓ Global analysis saved to: {output_path}")
         return str(output_path)
@@ -1145,19 +1366,34 @@ def main():
         level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
     )
 
-    aggregator = GlobalMacroAggregator()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Global macro discovery aggregator")
+    parser.add_argument("--date", help="Regional discovery date (YYYYMMDD)")
+    parser.add_argument("--output", help="Output path for the global analysis")
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Re-parse every region instead of reusing cached partials",
+    )
+    args = parser.parse_args()
+
+    aggregator = GlobalMacroAggregator(date=args.date)
 
-    # Load regional data
-    aggregator.load_regional_data()
+    # Load regional partials (only refreshed regions are re-parsed)
+    statuses = aggregator.load_regional_partials(force=args.full_rebuild)
 
-    if not aggregator.regional_data:
+    if not aggregator.regional_partials:
         logger.error("No regional data found to aggregate")
         return
 
-    logger.info(f"Loaded {len(aggregator.regional_data)} regional datasets")
+    logger.info(
+        f"Loaded {len(aggregator.regional_partials)} regional datasets "
+        f"({sum(1 for s in statuses.values() if s == 'cached')} from cache)"
+    )
 
     # Generate and save global analysis
-    output_path = aggregator.save_global_analysis()
+    output_path = aggregator.save_global_analysis(args.output)
 
     # Validate schema compliance
     try:
@@ -1165,15 +1401,10 @@ def main():
             Path(__file__).parent / "schemas" / "macro_analysis_discovery_schema.json"
         )
         if schema_path.exists():
-            import jsonschema
-
-            with open(schema_path, "r") as f:
-                schema = json.load(f)
-
-            with open(output_path, "r") as f:
-                analysis = json.load(f)
+            from utils.schema_registry import get_schema_registry
 
-            jsonschema.validate(analysis, schema)
+            analysis = read_json(output_path)
+            get_schema_registry().get_validator(schema_path).validate(analysis)
             logger.info("✓ Schema validation passed")
         else:
             logger.warning("Schema file not found - skipping validation")
@@ -1183,8 +1414,8 @@ def main():
 
     # Print summary
     print("\n✓ Global macro-economic discovery analysis completed")
-    print("Output: {output_path}")
-    print("Regional data sources: {list(aggregator.regional_data.keys())}")
+    print(f"Output: {output_path}")
+    print(f"Regional data sources: {list(aggregator.regional_partials.keys())}")
     print("Institutional grade: Ready for analyze phase")
 
 
@@ -19,6 +19,8 @@ import plotly.graph_objects as go
 import plotly.io as pio
 from plotly.subplots import make_subplots
 
+from utils.markdown_report_tokenizer import MarkdownReport, load_report
+
 
 class LiveSignalsDashboard:
     """Generate interactive Plotly dashboards for live signals data"""
@@ -103,59 +105,55 @@ class LiveSignalsDashboard:
 
     def parse_live_signals_report(self, file_path: Path) -> Dict[str, Any]:
         """Parse live signals markdown report and extract structured data"""
-        with open(file_path, "r") as f:
-            content = f.read()
+        report = load_report(file_path)
 
         data = {
-            "metadata": self._extract_metadata(content),
-            "portfolio_overview": self._extract_portfolio_overview(content),
-            "positions": self._extract_positions_table(content),
-            "performance_metrics": self._extract_performance_metrics(content),
-            "composition": self._extract_composition_data(content),
+            "metadata": self._extract_metadata(report),
+            "portfolio_overview": self._extract_portfolio_overview(report),
+            "positions": self._extract_positions_table(report),
+            "performance_metrics": self._extract_performance_metrics(report),
+            "composition": self._extract_composition_data(report.content),
         }
 
         return data
 
-    def _extract_metadata(self, content: str) -> Dict[str, Any]:
-        """Extract report metadata"""
-        lines = content.split("\n")
-        header_line = lines[1] if len(lines) > 1 else ""
+    def _extract_metadata(self, report: MarkdownReport) -> Dict[str, Any]:
+        """Extract report metadata from the header line"""
+        # Header line: **Portfolio**: <name> | **Date**: <date> | **Type**: <type>
+        header_fields = {
+            field.key.lower(): field.value
+            for field in report.fields
+            if field.line == 2 and field.bold
+        }
 
         metadata = {}
-        # Extract portfolio, date, type from header
-        if "Portfolio" in header_line:
-            portfolio_match = re.search(r"\*\*Portfolio\*\*:\s*([^|]+)", header_line)
-            if portfolio_match:
-                metadata["portfolio"] = portfolio_match.group(1).strip()
-
-        if "Date" in header_line:
-            date_match = re.search(r"\*\*Date\*\*:\s*([^|]+)", header_line)
-            if date_match:
-                metadata["date"] = date_match.group(1).strip()
-
-        if "Type" in header_line:
-            type_match = re.search(r"\*\*Type\*\*:\s*(.+)", header_line)
-            if type_match:
-                metadata["type"] = type_match.group(1).strip()
+        for key in ("portfolio", "date", "type"):
+            if key in header_fields:
+                metadata[key] = header_fields[key].strip()
 
         return metadata
 
-    def _extract_portfolio_overview(self, content: str) -> Dict[str, Any]:
+    def _extract_portfolio_overview(self, report: MarkdownReport) -> Dict[str, Any]:
         """Extract portfolio overview metrics"""
         overview = {}
 
-        # Extract key metrics using regex patterns
+        # Field key -> value pattern
         patterns = {
-            "active_positions": r"Active Positions\*\*:\s*(\d+)",
-            "portfolio_performance": r"Portfolio Performance\*\*:\s*([+\-]?\d+\.?\d*%)",
-            "unrealized_pnl": r"Unrealized P&L\*\*:\s*([+\-]?\$[\d,]+\.?\d*)",
-            "average_position_age": r"Average Position Age\*\*:\s*(\d+\.?\d*)\s*days",
+            "active_positions": ("Active Positions", r"^(\d+)"),
+            "portfolio_performance": (
+                "Portfolio Performance",
+                r"^([+\-]?\d+\.?\d*%)",
+            ),
+            "unrealized_pnl": ("Unrealized P&L", r"^([+\-]?\$[\d,]+\.?\d*)"),
+            "average_position_age": (
+                "Average Position Age",
+                r"^(\d+\.?\d*)\s*days",
+            ),
         }
 
-        for key, pattern in patterns.items():
-            match = re.search(pattern, content)
-            if match:
-                value = match.group(1)
+        for key, (field_key, pattern) in patterns.items():
+            value = report.get(field_key, pattern)
+            if value is not None:
                 # Clean numeric values
                 if key == "portfolio_performance":
                     overview[key] = float(value.replace("%", ""))
@@ -168,62 +166,61 @@ class LiveSignalsDashboard:
 
         return overview
 
-    def _extract_positions_table(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_positions_table(self, report: MarkdownReport) -> List[Dict[str, Any]]:
         """Extract positions from the complete active positions table"""
         positions = []
 
-        # Find the table section
-        table_start = content.find("## 📋 Complete Active Positions Table")
-        if table_start == -1:
+        section = report.find_section(r"Complete Active Positions Table")
+        if section is None:
+            return positions
+
+        tables = [
+            table
+            for child in section.walk()
+            for table in child.tables
+            if table.has_columns("Rank", "Ticker")
+        ]
+        if not tables:
             return positions
 
-        table_section = content[table_start:]
-        lines = table_section.split("\n")
-
-        # Find the actual table data (skip headers and separators)
-        table_data_started = False
-        for line in lines:
-            if "|" in line and not line.strip().startswith("|---"):
-                if "Rank" in line and "Ticker" in line:
-                    table_data_started = True
-                    continue
-                if table_data_started and line.strip().startswith("|"):
-                    parts = [p.strip() for p in line.split("|")]
-                    if len(parts) >= 8:  # Ensure we have all columns
-                        try:
-                            position = {
-                                "rank": int(parts[1]) if parts[1].isdigit() else 0,
-                                "ticker": parts[2],
-                                "strategy": parts[3],
-                                "entry_date": parts[4],
-                                "days_held": int(parts[5]) if parts[5].isdigit() else 0,
-                                "current_return": self._parse_percentage(parts[6]),
-                                "trend_status": parts[7],
-                                "risk_level": parts[8] if len(parts) > 8 else "Medium",
-                            }
-                            positions.append(position)
-                        except (ValueError, IndexError):
-                            continue
+        # | Rank | Ticker | Strategy | Entry Date | Days Held | Return | Trend | Risk |
+        for row in tables[0].rows:
+            if len(row) < 6:
+                continue
+            try:
+                position = {
+                    "rank": int(row[0]) if row[0].isdigit() else 0,
+                    "ticker": row[1],
+                    "strategy": row[2],
+                    "entry_date": row[3],
+                    "days_held": int(row[4]) if row[4].isdigit() else 0,
+                    "current_return": self._parse_percentage(row[5]),
+                    "trend_status": row[6] if len(row) > 6 else "",
+                    "risk_level": row[7] if len(row) > 7 else "Medium",
+                }
+                positions.append(position)
+            except (ValueError, IndexError):
+                continue
 
         return positions
 
-    def _extract_performance_metrics(self, content: str) -> Dict[str, Any]:
+    def _extract_performance_metrics(self, report: MarkdownReport) -> Dict[str, Any]:
         """Extract historical performance metrics"""
         metrics = {}
 
+        # Field key -> value pattern
         patterns = {
-            "total_closed_signals": r"Total Closed Signals\*\*:\s*(\d+)",
-            "win_rate": r"Win Rate\*\*:\s*([\d.]+)%",
-            "profit_factor": r"Profit Factor\*\*:\s*([\d.]+)",
-            "average_win": r"Average Win\*\*:\s*([+\-]?[\d.]+)%",
-            "average_loss": r"Average Loss\*\*:\s*([+\-]?[\d.]+)%",
-            "best_trade": r"Best Closed Trade\*\*:\s*\w+\s*([+\-]?[\d.]+)%",
+            "total_closed_signals": ("Total Closed Signals", r"^(\d+)"),
+            "win_rate": ("Win Rate", r"^([\d.]+)%"),
+            "profit_factor": ("Profit Factor", r"^([\d.]+)"),
+            "average_win": ("Average Win", r"^([+\-]?[\d.]+)%"),
+            "average_loss": ("Average Loss", r"^([+\-]?[\d.]+)%"),
+            "best_trade": ("Best Closed Trade", r"^\w+\s*([+\-]?[\d.]+)%"),
         }
 
-        for key, pattern in patterns.items():
-            match = re.search(pattern, content)
-            if match:
-                value = match.group(1)
+        for key, (field_key, pattern) in patterns.items():
+            value = report.get(field_key, pattern)
+            if value is not None:
                 if key in ["win_rate", "average_win", "average_loss", "best_trade"]:
                     metrics[key] = float(value)
                 elif key == "profit_factor":
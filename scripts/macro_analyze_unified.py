@@ -23,6 +23,7 @@ from utils.dynamic_confidence_framework import DynamicConfidenceEngine
 from utils.economic_calendar_framework import EconomicCalendarEngine
 from utils.enhanced_economic_forecasting import EconomicForecastingEngine
 from utils.geopolitical_risk_framework import GeopoliticalRiskEngine
+from utils.json_serialization import to_serializable, write_json
 from utils.market_regime_framework import MarketRegimeEngine
 from utils.policy_transmission_framework import PolicyTransmissionEngine
 from utils.sector_correlation_framework import SectorCorrelationEngine
@@ -1311,17 +1312,9 @@ class UnifiedMacroAnalyzer:
         )
 
         # Convert any dataclass objects to dictionaries for JSON serialization
-        def convert_to_serializable(obj):
-            if hasattr(obj, "to_dict"):
-                return obj.to_dict()
-            elif isinstance(obj, dict):
-                return {k: convert_to_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_to_serializable(item) for item in obj]
-            else:
-                return obj
-
-        transmission_analysis = convert_to_serializable(transmission_analysis)
+        transmission_analysis = to_serializable(
+            transmission_analysis, fallback=lambda value: value
+        )
 
         print(
             "✓ Enhanced multi-channel policy transmission analysis completed successfully"
@@ -2644,8 +2637,7 @@ def main():
     output_file = output_dir / f"{region}_{date}_analysis.json"
 
     # Save analysis output
-    with open(output_file, "w") as f:
-        json.dump(analysis_output, f, indent=2)
+    write_json(analysis_output, output_file)
 
     print("Analysis complete: {output_file}")
 
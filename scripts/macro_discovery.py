@@ -27,7 +27,6 @@ Usage:
     python scripts/macro_discovery.py --region US --indicators all
 """
 
-import json
 import logging
 import subprocess
 import sys
@@ -37,24 +36,9 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
-
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder for datetime objects"""
-
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return super().default(obj)
-
-
 # Import configuration manager and schema selector (always required)
 from utils.config_manager import ConfigManager, ConfigurationError
+from utils.json_serialization import dumps, write_json
 from utils.schema_selector import create_schema_selector, get_schema_for_region
 
 
@@ -3321,14 +3305,7 @@ class MacroEconomicDiscovery:
             )
             output_file = self.output_dir / output_filename
 
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    discovery_output,
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                    cls=DateTimeEncoder,
-                )
+            write_json(discovery_output, output_file)
 
             logger.info(f"Macro-economic discovery output saved to: {output_file}")
 
@@ -4115,7 +4092,7 @@ def main():
     result = discovery.execute_discovery()
 
     if args.output_format == "json":
-        print(json.dumps(result, indent=2, cls=DateTimeEncoder))
+        print(dumps(result))
     else:
         # Print summary
         print("\n" + "=" * 60)
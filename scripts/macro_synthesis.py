@@ -17,7 +17,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # Import Jinja2 for template rendering
 try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    from jinja2 import Environment
+
+    from utils.template_registry import get_template_environment
 
     JINJA2_AVAILABLE = True
 except ImportError:
@@ -113,9 +115,9 @@ class MacroEconomicSynthesis:
             return None
 
         try:
-            env = Environment(
-                loader=FileSystemLoader(self.template_dir),
-                autoescape=select_autoescape(["html", "xml"]),
+            env = get_template_environment(
+                self.template_dir,
+                autoescape=["html", "xml"],
                 trim_blocks=True,
                 lstrip_blocks=True,
             )
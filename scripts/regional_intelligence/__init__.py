@@ -3,8 +3,13 @@ Regional Intelligence Module
 Provides sophisticated region-specific economic intelligence and configuration management
 """
 
-from .currency_analyzer import CurrencyAnalyzer
+from .currency_analyzer import CurrencyAnalyzer, CurrencyMatrices
 from .indicator_mapper import IndicatorMapper
 from .regional_loader import RegionalIntelligenceLoader
 
-__all__ = ["RegionalIntelligenceLoader", "CurrencyAnalyzer", "IndicatorMapper"]
+__all__ = [
+    "RegionalIntelligenceLoader",
+    "CurrencyAnalyzer",
+    "CurrencyMatrices",
+    "IndicatorMapper",
+]
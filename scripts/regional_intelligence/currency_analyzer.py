@@ -1,15 +1,32 @@
 #!/usr/bin/env python3
 """
 Currency Analyzer
-Advanced currency-specific analysis including REER, PPP, carry trade dynamics
+Advanced currency-specific analysis including REER, PPP, carry trade dynamics,
+plus cross-currency correlation, carry and PPP deviation matrices
 """
 
+import hashlib
+import threading
 from dataclasses import dataclass
+from datetime import date
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 
+# Currencies covered by matrix mode unless others are requested
+MATRIX_CURRENCIES = ("USD", "EUR", "JPY", "GBP", "CHF", "CAD", "AUD", "CNY")
+
+# Minimum overlapping returns before an observed correlation replaces the
+# regime estimate
+MIN_CORRELATION_OBSERVATIONS = 20
+
+# As-of dates kept in the matrix cache
+MATRIX_CACHE_SIZE = 8
+
+# Matrix cache key: (as-of date, currencies, market regime, input digest)
+_MatrixKey = Tuple[str, Tuple[str, ...], str, str]
+
 
 class CurrencyRegime(Enum):
     """Currency regime classification"""
@@ -42,6 +59,102 @@ class CurrencyAnalysis:
     intervention_probability: float
 
 
+@dataclass
+class CurrencyMatrices:
+    """
+    Cross-currency matrices as of one date
+
+    Row and column order follow currencies. Exchange rates are expressed as
+    USD per unit of each currency.
+    """
+
+    as_of: str
+    currencies: List[str]
+    market_regime: str
+    correlation: np.ndarray  # Return correlation (regime estimate if unobserved)
+    correlation_observed: np.ndarray  # True where computed from rate series
+    carry: np.ndarray  # Policy rate of row minus column (% p.a.)
+    carry_to_risk: np.ndarray  # Carry per unit of annualized pair volatility
+    ppp_deviation: np.ndarray  # % over(+)/under(-)valuation of row vs column
+    observations: int  # Aligned returns behind observed correlations
+
+    def pair(self, base: str, quote: str) -> Dict[str, Optional[float]]:
+        """Matrix entries for holding base funded in quote"""
+        i, j = self.currencies.index(base), self.currencies.index(quote)
+        return {
+            "correlation": _finite_or_none(self.correlation[i, j]),
+            "carry": _finite_or_none(self.carry[i, j]),
+            "carry_to_risk": _finite_or_none(self.carry_to_risk[i, j]),
+            "ppp_deviation": _finite_or_none(self.ppp_deviation[i, j]),
+        }
+
+    def currency_profile(self, currency_code: str) -> Dict[str, Any]:
+        """One currency's row summarized for regional analysis"""
+        i = self.currencies.index(currency_code)
+        others = [j for j in range(len(self.currencies)) if j != i]
+        profile: Dict[str, Any] = {"currency": currency_code}
+        if others:
+            correlations = self.correlation[i, others]
+            profile["most_correlated"] = self.currencies[
+                others[int(np.argmax(correlations))]
+            ]
+            profile["least_correlated"] = self.currencies[
+                others[int(np.argmin(correlations))]
+            ]
+            carry_to_risk = self.carry_to_risk[i, others]
+            if np.isfinite(carry_to_risk).any():
+                profile["best_funding_currency"] = self.currencies[
+                    others[int(np.nanargmax(carry_to_risk))]
+                ]
+        if "USD" in self.currencies:
+            usd = self.currencies.index("USD")
+            profile["carry_vs_usd"] = _finite_or_none(self.carry[i, usd])
+            profile["ppp_deviation_vs_usd"] = _finite_or_none(
+                self.ppp_deviation[i, usd]
+            )
+        return profile
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready matrices (unavailable entries as None)"""
+        return {
+            "as_of": self.as_of,
+            "currencies": list(self.currencies),
+            "market_regime": self.market_regime,
+            "observations": self.observations,
+            "correlation": _matrix_to_lists(self.correlation, 3),
+            "correlation_observed": self.correlation_observed.tolist(),
+            "carry": _matrix_to_lists(self.carry, 2),
+            "carry_to_risk": _matrix_to_lists(self.carry_to_risk, 3),
+            "ppp_deviation": _matrix_to_lists(self.ppp_deviation, 1),
+        }
+
+
+def _matrix_inputs_digest(
+    rate_series: Mapping[str, Sequence[float]],
+    policy_rates: Mapping[str, float],
+    spot_rates: Mapping[str, float],
+    periods_per_year: int,
+) -> str:
+    """Stable digest of the inputs behind one set of currency matrices"""
+    digest = hashlib.sha256(str(periods_per_year).encode("utf-8"))
+    for code in sorted(rate_series):
+        digest.update(f"series:{code}".encode("utf-8"))
+        digest.update(np.asarray(rate_series[code], dtype=np.float64).tobytes())
+    for name, rates in (("policy", policy_rates), ("spot", spot_rates)):
+        for code in sorted(rates):
+            digest.update(f"{name}:{code}={float(rates[code])!r}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _finite_or_none(value: float) -> Optional[float]:
+    return float(value) if np.isfinite(value) else None
+
+
+def _matrix_to_lists(matrix: np.ndarray, digits: int) -> List[List[Optional[float]]]:
+    rounded = np.round(matrix, digits)
+    return [[float(v) if np.isfinite(v) else None for v in row] for row in rounded]
+
+
 class CurrencyAnalyzer:
     """Advanced currency analysis and modeling"""
 
@@ -65,9 +178,54 @@ class CurrencyAnalyzer:
         "minimal": 0.5,  # <0.5% minimal appeal
     }
 
+    # Expected correlations by market regime (unlisted pairs use groups)
+    REGIME_CORRELATIONS = {
+        "normal": {
+            ("USD", "EUR"): 0.1,
+            ("USD", "JPY"): -0.2,
+            ("USD", "GBP"): 0.15,
+            ("EUR", "GBP"): 0.6,
+            ("EUR", "JPY"): 0.1,
+            ("GBP", "JPY"): 0.05,
+            ("AUD", "CAD"): 0.7,  # Commodity currencies
+            ("AUD", "NZD"): 0.85,  # High correlation
+        },
+        "crisis": {
+            # During crises, most risk currencies correlate positively vs safe havens
+            ("USD", "EUR"): -0.3,
+            ("USD", "JPY"): -0.5,
+            ("USD", "GBP"): -0.2,
+            ("EUR", "GBP"): 0.8,
+            ("EUR", "JPY"): 0.4,
+            ("AUD", "CAD"): 0.9,
+            ("AUD", "NZD"): 0.95,
+        },
+    }
+
+    # Currency groupings and default correlations between them
+    # (major developed, commodity, emerging markets, other)
+    CURRENCY_GROUPS = {
+        **dict.fromkeys(["USD", "EUR", "JPY", "GBP", "CHF"], 0),
+        **dict.fromkeys(["AUD", "NZD", "CAD", "NOK"], 1),
+        **dict.fromkeys(["BRL", "MXN", "ZAR", "TRY", "INR", "CNY"], 2),
+    }
+    GROUP_CORRELATIONS = np.array(
+        [
+            [0.2, -0.1, 0.1, 0.1],
+            [-0.1, 0.6, 0.1, 0.1],
+            [0.1, 0.1, 0.4, 0.1],
+            [0.1, 0.1, 0.1, 0.1],
+        ]
+    )
+
+    # PPP references quoted as units of currency per USD
+    PPP_UNITS_PER_USD = frozenset({"JPY/USD", "USD/CNY"})
+
     def __init__(self):
         self.ppp_reference_rates = self._initialize_ppp_references()
         self.reer_base_periods = self._initialize_reer_bases()
+        self._matrix_cache: Dict[_MatrixKey, CurrencyMatrices] = {}
+        self._matrix_lock = threading.Lock()
 
     def _initialize_ppp_references(self) -> Dict[str, float]:
         """Initialize PPP reference exchange rates (indicative)"""
@@ -376,75 +534,229 @@ class CurrencyAnalyzer:
         self, currencies: List[str], market_regime: str = "normal"
     ) -> Dict[Tuple[str, str], float]:
         """Calculate expected currency correlations based on regime"""
-
-        # Base correlation matrices for different market regimes
-        normal_correlations = {
-            ("USD", "EUR"): 0.1,
-            ("USD", "JPY"): -0.2,
-            ("USD", "GBP"): 0.15,
-            ("EUR", "GBP"): 0.6,
-            ("EUR", "JPY"): 0.1,
-            ("GBP", "JPY"): 0.05,
-            ("AUD", "CAD"): 0.7,  # Commodity currencies
-            ("AUD", "NZD"): 0.85,  # High correlation
+        matrix = self._default_correlation_matrix(currencies, market_regime)
+        rows, cols = np.triu_indices(len(currencies), k=1)
+        return {
+            (currencies[i], currencies[j]): float(matrix[i, j])
+            for i, j in zip(rows, cols)
         }
 
-        crisis_correlations = {
-            # During crises, most risk currencies correlate positively vs safe havens
-            ("USD", "EUR"): -0.3,
-            ("USD", "JPY"): -0.5,
-            ("USD", "GBP"): -0.2,
-            ("EUR", "GBP"): 0.8,
-            ("EUR", "JPY"): 0.4,
-            ("AUD", "CAD"): 0.9,
-            ("AUD", "NZD"): 0.95,
-        }
+    def _estimate_default_correlation(self, curr1: str, curr2: str) -> float:
+        """Estimate default correlation between two currencies"""
+        return float(
+            self.GROUP_CORRELATIONS[
+                self.CURRENCY_GROUPS.get(curr1, 3), self.CURRENCY_GROUPS.get(curr2, 3)
+            ]
+        )
 
-        correlation_matrix = (
-            normal_correlations if market_regime == "normal" else crisis_correlations
+    def _default_correlation_matrix(
+        self, currencies: Sequence[str], market_regime: str = "normal"
+    ) -> np.ndarray:
+        """Regime and currency-group correlation estimates for all pairs"""
+        groups = np.array([self.CURRENCY_GROUPS.get(c, 3) for c in currencies])
+        matrix = self.GROUP_CORRELATIONS[groups[:, None], groups[None, :]]
+
+        regime_table = self.REGIME_CORRELATIONS[
+            "normal" if market_regime == "normal" else "crisis"
+        ]
+        index = {code: i for i, code in enumerate(currencies)}
+        for (curr1, curr2), correlation in regime_table.items():
+            if curr1 in index and curr2 in index:
+                matrix[index[curr1], index[curr2]] = correlation
+                matrix[index[curr2], index[curr1]] = correlation
+
+        np.fill_diagonal(matrix, 1.0)
+        return matrix
+
+    def calculate_currency_matrices(
+        self,
+        rate_series: Optional[Mapping[str, Sequence[float]]] = None,
+        policy_rates: Optional[Mapping[str, float]] = None,
+        spot_rates: Optional[Mapping[str, float]] = None,
+        currencies: Optional[Sequence[str]] = None,
+        as_of: Optional[str] = None,
+        market_regime: str = "normal",
+        periods_per_year: int = 252,
+        force_refresh: bool = False,
+    ) -> CurrencyMatrices:
+        """
+        Correlation, carry and PPP deviation matrices for all currencies at once
+
+        Matrices are cached per as-of date, currency set, regime and a digest
+        of the inputs, so every regional analysis of that date sharing the
+        same inputs shares one computation.
+
+        Args:
+            rate_series: Aligned rate series per currency (USD per unit, same
+                dates and length for every currency; NaN for gaps)
+            policy_rates: Policy rate per currency (%)
+            spot_rates: Spot rates (USD per unit); defaults to the last value
+                of each rate series
+            currencies: Currencies to cover (default: MATRIX_CURRENCIES plus
+                any currency supplied in the inputs)
+            as_of: As-of date (YYYY-MM-DD, default: today)
+            market_regime: Regime for estimated correlations ('normal', 'crisis')
+            periods_per_year: Observations per year in rate_series
+            force_refresh: Recompute even if cached for this as-of date
+
+        Returns:
+            CurrencyMatrices; unobserved correlations fall back to the regime
+            and currency-group estimates, and missing rates leave NaN entries
+        """
+        rate_series = rate_series or {}
+        policy_rates = policy_rates or {}
+        spot_rates = spot_rates or {}
+        currencies = tuple(
+            dict.fromkeys(
+                currencies
+                or [*MATRIX_CURRENCIES, *rate_series, *policy_rates, *spot_rates]
+            )
+        )
+        as_of = as_of or date.today().isoformat()
+        key = (
+            as_of,
+            currencies,
+            market_regime,
+            _matrix_inputs_digest(
+                rate_series, policy_rates, spot_rates, periods_per_year
+            ),
         )
 
-        # Generate correlations for requested pairs
-        result_correlations = {}
-        for i, curr1 in enumerate(currencies):
-            for j, curr2 in enumerate(currencies[i + 1 :], i + 1):
-                pair = (curr1, curr2)
-                reverse_pair = (curr2, curr1)
-
-                if pair in correlation_matrix:
-                    result_correlations[pair] = correlation_matrix[pair]
-                elif reverse_pair in correlation_matrix:
-                    result_correlations[pair] = correlation_matrix[reverse_pair]
-                else:
-                    # Default correlation based on currency characteristics
-                    result_correlations[pair] = self._estimate_default_correlation(
-                        curr1, curr2
-                    )
+        with self._matrix_lock:
+            cached = self._matrix_cache.get(key)
+        if cached is not None and not force_refresh:
+            return cached
+
+        matrices = self._build_currency_matrices(
+            currencies,
+            rate_series,
+            policy_rates,
+            spot_rates,
+            as_of,
+            market_regime,
+            periods_per_year,
+        )
+        with self._matrix_lock:
+            self._matrix_cache[key] = matrices
+            while len(self._matrix_cache) > MATRIX_CACHE_SIZE:
+                oldest = min(self._matrix_cache, key=lambda cached_key: cached_key[0])
+                del self._matrix_cache[oldest]
+        return matrices
+
+    def _build_currency_matrices(
+        self,
+        currencies: Tuple[str, ...],
+        rate_series: Mapping[str, Sequence[float]],
+        policy_rates: Mapping[str, float],
+        spot_rates: Mapping[str, float],
+        as_of: str,
+        market_regime: str,
+        periods_per_year: int,
+    ) -> CurrencyMatrices:
+        """Compute all matrices from aligned series with array operations"""
+        n = len(currencies)
+        lengths = {len(rate_series[c]) for c in currencies if c in rate_series}
+        if len(lengths) > 1:
+            raise ValueError("rate_series must be aligned (equal length per currency)")
+        periods = lengths.pop() if lengths else 0
+
+        levels = np.full((periods, n), np.nan)
+        for i, code in enumerate(currencies):
+            if code == "USD":
+                levels[:, i] = 1.0
+            elif code in rate_series:
+                levels[:, i] = np.asarray(rate_series[code], dtype=float)
+
+        # Log returns of each currency's USD value, on dates where every
+        # currency with data has a value
+        returns = np.diff(np.log(levels), axis=0)
+        has_data = np.isfinite(returns).any(axis=0)
+        complete = np.isfinite(returns[:, has_data]).all(axis=1)
+        returns = np.where(np.isfinite(returns), returns, 0.0)[complete]
+        observations = len(returns)
+
+        correlation = self._default_correlation_matrix(currencies, market_regime)
+        observed = np.zeros((n, n), dtype=bool)
+        pair_volatility = np.full((n, n), np.nan)
+        if observations >= 2:
+            covariance = np.atleast_2d(np.cov(returns, rowvar=False))
+            variance = np.diag(covariance)
+            # Pair return is the row currency's return minus the column's
+            pair_variance = variance[:, None] + variance[None, :] - 2 * covariance
+            usable = has_data[:, None] & has_data[None, :]
+            pair_volatility = np.where(
+                usable,
+                np.sqrt(np.maximum(pair_variance, 0.0) * periods_per_year) * 100,
+                np.nan,
+            )
 
-        return result_correlations
+            # USD has no return against itself; its correlations use the
+            # dollar's move against the equal-weighted basket of the others
+            correlation_returns = returns.copy()
+            basket = has_data.copy()
+            if "USD" in currencies:
+                usd = currencies.index("USD")
+                basket[usd] = False
+                if basket.any():
+                    correlation_returns[:, usd] = -returns[:, basket].mean(axis=1)
+                    has_data[usd] = True
+
+            if observations >= MIN_CORRELATION_OBSERVATIONS:
+                valid = has_data & (correlation_returns.std(axis=0) > 0)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    observed_correlation = np.corrcoef(
+                        correlation_returns, rowvar=False
+                    )
+                observed = valid[:, None] & valid[None, :]
+                correlation = np.where(observed, observed_correlation, correlation)
+                np.fill_diagonal(correlation, 1.0)
+
+        rates = np.array([policy_rates.get(c, np.nan) for c in currencies], dtype=float)
+        carry = rates[:, None] - rates[None, :]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            carry_to_risk = np.where(
+                pair_volatility > 0, carry / pair_volatility, np.nan
+            )
 
-    def _estimate_default_correlation(self, curr1: str, curr2: str) -> float:
-        """Estimate default correlation between two currencies"""
+        spot = np.array(
+            [
+                spot_rates.get(code, self._last_finite(levels[:, i]))
+                for i, code in enumerate(currencies)
+            ],
+            dtype=float,
+        )
+        if "USD" in currencies:
+            spot[currencies.index("USD")] = 1.0
+        fair_value = np.array([self._ppp_usd_per_unit(c) for c in currencies])
+        valuation = spot / fair_value
+        ppp_deviation = (valuation[:, None] / valuation[None, :] - 1.0) * 100
+
+        return CurrencyMatrices(
+            as_of=as_of,
+            currencies=list(currencies),
+            market_regime=market_regime,
+            correlation=correlation,
+            correlation_observed=observed,
+            carry=carry,
+            carry_to_risk=carry_to_risk,
+            ppp_deviation=ppp_deviation,
+            observations=observations,
+        )
 
-        # Currency groupings
-        major_developed = ["USD", "EUR", "JPY", "GBP", "CHF"]
-        commodity_currencies = ["AUD", "NZD", "CAD", "NOK"]
-        emerging_markets = ["BRL", "MXN", "ZAR", "TRY", "INR", "CNY"]
-
-        # Same group correlations
-        if curr1 in commodity_currencies and curr2 in commodity_currencies:
-            return 0.6
-        elif curr1 in emerging_markets and curr2 in emerging_markets:
-            return 0.4
-        elif curr1 in major_developed and curr2 in major_developed:
-            return 0.2
-        # Cross-group correlations
-        elif (curr1 in major_developed and curr2 in commodity_currencies) or (
-            curr2 in major_developed and curr1 in commodity_currencies
-        ):
-            return -0.1
-        else:
-            return 0.1  # Default low positive correlation
+    @staticmethod
+    def _last_finite(values: np.ndarray) -> float:
+        finite = values[np.isfinite(values)]
+        return float(finite[-1]) if len(finite) else np.nan
+
+    def _ppp_usd_per_unit(self, currency_code: str) -> float:
+        """PPP fair value of a currency in USD per unit (NaN if unknown)"""
+        if currency_code == "USD":
+            return 1.0
+        for key in (f"{currency_code}/USD", f"USD/{currency_code}"):
+            if key in self.ppp_reference_rates:
+                rate = self.ppp_reference_rates[key]
+                return 1.0 / rate if key in self.PPP_UNITS_PER_USD else rate
+        return np.nan
 
     def generate_currency_risk_assessment(
         self, analysis: CurrencyAnalysis
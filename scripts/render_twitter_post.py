@@ -1,23 +1,47 @@
 #!/usr/bin/env python3
+import argparse
 import json
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Template
 
+from utils.template_registry import get_template_environment
 
-def render_twitter_post(ticker, date):
+METADATA_DIR = Path("data/outputs/twitter/post_strategy")
+TEMPLATES_DIR = Path(__file__).parent / "templates" / "twitter"
+
+_template_cache: Dict[Optional[str], Template] = {}
+_template_lock = threading.Lock()
+
+
+def _get_template(template_name=None):
+    """Compile a post template once per process (None = built-in strategy post)"""
+    with _template_lock:
+        template = _template_cache.get(template_name)
+        if template is None:
+            # Shared environment with autoescape for security
+            env = get_template_environment(TEMPLATES_DIR, autoescape=True)
+            if template_name:
+                template = env.get_template(template_name)
+            else:
+                template = env.from_string(TEMPLATE_CONTENT)
+            _template_cache[template_name] = template
+        return template
+
+
+def render_twitter_post(ticker, date, template_name=None, metadata_dir=METADATA_DIR):
     """Render Twitter post using Jinja2 template with DOCU data"""
 
     # Load data from metadata
-    metadata_file = f"data/outputs/twitter/post_strategy/{ticker}_{date}_metadata.json"
+    metadata_file = Path(metadata_dir) / f"{ticker}_{date}_metadata.json"
     with open(metadata_file, "r") as f:
         metadata = json.load(f)
 
-    # Set up Jinja2 environment with autoescape for security
-    env = Environment(
-        loader=FileSystemLoader("scripts/templates/twitter/"), autoescape=True
-    )
-
     # Prepare context for template
     context = {
         "ticker": metadata["ticker"],
@@ -62,8 +86,79 @@ def render_twitter_post(ticker, date):
         },
     }
 
-    # Create inline template to avoid import issues
-    template_content = """📈 ${{ ticker }} dual {{ data.strategy_type }} ({{ data.short_window }}/{{ data.long_window }}) delivered {{ data.net_performance }}% returns with {{ data.win_rate }}% win rate - {{ data.key_insight }}
+    template = _get_template(template_name)
+    rendered_content = template.render(**context)
+
+    return rendered_content
+
+
+def render_twitter_posts_batch(
+    jobs, max_workers=4, output_dir=None, metadata_dir=METADATA_DIR
+):
+    """
+    Render many (ticker, date, template) jobs with shared template state
+
+    Args:
+        jobs: Dicts with ticker, date and optional template file name
+        max_workers: Upper bound on concurrently rendered jobs
+        output_dir: Directory for rendered posts and batch_summary.json
+            (defaults to <metadata_dir>/rendered)
+        metadata_dir: Directory holding {ticker}_{date}_metadata.json files
+
+    Returns:
+        Batch summary with per-job results and failures
+    """
+    output_dir = Path(output_dir) if output_dir else Path(metadata_dir) / "rendered"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    start_time = time.perf_counter()
+
+    def run(indexed_job):
+        index, job = indexed_job
+        job_start = time.perf_counter()
+        result = {"job_index": index, "job": job, "success": False}
+        try:
+            ticker = str(job["ticker"]).upper()
+            date = str(job["date"])
+            template_name = job.get("template") or None
+            content = render_twitter_post(ticker, date, template_name, metadata_dir)
+
+            suffix = f"_{Path(template_name).stem}" if template_name else ""
+            output_path = output_dir / f"{ticker}_{date}{suffix}.md"
+            output_path.write_text(content, encoding="utf-8")
+            result.update(
+                {
+                    "success": True,
+                    "output_path": str(output_path),
+                    "character_count": len(content),
+                }
+            )
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["duration_seconds"] = round(time.perf_counter() - job_start, 4)
+        return result
+
+    workers = max(1, min(max_workers, len(jobs) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run, enumerate(jobs)))
+
+    succeeded = sum(1 for r in results if r["success"])
+    summary = {
+        "duration_seconds": round(time.perf_counter() - start_time, 3),
+        "max_workers": workers,
+        "total_jobs": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "jobs": results,
+    }
+    summary_path = output_dir / "batch_summary.json"
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    summary["summary_path"] = str(summary_path)
+
+    return summary
+
+
+TEMPLATE_CONTENT = """📈 ${{ ticker }} dual {{ data.strategy_type }} ({{ data.short_window }}/{{ data.long_window }}) delivered {{ data.net_performance }}% returns with {{ data.win_rate }}% win rate - {{ data.key_insight }}
 
 Here's why this signal matters. 👇
 
@@ -105,24 +200,40 @@ Not financial advice. Historical performance doesn't guarantee future results. T
 
 #TradingSignals #TradingStrategy #TradingOpportunity #investment"""
 
-    # Create template from string
-    template = env.from_string(template_content)
-    rendered_content = template.render(**context)
-
-    return rendered_content
-
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
+    parser = argparse.ArgumentParser(description="Render Twitter strategy posts")
+    parser.add_argument("ticker", nargs="?", help="Ticker symbol")
+    parser.add_argument("date", nargs="?", help="Date (YYYYMMDD)")
+    parser.add_argument("--manifest", help="JSON list of {ticker, date, template} jobs")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent batch jobs")
+    parser.add_argument("--output-dir", default=None, help="Batch output directory")
+    args = parser.parse_args()
+
+    if args.manifest:
+        with open(args.manifest, "r") as f:
+            manifest = json.load(f)
+        jobs = manifest.get("jobs", []) if isinstance(manifest, dict) else manifest
+        summary = render_twitter_posts_batch(
+            jobs, max_workers=args.workers, output_dir=args.output_dir
+        )
+        print(
+            f"Rendered {summary['succeeded']}/{summary['total_jobs']} posts "
+            f"-> {summary['summary_path']}"
+        )
+        for job in summary["jobs"]:
+            if not job["success"]:
+                print(f"  FAILED {job['job']}: {job['error']}")
+        sys.exit(0 if summary["failed"] == 0 else 1)
+
+    if not (args.ticker and args.date):
         print("Usage: python render_twitter_post.py <ticker> <date>")
+        print("       python render_twitter_post.py --manifest jobs.json [--workers N]")
         sys.exit(1)
 
-    ticker = sys.argv[1]
-    date = sys.argv[2]
-
     try:
-        content = render_twitter_post(ticker, date)
+        content = render_twitter_post(args.ticker, args.date)
         print(content)
     except Exception as e:
-        print("Error rendering Twitter post: {e}")
+        print(f"Error rendering Twitter post: {e}")
         sys.exit(1)
@@ -476,6 +476,7 @@ class AlphaVantageService(BaseFinancialService):
                     "Forex rates",
                     "Cryptocurrency data",
                 ],
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -485,6 +486,7 @@ class AlphaVantageService(BaseFinancialService):
                 "status": "unhealthy",
                 "error": str(e),
                 "error_type": type(e).__name__,
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -3,8 +3,9 @@ Base Financial Service
 
 Provides common infrastructure for all financial data services including:
 - Standardized error handling and validation
-- Production-grade caching with TTL support
+- Production-grade caching with TTL support and stale-while-revalidate
 - Rate limiting with service-specific limits
+- Circuit breaking, jittered backoff and optional hedged requests
 - Logging with correlation IDs
 - Configuration management
 - Data validation with Pydantic models
@@ -17,16 +18,24 @@ import sys
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Union
 
 import requests
 from pydantic import BaseModel, Field
 
 # Add utils directory to path for importing historical data manager
 sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
-from unified_cache import UnifiedCache
+from network_resilience import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    RetryConfig,
+    RetryHandler,
+)
+from unified_cache import UnifiedCache, describe_freshness
 
 from utils.historical_data_manager import DataType, HistoricalDataManager, Timeframe
 
@@ -61,11 +70,19 @@ class APITimeoutError(FinancialServiceError):
     pass
 
 
+class ServiceUnavailableError(FinancialServiceError):
+    """Raised when a service circuit is open and no cached or fallback data exists"""
+
+    pass
+
+
 class CacheConfig(BaseModel):
     """Cache configuration"""
 
     enabled: bool = True
     ttl_seconds: int = 900  # 15 minutes default
+    stale_while_revalidate: bool = True  # Serve bounded-stale data while refreshing
+    max_stale_seconds: int = 300  # How long past TTL stale data may be served
     cache_dir: str = Field(
         default_factory=lambda: str(
             Path(__file__).parent.parent.parent / "data" / "cache"
@@ -82,6 +99,31 @@ class RateLimitConfig(BaseModel):
     burst_limit: int = 10
 
 
+class ResilienceConfig(BaseModel):
+    """Circuit breaker, backoff and hedged request configuration"""
+
+    circuit_breaker_enabled: bool = True
+    failure_threshold: int = 5  # Consecutive failures before opening circuit
+    recovery_timeout_seconds: int = 60  # Seconds before a half-open probe
+    success_threshold: int = 1  # Probe successes needed to close circuit
+
+    backoff_initial_delay: float = 1.0
+    backoff_max_delay: float = 30.0
+    backoff_jitter: bool = True
+
+    # Hedged requests: fire a second attempt once the first exceeds the
+    # observed latency percentile (empty endpoint list hedges every endpoint)
+    hedging_enabled: bool = False
+    hedged_endpoints: List[str] = Field(default_factory=list)
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+    hedge_default_delay_seconds: float = 1.0
+    hedge_min_delay_seconds: float = 0.05
+
+    latency_window: int = 200  # Latency samples kept per service
+    last_good_entries: int = 100  # Responses kept for open-circuit fallback
+
+
 class HistoricalStorageConfig(BaseModel):
     """Historical data storage configuration"""
 
@@ -111,6 +153,7 @@ class ServiceConfig(BaseModel):
     max_retries: int = 3
     cache: CacheConfig = Field(default_factory=CacheConfig)
     rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    resilience: ResilienceConfig = Field(default_factory=ResilienceConfig)
     historical_storage: HistoricalStorageConfig = Field(
         default_factory=HistoricalStorageConfig
     )
@@ -134,6 +177,19 @@ class FileBasedCache:
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Retrieve cached data if not expired"""
+        entry = self.get_entry(key, allow_stale=False)
+        return entry["data"] if entry else None
+
+    def get_entry(self, key: str, allow_stale: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve cached data with freshness metadata
+
+        Entries past their TTL are kept (and returned when allow_stale is set)
+        until the max_stale_seconds window has also elapsed.
+
+        Returns:
+            Dict with "data" and "freshness" keys, or None on a miss
+        """
         if not self.config.enabled:
             return None
 
@@ -147,19 +203,28 @@ class FileBasedCache:
 
             # Check if cache is expired
             cached_time = datetime.fromisoformat(cached_data["timestamp"])
-            if datetime.now() - cached_time > timedelta(
-                seconds=self.config.ttl_seconds
-            ):
-                cache_path.unlink()  # Remove expired cache
+            freshness = describe_freshness(
+                cached_time, self.config.ttl_seconds, self._stale_window()
+            )
+            if freshness["status"] == "expired":
+                cache_path.unlink(missing_ok=True)  # Remove expired cache
+                return None
+            if freshness["status"] == "stale" and not allow_stale:
                 return None
 
-            return cached_data["data"]
+            return {"data": cached_data["data"], "freshness": freshness}
 
         except (json.JSONDecodeError, KeyError, ValueError):
             # Remove corrupted cache file
             cache_path.unlink(missing_ok=True)
             return None
 
+    def _stale_window(self) -> int:
+        """Get how long past TTL entries are retained for stale reads"""
+        if not self.config.stale_while_revalidate:
+            return 0
+        return self.config.max_stale_seconds
+
     def set(self, key: str, data: Dict[str, Any]) -> None:
         """Store data in cache with timestamp"""
         if not self.config.enabled:
@@ -187,7 +252,7 @@ class FileBasedCache:
                     cached_data = json.load(f)
                 cached_time = datetime.fromisoformat(cached_data["timestamp"])
                 if datetime.now() - cached_time > timedelta(
-                    seconds=self.config.ttl_seconds
+                    seconds=self.config.ttl_seconds + self._stale_window()
                 ):
                     cache_file.unlink()
             except Exception:
@@ -201,6 +266,7 @@ class RateLimiter:
     def __init__(self, config: RateLimitConfig):
         self.config = config
         self.requests: List[float] = []
+        self._lock = threading.Lock()
 
     def can_make_request(self) -> bool:
         """Check if request is allowed under rate limit"""
@@ -230,6 +296,28 @@ class RateLimiter:
             if wait_time > 0:
                 time.sleep(wait_time)
 
+    def acquire(self) -> None:
+        """
+        Wait for a free slot and record the request atomically
+
+        Safe to call from concurrent threads: at most requests_per_minute
+        requests are recorded in any 60 second window.
+        """
+        if not self.config.enabled:
+            return
+
+        while True:
+            with self._lock:
+                now = time.time()
+                self.requests = [
+                    req_time for req_time in self.requests if now - req_time < 60
+                ]
+                if len(self.requests) < self.config.requests_per_minute:
+                    self.requests.append(now)
+                    return
+                wait_time = 60 - (now - min(self.requests))
+            time.sleep(max(wait_time, 0.01))
+
 
 class BaseFinancialService(ABC):
     """
@@ -239,6 +327,8 @@ class BaseFinancialService(ABC):
     - Caching with TTL
     - Rate limiting
     - Error handling with retry logic
+    - Circuit breaking with cache/fallback on open circuits
+    - Hedged requests for latency-sensitive endpoints
     - Request logging with correlation IDs
     - Data validation
     """
@@ -249,6 +339,38 @@ class BaseFinancialService(ABC):
         self.session = requests.Session()
         self.logger = self._setup_logger()
 
+        # Network resilience: circuit breaker, jittered backoff, latency tracking
+        resilience = config.resilience
+        self.circuit_breaker = None
+        if resilience.circuit_breaker_enabled:
+            self.circuit_breaker = CircuitBreaker(
+                config.name,
+                CircuitBreakerConfig(
+                    failure_threshold=resilience.failure_threshold,
+                    recovery_timeout=resilience.recovery_timeout_seconds,
+                    success_threshold=resilience.success_threshold,
+                    timeout_seconds=float(config.timeout_seconds),
+                ),
+            )
+        self.retry_handler = RetryHandler(
+            RetryConfig(
+                max_retries=config.max_retries,
+                initial_delay=resilience.backoff_initial_delay,
+                max_delay=resilience.backoff_max_delay,
+                jitter=resilience.backoff_jitter,
+            )
+        )
+        self._latency_samples: Deque[float] = deque(maxlen=resilience.latency_window)
+        self._hedge_stats = {"hedged_requests": 0, "hedge_wins": 0}
+        self._resilience_lock = threading.Lock()
+        self._last_good_responses: "OrderedDict[str, Any]" = OrderedDict()
+
+        # Stale-while-revalidate: one background refresh per cache key
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshes_in_flight: Dict[str, Future] = {}
+        self._refresh_lock = threading.Lock()
+        self._request_context = threading.local()
+
         # Initialize historical data manager if enabled
         self.historical_manager = None
         if config.historical_storage.enabled:
@@ -267,6 +389,11 @@ class BaseFinancialService(ABC):
                 ttl_seconds=config.cache.ttl_seconds,
                 service_name=config.name,
                 use_trading_session_ttl=True,  # Enable trading session TTL
+                max_stale_seconds=(
+                    config.cache.max_stale_seconds
+                    if config.cache.stale_while_revalidate
+                    else 0
+                ),
             )
             self.logger.info("Using unified cache with historical data storage")
         else:
@@ -862,19 +989,297 @@ class BaseFinancialService(ABC):
 
             self.logger.error(f"Trigger error traceback: {traceback.format_exc()}")
 
+    def _circuit_allows_request(self) -> bool:
+        """Check whether the service circuit lets a request through"""
+        return self.circuit_breaker is None or self.circuit_breaker.allow_request()
+
+    def _is_service_failure(self, error: Exception) -> bool:
+        """Decide whether an error means the remote service is unhealthy"""
+        if isinstance(error, requests.exceptions.HTTPError):
+            status_code = getattr(error.response, "status_code", None)
+            # Client errors (404, 429, ...) prove the host is up
+            return status_code is None or status_code >= 500
+        return True
+
+    def _record_latency(self, elapsed: float) -> None:
+        """Record a successful request latency sample (seconds)"""
+        with self._resilience_lock:
+            self._latency_samples.append(elapsed)
+
+    def _latency_percentile(self, percentile: float) -> Optional[float]:
+        """Get a latency percentile (seconds) from recent successful requests"""
+        with self._resilience_lock:
+            samples = sorted(self._latency_samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(percentile / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def _get_hedge_delay(self) -> float:
+        """Get the delay before a hedged attempt, derived from observed latency"""
+        resilience = self.config.resilience
+        with self._resilience_lock:
+            sample_count = len(self._latency_samples)
+        delay = self._latency_percentile(resilience.hedge_percentile)
+        if sample_count < resilience.hedge_min_samples or delay is None:
+            return resilience.hedge_default_delay_seconds
+
+        return max(resilience.hedge_min_delay_seconds, delay)
+
+    def _should_hedge(self, endpoint: str) -> bool:
+        """Check whether requests to an endpoint are hedged by configuration"""
+        resilience = self.config.resilience
+        if not resilience.hedging_enabled:
+            return False
+        if not resilience.hedged_endpoints:
+            return True
+        return any(pattern in endpoint for pattern in resilience.hedged_endpoints)
+
+    def _execute_request(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        """
+        Execute a single HTTP attempt and report its outcome to the circuit breaker
+
+        Raises:
+            requests.exceptions.RequestException: When the attempt fails
+        """
+        # Rate limiting
+        self.rate_limiter.acquire()
+
+        start = time.perf_counter()
+        try:
+            response = self.session.get(
+                url, params=params, timeout=self.config.timeout_seconds
+            )
+            response.raise_for_status()
+        except Exception as e:
+            if self.circuit_breaker is not None:
+                elapsed = time.perf_counter() - start
+                if self._is_service_failure(e):
+                    self.circuit_breaker.record_failure(elapsed, e)
+                else:
+                    self.circuit_breaker.record_success(elapsed)
+            raise
+
+        elapsed = time.perf_counter() - start
+        self._record_latency(elapsed)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success(elapsed)
+        return response
+
+    def _execute_hedged_request(
+        self, url: str, params: Dict[str, Any], correlation_id: str
+    ) -> requests.Response:
+        """
+        Execute an HTTP request, hedging with a second attempt when slow
+
+        The second attempt fires once the first exceeds the p95-derived hedge
+        delay; whichever succeeds first wins and the other is ignored.
+        """
+        hedge_delay = self._get_hedge_delay()
+        executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix=f"{self.config.name}_hedge"
+        )
+        try:
+            primary = executor.submit(self._execute_request, url, params)
+            done, _ = wait([primary], timeout=hedge_delay)
+            if done:
+                return primary.result()
+
+            with self._resilience_lock:
+                self._hedge_stats["hedged_requests"] += 1
+            self.logger.info(
+                f"Hedging request after {hedge_delay:.3f}s - ID: {correlation_id}"
+            )
+            hedge = executor.submit(self._execute_request, url, params)
+
+            pending = {primary, hedge}
+            last_error: Optional[Exception] = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+
+                    if future is hedge:
+                        with self._resilience_lock:
+                            self._hedge_stats["hedge_wins"] += 1
+                    return response
+
+            if last_error is None:
+                raise requests.exceptions.RequestException(
+                    f"Hedged request returned no response - ID: {correlation_id}"
+                )
+            raise last_error
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _remember_good_response(self, cache_key: str, data: Any) -> None:
+        """Keep the latest good response per key for open-circuit fallback"""
+        with self._resilience_lock:
+            self._last_good_responses[cache_key] = data
+            self._last_good_responses.move_to_end(cache_key)
+            while (
+                len(self._last_good_responses)
+                > self.config.resilience.last_good_entries
+            ):
+                self._last_good_responses.popitem(last=False)
+
+    def _get_fallback_response(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """
+        Provide fallback data when the service circuit is open
+
+        Services override this for graceful degradation; the default has none.
+        """
+        return None
+
+    def _serve_open_circuit(
+        self,
+        endpoint: str,
+        cache_key: str,
+        correlation_id: str,
+        require_fresh: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Fail fast on an open circuit to the last good response or fallback
+
+        Callers requiring fresh data only get a fresh cache entry; stale
+        entries, last good responses and fallbacks are never served to them.
+        """
+        self.logger.warning(
+            f"Circuit open for {self.config.name}, failing fast for {endpoint} - "
+            f"ID: {correlation_id}"
+        )
+
+        cache_entry = self.cache.get_entry(cache_key, allow_stale=not require_fresh)
+        if cache_entry and cache_entry["data"]:
+            self._set_response_freshness(cache_entry["freshness"])
+            return cache_entry["data"]
+
+        if require_fresh:
+            raise ServiceUnavailableError(
+                f"{self.config.name} circuit is open and no fresh data is available "
+                f"for {endpoint}"
+            )
+
+        with self._resilience_lock:
+            last_good = self._last_good_responses.get(cache_key)
+        if last_good is not None:
+            self._set_response_freshness({"status": "last_good"})
+            return last_good
+
+        fallback = self._get_fallback_response(endpoint)
+        if fallback is not None:
+            self._set_response_freshness({"status": "fallback"})
+            return fallback
+
+        raise ServiceUnavailableError(
+            f"{self.config.name} circuit is open and no cached or fallback data "
+            f"is available for {endpoint}"
+        )
+
+    @property
+    def last_response_freshness(self) -> Optional[Dict[str, Any]]:
+        """Freshness metadata of the last response returned on this thread"""
+        return getattr(self._request_context, "freshness", None)
+
+    def _set_response_freshness(self, freshness: Dict[str, Any]) -> None:
+        """Record freshness metadata for the response about to be returned"""
+        self._request_context.freshness = freshness
+
+    def _requires_fresh(self, require_fresh: Optional[bool]) -> bool:
+        """Resolve whether a request may be served from stale cache entries"""
+        if require_fresh is not None:
+            return require_fresh
+        return not self.config.cache.stale_while_revalidate
+
+    def _schedule_refresh(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        cache_key: str,
+        hedge: Optional[bool],
+    ) -> Future:
+        """
+        Refresh a cache key in the background, de-duplicating concurrent refreshes
+
+        Returns:
+            Future of the in-flight refresh for this key
+        """
+        with self._refresh_lock:
+            in_flight = self._refreshes_in_flight.get(cache_key)
+            if in_flight is not None and not in_flight.done():
+                return in_flight
+
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix=f"{self.config.name}_refresh"
+                )
+
+            future = self._refresh_executor.submit(
+                self._run_refresh, endpoint, params, cache_key, hedge
+            )
+            self._refreshes_in_flight[cache_key] = future
+            return future
+
+    def _run_refresh(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        cache_key: str,
+        hedge: Optional[bool],
+    ) -> Optional[Dict[str, Any]]:
+        """Background revalidation of a stale cache entry"""
+        correlation_id = self._generate_correlation_id(endpoint, params)
+        try:
+            return self._fetch_and_cache(
+                endpoint, params, cache_key, correlation_id, hedge
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Background refresh failed for {endpoint} - ID: {correlation_id}, "
+                f"Error: {e}"
+            )
+            return None
+        finally:
+            with self._refresh_lock:
+                self._refreshes_in_flight.pop(cache_key, None)
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> None:
+        """Block until in-flight background refreshes finish"""
+        with self._refresh_lock:
+            pending = list(self._refreshes_in_flight.values())
+        if pending:
+            wait(pending, timeout=timeout)
+
     def _make_request_with_retry(
         self,
         endpoint: str,
         params: Dict[str, Any] = None,
         cache_key: Optional[str] = None,
+        hedge: Optional[bool] = None,
+        require_fresh: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Make API request with caching, rate limiting, and retry logic
 
+        Entries past their TTL but within the stale window are returned
+        immediately while a single background refresh revalidates them, unless
+        strictly fresh data is required. Freshness of the returned data is
+        available from last_response_freshness.
+
+        Retries use jittered exponential backoff and stop as soon as the
+        service circuit opens, falling back to the last good response.
+
         Args:
             endpoint: API endpoint to call
             params: Request parameters
             cache_key: Optional custom cache key
+            hedge: Force hedging on/off (defaults to resilience configuration)
+            require_fresh: Reject stale cache entries, also on an open circuit
+                (defaults to cache configuration)
 
         Returns:
             API response data
@@ -883,6 +1288,7 @@ class BaseFinancialService(ABC):
             RateLimitError: When rate limit is exceeded
             DataNotFoundError: When requested data is not available
             APITimeoutError: When request times out
+            ServiceUnavailableError: When the circuit is open without fallback
             FinancialServiceError: For other API errors
         """
         if params is None:
@@ -894,36 +1300,81 @@ class BaseFinancialService(ABC):
         correlation_id = self._generate_correlation_id(endpoint, params)
 
         # Check cache first
-        cached_data = self.cache.get(cache_key)
-        if cached_data:
-            self.logger.info(f"Cache hit for {endpoint} - ID: {correlation_id}")
-            return cached_data
+        fresh_required = self._requires_fresh(require_fresh)
+        cache_entry = self.cache.get_entry(cache_key, allow_stale=not fresh_required)
+        if cache_entry and cache_entry["data"]:
+            freshness = cache_entry["freshness"]
+            self._set_response_freshness(freshness)
+            if freshness["status"] == "fresh":
+                self.logger.info(f"Cache hit for {endpoint} - ID: {correlation_id}")
+            else:
+                # Serve bounded-stale data now and revalidate once in background
+                self.logger.info(
+                    f"Stale cache hit for {endpoint} "
+                    f"({freshness['stale_by_seconds']}s past TTL), revalidating - "
+                    f"ID: {correlation_id}"
+                )
+                self._schedule_refresh(endpoint, params, cache_key, hedge)
+            return cache_entry["data"]
+
+        return self._fetch_and_cache(
+            endpoint,
+            params,
+            cache_key,
+            correlation_id,
+            hedge,
+            require_fresh=fresh_required,
+        )
 
+    def _auth_params(self) -> Dict[str, Any]:
+        """Query parameters authenticating a request (override for other names)"""
+        return {"apikey": self.config.api_key} if self.config.api_key else {}
+
+    def _fetch_and_cache(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        cache_key: str,
+        correlation_id: str,
+        hedge: Optional[bool] = None,
+        require_fresh: bool = False,
+        cache_result: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Fetch from the API with retries and store the validated result
+
+        With cache_result=False the response is neither written to the
+        response cache nor kept as the last good response (for callers that
+        persist the data in their own store).
+        """
         # Prepare request parameters
-        if self.config.api_key:
-            params = {**params, "apikey": self.config.api_key}
+        params = {**params, **self._auth_params()}
 
         url = (
             f"{self.config.base_url}/{endpoint.lstrip('/')}"
             if endpoint
             else self.config.base_url
         )
+        if hedge is None:
+            hedge = self._should_hedge(endpoint)
 
         for attempt in range(self.config.max_retries + 1):
-            try:
-                # Rate limiting
-                self.rate_limiter.wait_if_needed()
-                self.rate_limiter.record_request()
+            # Stop hammering a host whose circuit is open
+            if not self._circuit_allows_request():
+                return self._serve_open_circuit(
+                    endpoint, cache_key, correlation_id, require_fresh
+                )
 
+            try:
                 self.logger.info(
                     f"Making request (attempt {attempt + 1}/"
                     f"{self.config.max_retries + 1}) to {endpoint} - ID: {correlation_id}"
                 )
 
-                response = self.session.get(
-                    url, params=params, timeout=self.config.timeout_seconds
-                )
-                response.raise_for_status()
+                if hedge:
+                    response = self._execute_hedged_request(url, params, correlation_id)
+                else:
+                    response = self._execute_request(url, params)
 
                 data = response.json()
 
@@ -931,14 +1382,16 @@ class BaseFinancialService(ABC):
                 validated_data = self._validate_response(data, endpoint)
 
                 # Cache successful result
-                if isinstance(self.cache, UnifiedCache):
-                    # Pass endpoint and params for unified cache
-                    self.cache.set(
-                        cache_key, validated_data, endpoint=endpoint, params=params
-                    )
-                else:
-                    # Traditional cache
-                    self.cache.set(cache_key, validated_data)
+                if cache_result:
+                    if isinstance(self.cache, UnifiedCache):
+                        # Pass endpoint and params for unified cache
+                        self.cache.set(
+                            cache_key, validated_data, endpoint=endpoint, params=params
+                        )
+                    else:
+                        # Traditional cache
+                        self.cache.set(cache_key, validated_data)
+                    self._remember_good_response(cache_key, validated_data)
 
                 # Store in historical data system (only if not using unified cache)
                 if not isinstance(self.cache, UnifiedCache):
@@ -968,18 +1421,22 @@ class BaseFinancialService(ABC):
                 self.logger.info(
                     f"Request successful for {endpoint} - ID: {correlation_id}"
                 )
+                self._set_response_freshness(
+                    {"status": "live", "fetched_at": datetime.now().isoformat()}
+                )
                 return validated_data
 
             except requests.exceptions.HTTPError as e:
-                if response.status_code == 429:
+                status_code = getattr(e.response, "status_code", None)
+                if status_code == 429:
                     raise RateLimitError(f"Rate limit exceeded: {e}")
-                elif response.status_code == 404:
+                elif status_code == 404:
                     raise DataNotFoundError(f"Data not found: {e}")
                 elif attempt < self.config.max_retries:
-                    wait_time = 2**attempt  # Exponential backoff
+                    wait_time = self.retry_handler.get_delay(attempt + 1)
                     self.logger.warning(
                         f"HTTP error (attempt {attempt + 1}/"
-                        f"{self.config.max_retries + 1}), retrying in {wait_time}s - "
+                        f"{self.config.max_retries + 1}), retrying in {wait_time:.2f}s - "
                         f"ID: {correlation_id}, Error: {e}"
                     )
                     time.sleep(wait_time)
@@ -990,10 +1447,10 @@ class BaseFinancialService(ABC):
 
             except requests.exceptions.Timeout:
                 if attempt < self.config.max_retries:
-                    wait_time = 2**attempt
+                    wait_time = self.retry_handler.get_delay(attempt + 1)
                     self.logger.warning(
                         f"Timeout (attempt {attempt + 1}/"
-                        f"{self.config.max_retries + 1}), retrying in {wait_time}s - "
+                        f"{self.config.max_retries + 1}), retrying in {wait_time:.2f}s - "
                         f"ID: {correlation_id}"
                     )
                     time.sleep(wait_time)
@@ -1004,10 +1461,10 @@ class BaseFinancialService(ABC):
 
             except Exception as e:
                 if attempt < self.config.max_retries:
-                    wait_time = 2**attempt
+                    wait_time = self.retry_handler.get_delay(attempt + 1)
                     self.logger.warning(
                         f"Request failed (attempt {attempt + 1}/"
-                        f"{self.config.max_retries + 1}), retrying in {wait_time}s - "
+                        f"{self.config.max_retries + 1}), retrying in {wait_time:.2f}s - "
                         f"ID: {correlation_id}, Error: {e}"
                     )
                     time.sleep(wait_time)
@@ -1050,6 +1507,7 @@ class BaseFinancialService(ABC):
             "base_url": self.config.base_url,
             "cache_enabled": self.config.cache.enabled,
             "rate_limit_enabled": self.config.rate_limit.enabled,
+            "resilience": self.get_resilience_status(),
         }
 
         try:
@@ -1067,6 +1525,35 @@ class BaseFinancialService(ABC):
 
         return health_status
 
+    def get_resilience_status(self) -> Dict[str, Any]:
+        """
+        Get circuit breaker, latency and hedging state for this service
+
+        Returns:
+            Dictionary with breaker status, latency percentiles and hedge counts
+        """
+        p50 = self._latency_percentile(50)
+        p95 = self._latency_percentile(95)
+        with self._resilience_lock:
+            sample_count = len(self._latency_samples)
+            hedge_stats = dict(self._hedge_stats)
+
+        return {
+            "circuit_breaker": (
+                self.circuit_breaker.get_status() if self.circuit_breaker else None
+            ),
+            "latency": {
+                "samples": sample_count,
+                "p50_ms": round(p50 * 1000, 2) if p50 is not None else None,
+                "p95_ms": round(p95 * 1000, 2) if p95 is not None else None,
+            },
+            "hedging": {
+                "enabled": self.config.resilience.hedging_enabled,
+                "hedge_delay_ms": round(self._get_hedge_delay() * 1000, 2),
+                **hedge_stats,
+            },
+        }
+
     def cleanup_cache(self) -> None:
         """Clean up expired cache entries"""
         self.cache.cleanup_expired()
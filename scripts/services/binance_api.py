@@ -7,13 +7,21 @@ Production-grade Binance API integration with:
 - Order book depth and recent trades data
 - Historical klines/candlestick data for technical analysis
 - Exchange information and trading rules
+- Concurrent multi-symbol summaries and resumable klines backfill into a
+  local columnar candle store
 - Completely free public endpoints with no authentication required
 """
 
+import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from .base_financial_service import (
     BaseFinancialService,
@@ -25,6 +33,262 @@ from .base_financial_service import (
 sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
 from config_loader import ConfigLoader
 
+DEFAULT_KLINE_STORE_DIR = (
+    Path(__file__).parent.parent.parent / "data" / "cache" / "binance_klines"
+)
+
+KLINES_ENDPOINT = "/api/v3/klines"
+
+# Binance caps klines responses at this many candles per request
+MAX_KLINES_PER_REQUEST = 1000
+
+# Candle length per interval ("1M" approximated as 31 days)
+INTERVAL_MILLISECONDS = {
+    "1s": 1000,
+    "1m": 60_000,
+    "3m": 180_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "2h": 7_200_000,
+    "4h": 14_400_000,
+    "6h": 21_600_000,
+    "8h": 28_800_000,
+    "12h": 43_200_000,
+    "1d": 86_400_000,
+    "3d": 259_200_000,
+    "1w": 604_800_000,
+    "1M": 2_678_400_000,
+}
+
+# Leading kline fields kept as columns (the rest are trade counts and
+# taker volumes)
+KLINE_COLUMNS = ("open_time", "open", "high", "low", "close", "volume", "close_time")
+_TIME_COLUMNS = ("open_time", "close_time")
+
+
+def _empty_columns() -> Dict[str, np.ndarray]:
+    return {
+        name: np.empty(0, dtype=np.int64 if name in _TIME_COLUMNS else np.float64)
+        for name in KLINE_COLUMNS
+    }
+
+
+def klines_to_columns(klines: List[List[Union[str, float]]]) -> Dict[str, np.ndarray]:
+    """
+    Convert raw Binance kline rows to aligned numpy columns
+
+    Args:
+        klines: Kline rows as returned by /api/v3/klines
+
+    Returns:
+        Dictionary of KLINE_COLUMNS arrays (times as int64 milliseconds)
+    """
+    if not klines:
+        return _empty_columns()
+
+    fields = list(zip(*klines))
+    return {
+        name: np.array(
+            fields[i], dtype=np.int64 if name in _TIME_COLUMNS else np.float64
+        )
+        for i, name in enumerate(KLINE_COLUMNS)
+    }
+
+
+def calculate_candle_statistics(columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """
+    Summary statistics over candle columns
+
+    Args:
+        columns: Candle columns sorted by open time
+
+    Returns:
+        Dictionary of price and volume statistics (empty without candles)
+    """
+    closes = columns["close"]
+    if len(closes) == 0:
+        return {}
+
+    volumes = columns["volume"]
+    total_volume = float(volumes.sum())
+    start_price = float(closes[0])
+    end_price = float(closes[-1])
+    has_change = len(closes) >= 2
+
+    volatility = None
+    if len(closes) >= 3 and np.all(closes[:-1] > 0):
+        returns = np.diff(closes) / closes[:-1]
+        volatility = float(np.std(returns, ddof=1) * 100)
+
+    return {
+        "data_points": len(closes),
+        "start_price": start_price,
+        "end_price": end_price,
+        "price_change": end_price - start_price if has_change else 0,
+        "price_change_percent": (
+            (end_price - start_price) / start_price * 100
+            if has_change and start_price > 0
+            else 0
+        ),
+        "highest_price": float(columns["high"].max()),
+        "lowest_price": float(columns["low"].min()),
+        "average_volume": total_volume / len(volumes),
+        "total_volume": total_volume,
+        "vwap": (
+            float(np.dot(closes, volumes) / total_volume) if total_volume > 0 else None
+        ),
+        "volatility_percent": volatility,
+    }
+
+
+class BinanceKlineStore:
+    """
+    Persistent columnar store of Binance candles keyed by symbol and interval
+
+    Each (symbol, interval) entry holds numpy columns sorted by open time,
+    the earliest time a backfill covered and when it was last updated, saved
+    as one .npz file. Merged candles replace stored candles with the same
+    open time, so a candle stored while still forming is corrected when a
+    backfill resumes from it.
+    """
+
+    def __init__(self, store_dir: Optional[Union[str, Path]] = DEFAULT_KLINE_STORE_DIR):
+        """
+        Args:
+            store_dir: Directory for stored candles (None keeps them in memory)
+        """
+        self.store_dir = Path(store_dir) if store_dir is not None else None
+        self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, symbol: str, interval: str) -> Optional[Dict[str, Any]]:
+        """Stored entry for a symbol and interval (None if never backfilled)"""
+        key = (symbol.upper(), interval)
+        with self._lock:
+            if key not in self._entries:
+                entry = self._load(key)
+                if entry is None:
+                    return None
+                self._entries[key] = entry
+            return self._entries[key]
+
+    def merge(
+        self,
+        symbol: str,
+        interval: str,
+        columns: Dict[str, np.ndarray],
+        covered_from: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Merge fetched candles into the stored entry
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Kline interval
+            columns: Candle columns; candles for stored open times replace them
+            covered_from: Open time the fetch started from, extending coverage
+                back to it even when no candles exist that early
+
+        Returns:
+            Updated entry
+        """
+        key = (symbol.upper(), interval)
+        with self._lock:
+            entry = self.get(symbol, interval)
+            stored = entry["columns"] if entry else _empty_columns()
+            combined = {
+                name: np.concatenate([stored[name], columns[name]])
+                for name in KLINE_COLUMNS
+            }
+
+            # Keep the last occurrence of each open time, sorted by open time
+            reversed_times = combined["open_time"][::-1]
+            _, last_from_end = np.unique(reversed_times, return_index=True)
+            keep = len(reversed_times) - 1 - last_from_end
+
+            starts = [
+                value
+                for value in (entry and entry["covered_from"], covered_from)
+                if value is not None
+            ]
+            entry = {
+                "columns": {name: combined[name][keep] for name in KLINE_COLUMNS},
+                "covered_from": min(starts) if starts else None,
+                "updated_at": int(time.time() * 1000),
+            }
+            self._entries[key] = entry
+            self._save(key, entry)
+            return entry
+
+    def candles(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Stored candle columns with open times in [start_time, end_time]"""
+        entry = self.get(symbol, interval)
+        if entry is None:
+            return _empty_columns()
+
+        open_times = entry["columns"]["open_time"]
+        lo = 0 if start_time is None else np.searchsorted(open_times, start_time)
+        hi = (
+            len(open_times)
+            if end_time is None
+            else np.searchsorted(open_times, end_time, side="right")
+        )
+        return {name: values[lo:hi] for name, values in entry["columns"].items()}
+
+    def clear(self) -> None:
+        """Drop all stored candles"""
+        with self._lock:
+            self._entries.clear()
+            if self.store_dir is not None and self.store_dir.exists():
+                for path in self.store_dir.glob("*/*.npz"):
+                    path.unlink()
+
+    def _path(self, key: Tuple[str, str]) -> Path:
+        symbol, interval = key
+        # "1M" and "1m" must not collide on case-insensitive file systems
+        return self.store_dir / symbol / f"{interval.replace('M', 'mo')}.npz"
+
+    def _load(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        if self.store_dir is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                covered_from = int(data["covered_from"])
+                return {
+                    "columns": {name: data[name] for name in KLINE_COLUMNS},
+                    "covered_from": covered_from if covered_from >= 0 else None,
+                    "updated_at": int(data["updated_at"]),
+                }
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _save(self, key: Tuple[str, str], entry: Dict[str, Any]) -> None:
+        if self.store_dir is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        covered_from = entry["covered_from"]
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                covered_from=np.int64(-1 if covered_from is None else covered_from),
+                updated_at=np.int64(entry["updated_at"]),
+                **entry["columns"],
+            )
+        os.replace(temp_path, path)
+
 
 class BinanceAPIService(BaseFinancialService):
     """
@@ -37,18 +301,26 @@ class BinanceAPIService(BaseFinancialService):
     - Exchange information and symbol details
     """
 
-    def __init__(self, config: ServiceConfig):
+    def __init__(
+        self, config: ServiceConfig, kline_store: Optional[BinanceKlineStore] = None
+    ):
         super().__init__(config)
 
         # Binance public API is completely free, no API key required
         if not self.config.base_url:
             self.config.base_url = "https://api.binance.com"
 
+        self.kline_store = kline_store or BinanceKlineStore()
+
     def _validate_response(
         self, data: Union[Dict[str, Any], List[Dict[str, Any]]], endpoint: str
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Validate Binance API response data"""
 
+        # An empty klines page marks the end of a paginated backfill
+        if endpoint == KLINES_ENDPOINT and data == []:
+            return data
+
         if not data:
             raise DataNotFoundError(f"No data returned from Binance API {endpoint}")
 
@@ -163,33 +435,15 @@ class BinanceAPIService(BaseFinancialService):
         """Get kline/candlestick data"""
 
         # Validate interval
-        valid_intervals = [
-            "1s",
-            "1m",
-            "3m",
-            "5m",
-            "15m",
-            "30m",
-            "1h",
-            "2h",
-            "4h",
-            "6h",
-            "8h",
-            "12h",
-            "1d",
-            "3d",
-            "1w",
-            "1M",
-        ]
-        if interval not in valid_intervals:
+        if interval not in INTERVAL_MILLISECONDS:
             interval = "1h"
 
-        if limit > 1000:
-            limit = 1000
+        if limit > MAX_KLINES_PER_REQUEST:
+            limit = MAX_KLINES_PER_REQUEST
         elif limit < 1:
             limit = 1
 
-        endpoint = "/api/v3/klines"
+        endpoint = KLINES_ENDPOINT
         params = {"symbol": symbol.upper(), "interval": interval, "limit": limit}
 
         if start_time:
@@ -200,6 +454,144 @@ class BinanceAPIService(BaseFinancialService):
         data = self._make_request_with_retry(endpoint, params=params)
         return self._validate_response(data, f"klines for {symbol}")
 
+    def backfill_klines(
+        self,
+        symbol: str = "BTCUSDT",
+        interval: str = "1h",
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        page_limit: int = MAX_KLINES_PER_REQUEST,
+    ) -> Dict[str, Any]:
+        """
+        Backfill candles into the kline store and return the requested range
+
+        Pages through /api/v3/klines from the last stored candle (re-requesting
+        it, as it may have been stored while still forming) and fills any gap
+        before the earliest time already covered. Pages continuing stored data
+        are saved as they arrive, so an interrupted backfill resumes where it
+        stopped.
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Kline interval
+            start_time: First open time in milliseconds (defaults to
+                page_limit candles before end_time)
+            end_time: Last open time in milliseconds (defaults to now)
+            page_limit: Candles requested per page
+
+        Returns:
+            Dictionary with the candle columns for the range, the backfill
+            status ("stored", "fetched" or "resumed") and page counts
+        """
+        symbol = symbol.upper()
+        if interval not in INTERVAL_MILLISECONDS:
+            interval = "1h"
+        page_limit = max(1, min(page_limit, MAX_KLINES_PER_REQUEST))
+        if end_time is None:
+            end_time = int(time.time() * 1000)
+        if start_time is None:
+            start_time = end_time - page_limit * INTERVAL_MILLISECONDS[interval]
+
+        entry = self.kline_store.get(symbol, interval)
+        stored_times = entry["columns"]["open_time"] if entry else []
+
+        # (start, end, save each page) segments still to fetch
+        segments = []
+        if len(stored_times) == 0:
+            status = "fetched"
+            segments.append((start_time, end_time, True))
+        else:
+            status = "resumed"
+            covered_from = entry["covered_from"]
+            if covered_from is None or start_time < covered_from:
+                gap_end = int(stored_times[0]) if covered_from is None else covered_from
+                segments.append((start_time, gap_end - 1, False))
+
+            last_close = int(entry["columns"]["close_time"][-1])
+            last_final = last_close < entry["updated_at"]
+            if end_time > last_close or not last_final:
+                segments.append((int(stored_times[-1]), end_time, True))
+
+            if not segments:
+                status = "stored"
+
+        pages = 0
+        fetched = 0
+        for segment_start, segment_end, save_pages in segments:
+            segment_pages, segment_fetched = self._backfill_segment(
+                symbol, interval, segment_start, segment_end, page_limit, save_pages
+            )
+            pages += segment_pages
+            fetched += segment_fetched
+
+        return {
+            "symbol": symbol,
+            "interval": interval,
+            "status": status,
+            "pages": pages,
+            "candles_fetched": fetched,
+            "columns": self.kline_store.candles(symbol, interval, start_time, end_time),
+        }
+
+    def _backfill_segment(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: int,
+        end_time: int,
+        page_limit: int,
+        save_pages: bool,
+    ) -> Tuple[int, int]:
+        """
+        Fetch [start_time, end_time] page by page into the kline store
+
+        Pages that continue stored data are saved one by one; a gap before
+        stored data is saved once complete, so coverage never spans a hole.
+
+        Returns:
+            Pages requested and candles fetched
+        """
+        pages = []
+        cursor = start_time
+        while cursor <= end_time:
+            page = self._fetch_klines_page(
+                symbol, interval, cursor, end_time, page_limit
+            )
+            columns = klines_to_columns(page)
+            pages.append(columns)
+            if save_pages:
+                self.kline_store.merge(symbol, interval, columns, start_time)
+            if len(page) < page_limit:
+                break
+            cursor = int(columns["open_time"][-1]) + 1
+
+        if not save_pages:
+            merged = {
+                name: np.concatenate([columns[name] for columns in pages])
+                for name in KLINE_COLUMNS
+            }
+            self.kline_store.merge(symbol, interval, merged, start_time)
+
+        return len(pages), sum(len(columns["open_time"]) for columns in pages)
+
+    def _fetch_klines_page(
+        self, symbol: str, interval: str, start_time: int, end_time: int, limit: int
+    ) -> List[List[Union[str, float]]]:
+        """One klines page fetched from the API, bypassing the response cache
+        (the kline store persists it)"""
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "startTime": str(start_time),
+            "endTime": str(end_time),
+            "limit": limit,
+        }
+        cache_key = self._generate_cache_key(KLINES_ENDPOINT, params)
+        correlation_id = self._generate_correlation_id(KLINES_ENDPOINT, params)
+        return self._fetch_and_cache(
+            KLINES_ENDPOINT, params, cache_key, correlation_id, cache_result=False
+        )
+
     def get_average_price(self, symbol: str = "BTCUSDT") -> Dict[str, Any]:
         """Get current average price for a symbol"""
         endpoint = "/api/v3/avgPrice"
@@ -289,54 +681,58 @@ class BinanceAPIService(BaseFinancialService):
 
         summary = {
             "symbols": [],
+            "failed_symbols": [],
             "market_overview": {},
             "timestamp": datetime.now().isoformat(),
         }
-
-        for symbol in symbols:
-            try:
-                ticker_data = self.get_24hr_ticker_stats(symbol)
-                price_data = self.get_symbol_price_ticker(symbol)
-
-                symbol_summary = {
-                    "symbol": symbol,
-                    "current_price": float(price_data.get("price", 0)),
-                    "price_change_24h": float(ticker_data.get("priceChange", 0)),
-                    "price_change_percent_24h": float(
-                        ticker_data.get("priceChangePercent", 0)
-                    ),
-                    "volume_24h": float(ticker_data.get("volume", 0)),
-                    "high_24h": float(ticker_data.get("highPrice", 0)),
-                    "low_24h": float(ticker_data.get("lowPrice", 0)),
-                }
-
-                summary["symbols"].append(symbol_summary)
-
-            except Exception as e:
-                # Skip failed symbols
-                continue
+        if not symbols:
+            return summary
+
+        # Fetch symbols concurrently, bounded by the rate limit burst size
+        workers = min(self.config.rate_limit.burst_limit, len(symbols))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            futures = [
+                executor.submit(self._get_symbol_summary, symbol) for symbol in symbols
+            ]
+            for symbol, future in zip(symbols, futures):
+                try:
+                    summary["symbols"].append(future.result())
+                except Exception:
+                    # Skip failed symbols
+                    summary["failed_symbols"].append(symbol)
 
         # Calculate market overview
         if summary["symbols"]:
-            total_volume = sum([s["volume_24h"] for s in summary["symbols"]])
-            avg_change = sum(
+            volumes = np.array([s["volume_24h"] for s in summary["symbols"]])
+            changes = np.array(
                 [s["price_change_percent_24h"] for s in summary["symbols"]]
-            ) / len(summary["symbols"])
+            )
 
             summary["market_overview"] = {
                 "total_symbols": len(summary["symbols"]),
-                "total_volume_24h": round(total_volume, 2),
-                "average_change_percent_24h": round(avg_change, 2),
-                "symbols_up": len(
-                    [s for s in summary["symbols"] if s["price_change_percent_24h"] > 0]
-                ),
-                "symbols_down": len(
-                    [s for s in summary["symbols"] if s["price_change_percent_24h"] < 0]
-                ),
+                "total_volume_24h": round(float(volumes.sum()), 2),
+                "average_change_percent_24h": round(float(changes.mean()), 2),
+                "symbols_up": int(np.count_nonzero(changes > 0)),
+                "symbols_down": int(np.count_nonzero(changes < 0)),
             }
 
         return summary
 
+    def _get_symbol_summary(self, symbol: str) -> Dict[str, Any]:
+        """24-hour summary for one symbol"""
+        ticker_data = self.get_24hr_ticker_stats(symbol)
+        price_data = self.get_symbol_price_ticker(symbol)
+
+        return {
+            "symbol": symbol,
+            "current_price": float(price_data.get("price", 0)),
+            "price_change_24h": float(ticker_data.get("priceChange", 0)),
+            "price_change_percent_24h": float(ticker_data.get("priceChangePercent", 0)),
+            "volume_24h": float(ticker_data.get("volume", 0)),
+            "high_24h": float(ticker_data.get("highPrice", 0)),
+            "low_24h": float(ticker_data.get("lowPrice", 0)),
+        }
+
     def get_bitcoin_price_history(self, days: int = 7) -> Dict[str, Any]:
         """Get Bitcoin price history for analysis"""
         if days > 30:
@@ -361,52 +757,37 @@ class BinanceAPIService(BaseFinancialService):
             interval = "4h"
 
         try:
-            klines = self.get_klines(
+            backfill = self.backfill_klines(
                 symbol="BTCUSDT",
                 interval=interval,
-                start_time=str(start_ms),
-                end_time=str(end_ms),
-                limit=1000,
+                start_time=start_ms,
+                end_time=end_ms,
             )
-
-            # Process klines data
-            price_history = []
-            for kline in klines:
-                price_data = {
-                    "open_time": int(kline[0]),
-                    "open_price": float(kline[1]),
-                    "high_price": float(kline[2]),
-                    "low_price": float(kline[3]),
-                    "close_price": float(kline[4]),
-                    "volume": float(kline[5]),
-                    "close_time": int(kline[6]),
-                    "datetime": datetime.fromtimestamp(
-                        int(kline[0]) / 1000
-                    ).isoformat(),
-                }
-                price_history.append(price_data)
-
-            # Calculate summary statistics
-            if price_history:
-                closes = [p["close_price"] for p in price_history]
-                highs = [p["high_price"] for p in price_history]
-                lows = [p["low_price"] for p in price_history]
-                volumes = [p["volume"] for p in price_history]
+            columns = backfill["columns"]
+
+            if len(columns["open_time"]):
+                open_times = columns["open_time"].tolist()
+                price_history = [
+                    {
+                        "open_time": open_ms,
+                        "open_price": open_price,
+                        "high_price": high,
+                        "low_price": low,
+                        "close_price": close,
+                        "volume": volume,
+                        "close_time": close_ms,
+                        "datetime": datetime.fromtimestamp(open_ms / 1000).isoformat(),
+                    }
+                    for open_ms, open_price, high, low, close, volume, close_ms in zip(
+                        open_times,
+                        *(columns[name].tolist() for name in KLINE_COLUMNS[1:]),
+                    )
+                ]
 
                 summary_stats = {
                     "period_days": days,
                     "interval": interval,
-                    "data_points": len(price_history),
-                    "start_price": closes[0] if closes else 0,
-                    "end_price": closes[-1] if closes else 0,
-                    "price_change": closes[-1] - closes[0] if len(closes) >= 2 else 0,
-                    "price_change_percent": ((closes[-1] - closes[0]) / closes[0] * 100)
-                    if len(closes) >= 2 and closes[0] > 0
-                    else 0,
-                    "highest_price": max(highs) if highs else 0,
-                    "lowest_price": min(lows) if lows else 0,
-                    "average_volume": sum(volumes) / len(volumes) if volumes else 0,
-                    "total_volume": sum(volumes) if volumes else 0,
+                    **calculate_candle_statistics(columns),
                 }
 
                 return {
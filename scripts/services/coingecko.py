@@ -398,6 +398,7 @@ class CoinGeckoService(BaseFinancialService):
                     "exchanges": "1,000+",
                     "blockchain_networks": "200+",
                 },
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -407,6 +408,7 @@ class CoinGeckoService(BaseFinancialService):
                 "status": "unhealthy",
                 "error": str(e),
                 "error_type": type(e).__name__,
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
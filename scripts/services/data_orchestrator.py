@@ -7,14 +7,38 @@ Coordinates multiple financial data services to provide:
 - Unified data aggregation and enrichment
 - Institutional-grade data quality assessment
 - Error handling and fallback strategies
+- Concurrent provider fan-out with per-call deadlines and early consensus
+- Per-provider latency histograms
 """
 
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .base_financial_service import FinancialServiceError
 
+# Upper bounds (milliseconds) of the provider latency histogram buckets
+LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# Fan-out call key (service name, or (service, ticker) for batched validation)
+CallKey = TypeVar("CallKey", bound=Hashable)
+
 
 class DataOrchestrator:
     """
@@ -27,10 +51,30 @@ class DataOrchestrator:
     - Confidence scoring
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = 8,
+        default_timeout_seconds: float = 10.0,
+        consistency_threshold_pct: float = 1.0,
+        latency_window: int = 500,
+    ):
         self.services: Dict[str, Any] = {}
         self.logger = logging.getLogger("data_orchestrator")
 
+        # Concurrency and consensus configuration
+        self.max_workers = max_workers
+        self.default_timeout_seconds = default_timeout_seconds
+        self.consistency_threshold_pct = consistency_threshold_pct
+
+        # Rolling per-provider latency samples (milliseconds)
+        self._latency_window = latency_window
+        self._latency_samples: Dict[str, Deque[float]] = {}
+        self._latency_lock = threading.Lock()
+
+        # Shared fan-out pool, created on first use and released by close()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
     def register_service(self, name: str, service: Any) -> None:
         """Register a financial service"""
         self.services[name] = service
@@ -46,47 +90,356 @@ class DataOrchestrator:
         """List all registered services"""
         return list(self.services.keys())
 
+    def _record_latency(self, service_name: str, elapsed_ms: float) -> None:
+        """Record a provider call latency sample"""
+        with self._latency_lock:
+            samples = self._latency_samples.get(service_name)
+            if samples is None:
+                samples = deque(maxlen=self._latency_window)
+                self._latency_samples[service_name] = samples
+            samples.append(elapsed_ms)
+
+    def get_latency_histograms(
+        self, service_names: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-provider latency histograms from recent calls
+
+        Args:
+            service_names: Providers to include (defaults to all with samples)
+
+        Returns:
+            Dict mapping provider name to bucket counts and summary percentiles
+        """
+        with self._latency_lock:
+            snapshot = {
+                name: list(samples)
+                for name, samples in self._latency_samples.items()
+                if service_names is None or name in service_names
+            }
+
+        histograms = {}
+        for name, samples in snapshot.items():
+            if not samples:
+                continue
+
+            buckets: Dict[str, int] = {
+                f"le_{bound}ms": 0 for bound in LATENCY_BUCKETS_MS
+            }
+            buckets["gt_10000ms"] = 0
+            for sample in samples:
+                for bound in LATENCY_BUCKETS_MS:
+                    if sample <= bound:
+                        buckets[f"le_{bound}ms"] += 1
+                        break
+                else:
+                    buckets["gt_10000ms"] += 1
+
+            ordered = sorted(samples)
+            histograms[name] = {
+                "count": len(ordered),
+                "buckets": buckets,
+                "p50_ms": round(ordered[int(0.50 * (len(ordered) - 1))], 2),
+                "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))], 2),
+                "max_ms": round(ordered[-1], 2),
+                "last_ms": round(samples[-1], 2),
+            }
+
+        return histograms
+
+    def _timed_call(
+        self, service_name: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Invoke a provider method and record its latency (success or failure)"""
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._record_latency(service_name, (time.perf_counter() - start) * 1000)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the orchestrator's fan-out pool, creating it on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.max_workers),
+                    thread_name_prefix="orchestrator",
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the fan-out pool without waiting for running provider calls"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fan_out(
+        self,
+        calls: Dict[CallKey, Tuple[str, Callable[[], Any]]],
+        timeout_seconds: Optional[float] = None,
+        stop_when: Optional[Callable[[Dict[CallKey, Any]], bool]] = None,
+    ) -> Tuple[Dict[CallKey, Any], Dict[CallKey, str], List[CallKey]]:
+        """
+        Dispatch provider calls concurrently under a shared deadline
+
+        Args:
+            calls: Mapping of call key to (service name, zero-argument callable)
+            timeout_seconds: Deadline for all calls (defaults to orchestrator default)
+            stop_when: Optional predicate on completed results; when it returns
+                True the remaining calls are cancelled or ignored
+
+        Returns:
+            Tuple of (results by key, errors by key, keys left unfinished)
+        """
+        results: Dict[CallKey, Any] = {}
+        errors: Dict[CallKey, str] = {}
+        if not calls:
+            return results, errors, []
+
+        timeout = (
+            self.default_timeout_seconds if timeout_seconds is None else timeout_seconds
+        )
+        deadline = time.monotonic() + timeout
+
+        executor = self._get_executor()
+        futures: Dict[Future, CallKey] = {
+            executor.submit(self._timed_call, service_name, func): key
+            for key, (service_name, func) in calls.items()
+        }
+        pending = set(futures)
+
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            done, pending = wait(
+                pending, timeout=remaining, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    errors[key] = str(e)
+
+            if stop_when is not None and pending and stop_when(results):
+                break
+
+        # Never block on stragglers; queued calls are cancelled and running
+        # calls finish in the background
+        unfinished = [futures[future] for future in pending]
+        for future in pending:
+            future.cancel()
+        return results, errors, unfinished
+
+    def _has_price_consensus(
+        self, prices: List[float], min_agreeing_sources: int
+    ) -> bool:
+        """Check whether enough prices agree within the consistency threshold"""
+        if len(prices) < min_agreeing_sources:
+            return False
+
+        ordered = sorted(prices)
+        for start in range(len(ordered) - min_agreeing_sources + 1):
+            window = ordered[start : start + min_agreeing_sources]
+            mean = sum(window) / len(window)
+            if mean > 0 and (window[-1] - window[0]) / mean * 100 < (
+                self.consistency_threshold_pct
+            ):
+                return True
+        return False
+
+    def _resolve_method(
+        self, service_name: str, method_name: str
+    ) -> Tuple[Optional[Callable[..., Any]], Optional[str]]:
+        """Resolve a registered service method or describe why it is unavailable"""
+        if service_name not in self.services:
+            return None, f"Service {service_name} not registered"
+
+        method = getattr(self.services[service_name], method_name, None)
+        if not method:
+            return None, f"Method {method_name} not found"
+        return method, None
+
     def validate_cross_source_prices(
-        self, ticker: str, source_methods: Dict[str, str]
+        self,
+        ticker: str,
+        source_methods: Dict[str, str],
+        timeout_seconds: Optional[float] = None,
+        min_agreeing_sources: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Validate prices across multiple sources
 
+        Providers are queried concurrently under a shared deadline. When
+        min_agreeing_sources is set, the call returns as soon as that many
+        prices agree within the consistency threshold and the remaining
+        providers are ignored.
+
         Args:
             ticker: Stock ticker symbol
             source_methods: Dict mapping service names to method names
+            timeout_seconds: Per-call deadline (defaults to orchestrator default)
+            min_agreeing_sources: Agreeing sources required for early consensus
 
         Returns:
             Dict containing validation results and confidence score
         """
-        price_sources = {}
-        errors = {}
+        errors: Dict[str, str] = {}
+        calls: Dict[str, Tuple[str, Callable[[], Any]]] = {}
 
         for service_name, method_name in source_methods.items():
-            if service_name not in self.services:
-                errors[service_name] = f"Service {service_name} not registered"
+            method, error = self._resolve_method(service_name, method_name)
+            if method is None:
+                errors[service_name] = str(error)
                 continue
+            calls[service_name] = (service_name, partial(method, ticker))
+
+        def extract_prices(results: Dict[str, Any]) -> Dict[str, float]:
+            prices = {}
+            for name in source_methods:
+                if name in results:
+                    # Extract price from different response formats
+                    price = self._extract_price_from_response(results[name], name)
+                    if price:
+                        prices[name] = price
+            return prices
+
+        stop_when: Optional[Callable[[Dict[str, Any]], bool]] = None
+        if min_agreeing_sources:
+
+            def has_consensus(results: Dict[str, Any]) -> bool:
+                return self._has_price_consensus(
+                    list(extract_prices(results).values()), min_agreeing_sources
+                )
+
+            stop_when = has_consensus
+
+        results, call_errors, unfinished = self._fan_out(
+            calls, timeout_seconds, stop_when
+        )
 
-            try:
-                service = self.services[service_name]
-                method = getattr(service, method_name, None)
+        for service_name, error in call_errors.items():
+            errors[service_name] = error
+            self.logger.warning(f"Failed to get price from {service_name}: {error}")
+
+        price_sources = extract_prices(results)
+        early_consensus = bool(
+            min_agreeing_sources
+            and unfinished
+            and self._has_price_consensus(
+                list(price_sources.values()), min_agreeing_sources
+            )
+        )
+        if not early_consensus:
+            for service_name in unfinished:
+                errors[service_name] = "Deadline exceeded"
+
+        validation = self._calculate_price_validation(price_sources, errors)
+        validation["orchestration_metadata"] = {
+            "early_consensus": early_consensus,
+            "skipped_sources": sorted(unfinished) if early_consensus else [],
+            "timed_out_sources": [] if early_consensus else sorted(unfinished),
+            "latency_histograms": self.get_latency_histograms(list(source_methods)),
+        }
+        return validation
+
+    def validate_cross_source_prices_batch(
+        self,
+        tickers: List[str],
+        source_methods: Dict[str, str],
+        batch_methods: Optional[Dict[str, str]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate prices for many tickers in one concurrent fan-out
+
+        All (provider, ticker) calls share one worker pool and deadline. A
+        provider listed in batch_methods is called once with the full ticker
+        list and must return a dict keyed by ticker, amortising its overhead.
+
+        Args:
+            tickers: Stock ticker symbols
+            source_methods: Dict mapping service names to single-ticker methods
+            batch_methods: Optional dict mapping service names to batch methods
+            timeout_seconds: Deadline for the whole batch
 
-                if not method:
-                    errors[service_name] = f"Method {method_name} not found"
+        Returns:
+            Dict mapping each ticker to its validate_cross_source_prices result
+        """
+        batch_methods = batch_methods or {}
+        setup_errors: Dict[str, str] = {}
+        calls: Dict[Tuple[str, Optional[str]], Tuple[str, Callable[[], Any]]] = {}
+
+        for service_name, method_name in source_methods.items():
+            batch_name = batch_methods.get(service_name)
+            if batch_name:
+                batch_method, _ = self._resolve_method(service_name, batch_name)
+                if batch_method is not None:
+                    calls[(service_name, None)] = (
+                        service_name,
+                        partial(batch_method, list(tickers)),
+                    )
                     continue
 
-                result = method(ticker)
+            method, error = self._resolve_method(service_name, method_name)
+            if method is None:
+                setup_errors[service_name] = str(error)
+                continue
+            for ticker in tickers:
+                calls[(service_name, ticker)] = (service_name, partial(method, ticker))
+
+        results, call_errors, unfinished = self._fan_out(calls, timeout_seconds)
+        histograms = self.get_latency_histograms(list(source_methods))
 
-                # Extract price from different response formats
-                price = self._extract_price_from_response(result, service_name)
+        batch_results = {}
+        for ticker in tickers:
+            price_sources: Dict[str, float] = {}
+            errors = dict(setup_errors)
+            timed_out = []
+
+            for service_name in source_methods:
+                if service_name in setup_errors:
+                    continue
+
+                key = (
+                    (service_name, None)
+                    if (service_name, None) in calls
+                    else (service_name, ticker)
+                )
+                if key in call_errors:
+                    errors[service_name] = call_errors[key]
+                    continue
+                if key in unfinished:
+                    errors[service_name] = "Deadline exceeded"
+                    timed_out.append(service_name)
+                    continue
+                if key not in results:
+                    continue
+
+                response = results[key]
+                if key[1] is None:
+                    response = (response or {}).get(ticker)
+                    if response is None:
+                        errors[service_name] = f"No batch result for {ticker}"
+                        continue
+
+                price = self._extract_price_from_response(response, service_name)
                 if price:
                     price_sources[service_name] = price
 
-            except Exception as e:
-                errors[service_name] = str(e)
-                self.logger.warning(f"Failed to get price from {service_name}: {e}")
+            validation = self._calculate_price_validation(price_sources, errors)
+            validation["orchestration_metadata"] = {
+                "early_consensus": False,
+                "skipped_sources": [],
+                "timed_out_sources": timed_out,
+                "latency_histograms": histograms,
+            }
+            batch_results[ticker] = validation
 
-        return self._calculate_price_validation(price_sources, errors)
+        return batch_results
 
     def _extract_price_from_response(
         self, response: Dict[str, Any], service_name: str
@@ -176,8 +529,8 @@ class DataOrchestrator:
         price_range = max_price - min_price
         deviation_percentage = (price_range / avg_price * 100) if avg_price > 0 else 100
 
-        # Determine consistency and confidence
-        is_consistent = deviation_percentage < 1.0  # Less than 1% deviation
+        # Determine consistency and confidence (default: less than 1% deviation)
+        is_consistent = deviation_percentage < self.consistency_threshold_pct
 
         if is_consistent:
             confidence_score = min(
@@ -209,14 +562,21 @@ class DataOrchestrator:
         }
 
     def get_comprehensive_analysis(
-        self, ticker: str, services_config: Dict[str, Dict[str, Any]]
+        self,
+        ticker: str,
+        services_config: Dict[str, Dict[str, Any]],
+        timeout_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Get comprehensive analysis from multiple services
 
+        Services are called concurrently; a service that misses the deadline
+        is reported as an error without delaying the others.
+
         Args:
             ticker: Stock ticker symbol
             services_config: Configuration for each service
+            timeout_seconds: Per-call deadline (defaults to orchestrator default)
 
         Returns:
             Comprehensive analysis with data quality metrics
@@ -224,35 +584,36 @@ class DataOrchestrator:
         results = {}
         errors = {}
         successful_sources = 0
+        calls: Dict[str, Tuple[str, Callable[[], Any]]] = {}
+        method_names: Dict[str, str] = {}
 
         for service_name, config in services_config.items():
-            if service_name not in self.services:
-                errors[service_name] = f"Service {service_name} not registered"
+            method_name = config.get("method", "get_stock_info")
+            method, error = self._resolve_method(service_name, method_name)
+            if method is None:
+                errors[service_name] = str(error)
                 continue
 
-            try:
-                service = self.services[service_name]
-                method_name = config.get("method", "get_stock_info")
-                method = getattr(service, method_name, None)
+            # Call service method with configured parameters
+            params = config.get("params", {})
+            method_names[service_name] = method_name
+            calls[service_name] = (service_name, partial(method, ticker, **params))
 
-                if not method:
-                    errors[service_name] = f"Method {method_name} not found"
-                    continue
-
-                # Call service method with configured parameters
-                params = config.get("params", {})
-                result = method(ticker, **params)
+        call_results, call_errors, unfinished = self._fan_out(calls, timeout_seconds)
+        for service_name in unfinished:
+            call_errors[service_name] = f"Deadline exceeded for {service_name}"
 
+        for service_name in services_config:
+            if service_name in call_results:
                 results[service_name] = {
-                    "data": result,
+                    "data": call_results[service_name],
                     "status": "success",
                     "timestamp": datetime.now().isoformat(),
-                    "method": method_name,
+                    "method": method_names[service_name],
                 }
                 successful_sources += 1
-
-            except Exception as e:
-                error_msg = str(e)
+            elif service_name in call_errors:
+                error_msg = call_errors[service_name]
                 errors[service_name] = error_msg
                 results[service_name] = {
                     "data": None,
@@ -260,7 +621,9 @@ class DataOrchestrator:
                     "error": error_msg,
                     "timestamp": datetime.now().isoformat(),
                 }
-                self.logger.error(f"Service {service_name} failed for {ticker}: {e}")
+                self.logger.error(
+                    f"Service {service_name} failed for {ticker}: {error_msg}"
+                )
 
         # Calculate overall data quality
         total_sources = len(services_config)
@@ -290,7 +653,11 @@ class DataOrchestrator:
             "errors": errors,
             "metadata": {
                 "services_used": list(services_config.keys()),
-                "orchestrator_version": "1.0.0",
+                "orchestrator_version": "1.1.0",
+                "timed_out_services": sorted(unfinished),
+                "latency_histograms": self.get_latency_histograms(
+                    list(services_config)
+                ),
             },
         }
 
@@ -733,6 +733,7 @@ class EIAEnergyService(BaseFinancialService):
                     "Regional energy production data",
                 ],
                 "data_categories": len(self.energy_series),
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -742,6 +743,7 @@ class EIAEnergyService(BaseFinancialService):
                 "status": "unhealthy",
                 "error": str(e),
                 "error_type": type(e).__name__,
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -7,12 +7,18 @@ Production-grade Financial Modeling Prep (FMP) integration with:
 - Insider trading data and earnings transcripts
 - Company profiles and financial ratios
 - Economic calendar and market news
+- Bulk quotes, profiles and fundamentals for many symbols as DataFrames,
+  backed by a local per-symbol, per-period fundamentals store
 """
 
 import sys
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
 
 from .base_financial_service import (
     BaseFinancialService,
@@ -24,6 +30,178 @@ from .base_financial_service import (
 # Add utils to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
 from config_loader import ConfigLoader
+from json_serialization import read_json, write_json
+
+DEFAULT_FUNDAMENTALS_STORE_DIR = (
+    Path(__file__).parent.parent.parent / "data" / "cache" / "fmp_fundamentals"
+)
+
+STATEMENT_TYPES = (
+    "income-statement",
+    "balance-sheet-statement",
+    "cash-flow-statement",
+)
+
+# Per-symbol fundamentals endpoints, in column precedence order for tables
+FUNDAMENTAL_DATASETS = STATEMENT_TYPES + ("key-metrics", "ratios")
+
+STATEMENT_PERIODS = ("annual", "quarter")
+
+# Symbols per request on endpoints accepting comma-separated symbols
+BATCH_SYMBOLS_PER_REQUEST = 50
+
+# Period length and how long after a period ends its filing is expected
+PERIOD_LENGTH_DAYS = {"annual": 365, "quarter": 91}
+FILING_LAG_DAYS = {"annual": 90, "quarter": 45}
+
+# Profile fields joined onto fundamentals tables
+PROFILE_COLUMNS = ("companyName", "sector", "industry", "mktCap")
+
+
+def _periods_to_fetch(
+    entry: Optional[Dict[str, Any]],
+    period: str,
+    limit: int,
+    max_age_seconds: int,
+    today: Optional[date] = None,
+) -> int:
+    """
+    Newest periods to request for a stored fundamentals entry
+
+    Stored periods are final once filed, so only periods that have ended and
+    passed their filing lag since the latest stored one are requested (plus
+    the latest stored period, to pick up restatements). Overdue periods are
+    re-checked at most once per max_age_seconds.
+
+    Returns:
+        Number of periods to request (0 when the stored entry is fresh)
+    """
+    if entry is None or not entry["rows"]:
+        return limit
+    if len(entry["rows"]) < limit and not entry["complete_history"]:
+        return limit
+
+    today = today or date.today()
+    latest = date.fromisoformat(entry["rows"][0]["date"][:10])
+    elapsed = (today - latest).days - FILING_LAG_DAYS[period]
+    due = max(0, elapsed // PERIOD_LENGTH_DAYS[period])
+    if due == 0:
+        return 0
+
+    checked_age = (
+        datetime.now() - datetime.fromisoformat(entry["checked_at"])
+    ).total_seconds()
+    if checked_age < max_age_seconds:
+        return 0
+    return min(limit, due + 1)
+
+
+class FMPFundamentalsStore:
+    """
+    Persistent local store of FMP fundamentals per symbol, dataset and period
+
+    Each (symbol, dataset, period) entry keeps the fetched rows newest first,
+    keyed by period end date, when it was last checked against the API and
+    whether the full history available has been fetched.
+    """
+
+    def __init__(
+        self, store_dir: Optional[Union[str, Path]] = DEFAULT_FUNDAMENTALS_STORE_DIR
+    ):
+        """
+        Args:
+            store_dir: Directory for stored fundamentals (None keeps them in memory)
+        """
+        self.store_dir = Path(store_dir) if store_dir is not None else None
+        self._entries: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def get(
+        self, symbol: str, dataset: str, period: str = "annual"
+    ) -> Optional[Dict[str, Any]]:
+        """Stored entry for a symbol, dataset and period (None if never fetched)"""
+        key = (symbol.upper(), dataset, period)
+        with self._lock:
+            if key not in self._entries:
+                entry = self._load(key)
+                if entry is None:
+                    return None
+                self._entries[key] = entry
+            return self._entries[key]
+
+    def merge(
+        self,
+        symbol: str,
+        dataset: str,
+        period: str,
+        rows: Iterable[Dict[str, Any]],
+        complete_history: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Merge fetched rows into the stored entry
+
+        Args:
+            symbol: Stock symbol
+            dataset: FUNDAMENTAL_DATASETS endpoint
+            period: "annual" or "quarter"
+            rows: FMP rows; rows for stored period end dates replace them
+            complete_history: The fetch returned every period available
+
+        Returns:
+            Updated entry
+        """
+        key = (symbol.upper(), dataset, period)
+        with self._lock:
+            entry = self.get(symbol, dataset, period)
+            merged = {row["date"]: row for row in entry["rows"]} if entry else {}
+            for row in rows:
+                if row.get("date"):
+                    merged[row["date"]] = {
+                        field: value
+                        for field, value in row.items()
+                        if field != "timestamp"
+                    }
+
+            entry = {
+                "symbol": key[0],
+                "dataset": dataset,
+                "period": period,
+                "rows": [merged[d] for d in sorted(merged, reverse=True)],
+                "complete_history": complete_history
+                or bool(entry and entry["complete_history"]),
+                "checked_at": datetime.now().isoformat(),
+            }
+            self._entries[key] = entry
+            self._save(key, entry)
+            return entry
+
+    def clear(self) -> None:
+        """Drop in-memory and persisted entries"""
+        with self._lock:
+            self._entries.clear()
+            if self.store_dir is not None and self.store_dir.exists():
+                for path in self.store_dir.glob("*/*.json"):
+                    path.unlink()
+
+    def _path(self, key: Tuple[str, str, str]) -> Optional[Path]:
+        if self.store_dir is None:
+            return None
+        symbol, dataset, period = key
+        return self.store_dir / symbol / f"{dataset}_{period}.json"
+
+    def _load(self, key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return read_json(path)
+        except Exception:
+            return None
+
+    def _save(self, key: Tuple[str, str, str], entry: Dict[str, Any]) -> None:
+        path = self._path(key)
+        if path is not None:
+            write_json(entry, path, compact=True)
 
 
 class FMPService(BaseFinancialService):
@@ -40,12 +218,18 @@ class FMPService(BaseFinancialService):
     - Market movers and earnings calendar
     """
 
-    def __init__(self, config: ServiceConfig):
+    def __init__(
+        self,
+        config: ServiceConfig,
+        fundamentals_store: Optional[FMPFundamentalsStore] = None,
+    ):
         super().__init__(config)
 
         if not config.api_key:
             raise ValidationError("FMP API key is required")
 
+        self.fundamentals_store = fundamentals_store or FMPFundamentalsStore()
+
     def _validate_response(
         self, data: Union[Dict[str, Any], List[Dict[str, Any]]], endpoint: str
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
@@ -130,13 +314,10 @@ class FMPService(BaseFinancialService):
         Returns:
             List containing financial statement data
         """
-        valid_statements = [
-            "income-statement",
-            "balance-sheet-statement",
-            "cash-flow-statement",
-        ]
-        if statement_type not in valid_statements:
-            raise ValidationError(f"statement_type must be one of: {valid_statements}")
+        if statement_type not in STATEMENT_TYPES:
+            raise ValidationError(
+                f"statement_type must be one of: {list(STATEMENT_TYPES)}"
+            )
 
         params = {"period": period, "limit": limit}
         result = self._make_request_with_retry(
@@ -274,6 +455,8 @@ class FMPService(BaseFinancialService):
         volume_lower_than: int = None,
         dividend_more_than: float = None,
         dividend_lower_than: float = None,
+        sector: str = None,
+        industry: str = None,
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
         """
@@ -288,12 +471,14 @@ class FMPService(BaseFinancialService):
             volume_lower_than: Maximum trading volume
             dividend_more_than: Minimum dividend yield
             dividend_lower_than: Maximum dividend yield
+            sector: Sector name (e.g. 'Technology')
+            industry: Industry name (e.g. 'Semiconductors')
             limit: Maximum number of results
 
         Returns:
             List containing stock screening results
         """
-        params = {"limit": limit}
+        params: Dict[str, Any] = {"limit": limit}
 
         if market_cap_more_than:
             params["marketCapMoreThan"] = market_cap_more_than
@@ -311,6 +496,10 @@ class FMPService(BaseFinancialService):
             params["dividendMoreThan"] = dividend_more_than
         if dividend_lower_than:
             params["dividendLowerThan"] = dividend_lower_than
+        if sector:
+            params["sector"] = sector
+        if industry:
+            params["industry"] = industry
 
         result = self._make_request_with_retry("stock-screener", params)
 
@@ -321,6 +510,247 @@ class FMPService(BaseFinancialService):
 
         return result
 
+    def get_bulk_quotes(
+        self, symbols: Sequence[str], max_workers: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Real-time quotes for many symbols from the batch quote endpoint
+
+        Args:
+            symbols: Stock symbols
+            max_workers: Concurrent batch requests (defaults to the burst limit)
+
+        Returns:
+            DataFrame indexed by symbol; symbols without a quote are listed
+            in attrs["errors"]
+        """
+        return self._get_batched("quote", symbols, max_workers)
+
+    def get_bulk_profiles(
+        self, symbols: Sequence[str], max_workers: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Company profiles for many symbols from the batch profile endpoint
+
+        Args:
+            symbols: Stock symbols
+            max_workers: Concurrent batch requests (defaults to the burst limit)
+
+        Returns:
+            DataFrame indexed by symbol; symbols without a profile are listed
+            in attrs["errors"]
+        """
+        return self._get_batched("profile", symbols, max_workers)
+
+    def get_bulk_fundamentals(
+        self,
+        symbols: Sequence[str],
+        datasets: Sequence[str] = FUNDAMENTAL_DATASETS,
+        period: str = "annual",
+        limit: int = 4,
+        include_profile: bool = True,
+        max_workers: Optional[int] = None,
+        max_age_seconds: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Fundamentals for many symbols as one table
+
+        Statements, key metrics and ratios have no multi-symbol endpoint, so
+        each (symbol, dataset) pair is fetched concurrently, bounded by the
+        rate limiter's burst limit. Rows are kept in the fundamentals store
+        and only periods filed since the latest stored one are requested.
+
+        Args:
+            symbols: Stock symbols (e.g. a sector screen)
+            datasets: FUNDAMENTAL_DATASETS endpoints to combine
+            period: Period type ('annual', 'quarter')
+            limit: Number of most recent periods per symbol
+            include_profile: Join company name, sector, industry and market cap
+            max_workers: Concurrent requests (defaults to the burst limit)
+            max_age_seconds: Minimum interval between checks for an overdue
+                period (defaults to the cache TTL)
+
+        Returns:
+            DataFrame with one row per symbol and period end date (newest
+            first within each symbol). On column name clashes the earlier
+            dataset wins. attrs["status"] maps "SYMBOL:dataset" to stored,
+            fetched or incremental, and attrs["errors"] lists failures.
+        """
+        invalid = [
+            dataset for dataset in datasets if dataset not in FUNDAMENTAL_DATASETS
+        ]
+        if invalid:
+            raise ValidationError(
+                f"datasets must be among: {list(FUNDAMENTAL_DATASETS)} (got {invalid})"
+            )
+        if period not in STATEMENT_PERIODS:
+            raise ValidationError(f"period must be one of: {list(STATEMENT_PERIODS)}")
+
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        if max_age_seconds is None:
+            max_age_seconds = self.config.cache.ttl_seconds
+        tasks = [(symbol, dataset) for symbol in symbols for dataset in datasets]
+        workers = self._bulk_workers(max_workers, len(tasks))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lambda task: self._load_fundamentals(
+                        task[0], task[1], period, limit, max_age_seconds
+                    ),
+                    tasks,
+                )
+            )
+
+        status = {}
+        errors = []
+        rows_by_dataset: Dict[str, List[Dict[str, Any]]] = {d: [] for d in datasets}
+        for (symbol, dataset), (rows, outcome) in zip(tasks, results):
+            if isinstance(outcome, Exception):
+                errors.append(
+                    {
+                        "symbol": symbol,
+                        "dataset": dataset,
+                        "error": str(outcome),
+                        "error_type": type(outcome).__name__,
+                    }
+                )
+                continue
+            status[f"{symbol}:{dataset}"] = outcome
+            rows_by_dataset[dataset].extend(
+                {**row, "symbol": symbol} for row in rows[:limit]
+            )
+
+        table = self._combine_fundamentals(rows_by_dataset)
+        if include_profile and not table.empty:
+            profiles = self.get_bulk_profiles(symbols, max_workers)
+            columns = [column for column in PROFILE_COLUMNS if column in profiles]
+            table = table.join(profiles[columns], on="symbol")
+            errors.extend(
+                {"symbol": symbol, "dataset": "profile", "error": message}
+                for symbol, message in profiles.attrs["errors"].items()
+            )
+
+        table.attrs["status"] = status
+        table.attrs["errors"] = errors
+        return table
+
+    def _request_rows(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rows from an endpoint returning a JSON array
+
+        Raises:
+            DataNotFoundError: If the response is not a list (e.g. an error payload)
+        """
+        data = self._make_request_with_retry(endpoint, params)
+        if not isinstance(data, list):
+            raise DataNotFoundError(
+                f"Expected a list of rows from {endpoint}, got {type(data).__name__}"
+            )
+        return data
+
+    def _bulk_workers(self, max_workers: Optional[int], tasks: int) -> int:
+        return max(
+            1, min(max_workers or self.config.rate_limit.burst_limit, tasks or 1)
+        )
+
+    def _get_batched(
+        self, endpoint: str, symbols: Sequence[str], max_workers: Optional[int]
+    ) -> pd.DataFrame:
+        """Rows from an endpoint accepting comma-separated symbols, by symbol"""
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        chunks = [
+            symbols[i : i + BATCH_SYMBOLS_PER_REQUEST]
+            for i in range(0, len(symbols), BATCH_SYMBOLS_PER_REQUEST)
+        ]
+
+        def fetch(chunk: List[str]) -> Union[List[Dict[str, Any]], Exception]:
+            try:
+                return self._request_rows(f"{endpoint}/{','.join(chunk)}")
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=self._bulk_workers(max_workers, len(chunks))
+        ) as executor:
+            responses = list(executor.map(fetch, chunks))
+
+        records = {}
+        errors = {}
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                errors.update(dict.fromkeys(chunk, str(response)))
+                continue
+            for row in response:
+                if isinstance(row, dict) and row.get("symbol"):
+                    records[row["symbol"].upper()] = {
+                        field: value
+                        for field, value in row.items()
+                        if field != "timestamp"
+                    }
+            for symbol in chunk:
+                if symbol not in records:
+                    errors[symbol] = f"No {endpoint} data returned for {symbol}"
+
+        table = pd.DataFrame.from_dict(records, orient="index")
+        table.index.name = "symbol"
+        table = table.drop(columns="symbol", errors="ignore")
+        table.attrs["errors"] = errors
+        return table
+
+    def _load_fundamentals(
+        self,
+        symbol: str,
+        dataset: str,
+        period: str,
+        limit: int,
+        max_age_seconds: int,
+    ) -> Tuple[List[Dict[str, Any]], Union[str, Exception]]:
+        """Stored rows for one symbol and dataset, fetching only due periods"""
+        try:
+            entry = self.fundamentals_store.get(symbol, dataset, period)
+            count = _periods_to_fetch(entry, period, limit, max_age_seconds)
+            if count == 0:
+                return entry["rows"], "stored"
+
+            rows = self._request_rows(
+                f"{dataset}/{symbol}", {"period": period, "limit": count}
+            )
+            # A short full fetch means the symbol has no older periods
+            entry = self.fundamentals_store.merge(
+                symbol,
+                dataset,
+                period,
+                rows,
+                complete_history=count == limit and len(rows) < limit,
+            )
+            return entry["rows"], "fetched" if count == limit else "incremental"
+        except Exception as e:
+            self.logger.warning(f"Failed to load {dataset} for {symbol}: {e}")
+            return [], e
+
+    @staticmethod
+    def _combine_fundamentals(
+        rows_by_dataset: Dict[str, List[Dict[str, Any]]],
+    ) -> pd.DataFrame:
+        """Join per-dataset rows on (symbol, date), earlier datasets winning"""
+        frames = []
+        seen = set()
+        for rows in rows_by_dataset.values():
+            if not rows:
+                continue
+            frame = pd.DataFrame.from_records(rows).set_index(["symbol", "date"])
+            frame = frame.drop(columns=[c for c in frame.columns if c in seen])
+            seen.update(frame.columns)
+            frames.append(frame)
+
+        if not frames:
+            return pd.DataFrame(columns=["symbol", "date"])
+        table = pd.concat(frames, axis=1).sort_index(ascending=[True, False])
+        return table.reset_index()
+
     def get_market_gainers(self) -> List[Dict[str, Any]]:
         """
         Get market gainers
@@ -472,7 +902,9 @@ class FMPService(BaseFinancialService):
                     "Company profiles and financial ratios",
                     "Economic calendar and market news",
                     "Stock screening and market movers",
+                    "Bulk quotes, profiles and fundamentals tables",
                 ],
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -482,6 +914,7 @@ class FMPService(BaseFinancialService):
                 "status": "unhealthy",
                 "error": str(e),
                 "error_type": type(e).__name__,
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -7,13 +7,19 @@ Production-grade Federal Reserve Economic Data (FRED) integration with:
 - Inflation, interest rates, employment, and GDP data
 - Historical economic data with flexible date ranges
 - Real-time economic indicators
+- Batched series fetches through a persistent, vintage-keyed local store
 """
 
+import bisect
 import os
 import sys
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 from base_financial_service import (
@@ -26,6 +32,220 @@ from base_financial_service import (
 # Add utils to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
 from config_loader import ConfigLoader
+from json_serialization import read_json, write_json
+
+DEFAULT_SERIES_STORE_DIR = (
+    Path(__file__).parent.parent.parent / "data" / "cache" / "fred_series"
+)
+
+# Vintage of current (non-ALFRED) observations
+LATEST_VINTAGE = "latest"
+
+# Incremental refreshes re-request this many days before the last stored
+# observation so recent revisions replace stored values
+REVISION_LOOKBACK_DAYS = 120
+
+# A year-over-year base must lie within this many days of one year earlier
+YOY_TOLERANCE_DAYS = 45
+
+
+def _observation_value(value: Any) -> Optional[float]:
+    """FRED observation value as float (None for missing "." values)"""
+    if value is None or value == ".":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def calculate_series_statistics(
+    dates: Sequence[str], values: Union[Sequence[float], np.ndarray]
+) -> Dict[str, Any]:
+    """
+    Trend, year-over-year and volatility statistics for one series
+
+    Args:
+        dates: Observation dates (YYYY-MM-DD, ascending) of valid observations
+        values: Observation values aligned with dates
+
+    Returns:
+        Dictionary of summary statistics (numbers as floats, None when the
+        series is too short for a statistic)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if n == 0:
+        return {"trend": "no_data", "observations_count": 0}
+
+    # Least-squares slope against the observation index
+    slope = None
+    trend = "insufficient_data"
+    if n >= 2:
+        x = np.arange(n, dtype=np.float64)
+        x -= x.mean()
+        slope = float(np.dot(x, values - values.mean()) / np.dot(x, x))
+        trend = "increasing" if slope > 0 else "decreasing" if slope < 0 else "stable"
+
+    # Change against the observation closest to (at or before) one year earlier
+    yoy_change = None
+    latest = date.fromisoformat(dates[-1])
+    try:
+        year_ago = latest.replace(year=latest.year - 1)
+    except ValueError:  # February 29th
+        year_ago = latest.replace(year=latest.year - 1, day=28)
+    parsed = np.asarray(dates, dtype="datetime64[D]")
+    base = np.searchsorted(parsed, np.datetime64(year_ago), side="right") - 1
+    if (
+        base >= 0
+        and np.datetime64(year_ago) - parsed[base] <= YOY_TOLERANCE_DAYS
+        and values[base] != 0
+    ):
+        yoy_change = float((values[-1] - values[base]) / values[base] * 100)
+
+    # Standard deviation of period-over-period percentage changes
+    volatility = None
+    if n >= 3:
+        previous = values[:-1]
+        changes = np.divide(
+            np.diff(values),
+            previous,
+            out=np.full(n - 1, np.nan),
+            where=previous != 0,
+        )
+        changes = changes[np.isfinite(changes)]
+        if len(changes) >= 2:
+            volatility = float(np.std(changes, ddof=1) * 100)
+
+    return {
+        "observations_count": n,
+        "latest_value": float(values[-1]),
+        "latest_date": dates[-1],
+        "average_value": float(values.mean()),
+        "min_value": float(values.min()),
+        "max_value": float(values.max()),
+        "period_change": float(values[-1] - values[0]),
+        "trend_slope": slope,
+        "trend": trend,
+        "recent_trend": (
+            "increasing" if n >= 3 and values[-1] > values[-3] else "decreasing"
+        ),
+        "yoy_change": yoy_change,
+        "volatility": volatility,
+    }
+
+
+class FREDSeriesStore:
+    """
+    Persistent local store of FRED observations keyed by series and vintage
+
+    Each (series, vintage) entry keeps columnar dates and values, the
+    earliest observation date it covers and when it was last updated.
+    The "latest" vintage holds current data and is refreshed incrementally;
+    dated vintages (ALFRED real-time snapshots) never change once stored.
+    """
+
+    def __init__(
+        self, store_dir: Optional[Union[str, Path]] = DEFAULT_SERIES_STORE_DIR
+    ):
+        """
+        Args:
+            store_dir: Directory for stored series (None keeps them in memory)
+        """
+        self.store_dir = Path(store_dir) if store_dir is not None else None
+        self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def get(
+        self, series_id: str, vintage: str = LATEST_VINTAGE
+    ) -> Optional[Dict[str, Any]]:
+        """Stored entry for a series and vintage (None if never fetched)"""
+        key = (series_id.upper(), vintage)
+        with self._lock:
+            if key not in self._entries:
+                entry = self._load(key)
+                if entry is None:
+                    return None
+                self._entries[key] = entry
+            return self._entries[key]
+
+    def merge(
+        self,
+        series_id: str,
+        vintage: str,
+        observations: Iterable[Dict[str, Any]],
+        observation_start: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Merge fetched observations into the stored entry
+
+        Args:
+            series_id: FRED series ID
+            vintage: "latest" or a vintage date (YYYY-MM-DD)
+            observations: FRED observations ({"date", "value"}); values for
+                dates already stored replace them (revisions)
+            observation_start: First date the fetch covered (None: full history)
+
+        Returns:
+            Updated entry
+        """
+        key = (series_id.upper(), vintage)
+        with self._lock:
+            entry = self.get(series_id, vintage)
+            merged: Dict[str, Optional[float]] = {}
+            covered_from = observation_start
+            if entry is not None:
+                merged.update(zip(entry["dates"], entry["values"]))
+                if entry["observation_start"] is None or covered_from is None:
+                    covered_from = None
+                else:
+                    covered_from = min(entry["observation_start"], covered_from)
+
+            for observation in observations:
+                if observation.get("date"):
+                    merged[observation["date"]] = _observation_value(
+                        observation.get("value")
+                    )
+
+            dates = sorted(merged)
+            entry = {
+                "series_id": key[0],
+                "vintage": vintage,
+                "dates": dates,
+                "values": [merged[d] for d in dates],
+                "observation_start": covered_from,
+                "updated_at": datetime.now().isoformat(),
+            }
+            self._entries[key] = entry
+            self._save(key, entry)
+            return entry
+
+    def clear(self) -> None:
+        """Drop in-memory and persisted entries"""
+        with self._lock:
+            self._entries.clear()
+            if self.store_dir is not None and self.store_dir.exists():
+                for path in self.store_dir.glob("*/*.json"):
+                    path.unlink()
+
+    def _path(self, key: Tuple[str, str]) -> Optional[Path]:
+        if self.store_dir is None:
+            return None
+        return self.store_dir / key[0] / f"{key[1]}.json"
+
+    def _load(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return read_json(path)
+        except Exception:
+            return None
+
+    def _save(self, key: Tuple[str, str], entry: Dict[str, Any]) -> None:
+        path = self._path(key)
+        if path is not None:
+            write_json(entry, path, compact=True)
 
 
 class FREDEconomicService(BaseFinancialService):
@@ -39,9 +259,14 @@ class FREDEconomicService(BaseFinancialService):
     - Historical time series data
     """
 
-    def __init__(self, config: ServiceConfig):
+    def __init__(
+        self, config: ServiceConfig, series_store: Optional[FREDSeriesStore] = None
+    ):
         super().__init__(config)
 
+        # Local observation store behind get_series_batch
+        self.series_store = series_store or FREDSeriesStore()
+
         # Common economic indicators mapping
         self.indicators = {
             "inflation": {
@@ -98,29 +323,9 @@ class FREDEconomicService(BaseFinancialService):
 
         return data
 
-    def _make_request_with_retry(
-        self, endpoint: str, params: Dict[str, Any] = None
-    ) -> Dict[str, Any]:
-        """Override to use 'api_key' parameter instead of 'apikey' for FRED API"""
-        if params is None:
-            params = {}
-
-        # FRED uses 'api_key' not 'apikey' - temporarily store API key and set to None
-        original_api_key = self.config.api_key
-        self.config.api_key = None
-
-        # Add FRED-specific API key parameter
-        if original_api_key:
-            params = {**params, "api_key": original_api_key}
-
-        try:
-            # Call parent method without API key auto-addition
-            result = super()._make_request_with_retry(endpoint, params)
-        finally:
-            # Restore original API key
-            self.config.api_key = original_api_key
-
-        return result
+    def _auth_params(self) -> Dict[str, Any]:
+        """FRED uses 'api_key' rather than 'apikey'"""
+        return {"api_key": self.config.api_key} if self.config.api_key else {}
 
     def get_series_data(
         self, series_id: str, start_date: str = None, end_date: str = None
@@ -210,6 +415,148 @@ class FREDEconomicService(BaseFinancialService):
 
         return result
 
+    def get_series_batch(
+        self,
+        series_ids: Iterable[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        vintage_date: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_age_seconds: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many series concurrently through the local series store
+
+        Series are fetched in parallel (up to the rate limit burst size);
+        every request still passes the shared rate limiter. Stored series
+        are served without a request while fresh, refreshed incrementally
+        when stale, and fetched in full when the requested range starts
+        before what is stored.
+
+        Args:
+            series_ids: FRED series IDs
+            start_date: Start date in YYYY-MM-DD format (optional)
+            end_date: End date in YYYY-MM-DD format (optional)
+            vintage_date: Observations as known on this date (ALFRED vintage)
+            max_workers: Concurrent requests (defaults to the burst limit)
+            max_age_seconds: Age after which the latest vintage is refreshed
+                (defaults to the cache TTL)
+
+        Returns:
+            Series ID -> columnar dates/values with statistics, or an error
+        """
+        series_ids = list(dict.fromkeys(series_ids))
+        workers = max(
+            1,
+            min(
+                max_workers or self.config.rate_limit.burst_limit, len(series_ids) or 1
+            ),
+        )
+        if max_age_seconds is None:
+            max_age_seconds = self.config.cache.ttl_seconds
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                series_id: executor.submit(
+                    self._load_series,
+                    series_id,
+                    start_date,
+                    end_date,
+                    vintage_date,
+                    max_age_seconds,
+                )
+                for series_id in series_ids
+            }
+
+        results = {}
+        for series_id, future in futures.items():
+            try:
+                results[series_id] = future.result()
+            except Exception as e:
+                results[series_id] = {
+                    "series_id": series_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                }
+        return results
+
+    def _load_series(
+        self,
+        series_id: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        vintage_date: Optional[str],
+        max_age_seconds: int,
+    ) -> Dict[str, Any]:
+        """Serve one series from the store, fetching only what is missing"""
+        vintage = vintage_date or LATEST_VINTAGE
+        entry = self.series_store.get(series_id, vintage)
+
+        covers_range = entry is not None and (
+            entry["observation_start"] is None
+            or (start_date is not None and entry["observation_start"] <= start_date)
+        )
+        # Past vintages never change; the latest is reused while fresh
+        fresh = covers_range and (
+            vintage != LATEST_VINTAGE
+            or (
+                datetime.now() - datetime.fromisoformat(entry["updated_at"])
+            ).total_seconds()
+            < max_age_seconds
+        )
+        if fresh:
+            status = "stored"
+        else:
+            params = {"series_id": series_id, "file_type": "json"}
+            fetch_start = start_date
+            if vintage_date:
+                params["realtime_start"] = vintage_date
+                params["realtime_end"] = vintage_date
+            if covers_range and entry["dates"]:
+                # Re-request recent history so revisions replace stored values
+                last_date = date.fromisoformat(entry["dates"][-1])
+                fetch_start = (
+                    last_date - timedelta(days=REVISION_LOOKBACK_DAYS)
+                ).isoformat()
+                status = "incremental"
+            else:
+                status = "fetched"
+            if fetch_start:
+                params["observation_start"] = fetch_start
+
+            data = self._make_request_with_retry("series/observations", params)
+            entry = self.series_store.merge(
+                series_id,
+                vintage,
+                data.get("observations", []),
+                observation_start=(
+                    entry["observation_start"] if covers_range else start_date
+                ),
+            )
+
+        dates = np.asarray(entry["dates"], dtype=object)
+        values = np.asarray(
+            [np.nan if v is None else v for v in entry["values"]], dtype=np.float64
+        )
+        selected = ~np.isnan(values)
+        if start_date:
+            selected &= dates >= start_date
+        if end_date:
+            selected &= dates <= end_date
+        dates = dates[selected].tolist()
+        values = values[selected]
+
+        return {
+            "series_id": series_id,
+            "vintage": vintage,
+            "status": status,
+            "dates": dates,
+            "values": values,
+            "statistics": calculate_series_statistics(dates, values),
+            "updated_at": entry["updated_at"],
+            "source": "fred",
+        }
+
     def get_economic_indicator(
         self, series_id: str, date_range: str = "1y"
     ) -> Dict[str, Any]:
@@ -255,38 +602,17 @@ class FREDEconomicService(BaseFinancialService):
         # Calculate statistics
         statistics = {"trend": "no_data"}
         if valid_observations:
-            values = [float(obs["value"]) for obs in valid_observations]
-            latest_value = values[-1] if values else None
-            avg_value = sum(values) / len(values) if values else None
-            min_value = min(values) if values else None
-            max_value = max(values) if values else None
-
-            # Calculate trend (simple linear regression)
-            if len(values) >= 2:
-                x = list(range(len(values)))
-                n = len(values)
-                sum_x = sum(x)
-                sum_y = sum(values)
-                sum_xy = sum(x[i] * values[i] for i in range(n))
-                sum_x2 = sum(x[i] ** 2 for i in range(n))
-
-                slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x**2)
-                trend = (
-                    "increasing"
-                    if slope > 0
-                    else "decreasing"
-                    if slope < 0
-                    else "stable"
-                )
-            else:
-                trend = "insufficient_data"
-
+            summary = calculate_series_statistics(
+                [obs["date"] for obs in valid_observations],
+                [float(obs["value"]) for obs in valid_observations],
+            )
+            avg_value = summary["average_value"]
             statistics = {
-                "latest_value": str(latest_value),
+                "latest_value": str(summary["latest_value"]),
                 "average_value": str(round(avg_value, 2)) if avg_value else None,
-                "min_value": str(min_value),
-                "max_value": str(max_value),
-                "trend": trend,
+                "min_value": str(summary["min_value"]),
+                "max_value": str(summary["max_value"]),
+                "trend": summary["trend"],
                 "observations_count": str(len(valid_observations)),
             }
 
@@ -373,33 +699,28 @@ class FREDEconomicService(BaseFinancialService):
                 k: v for k, v in target_indicators.items() if k in requested_indicators
             }
 
-        for indicator_name, series_id in target_indicators.items():
-            try:
-                # Get last 1 year of data
-                data = self.get_series_data(
-                    series_id,
-                    (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d"),
-                    datetime.now().strftime("%Y-%m-%d"),
-                )
-
-                observations = data.get("observations", [])
-                valid_observations = [
-                    obs
-                    for obs in observations
-                    if obs.get("value") and obs["value"] != "."
-                ]
-
-                if valid_observations:
-                    latest_value = float(valid_observations[-1]["value"])
-                    sector_data[indicator_name] = {
-                        "series_id": series_id,
-                        "latest_value": latest_value,
-                        "latest_date": valid_observations[-1]["date"],
-                        "observations_count": len(valid_observations),
-                    }
+        # Get last 1 year of data for every indicator in one batch
+        batch = self.get_series_batch(
+            target_indicators.values(),
+            (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d"),
+            datetime.now().strftime("%Y-%m-%d"),
+        )
 
-            except Exception as e:
-                sector_data[indicator_name] = {"series_id": series_id, "error": str(e)}
+        for indicator_name, series_id in target_indicators.items():
+            series = batch[series_id]
+            if "error" in series:
+                sector_data[indicator_name] = {
+                    "series_id": series_id,
+                    "error": series["error"],
+                }
+            elif series["dates"]:
+                summary = series["statistics"]
+                sector_data[indicator_name] = {
+                    "series_id": series_id,
+                    "latest_value": summary["latest_value"],
+                    "latest_date": summary["latest_date"],
+                    "observations_count": summary["observations_count"],
+                }
 
         return {
             "sector": sector,
@@ -437,46 +758,41 @@ class FREDEconomicService(BaseFinancialService):
         else:
             start_date = end_date - timedelta(days=365)
 
+        # Fetch one more year (plus the YoY matching tolerance) so the
+        # year-over-year change has a base observation before the window
+        window_start = start_date.strftime("%Y-%m-%d")
+        yoy_start = start_date - timedelta(days=365 + YOY_TOLERANCE_DAYS)
+
         inflation_data = {}
+        batch = self.get_series_batch(
+            inflation_series.values(),
+            yoy_start.strftime("%Y-%m-%d"),
+            end_date.strftime("%Y-%m-%d"),
+        )
 
         for measure_name, series_id in inflation_series.items():
-            try:
-                data = self.get_series_data(
-                    series_id,
-                    start_date.strftime("%Y-%m-%d"),
-                    end_date.strftime("%Y-%m-%d"),
+            series = batch[series_id]
+            if "error" in series:
+                inflation_data[measure_name] = {"error": series["error"]}
+                continue
+            first = bisect.bisect_left(series["dates"], window_start)
+            if first < len(series["dates"]):
+                yoy_change = series["statistics"]["yoy_change"]
+                summary = calculate_series_statistics(
+                    series["dates"][first:], series["values"][first:]
                 )
-
-                observations = data.get("observations", [])
-                valid_observations = [
-                    obs
-                    for obs in observations
-                    if obs.get("value") and obs["value"] != "."
-                ]
-
-                if valid_observations:
-                    values = [float(obs["value"]) for obs in valid_observations]
-                    latest_value = values[-1]
-
-                    # Calculate year-over-year change
-                    yoy_change = None
-                    if len(values) >= 12:  # Monthly data
-                        yoy_change = ((latest_value - values[-13]) / values[-13]) * 100
-
-                    inflation_data[measure_name] = {
-                        "series_id": series_id,
-                        "latest_value": latest_value,
-                        "latest_date": valid_observations[-1]["date"],
-                        "yoy_change": round(yoy_change, 2) if yoy_change else None,
-                        "recent_trend": (
-                            "increasing"
-                            if len(values) >= 3 and values[-1] > values[-3]
-                            else "decreasing"
-                        ),
-                    }
-
-            except Exception as e:
-                inflation_data[measure_name] = {"error": str(e)}
+                inflation_data[measure_name] = {
+                    "series_id": series_id,
+                    "latest_value": summary["latest_value"],
+                    "latest_date": summary["latest_date"],
+                    "yoy_change": round(yoy_change, 2) if yoy_change else None,
+                    "recent_trend": summary["recent_trend"],
+                    "volatility": (
+                        round(summary["volatility"], 4)
+                        if summary["volatility"] is not None
+                        else None
+                    ),
+                }
 
         return {
             "period": period,
@@ -529,40 +845,27 @@ class FREDEconomicService(BaseFinancialService):
             start_date = end_date - timedelta(days=365)
 
         rates_data = {}
+        batch = self.get_series_batch(
+            rate_series.values(),
+            start_date.strftime("%Y-%m-%d"),
+            end_date.strftime("%Y-%m-%d"),
+        )
 
         for rate_name, series_id in rate_series.items():
-            try:
-                data = self.get_series_data(
-                    series_id,
-                    start_date.strftime("%Y-%m-%d"),
-                    end_date.strftime("%Y-%m-%d"),
-                )
-
-                observations = data.get("observations", [])
-                valid_observations = [
-                    obs
-                    for obs in observations
-                    if obs.get("value") and obs["value"] != "."
-                ]
-
-                if valid_observations:
-                    values = [float(obs["value"]) for obs in valid_observations]
-                    latest_value = values[-1]
-
-                    # Calculate change from start of period
-                    period_change = latest_value - values[0] if len(values) > 1 else 0
-
-                    rates_data[rate_name] = {
-                        "series_id": series_id,
-                        "latest_value": latest_value,
-                        "latest_date": valid_observations[-1]["date"],
-                        "period_change": round(period_change, 2),
-                        "min_in_period": min(values),
-                        "max_in_period": max(values),
-                    }
-
-            except Exception as e:
-                rates_data[rate_name] = {"error": str(e)}
+            series = batch[series_id]
+            if "error" in series:
+                rates_data[rate_name] = {"error": series["error"]}
+            elif series["dates"]:
+                summary = series["statistics"]
+                rates_data[rate_name] = {
+                    "series_id": series_id,
+                    "latest_value": summary["latest_value"],
+                    "latest_date": summary["latest_date"],
+                    "period_change": round(summary["period_change"], 2),
+                    "min_in_period": summary["min_value"],
+                    "max_in_period": summary["max_value"],
+                    "trend": summary["trend"],
+                }
 
         return {
             "rate_type": rate_type,
@@ -613,6 +916,7 @@ class FREDEconomicService(BaseFinancialService):
                     "Real-time economic indicators",
                 ],
                 "data_categories": len(self.indicators),
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -622,6 +926,7 @@ class FREDEconomicService(BaseFinancialService):
                 "status": "unhealthy",
                 "error": str(e),
                 "error_type": type(e).__name__,
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -475,6 +475,7 @@ class IMFService(BaseFinancialService):
                     "indicators": len(self.datasets),
                     "regions": len(self.regions),
                 },
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -484,6 +485,7 @@ class IMFService(BaseFinancialService):
                 "status": "unhealthy",
                 "error": str(e),
                 "error_type": type(e).__name__,
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -715,6 +715,7 @@ class MacroEconomicService(BaseFinancialService):
                     "cache_enabled": self.config.cache.enabled,
                     "rate_limit_enabled": self.config.rate_limit.enabled,
                 },
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -724,6 +725,7 @@ class MacroEconomicService(BaseFinancialService):
                 "status": "unhealthy",
                 "error": str(e),
                 "error_type": type(e).__name__,
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -514,6 +514,7 @@ class RegionalCentralBankService(BaseFinancialService):
             "service": "regional_central_bank",
             "status": "healthy",
             "supported_regions": list(self._central_bank_mappings.keys()),
+            "resilience": self.get_resilience_status(),
             "timestamp": datetime.now().isoformat(),
             "version": "1.0.0",
         }
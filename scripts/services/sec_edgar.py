@@ -546,6 +546,7 @@ class SECEDGARService(BaseFinancialService):
                 "supported_filing_types": len(
                     self.get_supported_filings()["supported_filings"]
                 ),
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -555,6 +556,7 @@ class SECEDGARService(BaseFinancialService):
                 "status": "unhealthy",
                 "error": str(e),
                 "error_type": type(e).__name__,
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -7,12 +7,16 @@ Production-grade Yahoo Finance data integration with:
 - Comprehensive error handling and validation
 - Caching and rate limiting
 - Integration with existing yahoo_finance_service.py
+- Historical storage and collection triggers written by a queued background
+  worker, off the request path
 """
 
+import atexit
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 # Add scripts directory to path for importing existing service
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -35,6 +39,185 @@ from base_financial_service import (
 sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
 from config_loader import ConfigLoader
 
+# Maximum storage jobs written per ingestion worker pass
+DEFAULT_INGESTION_BATCH_SIZE = 32
+
+
+class YahooIngestionWorker:
+    """
+    Queued writer for historical storage and collection trigger checks
+
+    Request methods submit validated responses and return immediately; a
+    single background thread writes them in batches. Pending work is
+    coalesced per (kind, ticker, period), so a burst of calls for the same
+    ticker results in one write of the latest response.
+    """
+
+    def __init__(
+        self,
+        service: BaseFinancialService,
+        batch_size: int = DEFAULT_INGESTION_BATCH_SIZE,
+        background: bool = True,
+    ):
+        """
+        Args:
+            service: Service whose storage and trigger hooks perform the writes
+            batch_size: Maximum jobs taken per worker pass
+            background: Queue work for the worker thread (False writes inline)
+        """
+        self.service = service
+        self.batch_size = batch_size
+        self.background = background
+        self.stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "written": 0,
+            "skipped": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+        self._pending: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._active = 0
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._exit_hook_registered = False
+        self._condition = threading.Condition()
+
+    def submit(
+        self,
+        key: Tuple[str, ...],
+        data: Dict[str, Any],
+        endpoint: str,
+        params: Dict[str, Any],
+        timeframe: Optional[Any] = None,
+        trigger: bool = True,
+    ) -> None:
+        """
+        Queue storage (and optionally a collection trigger check) for a response
+
+        Args:
+            key: Coalescing key; queued work under the same key is replaced
+            data: Validated response data
+            endpoint: Endpoint name used for storage and type detection
+            params: Request parameters
+            timeframe: Optional storage timeframe
+            trigger: Also evaluate collection triggers
+        """
+        job = {
+            "data": dict(data),
+            "endpoint": endpoint,
+            "params": params,
+            "timeframe": timeframe,
+            "trigger": trigger,
+        }
+        with self._condition:
+            self.stats["submitted"] += 1
+        if not self.background:
+            self._write(job)
+            return
+
+        with self._condition:
+            if key in self._pending:
+                self.stats["coalesced"] += 1
+            self._pending[key] = job
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"{self.service.config.name}_ingestion",
+                    daemon=True,
+                )
+                self._thread.start()
+                if not self._exit_hook_registered:
+                    # Registered once; drain is a no-op while no worker runs
+                    atexit.register(self.drain)
+                    self._exit_hook_registered = True
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until all queued work has been written
+
+        Returns:
+            True if the queue emptied before the timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._active, timeout
+            )
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write all queued work and stop the worker thread
+
+        The thread is started again by the next submit.
+
+        Returns:
+            True if the worker finished before the timeout
+        """
+        with self._condition:
+            thread = self._thread
+            if thread is None:
+                return True
+            self._stopping = True
+            self._condition.notify_all()
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    @property
+    def pending(self) -> int:
+        """Number of queued (not yet taken) jobs"""
+        with self._condition:
+            return len(self._pending)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._stopping)
+                if not self._pending:
+                    self._thread = None
+                    self._stopping = False
+                    self._condition.notify_all()
+                    return
+                keys = list(self._pending)[: self.batch_size]
+                batch = [self._pending.pop(key) for key in keys]
+                self._active = len(batch)
+                self.stats["batches"] += 1
+
+            try:
+                # Group by ticker so each symbol's files are written together
+                for key, job in sorted(zip(keys, batch), key=lambda item: item[0][1]):
+                    self._write(job)
+            finally:
+                with self._condition:
+                    self._active = 0
+                    self._condition.notify_all()
+
+    def _write(self, job: Dict[str, Any]) -> None:
+        endpoint = job["endpoint"]
+        kwargs = {"timeframe": job["timeframe"]} if job["timeframe"] else {}
+        try:
+            stored = self.service.store_historical_data(
+                job["data"], endpoint, job["params"], **kwargs
+            )
+            outcome = "written" if stored else "skipped"
+        except Exception as e:
+            outcome = "failed"
+            self.service.logger.warning(
+                f"Historical storage failed for {endpoint}: {e}"
+            )
+        with self._condition:
+            self.stats[outcome] += 1
+
+        if job["trigger"]:
+            try:
+                self.service._trigger_collection_if_needed(
+                    job["data"], endpoint, job["params"]
+                )
+            except Exception as e:
+                self.service.logger.debug(
+                    f"Collection trigger check failed for {endpoint}: {e}"
+                )
+
 
 class YahooFinanceAPIService(BaseFinancialService):
     """
@@ -53,6 +236,12 @@ class YahooFinanceAPIService(BaseFinancialService):
             rate_limit=config.rate_limit.requests_per_minute,
         )
 
+        # Storage and trigger checks run off the request path unless
+        # collection is configured to be synchronous
+        self.ingestion = YahooIngestionWorker(
+            self, background=config.historical_storage.background_collection
+        )
+
     def _validate_response(self, data: Dict[str, Any], endpoint: str) -> Dict[str, Any]:
         """Validate Yahoo Finance response data"""
 
@@ -97,25 +286,13 @@ class YahooFinanceAPIService(BaseFinancialService):
             result = self.yf_service.get_stock_info(ticker)
             validated_data = self._validate_response(result, f"stock_info_{ticker}")
 
-            # Store in historical data system
-            try:
-                self.store_historical_data(
-                    validated_data, f"stock_info_{ticker}", {"symbol": ticker}
-                )
-            except Exception as e:
-                self.logger.warning(
-                    f"Historical storage failed for stock_info_{ticker}: {e}"
-                )
-
-            # Trigger comprehensive collection if needed
-            try:
-                self._trigger_collection_if_needed(
-                    validated_data, f"stock_info_{ticker}", {"symbol": ticker}
-                )
-            except Exception as e:
-                self.logger.debug(
-                    f"Collection trigger check failed for stock_info_{ticker}: {e}"
-                )
+            # Store and check collection triggers in the ingestion worker
+            self.ingestion.submit(
+                ("stock_info", ticker.upper()),
+                validated_data,
+                f"stock_info_{ticker}",
+                {"symbol": ticker},
+            )
 
             return validated_data
 
@@ -143,29 +320,13 @@ class YahooFinanceAPIService(BaseFinancialService):
                 result, f"historical_{ticker}_{period}"
             )
 
-            # Store in historical data system
-            try:
-                self.store_historical_data(
-                    validated_data,
-                    f"historical_{ticker}_{period}",
-                    {"symbol": ticker, "period": period},
-                )
-            except Exception as e:
-                self.logger.warning(
-                    f"Historical storage failed for historical_{ticker}_{period}: {e}"
-                )
-
-            # Trigger comprehensive collection if needed
-            try:
-                self._trigger_collection_if_needed(
-                    validated_data,
-                    f"historical_{ticker}_{period}",
-                    {"symbol": ticker, "period": period},
-                )
-            except Exception as e:
-                self.logger.debug(
-                    f"Collection trigger check failed for historical_{ticker}_{period}: {e}"
-                )
+            # Store and check collection triggers in the ingestion worker
+            self.ingestion.submit(
+                ("historical", ticker.upper(), period),
+                validated_data,
+                f"historical_{ticker}_{period}",
+                {"symbol": ticker, "period": period},
+            )
 
             return validated_data
 
@@ -195,15 +356,17 @@ class YahooFinanceAPIService(BaseFinancialService):
                 result, f"historical_weekly_{ticker}_{period}"
             )
 
-            # Store in historical data system with WEEKLY timeframe
+            # Store with WEEKLY timeframe in the ingestion worker
             try:
                 from utils.historical_data_manager import Timeframe
 
-                self.store_historical_data(
+                self.ingestion.submit(
+                    ("historical_weekly", ticker.upper(), period),
                     validated_data,
                     f"historical_weekly_{ticker}_{period}",
                     {"symbol": ticker, "period": period},
                     timeframe=Timeframe.WEEKLY,
+                    trigger=False,
                 )
             except Exception as e:
                 self.logger.warning(
@@ -362,6 +525,11 @@ class YahooFinanceAPIService(BaseFinancialService):
                     "Production-grade caching",
                     "Rate limiting",
                 ],
+                "resilience": self.get_resilience_status(),
+                "ingestion": {
+                    **self.ingestion.stats,
+                    "pending": self.ingestion.pending,
+                },
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -372,9 +540,14 @@ class YahooFinanceAPIService(BaseFinancialService):
                 "service_name": self.config.name,
                 "status": "unhealthy",
                 "error": str(e),
+                "resilience": self.get_resilience_status(),
                 "timestamp": datetime.now().isoformat(),
             }
 
+    def flush_ingestion(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued historical storage and trigger checks are written"""
+        return self.ingestion.flush(timeout)
+
     def cleanup_cache(self) -> None:
         """Clean up expired cache entries"""
         super().cleanup_cache()
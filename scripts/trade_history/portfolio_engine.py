@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Portfolio Equity Engine - Event-Driven Daily Portfolio Series
+
+Builds daily portfolio series from trade entry/exit events in a single aligned
+pass over a calendar index:
+- Realized and cumulative P&L (booked on exit date)
+- Equity, return percentage and drawdown from running peak
+- Open position count and gross exposure (entry notional of open trades)
+- Benchmark cumulative returns and portfolio excess return per benchmark
+
+Each trade is mapped to calendar positions once with searchsorted and the
+daily series are accumulated with bincount/cumsum, so the cost is
+O(days + trades) instead of re-filtering every trade for every day.
+"""
+
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+class PortfolioEquityEngine:
+    """Vectorized equity, drawdown, exposure and benchmark-relative series"""
+
+    def __init__(
+        self,
+        initial_capital: float = 10000.0,
+        entry_column: str = "Entry_Timestamp",
+        exit_column: str = "Exit_Timestamp",
+        pnl_column: str = "PnL",
+        size_column: str = "Position_Size",
+        price_column: str = "Avg_Entry_Price",
+    ):
+        self.initial_capital = float(initial_capital)
+        self.entry_column = entry_column
+        self.exit_column = exit_column
+        self.pnl_column = pnl_column
+        self.size_column = size_column
+        self.price_column = price_column
+
+    def _event_days(self, trades_df: pd.DataFrame, column: str) -> pd.DatetimeIndex:
+        """Normalize an event timestamp column to tz-naive calendar days"""
+        if column not in trades_df.columns:
+            return pd.DatetimeIndex([pd.NaT] * len(trades_df))
+
+        timestamps = pd.DatetimeIndex(pd.to_datetime(trades_df[column]))
+        if timestamps.tz is not None:
+            timestamps = timestamps.tz_localize(None)
+        return timestamps.normalize()
+
+    def _entry_notional(self, trades_df: pd.DataFrame) -> np.ndarray:
+        """Entry notional per trade (falls back to one unit per position)"""
+        if (
+            self.size_column not in trades_df.columns
+            or self.price_column not in trades_df.columns
+        ):
+            return np.ones(len(trades_df))
+
+        size = pd.to_numeric(trades_df[self.size_column], errors="coerce")
+        price = pd.to_numeric(trades_df[self.price_column], errors="coerce")
+        return (size * price).fillna(0.0).to_numpy(dtype=float)
+
+    def build(
+        self,
+        trades_df: pd.DataFrame,
+        start_date: Union[str, pd.Timestamp],
+        end_date: Optional[Union[str, pd.Timestamp]] = None,
+        benchmark_prices: Optional[Dict[str, pd.Series]] = None,
+    ) -> pd.DataFrame:
+        """
+        Build daily portfolio series from trade events
+
+        Args:
+            trades_df: Trades with entry/exit timestamps, PnL and sizing columns;
+                open trades have a missing exit timestamp
+            start_date: First calendar day of the series
+            end_date: Last calendar day (defaults to the latest exit date)
+            benchmark_prices: Optional price series per benchmark ticker
+
+        Returns:
+            DataFrame indexed by calendar day with P&L, equity, drawdown,
+            exposure and per-benchmark return/excess columns
+        """
+        start = pd.Timestamp(start_date).normalize()
+        entry_days = self._event_days(trades_df, self.entry_column)
+        exit_days = self._event_days(trades_df, self.exit_column)
+
+        if end_date is None:
+            end = exit_days.max() if exit_days.notna().any() else start
+        else:
+            end = pd.Timestamp(end_date).normalize()
+        end = max(start, end)
+
+        dates = pd.date_range(start=start, end=end, freq="D")
+        n_days = len(dates)
+
+        closed = np.asarray(exit_days.notna())
+        exit_idx = np.full(len(trades_df), n_days, dtype=np.int64)
+        exit_idx[closed] = dates.searchsorted(exit_days[closed])
+
+        # Realized P&L booked on exit day; exits outside the window are ignored
+        pnl = (
+            pd.to_numeric(trades_df[self.pnl_column], errors="coerce")
+            .fillna(0.0)
+            .to_numpy(dtype=float)
+            if self.pnl_column in trades_df.columns
+            else np.zeros(len(trades_df))
+        )
+        in_window = closed & np.asarray(exit_days >= start) & (exit_idx < n_days)
+        daily_pnl = np.bincount(
+            exit_idx[in_window], weights=pnl[in_window], minlength=n_days
+        )[:n_days]
+        cumulative_pnl = np.cumsum(daily_pnl)
+
+        equity = self.initial_capital + cumulative_pnl
+        running_peak = np.maximum.accumulate(equity)
+        drawdown_pct = np.where(
+            running_peak > 0, (equity - running_peak) / running_peak * 100, 0.0
+        )
+
+        # Positions are open from entry day until (excluding) exit day
+        has_entry = np.asarray(entry_days.notna())
+        entry_idx = np.zeros(len(trades_df), dtype=np.int64)
+        entry_idx[has_entry] = dates.searchsorted(entry_days[has_entry])
+        active = has_entry & (entry_idx < exit_idx) & (entry_idx < n_days)
+
+        notional = self._entry_notional(trades_df)
+        count_delta = np.zeros(n_days + 1)
+        exposure_delta = np.zeros(n_days + 1)
+        np.add.at(count_delta, entry_idx[active], 1.0)
+        np.add.at(count_delta, exit_idx[active], -1.0)
+        np.add.at(exposure_delta, entry_idx[active], notional[active])
+        np.add.at(exposure_delta, exit_idx[active], -notional[active])
+        open_positions = np.cumsum(count_delta)[:n_days]
+        exposure = np.cumsum(exposure_delta)[:n_days]
+
+        series = pd.DataFrame(
+            {
+                "Realized_PnL": daily_pnl,
+                "Cumulative_PnL": cumulative_pnl,
+                "Portfolio": cumulative_pnl / self.initial_capital * 100,
+                "Equity": equity,
+                "Drawdown_Pct": drawdown_pct,
+                "Open_Positions": open_positions.round().astype(np.int64),
+                "Exposure": exposure,
+                "Exposure_Pct": np.where(equity > 0, exposure / equity * 100, 0.0),
+            },
+            index=dates,
+        )
+
+        for ticker, prices in (benchmark_prices or {}).items():
+            returns = self.benchmark_returns(prices, start, dates)
+            series[ticker] = returns
+            series[f"Excess_vs_{ticker}"] = series["Portfolio"] - returns
+
+        return series
+
+    @staticmethod
+    def benchmark_returns(
+        prices: pd.Series, start_date: pd.Timestamp, dates: pd.DatetimeIndex
+    ) -> pd.Series:
+        """Cumulative benchmark return (%) from start_date aligned to dates"""
+        prices = prices[prices.index >= start_date]
+        if prices.empty:
+            return pd.Series(np.nan, index=dates)
+
+        returns = (prices / prices.iloc[0] - 1) * 100
+        return returns.reindex(dates).ffill()
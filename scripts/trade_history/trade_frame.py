@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Typed Trade Frame - Shared Columnar Loader for DASV Trade History Phases
+
+Loads a portfolio trade CSV once into a typed pandas frame so that every DASV
+phase (discover → analyze → synthesize → validate) can share the same data:
+- Numeric trade columns coerced to float64 (unparseable values become NaN)
+- Strategy window columns coerced to nullable Int64
+- All other columns left exactly as pandas parsed them
+- Vectorized conversion to the record dictionaries used by discovery output
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+# Columns the DASV phases treat as floating point values
+TRADE_NUMERIC_COLUMNS = [
+    "Position_Size",
+    "Avg_Entry_Price",
+    "Avg_Exit_Price",
+    "PnL",
+    "Return",
+    "Duration_Days",
+    "Days_Since_Entry",
+    "Current_Unrealized_PnL",
+    "Max_Favourable_Excursion",
+    "Max_Adverse_Excursion",
+    "MFE_MAE_Ratio",
+    "Exit_Efficiency",
+    "Exit_Efficiency_Fixed",
+]
+
+# Columns the DASV phases treat as integer values
+TRADE_INTEGER_COLUMNS = ["Short_Window", "Long_Window", "Signal_Window"]
+
+
+def load_trade_frame(file_path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Load a trade history CSV into a typed columnar frame
+
+    Args:
+        file_path: Path to the portfolio trade history CSV
+
+    Returns:
+        DataFrame with numeric columns as float64 and window columns as Int64
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {file_path}")
+
+    return coerce_trade_frame(pd.read_csv(file_path))
+
+
+def coerce_trade_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Apply the DASV column typing to an already-loaded trade frame"""
+    frame = frame.copy()
+
+    for col in TRADE_NUMERIC_COLUMNS:
+        if col in frame.columns:
+            frame[col] = pd.to_numeric(frame[col], errors="coerce").astype("float64")
+
+    for col in TRADE_INTEGER_COLUMNS:
+        if col in frame.columns:
+            values = pd.to_numeric(frame[col], errors="coerce")
+            frame[col] = np.trunc(values).astype("Int64")
+
+    return frame
+
+
+def trade_frame_to_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a typed trade frame into discovery trade records
+
+    Missing values become None, numeric columns native floats, window columns
+    native ints and every other column a string - matching the record layout
+    produced by row-by-row CSV ingestion.
+    """
+    columns: Dict[str, pd.Series] = {}
+
+    for col_name in frame.columns:
+        col = str(col_name)
+        series = frame[col_name]
+        missing = series.isna()
+
+        if col in TRADE_NUMERIC_COLUMNS:
+            values = series.astype("float64").astype(object)
+        elif col in TRADE_INTEGER_COLUMNS:
+            values = series.astype("Int64").astype(object)
+        else:
+            values = series.astype(str).astype(object)
+
+        columns[col] = values.where(~missing, None)
+
+    if not columns:
+        return [{} for _ in range(len(frame))]
+
+    return pd.DataFrame(columns, index=frame.index).to_dict("records")
@@ -109,9 +109,9 @@ class TradingCalculationEngine:
     - Single calculation implementation used by all DASV phases
     """
 
-    def __init__(self, csv_file_path: str):
+    def __init__(self, csv_file_path: str, raw_data: Optional[pd.DataFrame] = None):
         self.csv_file_path = csv_file_path
-        self.raw_data = None
+        self.raw_data = raw_data
         self.trades = []
         self.portfolio_metrics = {}
         self.validation_passed = False
@@ -119,9 +119,10 @@ class TradingCalculationEngine:
         self._load_and_validate_data()
 
     def _load_and_validate_data(self):
-        """Load CSV data and perform initial validation"""
+        """Load CSV data (unless a frame was supplied) and perform initial validation"""
         try:
-            self.raw_data = pd.read_csv(self.csv_file_path)
+            if self.raw_data is None:
+                self.raw_data = pd.read_csv(self.csv_file_path)
             self._parse_trades()
             self._validate_all_trades()
             self.validation_passed = True
@@ -19,12 +19,13 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import numpy as np
 import scipy.stats as stats
 
 from trade_history.unified_calculation_engine import TradingCalculationEngine
+from utils.json_serialization import to_serializable, write_json
 
 # Configure logging
 logging.basicConfig(
@@ -45,21 +46,11 @@ class AtomicAnalysisTool:
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_file: Optional[Path] = None
 
     def _convert_numpy_types(self, obj):
         """Convert numpy types to native Python types for JSON serialization"""
-        if isinstance(obj, dict):
-            return {key: self._convert_numpy_types(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_numpy_types(item) for item in obj]
-        elif isinstance(obj, np.bool_):
-            return bool(obj)
-        elif isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
-        else:
-            return obj
+        return to_serializable(obj, fallback=lambda value: value)
 
     def load_discovery_data(self) -> Dict[str, Any]:
         """
@@ -175,7 +166,9 @@ class AtomicAnalysisTool:
         }
 
     def perform_advanced_statistical_analysis(
-        self, engine: TradingCalculationEngine
+        self,
+        engine: TradingCalculationEngine,
+        base_metrics: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Perform advanced statistical analysis using unified engine base metrics
@@ -186,8 +179,9 @@ class AtomicAnalysisTool:
         if not closed_trades:
             return {"status": "NO_CLOSED_TRADES"}
 
-        # Get base metrics from unified engine
-        base_metrics = engine.calculate_portfolio_performance()
+        # Get base metrics from unified engine (reuse when already calculated)
+        if base_metrics is None:
+            base_metrics = engine.calculate_portfolio_performance()
 
         # Extract returns for advanced statistical analysis
         returns = [trade.return_csv for trade in closed_trades]
@@ -369,28 +363,39 @@ class AtomicAnalysisTool:
 
         return confidence_scores
 
-    def execute_analysis(self) -> Dict[str, Any]:
+    def execute_analysis(
+        self,
+        discovery_data: Optional[Dict[str, Any]] = None,
+        engine: Optional[TradingCalculationEngine] = None,
+    ) -> Dict[str, Any]:
         """
         Execute atomic statistical analysis
+
+        Args:
+            discovery_data: Optional in-memory discovery output (skips JSON reload)
+            engine: Optional unified engine already built from the trade frame
         """
         logger.info(f"Starting atomic analysis for portfolio: {self.portfolio_name}")
 
         try:
             # Step 1: Load discovery data
-            discovery_data = self.load_discovery_data()
+            if discovery_data is None:
+                discovery_data = self.load_discovery_data()
 
             # Step 2: Extract CSV path and initialize unified engine
-            csv_path = discovery_data["discovery_metadata"]["data_source"]
-            engine = TradingCalculationEngine(csv_path)
+            if engine is None:
+                csv_path = discovery_data["discovery_metadata"]["data_source"]
+                engine = TradingCalculationEngine(csv_path)
 
             # Step 3: Validate unified engine metrics against discovery data
-            validation_results = engine.validate_portfolio_metrics(
-                engine.calculate_portfolio_performance()
-            )
+            base_metrics = engine.calculate_portfolio_performance()
+            validation_results = engine.validate_portfolio_metrics(base_metrics)
 
             # Step 4: Perform analysis components
             signal_effectiveness = self.analyze_signal_effectiveness(engine)
-            statistical_analysis = self.perform_advanced_statistical_analysis(engine)
+            statistical_analysis = self.perform_advanced_statistical_analysis(
+                engine, base_metrics
+            )
             optimization_opportunities = self.generate_optimization_opportunities(
                 signal_effectiveness,
                 statistical_analysis.get("statistical_analysis", {}),
@@ -463,9 +468,9 @@ class AtomicAnalysisTool:
             )
             output_file = self.output_dir / output_filename
 
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(analysis_output, f, indent=2, ensure_ascii=False)
+            write_json(analysis_output, output_file)
 
+            self.output_file = output_file
             logger.info(f"Analysis output saved to: {output_file}")
 
             # Log summary
@@ -14,7 +14,6 @@ This analysis provides the foundation for trade strategy optimization and
 portfolio performance assessment.
 """
 
-import json
 import warnings
 from datetime import datetime, timezone
 from pathlib import Path
@@ -24,22 +23,9 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
-warnings.filterwarnings("ignore")
-
-
-class NumpyEncoder(json.JSONEncoder):
-    """Custom JSON encoder for numpy data types."""
+from utils.json_serialization import write_json
 
-    def default(self, obj):
-        if isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, np.bool_):
-            return bool(obj)
-        return super().default(obj)
+warnings.filterwarnings("ignore")
 
 
 class LiveSignalsStatisticalAnalyzer:
@@ -916,10 +902,7 @@ class LiveSignalsStatisticalAnalyzer:
         timestamp = datetime.now().strftime("%Y%m%d")
         output_file = self.output_dir / f"live_signals_{timestamp}.json"
 
-        with open(output_file, "w") as f:
-            json.dump(
-                analysis_result, f, indent=2, ensure_ascii=False, cls=NumpyEncoder
-            )
+        write_json(analysis_result, output_file)
 
         print("\n💾 Analysis saved to: {output_file}")
         return str(output_file)
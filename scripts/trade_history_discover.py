@@ -26,10 +26,12 @@ import re
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 import pandas as pd
 
+from trade_history.trade_frame import load_trade_frame, trade_frame_to_records
+
 # Import service discovery and CLI wrapper
 try:
     from cli_wrapper import ImportError  # Placeholder import
@@ -68,6 +70,8 @@ class TradeHistoryDiscovery:
         self.trades: List[Dict[str, Any]] = []
         self.local_inventory: Dict[str, Any] = {}
         self.confidence_factors: Dict[str, float] = {}
+        self.output_file: Optional[Path] = None
+        self.source_file: Optional[Path] = None
 
     def resolve_portfolio_file(self) -> Path:
         """
@@ -113,62 +117,30 @@ class TradeHistoryDiscovery:
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
 
-        trades = []
-
         try:
-            # Use pandas for robust CSV parsing
-            df = pd.read_csv(file_path)
-
-            # Log CSV structure
-            logger.info(f"CSV loaded: {len(df)} rows, {len(df.columns)} columns")
-            logger.info(f"Columns: {list(df.columns)}")
-
-            # Convert to list of dictionaries
-            for _, row in df.iterrows():
-                trade: Dict[str, Any] = {}
-                for col_name, value in row.items():
-                    col = str(col_name)  # Ensure column name is string
-                    # Handle NaN values
-                    if pd.isna(value):
-                        trade[col] = None
-                    elif col in [
-                        "Position_Size",
-                        "Avg_Entry_Price",
-                        "Avg_Exit_Price",
-                        "PnL",
-                        "Return",
-                        "Duration_Days",
-                        "Days_Since_Entry",
-                        "Current_Unrealized_PnL",
-                        "Max_Favourable_Excursion",
-                        "Max_Adverse_Excursion",
-                        "MFE_MAE_Ratio",
-                        "Exit_Efficiency",
-                        "Exit_Efficiency_Fixed",
-                    ]:
-                        # Numeric fields
-                        try:
-                            trade[col] = float(value) if not pd.isna(value) else None
-                        except (ValueError, TypeError):
-                            trade[col] = None
-                    elif col in ["Short_Window", "Long_Window", "Signal_Window"]:
-                        # Integer fields
-                        try:
-                            trade[col] = int(value) if not pd.isna(value) else None
-                        except (ValueError, TypeError):
-                            trade[col] = None
-                    else:
-                        # String fields - ensure proper type
-                        if pd.isna(value):
-                            trade[col] = None
-                        else:
-                            trade[col] = str(value)
-
-                trades.append(trade)
-
+            # Use pandas for robust CSV parsing with DASV column typing
+            df = load_trade_frame(file_path)
         except Exception as e:
             raise ValueError(f"Failed to parse CSV file {file_path}: {e}")
 
+        return self.load_trade_records(df)
+
+    def load_trade_records(self, trade_frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Convert an already-loaded typed trade frame into discovery trade records
+        """
+        # Log CSV structure
+        logger.info(
+            f"CSV loaded: {len(trade_frame)} rows, {len(trade_frame.columns)} columns"
+        )
+        logger.info(f"Columns: {list(trade_frame.columns)}")
+
+        try:
+            # Convert to list of dictionaries (numeric/integer/string typed)
+            trades = trade_frame_to_records(trade_frame)
+        except Exception as e:
+            raise ValueError(f"Failed to parse trade data: {e}")
+
         logger.info(f"Successfully parsed {len(trades)} trades from CSV")
         return trades
 
@@ -663,7 +635,7 @@ class TradeHistoryDiscovery:
             "discovery_metadata": {
                 "execution_timestamp": self.execution_date.isoformat(),
                 "protocol_version": "DASV_Phase_1_Comprehensive",
-                "data_source": str(self.resolve_portfolio_file()),
+                "data_source": str(self.source_file or self.resolve_portfolio_file()),
                 "confidence_score": confidence_scores["overall"],
                 "data_completeness": confidence_scores["trade_data_completeness"],
                 "derivable_fields_calculated": confidence_scores["derivable_fields"],
@@ -808,7 +780,7 @@ class TradeHistoryDiscovery:
             "discovery_metadata": {
                 "execution_timestamp": self.execution_date.isoformat(),
                 "protocol_version": "DASV_Phase_1_Comprehensive",
-                "data_source": str(self.resolve_portfolio_file()),
+                "data_source": str(self.source_file or self.resolve_portfolio_file()),
                 "confidence_score": confidence_scores["overall"],
                 "data_completeness": confidence_scores["trade_data_completeness"],
                 "derivable_fields_calculated": confidence_scores["derivable_fields"],
@@ -821,7 +793,7 @@ class TradeHistoryDiscovery:
                 ],
             },
             "authoritative_trade_data": {
-                "csv_file_path": str(self.resolve_portfolio_file()),
+                "csv_file_path": str(self.source_file or self.resolve_portfolio_file()),
                 "comprehensive_trade_summary": {
                     "total_trades": len(all_trades),
                     "closed_positions": len(closed_trades),
@@ -1214,18 +1186,30 @@ class TradeHistoryDiscovery:
         logger.info("Market research complete")
         return research_enhancement
 
-    def execute_discovery(self) -> Dict[str, Any]:
+    def execute_discovery(
+        self,
+        trade_frame: Optional[pd.DataFrame] = None,
+        csv_file: Optional[Path] = None,
+    ) -> Dict[str, Any]:
         """
         Execute the complete DASV Phase 1 discovery protocol
+
+        Args:
+            trade_frame: Optional pre-loaded typed trade frame (skips CSV reload)
+            csv_file: CSV the trade frame was loaded from, or the file to load
+                instead of resolving it from the portfolio name
         """
         logger.info(
             f"Starting trade history discovery for portfolio: {self.portfolio_name}"
         )
 
         try:
-            # Step 1: Resolve and load CSV file
-            csv_file = self.resolve_portfolio_file()
-            trades = self.load_and_validate_csv(csv_file)
+            # Step 1: Resolve and load CSV file (or reuse the in-memory frame)
+            self.source_file = csv_file or self.resolve_portfolio_file()
+            if trade_frame is not None:
+                trades = self.load_trade_records(trade_frame)
+            else:
+                trades = self.load_and_validate_csv(self.source_file)
 
             # Step 2: Calculate ALL derivable fields (CRITICAL)
             trades = self.calculate_all_derivable_fields(trades)
@@ -1276,6 +1260,7 @@ class TradeHistoryDiscovery:
             with open(output_file, "w", encoding="utf-8") as f:
                 json.dump(discovery_output, f, indent=2, ensure_ascii=False)
 
+            self.output_file = output_file
             logger.info(f"Discovery output saved to: {output_file}")
 
             # Log summary statistics
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Trade History Pipeline - In-Process DASV Runner
+
+Runs all four trade history DASV phases in a single process:
+- Loads the portfolio CSV once into a typed columnar trade frame
+- Discover → Analyze → Synthesize → Validate with in-memory phase handoff
+- Builds the unified calculation engine for analysis from the shared frame
+- Still writes every phase JSON output to disk for audit
+
+Each phase remains runnable on its own through its atomic script; this runner
+only removes the repeated CSV parsing and JSON reloading between phases.
+
+Usage:
+    python scripts/trade_history_pipeline.py --portfolio {portfolio_name}
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from trade_history.trade_frame import load_trade_frame
+from trade_history.unified_calculation_engine import TradingCalculationEngine
+from trade_history_analyze import AtomicAnalysisTool
+from trade_history_discover import TradeHistoryDiscovery
+from trade_history_synthesize import AtomicSynthesisTool
+from trade_history_validate import TradingPerformanceValidator
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+DASV_PHASES = ["discover", "analyze", "synthesize", "validate"]
+
+
+class TradeHistoryPipeline:
+    """In-process DASV pipeline with a single trade data load"""
+
+    def __init__(self, portfolio_name: str, csv_file: Optional[Path] = None):
+        self.portfolio_name = portfolio_name
+        self.csv_file = csv_file
+
+        self.trade_frame: Optional[pd.DataFrame] = None
+        self.engine: Optional[TradingCalculationEngine] = None
+        self.phase_outputs: Dict[str, Any] = {}
+        self.phase_files: Dict[str, Optional[str]] = {}
+        self.phase_timings: Dict[str, float] = {}
+
+    def load_trade_data(self, discovery: TradeHistoryDiscovery) -> pd.DataFrame:
+        """Resolve the portfolio CSV and load it once into a typed trade frame"""
+        if self.csv_file is None:
+            self.csv_file = discovery.resolve_portfolio_file()
+
+        logger.info(f"Loading trade frame once for all phases: {self.csv_file}")
+        self.trade_frame = load_trade_frame(self.csv_file)
+        return self.trade_frame
+
+    def run_discovery(self) -> Dict[str, Any]:
+        """Phase 1: discovery from the in-memory trade frame"""
+        discovery = TradeHistoryDiscovery(self.portfolio_name)
+        trade_frame = self.load_trade_data(discovery)
+
+        discovery_output = discovery.execute_discovery(
+            trade_frame=trade_frame, csv_file=self.csv_file
+        )
+        self.phase_files["discover"] = (
+            str(discovery.output_file) if discovery.output_file else None
+        )
+        return discovery_output
+
+    def run_analysis(self, discovery_output: Dict[str, Any]) -> Dict[str, Any]:
+        """Phase 2: analysis on a unified engine built from the shared frame"""
+        self.engine = TradingCalculationEngine(
+            str(self.csv_file), raw_data=self.trade_frame
+        )
+
+        analysis_tool = AtomicAnalysisTool(self.portfolio_name)
+        analysis_output = analysis_tool.execute_analysis(
+            discovery_data=discovery_output, engine=self.engine
+        )
+        self.phase_files["analyze"] = (
+            str(analysis_tool.output_file) if analysis_tool.output_file else None
+        )
+        return analysis_output
+
+    def run_synthesis(
+        self, discovery_output: Dict[str, Any], analysis_output: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Phase 3: synthesis from in-memory discovery and analysis outputs"""
+        synthesis_tool = AtomicSynthesisTool(self.portfolio_name)
+        phase_data = {
+            "discovery": discovery_output,
+            "analysis": analysis_output,
+            "discovery_file": self.phase_files.get("discover"),
+            "analysis_file": self.phase_files.get("analyze"),
+        }
+
+        synthesis_output = synthesis_tool.execute_synthesis(phase_data=phase_data)
+        self.phase_files["synthesize"] = (
+            str(synthesis_tool.output_file) if synthesis_tool.output_file else None
+        )
+        return synthesis_output
+
+    def run_validation(
+        self, discovery_output: Dict[str, Any], analysis_output: Dict[str, Any]
+    ) -> bool:
+        """Phase 4: validation against the shared frame and in-memory outputs"""
+        validator = TradingPerformanceValidator(self.portfolio_name)
+        validator.attach_phase_outputs(
+            discovery_output, analysis_output, self.trade_frame
+        )
+        return validator.execute_validation()
+
+    def _timed(self, phase: str, func, *args) -> Any:
+        """Run a phase and record its wall-clock duration"""
+        start = time.perf_counter()
+        result = func(*args)
+        self.phase_timings[phase] = round(time.perf_counter() - start, 4)
+        logger.info(f"Phase '{phase}' completed in {self.phase_timings[phase]:.3f}s")
+        return result
+
+    def execute(self, phases: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Execute the requested DASV phases in order with in-memory handoff
+
+        Args:
+            phases: Ordered subset of DASV_PHASES (defaults to all four)
+
+        Returns:
+            Dictionary with per-phase outputs, audit file paths and timings
+        """
+        phases = phases or DASV_PHASES
+        unknown = [p for p in phases if p not in DASV_PHASES]
+        if unknown:
+            raise ValueError(f"Unknown DASV phases: {unknown}")
+
+        # Each phase depends on every earlier phase's in-memory output
+        last_phase = max(DASV_PHASES.index(p) for p in phases)
+        required = DASV_PHASES[: last_phase + 1]
+
+        logger.info(
+            f"Starting in-process DASV pipeline for {self.portfolio_name}: "
+            f"{' → '.join(required)}"
+        )
+
+        discovery_output = self._timed("discover", self.run_discovery)
+        self.phase_outputs["discover"] = discovery_output
+
+        if "analyze" in required:
+            analysis_output = self._timed(
+                "analyze", self.run_analysis, discovery_output
+            )
+            self.phase_outputs["analyze"] = analysis_output
+
+        if "synthesize" in required:
+            self.phase_outputs["synthesize"] = self._timed(
+                "synthesize", self.run_synthesis, discovery_output, analysis_output
+            )
+
+        if "validate" in required:
+            self.phase_outputs["validate"] = self._timed(
+                "validate", self.run_validation, discovery_output, analysis_output
+            )
+
+        return {
+            "portfolio": self.portfolio_name,
+            "csv_source": str(self.csv_file),
+            "phases_executed": required,
+            "phase_outputs": self.phase_outputs,
+            "phase_files": self.phase_files,
+            "phase_timings": self.phase_timings,
+        }
+
+
+def main():
+    """Main execution function."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="In-process trade history DASV pipeline"
+    )
+    parser.add_argument("--portfolio", required=True, help="Portfolio name (required)")
+    parser.add_argument(
+        "--phases",
+        nargs="+",
+        choices=DASV_PHASES,
+        default=DASV_PHASES,
+        help="DASV phases to run (earlier phases are always included)",
+    )
+    parser.add_argument(
+        "--csv-file", type=Path, help="Explicit trade history CSV (optional)"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    pipeline = TradeHistoryPipeline(args.portfolio, csv_file=args.csv_file)
+    result = pipeline.execute(args.phases)
+
+    print("\n" + "=" * 60)
+    print("DASV PIPELINE COMPLETE")
+    print("=" * 60)
+    print(f"Portfolio: {result['portfolio']}")
+    print(f"CSV Source: {result['csv_source']}")
+    for phase in result["phases_executed"]:
+        timing = result["phase_timings"].get(phase, 0.0)
+        output_file = result["phase_files"].get(phase) or "-"
+        print(f"  {phase:<11} {timing:>8.3f}s  {output_file}")
+    if "validate" in result["phase_outputs"]:
+        status = "PASSED" if result["phase_outputs"]["validate"] else "FAILED"
+        print(f"Validation: {status}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
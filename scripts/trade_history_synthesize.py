@@ -19,7 +19,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 # import numpy as np
 import pandas as pd
@@ -44,6 +44,7 @@ class AtomicSynthesisTool:
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_file: Optional[Path] = None
 
     def load_phase_data(self) -> Dict[str, Any]:
         """
@@ -383,27 +384,32 @@ class AtomicSynthesisTool:
         self, active_trades: pd.DataFrame
     ) -> List[Dict[str, Any]]:
         """Summarize active positions"""
-        positions = []
-        if not active_trades.empty:
-            for _, trade in active_trades.iterrows():
-                positions.append(
-                    {
-                        "ticker": trade.get("Ticker", "N/A"),
-                        "strategy": trade.get("Strategy_Type", "N/A"),
-                        "entry_date": str(trade.get("Entry_Timestamp", "N/A")),
-                        "days_held": (
-                            float(trade.get("Days_Since_Entry", 0))
-                            if pd.notna(trade.get("Days_Since_Entry"))
-                            else 0
-                        ),
-                        "unrealized_pnl": (
-                            float(trade.get("Current_Unrealized_PnL", 0))
-                            if pd.notna(trade.get("Current_Unrealized_PnL"))
-                            else 0
-                        ),
-                    }
+        if active_trades.empty:
+            return []
+
+        def column(name: str, default: Any) -> pd.Series:
+            if name in active_trades.columns:
+                return active_trades[name]
+            return pd.Series(default, index=active_trades.index, dtype=object)
+
+        positions = pd.DataFrame(
+            {
+                "ticker": column("Ticker", "N/A"),
+                "strategy": column("Strategy_Type", "N/A"),
+                "entry_date": column("Entry_Timestamp", "N/A").astype(str),
+                "days_held": pd.to_numeric(
+                    column("Days_Since_Entry", 0), errors="coerce"
                 )
-        return positions
+                .fillna(0)
+                .astype(float),
+                "unrealized_pnl": pd.to_numeric(
+                    column("Current_Unrealized_PnL", 0), errors="coerce"
+                )
+                .fillna(0)
+                .astype(float),
+            }
+        )
+        return positions.to_dict("records")
 
     def _assess_portfolio_risk(self, active_trades: pd.DataFrame) -> Dict[str, Any]:
         """Assess current portfolio risk"""
@@ -467,15 +473,22 @@ class AtomicSynthesisTool:
             "limitations": limitations,
         }
 
-    def execute_synthesis(self) -> Dict[str, Any]:
+    def execute_synthesis(
+        self, phase_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Execute atomic data synthesis
+
+        Args:
+            phase_data: Optional in-memory discovery/analysis handoff in the
+                same layout as load_phase_data (skips JSON reload)
         """
         logger.info(f"Starting atomic synthesis for portfolio: {self.portfolio_name}")
 
         try:
             # Step 1: Load discovery and analysis data
-            phase_data = self.load_phase_data()
+            if phase_data is None:
+                phase_data = self.load_phase_data()
 
             # Step 2: Extract key metrics
             key_metrics = self.extract_key_metrics(phase_data)
@@ -520,6 +533,7 @@ class AtomicSynthesisTool:
             with open(output_file, "w", encoding="utf-8") as f:
                 json.dump(synthesis_output, f, indent=2, ensure_ascii=False)
 
+            self.output_file = output_file
             logger.info(f"Synthesis output saved to: {output_file}")
 
             # Log summary
@@ -84,6 +84,27 @@ class TradingPerformanceValidator:
             print("❌ Error loading phase outputs: {str(e)}")
             return False
 
+    def attach_phase_outputs(
+        self,
+        discovery_data: Dict[str, Any],
+        analysis_data: Dict[str, Any],
+        csv_data: pd.DataFrame,
+    ) -> bool:
+        """Attach in-memory DASV phase outputs instead of reloading them from disk"""
+        self.discovery_data = discovery_data
+        self.analysis_data = analysis_data
+        self.csv_data = csv_data
+        print("✅ Phase outputs attached from in-memory pipeline handoff")
+        return True
+
+    def _phase_outputs_loaded(self) -> bool:
+        """Check whether all phase outputs are already available"""
+        return (
+            self.discovery_data is not None
+            and self.analysis_data is not None
+            and self.csv_data is not None
+        )
+
     def validate_statistical_calculations(self) -> Dict[str, Any]:
         """Phase 4A: Statistical Validation and Significance Testing"""
         print("\n🔍 Phase 4A: Statistical Validation and Significance Testing")
@@ -258,24 +279,18 @@ class TradingPerformanceValidator:
         }
 
         try:
-            # Check return calculation consistency in CSV
-            inconsistencies = 0
-            total_checked = 0
+            # Check return calculation consistency in CSV (vectorized)
+            entry_price = self.csv_data["Avg_Entry_Price"]
+            exit_price = self.csv_data["Avg_Exit_Price"]
+            checkable = entry_price.notna() & exit_price.notna() & (entry_price != 0)
 
-            for _, row in self.csv_data.iterrows():
-                if (
-                    pd.notna(row["Avg_Entry_Price"])
-                    and pd.notna(row["Avg_Exit_Price"])
-                    and row["Avg_Entry_Price"] != 0
-                ):
-                    expected_return = (
-                        row["Avg_Exit_Price"] - row["Avg_Entry_Price"]
-                    ) / row["Avg_Entry_Price"]
-                    actual_return = row["Return"]
+            expected_return = (exit_price - entry_price) / entry_price
+            deviation = (expected_return - self.csv_data["Return"]).abs()
 
-                    if abs(expected_return - actual_return) > 0.001:  # 0.1% tolerance
-                        inconsistencies += 1
-                    total_checked += 1
+            total_checked = int(checkable.sum())
+            inconsistencies = int(
+                (checkable & (deviation > 0.001)).sum()  # 0.1% tolerance
+            )
 
             consistency_rate = (
                 (total_checked - inconsistencies) / total_checked
@@ -437,28 +452,29 @@ class TradingPerformanceValidator:
         }
 
         try:
-            coherence_issues = 0
-            total_checks = 0
+            csv_data = self.csv_data
+
+            def column(name: str) -> pd.Series:
+                if name in csv_data.columns:
+                    return csv_data[name]
+                return pd.Series(0.0, index=csv_data.index)
 
             # Check MFE/MAE relationship for profitable trades
-            for _, row in self.csv_data.iterrows():
-                if row["PnL"] > 0:  # Profitable trades
-                    mfe = row.get("Max_Favourable_Excursion", 0)
-                    mae = abs(row.get("Max_Adverse_Excursion", 0))
+            profitable = csv_data["PnL"] > 0
+            mfe = column("Max_Favourable_Excursion")
+            mae = column("Max_Adverse_Excursion").abs()
 
-                    # For profitable trades, MFE should generally be >= |MAE|
-                    if mfe < mae and mfe > 0:
-                        coherence_issues += 1
-                    total_checks += 1
+            # For profitable trades, MFE should generally be >= |MAE|
+            mfe_mae_issues = profitable & (mfe < mae) & (mfe > 0)
 
-                # Check exit efficiency bounds (0.0 <= exit_efficiency <= 1.0)
-                exit_eff = row.get("Exit_Efficiency_Fixed", 0)
-                if pd.notna(exit_eff) and (
-                    exit_eff < -10 or exit_eff > 1
-                ):  # Allow some negative values for poor exits
-                    coherence_issues += 1
+            # Check exit efficiency bounds (0.0 <= exit_efficiency <= 1.0)
+            exit_eff = column("Exit_Efficiency_Fixed")
+            exit_eff_issues = exit_eff.notna() & (
+                (exit_eff < -10) | (exit_eff > 1)
+            )  # Allow some negative values for poor exits
 
-                total_checks += 1
+            coherence_issues = int(mfe_mae_issues.sum() + exit_eff_issues.sum())
+            total_checks = int(profitable.sum()) + len(csv_data)
 
             coherence_rate = (
                 (total_checks - coherence_issues) / total_checks
@@ -706,8 +722,8 @@ class TradingPerformanceValidator:
         print("🚀 DASV Phase 4: Trading Performance Validation Specialist")
         print("=" * 80)
 
-        # Phase 0: Load phase outputs
-        if not self.load_phase_outputs():
+        # Phase 0: Load phase outputs (unless attached in memory)
+        if not self._phase_outputs_loaded() and not self.load_phase_outputs():
             print("❌ Failed to load required phase outputs")
             return False
 
@@ -7,10 +7,16 @@ Unified processing system for all Twitter commands:
 - Template rendering coordination
 - Output formatting and export
 - Quality assurance and compliance checking
+- Batch rendering of (ticker, date, template) manifests with a bounded pool
 """
 
+import argparse
+import csv
 import json
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -21,6 +27,17 @@ from twitter_template_renderer import TwitterTemplateRenderer
 class TwitterCommandProcessor:
     """Unified processor for all Twitter commands"""
 
+    # Batch content type aliases -> (renderer content type, output directory)
+    BATCH_CONTENT_TYPES = {
+        "fundamental": ("fundamental", "fundamental_analysis"),
+        "fundamental_analysis": ("fundamental", "fundamental_analysis"),
+        "strategy": ("strategy", "post_strategy"),
+        "post_strategy": ("strategy", "post_strategy"),
+        "sector": ("sector", "sector_analysis"),
+        "sector_analysis": ("sector", "sector_analysis"),
+        "trade_history": ("trade_history", "trade_history"),
+    }
+
     def __init__(self, base_path: Optional[Path] = None):
         """Initialize the command processor"""
         self.base_path = base_path or Path(__file__).parent.parent
@@ -219,6 +236,218 @@ class TwitterCommandProcessor:
                 "validation_file_path": validation_file_path,
             }
 
+    def load_batch_manifest(
+        self, manifest_path: Union[str, Path]
+    ) -> List[Dict[str, Any]]:
+        """
+        Load batch jobs from a JSON or CSV manifest
+
+        JSON manifests are a list of jobs or {"jobs": [...]}; CSV manifests
+        have a header row. Each job has ticker (or identifier), date
+        (YYYYMMDD) and optional template and content_type (default
+        "fundamental").
+        """
+        path = Path(manifest_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Batch manifest not found: {manifest_path}")
+
+        if path.suffix.lower() == ".csv":
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                return [
+                    {k: v for k, v in row.items() if v not in (None, "")}
+                    for row in csv.DictReader(f)
+                ]
+
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        jobs = manifest.get("jobs", []) if isinstance(manifest, dict) else manifest
+        if not isinstance(jobs, list):
+            raise ValueError(f"Invalid batch manifest format: {manifest_path}")
+        return jobs
+
+    def process_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_workers: int = 4,
+        summary_path: Optional[Union[str, Path]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Render a manifest of Twitter jobs concurrently
+
+        Jobs share this processor's template renderer (and its compiled
+        templates) and each distinct source document is loaded once per batch.
+        A failing job is recorded in the summary without stopping the batch.
+
+        Args:
+            jobs: Job dicts with ticker/identifier, date, template, content_type
+            max_workers: Upper bound on concurrently rendered jobs
+            summary_path: Where to write the JSON summary (defaults to
+                data/outputs/twitter/batch/batch_summary_<timestamp>.json)
+
+        Returns:
+            Batch summary with per-job results and failures
+        """
+        start_time = time.perf_counter()
+        started_at = datetime.now()
+        source_cache: Dict[Tuple[str, str, str], Tuple[bool, Any]] = {}
+        key_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        cache_lock = threading.Lock()
+
+        def run(indexed_job: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+            index, job = indexed_job
+            return self._process_batch_job(
+                index, job, source_cache, key_locks, cache_lock
+            )
+
+        workers = max(1, min(max_workers, len(jobs) or 1))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="twitter-batch"
+        ) as executor:
+            results = list(executor.map(run, enumerate(jobs)))
+
+        succeeded = sum(1 for r in results if r["success"])
+        summary = {
+            "started_at": started_at.isoformat(),
+            "duration_seconds": round(time.perf_counter() - start_time, 3),
+            "max_workers": workers,
+            "total_jobs": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "source_documents_loaded": len(source_cache),
+            "jobs": results,
+        }
+
+        if summary_path is None:
+            summary_dir = self.twitter_outputs_path / "batch"
+            summary_dir.mkdir(parents=True, exist_ok=True)
+            summary_path = (
+                summary_dir
+                / f"batch_summary_{started_at.strftime('%Y%m%d_%H%M%S')}.json"
+            )
+        summary_path = Path(summary_path)
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        summary["summary_path"] = str(summary_path)
+
+        return summary
+
+    def _normalize_batch_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a manifest entry and resolve its content type and identifier"""
+        content_type = str(job.get("content_type", "fundamental")).lower()
+        if content_type not in self.BATCH_CONTENT_TYPES:
+            raise ValueError(f"Unknown content type: {content_type}")
+        render_type, output_dir = self.BATCH_CONTENT_TYPES[content_type]
+
+        identifier = (
+            job.get("ticker")
+            or job.get("identifier")
+            or job.get("sector")
+            or job.get("analysis_name")
+        )
+        date = str(job.get("date", "")).replace("-", "")
+        if not identifier:
+            raise ValueError("Batch job is missing a ticker/identifier")
+        if not re.match(r"^\d{8}$", date):
+            raise ValueError(f"Invalid date format: {date}. Expected format: YYYYMMDD")
+
+        identifier = str(identifier)
+        if render_type in ("fundamental", "strategy"):
+            identifier = identifier.upper()
+        elif render_type == "sector":
+            identifier = identifier.lower()
+
+        return {
+            "content_type": render_type,
+            "output_dir": output_dir,
+            "identifier": identifier,
+            "date": date,
+            "template": job.get("template") or None,
+        }
+
+    def _load_source_data(
+        self, content_type: str, identifier: str, date: str
+    ) -> Dict[str, Any]:
+        """Load source data for a renderer content type"""
+        loaders = {
+            "fundamental": self._load_fundamental_analysis_data,
+            "strategy": self._load_strategy_data,
+            "sector": self._load_sector_analysis_data,
+            "trade_history": self._load_trade_history_data,
+        }
+        return loaders[content_type](identifier, date)
+
+    def _process_batch_job(
+        self,
+        index: int,
+        job: Dict[str, Any],
+        source_cache: Dict[Tuple[str, str, str], Tuple[bool, Any]],
+        key_locks: Dict[Tuple[str, str, str], threading.Lock],
+        cache_lock: threading.Lock,
+    ) -> Dict[str, Any]:
+        """Render and export a single batch job, capturing any failure"""
+        start_time = time.perf_counter()
+        result: Dict[str, Any] = {"job_index": index, "job": job, "success": False}
+
+        try:
+            spec = self._normalize_batch_job(job)
+            result.update(
+                {
+                    "content_type": spec["content_type"],
+                    "identifier": spec["identifier"],
+                    "date": spec["date"],
+                    "template": spec["template"],
+                }
+            )
+
+            # Load each source document once, even when several jobs need it
+            key = (spec["content_type"], spec["identifier"], spec["date"])
+            with cache_lock:
+                key_lock = key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                if key not in source_cache:
+                    try:
+                        source_cache[key] = (True, self._load_source_data(*key))
+                    except Exception as e:
+                        source_cache[key] = (False, e)
+            loaded, source = source_cache[key]
+            if not loaded:
+                raise source
+            source_data = dict(source)
+
+            validation_result = self._validate_source_data(
+                source_data, spec["content_type"]
+            )
+            rendered_result = self.template_renderer.render_content(
+                spec["content_type"],
+                spec["identifier"],
+                source_data,
+                template_variant=spec["template"],
+            )
+
+            filename = f"{spec['identifier']}_{spec['date']}"
+            if spec["template"]:
+                filename = f"{filename}_{spec['template']}"
+            output_path = self._export_content(
+                rendered_result, spec["output_dir"], filename
+            )
+
+            result.update(
+                {
+                    "success": True,
+                    "output_path": str(output_path),
+                    "template_path": rendered_result["metadata"]["template_path"],
+                    "character_count": rendered_result["metadata"]["character_count"],
+                    "validation": validation_result,
+                }
+            )
+
+        except Exception as e:
+            result["error"] = str(e)
+
+        result["duration_seconds"] = round(time.perf_counter() - start_time, 4)
+        return result
+
     def _parse_ticker_date(self, ticker_date: str) -> Tuple[str, str]:
         """Parse ticker_date format (e.g., 'AAPL_20250618')"""
         if "_" not in ticker_date:
@@ -587,3 +816,32 @@ class TwitterCommandProcessor:
             ),
             "available_templates": self.template_renderer.get_available_templates(),
         }
+
+
+def main():
+    """Run a batch manifest from the command line"""
+    parser = argparse.ArgumentParser(description="Batch Twitter content rendering")
+    parser.add_argument("manifest", help="JSON or CSV manifest of rendering jobs")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent jobs")
+    parser.add_argument("--summary", default=None, help="Summary output path")
+    args = parser.parse_args()
+
+    processor = TwitterCommandProcessor()
+    jobs = processor.load_batch_manifest(args.manifest)
+    summary = processor.process_batch(
+        jobs, max_workers=args.workers, summary_path=args.summary
+    )
+
+    print(
+        f"Rendered {summary['succeeded']}/{summary['total_jobs']} jobs "
+        f"in {summary['duration_seconds']}s -> {summary['summary_path']}"
+    )
+    for job in summary["jobs"]:
+        if not job["success"]:
+            print(f"  FAILED [{job['job_index']}] {job['job']}: {job['error']}")
+
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
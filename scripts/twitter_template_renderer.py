@@ -16,12 +16,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from jinja2 import Template, TemplateNotFound
 
 # Add utils to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.cli_base import ServiceError, ValidationError
+from utils.template_registry import get_template_environment
 
 
 class TwitterTemplateRenderer:
@@ -32,9 +33,9 @@ class TwitterTemplateRenderer:
         self.templates_dir = templates_dir or Path(__file__).parent / "templates"
         self.twitter_templates_dir = self.templates_dir / "twitter"
 
-        # Setup Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
+        # Shared Jinja2 environment (compiled templates reused across instances)
+        self.jinja_env = get_template_environment(
+            self.templates_dir,
             autoescape=True,
             trim_blocks=True,
             lstrip_blocks=True,
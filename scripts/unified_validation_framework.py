@@ -13,7 +13,142 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+# Rule patterns (compiled once per process)
+EMOJI_RE = re.compile(
+    r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]"
+)
+REQUIRED_ELEMENT_PATTERNS = {
+    "ticker": re.compile(r"\$[A-Z]{1,5}"),
+    "blog_link": re.compile(r"https://www\.colemorton\.com/blog/"),
+    "hashtags": re.compile(r"#[A-Za-z]+"),
+}
+# Literal phrases are matched case-insensitively against lower-cased content
+DISCLAIMER_PHRASES = ("not financial advice", "do your own research")
+CTA_PHRASES = ("📋 full analysis:", "read more:", "check out:", "learn more:")
+RISK_KEYWORDS = ("risk", "loss", "volatile", "uncertain", "past performance")
+PROBLEMATIC_PHRASES = (
+    "you should buy",
+    "guaranteed returns",
+    "no risk",
+    "certain profit",
+    "will increase",
+)
+CONTENT_TYPE_KEYWORDS = {
+    "fundamental": ("fair value", "price target", "valuation", "dcf"),
+    "strategy": ("win rate", "performance", "signal", "strategy"),
+    "sector": ("sector", "allocation", "rotation", "etf"),
+    "trade_history": ("return", "trades", "performance", "portfolio"),
+}
+
+ValidationCheck = Callable[..., Dict[str, Any]]
+
+
+class ValidationContext:
+    """
+    Per-document state shared by every rule in a plan
+
+    Derived values (lower-cased text, lines, hook, emoji count) are computed
+    on first use and reused by all rules that need them.
+    """
+
+    __slots__ = (
+        "content",
+        "content_type",
+        "source_data",
+        "metadata",
+        "_content_lower",
+        "_lines",
+        "_emoji_count",
+    )
+
+    def __init__(
+        self,
+        content: str,
+        content_type: str,
+        source_data: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self.content = content
+        self.content_type = content_type
+        self.source_data = source_data if source_data is not None else {}
+        self.metadata = metadata
+        self._content_lower: Optional[str] = None
+        self._lines: Optional[List[str]] = None
+        self._emoji_count: Optional[int] = None
+
+    @property
+    def content_lower(self) -> str:
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return self._content_lower
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.content.split("\n")
+        return self._lines
+
+    @property
+    def hook(self) -> str:
+        return self.lines[0]
+
+    @property
+    def emoji_count(self) -> int:
+        if self._emoji_count is None:
+            self._emoji_count = len(EMOJI_RE.findall(self.content))
+        return self._emoji_count
+
+    def count_keywords(self, keywords: Iterable[str]) -> int:
+        """Number of lower-case keywords present in the content"""
+        content_lower = self.content_lower
+        return sum(1 for keyword in keywords if keyword in content_lower)
+
+
+class ValidationPlan:
+    """
+    Execution plan compiled once per content type
+
+    Rules are resolved into flat (category, criterion, check) steps grouped
+    by category, so validating a document is a single loop over bound checks
+    with no criteria lookups.
+    """
+
+    def __init__(
+        self,
+        content_type: str,
+        steps: List[Tuple[str, str, ValidationCheck]],
+        specific_check: Optional[ValidationCheck],
+        realtime_check: ValidationCheck,
+    ):
+        self.content_type = content_type
+        self.steps = tuple(steps)
+        self.specific_check = specific_check
+        self.realtime_check = realtime_check
+        self.categories = tuple(dict.fromkeys(category for category, _, _ in steps))
+
+    def execute(self, context: ValidationContext) -> Dict[str, Any]:
+        """Run every rule against one document context"""
+        results: Dict[str, Dict[str, Any]] = {
+            category: {} for category in self.categories
+        }
+        for category, criterion, check in self.steps:
+            results[category][criterion] = check(
+                context.content, context.content_type, context.source_data, context
+            )
+
+        if self.specific_check is not None:
+            results["content_specific"] = self.specific_check(
+                context.content, context.source_data, context
+            )
+        else:
+            results["content_specific"] = {"score": 1.0, "issues": []}
+
+        results.update(
+            self.realtime_check(context.content, context.content_type, context.metadata)
+        )
+        return results
 
 
 class UnifiedValidationFramework:
@@ -63,6 +198,31 @@ class UnifiedValidationFramework:
             "trade_history": self._validate_trade_history_specific,
         }
 
+        # Execution plans compiled on first use per content type
+        self._plans: Dict[str, ValidationPlan] = {}
+
+    def compile_plan(self, content_type: str) -> ValidationPlan:
+        """Compile (or return the cached) execution plan for a content type"""
+        plan = self._plans.get(content_type)
+        if plan is None:
+            steps = [
+                (category, criterion, validator)
+                for category, criteria in self.common_criteria.items()
+                for criterion, validator in criteria.items()
+            ]
+            plan = ValidationPlan(
+                content_type,
+                steps,
+                self.content_specific_validators.get(content_type),
+                self._validate_realtime_context,
+            )
+            self._plans[content_type] = plan
+        return plan
+
+    def clear_plans(self):
+        """Drop compiled plans after criteria or validators are changed"""
+        self._plans.clear()
+
     def validate_content(
         self,
         content: str,
@@ -83,10 +243,53 @@ class UnifiedValidationFramework:
             Comprehensive validation result
         """
 
+        return self._execute_plan(
+            self.compile_plan(content_type),
+            ValidationContext(content, content_type, source_data, metadata),
+        )
+
+    def validate_many(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        content_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate many documents against the compiled rule plans
+
+        Args:
+            documents: Dicts with "content" and optional "content_type",
+                "source_data" and "metadata" keys
+            content_type: Default content type for documents without one
+
+        Returns:
+            Validation results in document order
+        """
+
+        results = []
+        for document in documents:
+            doc_type = document.get("content_type", content_type)
+            results.append(
+                self._execute_plan(
+                    self.compile_plan(doc_type),
+                    ValidationContext(
+                        document["content"],
+                        doc_type,
+                        document.get("source_data"),
+                        document.get("metadata"),
+                    ),
+                )
+            )
+        return results
+
+    def _execute_plan(
+        self, plan: ValidationPlan, context: ValidationContext
+    ) -> Dict[str, Any]:
+        """Run a compiled plan and assemble the validation result"""
+
         validation_result = {
             "metadata": {
                 "validation_timestamp": datetime.now().isoformat(),
-                "content_type": content_type,
+                "content_type": context.content_type,
                 "validation_framework": "unified",
                 "framework_version": "1.0",
             },
@@ -97,35 +300,23 @@ class UnifiedValidationFramework:
             "methodology_notes": {},
         }
 
-        # Perform common validation
-        common_results = self._validate_common_criteria(
-            content, content_type, source_data
-        )
-
-        # Perform content-specific validation
-        specific_results = self._validate_content_specific(
-            content, content_type, source_data
-        )
-
-        # Perform real-time validation (if applicable)
-        realtime_results = self._validate_realtime_context(
-            content, content_type, metadata
-        )
-
-        # Combine all validation results
-        all_results = {**common_results, **specific_results, **realtime_results}
+        # Common, content-specific and real-time rules in one pass
+        all_results = plan.execute(context)
+        scored_results = self._scored_results(all_results)
 
         # Calculate overall scores
-        overall_assessment = self._calculate_overall_assessment(all_results)
+        overall_assessment = self._calculate_overall_assessment(
+            all_results, scored_results
+        )
 
         # Generate findings matrix
         findings_matrix = self._generate_findings_matrix(
-            all_results, content, source_data
+            all_results, context.content, context.source_data, scored_results
         )
 
         # Generate recommendations
         recommendations = self._generate_recommendations(
-            all_results, overall_assessment
+            all_results, overall_assessment, scored_results
         )
 
         # Compile final validation result
@@ -136,51 +327,37 @@ class UnifiedValidationFramework:
                 "critical_findings_matrix": findings_matrix,
                 "actionable_recommendations": recommendations,
                 "methodology_notes": self._generate_methodology_notes(
-                    content_type, all_results
+                    context.content_type, all_results
                 ),
             }
         )
 
         return validation_result
 
+    @staticmethod
+    def _scored_results(all_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Criterion results (category -> criterion -> result) in rule order"""
+
+        return [
+            result
+            for results in all_results.values()
+            if isinstance(results, dict)
+            for result in results.values()
+            if isinstance(result, dict)
+        ]
+
     def _validate_common_criteria(
         self, content: str, content_type: str, source_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Validate common criteria across all content types"""
 
+        context = ValidationContext(content, content_type, source_data)
         results = {}
-
-        # Content structure validation
-        results["content_structure"] = {}
-        for criterion, validator in self.common_criteria["content_structure"].items():
-            results["content_structure"][criterion] = validator(
-                content, content_type, source_data
-            )
-
-        # Compliance standards validation
-        results["compliance_standards"] = {}
-        for criterion, validator in self.common_criteria[
-            "compliance_standards"
-        ].items():
-            results["compliance_standards"][criterion] = validator(
-                content, content_type, source_data
-            )
-
-        # Accuracy standards validation
-        results["accuracy_standards"] = {}
-        for criterion, validator in self.common_criteria["accuracy_standards"].items():
-            results["accuracy_standards"][criterion] = validator(
-                content, content_type, source_data
-            )
-
-        # Engagement optimization validation
-        results["engagement_optimization"] = {}
-        for criterion, validator in self.common_criteria[
-            "engagement_optimization"
-        ].items():
-            results["engagement_optimization"][criterion] = validator(
-                content, content_type, source_data
-            )
+        for category, criteria in self.common_criteria.items():
+            results[category] = {
+                criterion: validator(content, content_type, source_data, context)
+                for criterion, validator in criteria.items()
+            }
 
         return results
 
@@ -211,12 +388,17 @@ class UnifiedValidationFramework:
             }
         }
 
-    # Common validation methods
+    # Common validation methods (context carries values shared across rules)
     def _validate_character_limits(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate character limits and structure"""
 
+        context = context or ValidationContext(content, content_type, source_data)
         issues = []
         score = 1.0
 
@@ -227,22 +409,24 @@ class UnifiedValidationFramework:
             score -= 0.3
 
         # Check hook length (first line)
-        lines = content.split("\n")
-        if lines:
-            hook_length = len(lines[0])
-            if hook_length > 280:
-                issues.append(f"Hook exceeds Twitter limit: {hook_length} characters")
-                score -= 0.5
+        hook_length = len(context.hook)
+        if hook_length > 280:
+            issues.append(f"Hook exceeds Twitter limit: {hook_length} characters")
+            score -= 0.5
 
         return {
             "score": max(0.0, score),
             "issues": issues,
             "character_count": total_chars,
-            "hook_length": len(lines[0]) if lines else 0,
+            "hook_length": hook_length,
         }
 
     def _validate_required_elements(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate required elements are present"""
 
@@ -250,28 +434,27 @@ class UnifiedValidationFramework:
         score = 1.0
 
         # Common required elements
-        required_elements = {
-            "ticker": r"\$[A-Z]{1,5}",
-            "blog_link": r"https://www\.colemorton\.com/blog/",
-            "hashtags": r"#[A-Za-z]+",
-        }
-
-        for element, pattern in required_elements.items():
-            if not re.search(pattern, content):
+        for element, pattern in REQUIRED_ELEMENT_PATTERNS.items():
+            if not pattern.search(content):
                 issues.append(f"Missing required element: {element}")
                 score -= 0.2
 
         return {
             "score": max(0.0, score),
             "issues": issues,
-            "elements_found": len(required_elements) - len(issues),
+            "elements_found": len(REQUIRED_ELEMENT_PATTERNS) - len(issues),
         }
 
     def _validate_formatting_rules(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate formatting rules"""
 
+        context = context or ValidationContext(content, content_type, source_data)
         issues = []
         score = 1.0
 
@@ -283,12 +466,7 @@ class UnifiedValidationFramework:
             score -= 0.5
 
         # Check for proper emoji usage
-        emoji_count = len(
-            re.findall(
-                r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]",
-                content,
-            )
-        )
+        emoji_count = context.emoji_count
         if emoji_count == 0:
             issues.append("No emojis found - may reduce engagement")
             score -= 0.1
@@ -299,24 +477,20 @@ class UnifiedValidationFramework:
         return {"score": max(0.0, score), "issues": issues, "emoji_count": emoji_count}
 
     def _validate_disclaimers(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate disclaimer presence and adequacy"""
 
+        context = context or ValidationContext(content, content_type, source_data)
         issues = []
         score = 1.0
 
         # Check for disclaimer presence
-        disclaimer_patterns = [
-            r"Not financial advice",
-            r"⚠️.*Not financial advice",
-            r"Do your own research",
-        ]
-
-        disclaimer_found = any(
-            re.search(pattern, content, re.IGNORECASE)
-            for pattern in disclaimer_patterns
-        )
+        disclaimer_found = context.count_keywords(DISCLAIMER_PHRASES) > 0
 
         if not disclaimer_found:
             issues.append("Missing required disclaimer")
@@ -329,18 +503,20 @@ class UnifiedValidationFramework:
         }
 
     def _validate_risk_warnings(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate risk warnings"""
 
+        context = context or ValidationContext(content, content_type, source_data)
         issues = []
         score = 1.0
 
         # Check for risk-related language
-        risk_keywords = ["risk", "loss", "volatile", "uncertain", "past performance"]
-        risk_mentions = sum(
-            1 for keyword in risk_keywords if keyword.lower() in content.lower()
-        )
+        risk_mentions = context.count_keywords(RISK_KEYWORDS)
 
         if risk_mentions == 0:
             issues.append("No risk warnings found")
@@ -353,31 +529,33 @@ class UnifiedValidationFramework:
         }
 
     def _validate_investment_advice(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate investment advice language compliance"""
 
+        context = context or ValidationContext(content, content_type, source_data)
         issues = []
         score = 1.0
 
         # Check for problematic language
-        problematic_phrases = [
-            "you should buy",
-            "guaranteed returns",
-            "no risk",
-            "certain profit",
-            "will increase",
-        ]
-
-        for phrase in problematic_phrases:
-            if phrase.lower() in content.lower():
+        content_lower = context.content_lower
+        for phrase in PROBLEMATIC_PHRASES:
+            if phrase in content_lower:
                 issues.append(f"Problematic investment advice language: '{phrase}'")
                 score -= 0.4
 
         return {"score": max(0.0, score), "issues": issues}
 
     def _validate_attribution(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate attribution requirements"""
 
@@ -392,7 +570,11 @@ class UnifiedValidationFramework:
         return {"score": max(0.0, score), "issues": issues}
 
     def _validate_data_consistency(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate data consistency"""
 
@@ -405,7 +587,11 @@ class UnifiedValidationFramework:
         return {"score": score, "issues": issues, "consistency_check": "basic"}
 
     def _validate_source_verification(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate source verification"""
 
@@ -420,7 +606,11 @@ class UnifiedValidationFramework:
         return {"score": max(0.0, score), "issues": issues}
 
     def _validate_claim_substantiation(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate claim substantiation"""
 
@@ -433,36 +623,38 @@ class UnifiedValidationFramework:
         return {"score": score, "issues": issues}
 
     def _validate_hook_effectiveness(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate hook effectiveness"""
 
+        context = context or ValidationContext(content, content_type, source_data)
         issues = []
         score = 1.0
 
-        lines = content.split("\n")
-        if not lines:
-            issues.append("No hook found")
-            return {"score": 0.0, "issues": issues}
-
-        hook = lines[0]
+        hook = context.hook
 
         # Check hook characteristics
         if len(hook) < 50:
             issues.append("Hook too short - may not be engaging")
             score -= 0.2
 
-        if not re.search(
-            r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]",
-            hook,
-        ):
+        # A hook emoji implies a content emoji, so the shared count short-circuits
+        if context.emoji_count == 0 or not EMOJI_RE.search(hook):
             issues.append("Hook missing emoji - may reduce engagement")
             score -= 0.1
 
         return {"score": max(0.0, score), "issues": issues, "hook_length": len(hook)}
 
     def _validate_content_accessibility(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate content accessibility"""
 
@@ -475,24 +667,20 @@ class UnifiedValidationFramework:
         return {"score": score, "issues": issues}
 
     def _validate_call_to_action(
-        self, content: str, content_type: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        content_type: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate call to action effectiveness"""
 
+        context = context or ValidationContext(content, content_type, source_data)
         issues = []
         score = 1.0
 
         # Check for call to action
-        cta_patterns = [
-            r"📋 Full analysis:",
-            r"Read more:",
-            r"Check out:",
-            r"Learn more:",
-        ]
-
-        cta_found = any(
-            re.search(pattern, content, re.IGNORECASE) for pattern in cta_patterns
-        )
+        cta_found = context.count_keywords(CTA_PHRASES) > 0
 
         if not cta_found:
             issues.append("No clear call to action found")
@@ -501,114 +689,108 @@ class UnifiedValidationFramework:
         return {"score": max(0.0, score), "issues": issues, "cta_found": cta_found}
 
     # Content-specific validation methods
-    def _validate_fundamental_specific(
-        self, content: str, source_data: Dict[str, Any]
+    def _keyword_check(
+        self,
+        content: str,
+        content_type: str,
+        context: Optional[ValidationContext],
+        mentions_key: str,
+        missing_issue: str,
     ) -> Dict[str, Any]:
-        """Validate fundamental analysis specific criteria"""
+        """Shared keyword-presence rule for content-specific validators"""
 
+        context = context or ValidationContext(content, content_type)
         issues = []
         score = 1.0
 
-        # Check for valuation-related content
-        valuation_keywords = ["fair value", "price target", "valuation", "DCF"]
-        valuation_mentions = sum(
-            1 for keyword in valuation_keywords if keyword.lower() in content.lower()
-        )
+        mentions = context.count_keywords(CONTENT_TYPE_KEYWORDS[content_type])
 
-        if valuation_mentions == 0:
-            issues.append("No valuation content found in fundamental analysis")
+        if mentions == 0:
+            issues.append(missing_issue)
             score -= 0.3
 
-        return {
-            "score": max(0.0, score),
-            "issues": issues,
-            "valuation_mentions": valuation_mentions,
-        }
+        return {"score": max(0.0, score), "issues": issues, mentions_key: mentions}
+
+    def _validate_fundamental_specific(
+        self,
+        content: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
+    ) -> Dict[str, Any]:
+        """Validate fundamental analysis specific criteria"""
+
+        # Check for valuation-related content
+        return self._keyword_check(
+            content,
+            "fundamental",
+            context,
+            "valuation_mentions",
+            "No valuation content found in fundamental analysis",
+        )
 
     def _validate_strategy_specific(
-        self, content: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate strategy specific criteria"""
 
-        issues = []
-        score = 1.0
-
         # Check for strategy metrics
-        strategy_keywords = ["win rate", "performance", "signal", "strategy"]
-        strategy_mentions = sum(
-            1 for keyword in strategy_keywords if keyword.lower() in content.lower()
+        return self._keyword_check(
+            content,
+            "strategy",
+            context,
+            "strategy_mentions",
+            "No strategy metrics found",
         )
 
-        if strategy_mentions == 0:
-            issues.append("No strategy metrics found")
-            score -= 0.3
-
-        return {
-            "score": max(0.0, score),
-            "issues": issues,
-            "strategy_mentions": strategy_mentions,
-        }
-
     def _validate_sector_specific(
-        self, content: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate sector analysis specific criteria"""
 
-        issues = []
-        score = 1.0
-
         # Check for sector-specific content
-        sector_keywords = ["sector", "allocation", "rotation", "ETF"]
-        sector_mentions = sum(
-            1 for keyword in sector_keywords if keyword.lower() in content.lower()
+        return self._keyword_check(
+            content,
+            "sector",
+            context,
+            "sector_mentions",
+            "No sector-specific content found",
         )
 
-        if sector_mentions == 0:
-            issues.append("No sector-specific content found")
-            score -= 0.3
-
-        return {
-            "score": max(0.0, score),
-            "issues": issues,
-            "sector_mentions": sector_mentions,
-        }
-
     def _validate_trade_history_specific(
-        self, content: str, source_data: Dict[str, Any]
+        self,
+        content: str,
+        source_data: Dict[str, Any],
+        context: Optional[ValidationContext] = None,
     ) -> Dict[str, Any]:
         """Validate trade history specific criteria"""
 
-        issues = []
-        score = 1.0
-
         # Check for performance data
-        performance_keywords = ["return", "trades", "performance", "portfolio"]
-        performance_mentions = sum(
-            1 for keyword in performance_keywords if keyword.lower() in content.lower()
+        return self._keyword_check(
+            content,
+            "trade_history",
+            context,
+            "performance_mentions",
+            "No performance data found",
         )
 
-        if performance_mentions == 0:
-            issues.append("No performance data found")
-            score -= 0.3
-
-        return {
-            "score": max(0.0, score),
-            "issues": issues,
-            "performance_mentions": performance_mentions,
-        }
-
     def _calculate_overall_assessment(
-        self, all_results: Dict[str, Any]
+        self,
+        all_results: Dict[str, Any],
+        scored_results: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Calculate overall assessment scores"""
 
+        if scored_results is None:
+            scored_results = self._scored_results(all_results)
+
         # Collect all scores
-        scores = []
-        for category, results in all_results.items():
-            if isinstance(results, dict):
-                for criterion, result in results.items():
-                    if isinstance(result, dict) and "score" in result:
-                        scores.append(result["score"])
+        scores = [result["score"] for result in scored_results if "score" in result]
 
         # Calculate overall reliability score
         overall_reliability = sum(scores) / len(scores) if scores else 0.0
@@ -646,38 +828,34 @@ class UnifiedValidationFramework:
         }
 
     def _generate_findings_matrix(
-        self, all_results: Dict[str, Any], content: str, source_data: Dict[str, Any]
+        self,
+        all_results: Dict[str, Any],
+        content: str,
+        source_data: Dict[str, Any],
+        scored_results: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Generate critical findings matrix"""
 
+        if scored_results is None:
+            scored_results = self._scored_results(all_results)
+
         verified_claims = []
         questionable_assertions = []
         inaccurate_statements = []
         unverifiable_claims = []
 
         # Collect issues from all validation results
-        for category, results in all_results.items():
-            if isinstance(results, dict):
-                for criterion, result in results.items():
-                    if isinstance(result, dict) and "issues" in result:
-                        for issue in result["issues"]:
-                            if (
-                                "missing" in issue.lower()
-                                or "not found" in issue.lower()
-                            ):
-                                unverifiable_claims.append(issue)
-                            elif (
-                                "inaccurate" in issue.lower()
-                                or "incorrect" in issue.lower()
-                            ):
-                                inaccurate_statements.append(issue)
-                            elif (
-                                "questionable" in issue.lower()
-                                or "uncertain" in issue.lower()
-                            ):
-                                questionable_assertions.append(issue)
-                            else:
-                                verified_claims.append(f"Issue identified: {issue}")
+        for result in scored_results:
+            for issue in result.get("issues", ()):
+                issue_lower = issue.lower()
+                if "missing" in issue_lower or "not found" in issue_lower:
+                    unverifiable_claims.append(issue)
+                elif "inaccurate" in issue_lower or "incorrect" in issue_lower:
+                    inaccurate_statements.append(issue)
+                elif "questionable" in issue_lower or "uncertain" in issue_lower:
+                    questionable_assertions.append(issue)
+                else:
+                    verified_claims.append(f"Issue identified: {issue}")
 
         return {
             "verified_accurate_claims": verified_claims,
@@ -687,26 +865,31 @@ class UnifiedValidationFramework:
         }
 
     def _generate_recommendations(
-        self, all_results: Dict[str, Any], overall_assessment: Dict[str, Any]
+        self,
+        all_results: Dict[str, Any],
+        overall_assessment: Dict[str, Any],
+        scored_results: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Generate actionable recommendations"""
 
+        if scored_results is None:
+            scored_results = self._scored_results(all_results)
+
         high_priority = []
         medium_priority = []
         low_priority = []
 
         # Collect recommendations based on scores
-        for category, results in all_results.items():
-            if isinstance(results, dict):
-                for criterion, result in results.items():
-                    if isinstance(result, dict) and "score" in result:
-                        score = result["score"]
-                        if score < 0.6:
-                            high_priority.extend(result.get("issues", []))
-                        elif score < 0.8:
-                            medium_priority.extend(result.get("issues", []))
-                        elif score < 0.9:
-                            low_priority.extend(result.get("issues", []))
+        for result in scored_results:
+            if "score" not in result:
+                continue
+            score = result["score"]
+            if score < 0.6:
+                high_priority.extend(result.get("issues", []))
+            elif score < 0.8:
+                medium_priority.extend(result.get("issues", []))
+            elif score < 0.9:
+                low_priority.extend(result.get("issues", []))
 
         return {
             "required_corrections": {
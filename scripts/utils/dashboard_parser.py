@@ -12,12 +12,21 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Union
 
 # Add project root to Python path for imports
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+# Add scripts directory to path for utils imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.markdown_report_tokenizer import (
+    MarkdownReport,
+    MarkdownSection,
+    load_report,
+    strip_markup,
+)
+
 
 @dataclass
 class TradeData:
@@ -88,194 +97,128 @@ class DashboardDataParser:
             Dictionary containing structured performance data
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
+            report = load_report(file_path)
 
             return {
-                "performance_metrics": self._extract_performance_metrics(content),
-                "trades": self._extract_trade_data(content),
-                "monthly_performance": self._extract_monthly_performance(content),
-                "quality_distribution": self._extract_quality_distribution(content),
-                "metadata": self._extract_metadata(content),
+                "performance_metrics": self._extract_performance_metrics(report),
+                "trades": self._extract_trade_data(report),
+                "monthly_performance": self._extract_monthly_performance(report),
+                "quality_distribution": self._extract_quality_distribution(report),
+                "metadata": self._extract_metadata(report),
             }
 
         except Exception as e:
             self.logger.error(f"Failed to parse report {file_path}: {e}")
             raise
 
-    def _extract_performance_metrics(self, content: str) -> PerformanceMetrics:
-        """Extract overall performance metrics from the content."""
-
-        # Extract total trades
-        total_trades_match = re.search(r"\*\*Total Closed Trades\*\*:\s*(\d+)", content)
-        total_trades = int(total_trades_match.group(1)) if total_trades_match else 0
-
-        # Extract win rate
-        win_rate_match = re.search(r"\*\*Win Rate\*\*:\s*([\d.]+)%", content)
-        win_rate = float(win_rate_match.group(1)) if win_rate_match else 0.0
-
-        # Extract total return
-        total_return_match = re.search(
-            r"\*\*Total Return\*\*:\s*([+-]?[\d.]+)%", content
-        )
-        total_return = float(total_return_match.group(1)) if total_return_match else 0.0
-
-        # Extract average duration
-        avg_duration_match = re.search(
-            r"\*\*Average Trade Duration\*\*:\s*([\d.]+)\s*days", content
-        )
-        avg_duration = float(avg_duration_match.group(1)) if avg_duration_match else 0.0
-
-        # Extract profit factor
-        profit_factor_match = re.search(r"\*\*Profit Factor\*\*:\s*([\d.]+)", content)
-        profit_factor = (
-            float(profit_factor_match.group(1)) if profit_factor_match else 0.0
-        )
-
-        # Extract average winner/loser
-        avg_winner_match = re.search(
-            r"\*\*Average Winner\*\*:\s*([+-]?[\d.]+)%", content
-        )
-        avg_winner = float(avg_winner_match.group(1)) if avg_winner_match else 0.0
-
-        avg_loser_match = re.search(r"\*\*Average Loser\*\*:\s*([+-]?[\d.]+)%", content)
-        avg_loser = float(avg_loser_match.group(1)) if avg_loser_match else 0.0
-
-        # Extract best/worst trades
-        best_trade_match = re.search(r"\*\*Best Trade\*\*:\s*([^(]+\([^)]+\))", content)
-        best_trade = best_trade_match.group(1).strip() if best_trade_match else ""
-
-        worst_trade_match = re.search(
-            r"\*\*Worst Trade\*\*:\s*([^(]+\([^)]+\))", content
-        )
-        worst_trade = worst_trade_match.group(1).strip() if worst_trade_match else ""
+    @staticmethod
+    def _number(
+        report: Union[MarkdownReport, MarkdownSection],
+        key: str,
+        pattern: str,
+        cast: Callable[[str], Any] = float,
+        default: Any = 0.0,
+    ) -> Any:
+        """First field value for key matching pattern, converted with cast."""
+        value = report.get(key, pattern)
+        return cast(value) if value is not None else default
+
+    def _extract_performance_metrics(
+        self, report: MarkdownReport
+    ) -> PerformanceMetrics:
+        """Extract overall performance metrics from the report fields."""
+        best_trade = report.get("Best Trade", r"^([^(]+\([^)]+\))") or ""
+        worst_trade = report.get("Worst Trade", r"^([^(]+\([^)]+\))") or ""
 
         return PerformanceMetrics(
-            total_trades=total_trades,
-            win_rate=win_rate,
-            total_return=total_return,
-            average_duration=avg_duration,
-            profit_factor=profit_factor,
-            average_winner=avg_winner,
-            average_loser=avg_loser,
-            best_trade=best_trade,
-            worst_trade=worst_trade,
+            total_trades=self._number(report, "Total Closed Trades", r"^(\d+)", int, 0),
+            win_rate=self._number(report, "Win Rate", r"^([\d.]+)%"),
+            total_return=self._number(report, "Total Return", r"^([+-]?[\d.]+)%"),
+            average_duration=self._number(
+                report, "Average Trade Duration", r"^([\d.]+)\s*days"
+            ),
+            profit_factor=self._number(report, "Profit Factor", r"^([\d.]+)"),
+            average_winner=self._number(report, "Average Winner", r"^([+-]?[\d.]+)%"),
+            average_loser=self._number(report, "Average Loser", r"^([+-]?[\d.]+)%"),
+            best_trade=best_trade.strip(),
+            worst_trade=worst_trade.strip(),
         )
 
-    def _extract_trade_data(self, content: str) -> List[TradeData]:
-        """Extract individual trade data from the markdown table."""
+    def _extract_trade_data(self, report: MarkdownReport) -> List[TradeData]:
+        """Extract individual trade data from the ranked trade table."""
         trades = []
 
-        # Find the trade table section
-        table_match = re.search(
-            r"\|\s*\*\*Rank\*\*.*?\n((?:\|.*?\n)*)", content, re.MULTILINE | re.DOTALL
-        )
-
-        if not table_match:
+        table = report.find_table("Rank", "Ticker", "Return", "Duration")
+        if table is None:
             self.logger.warning("Could not find trade data table")
             return trades
 
-        table_content = table_match.group(1)
-
-        # Parse each row
-        for line in table_content.split("\n"):
-            if "|" in line and line.strip() and not line.strip().startswith("|---"):
-                parts = [part.strip() for part in line.split("|") if part.strip()]
-
-                if len(parts) >= 8:
-                    try:
-                        # Original table format: | Rank | Ticker | P&L ($) | Return (%) | Duration | Strategy | Quality | X/Twitter Link |
-                        rank = int(parts[0])
-                        ticker = parts[1].replace("**", "").strip()
-                        # parts[2] is P&L ($) - skip for now
-
-                        # Extract return percentage from column 3
-                        return_str = (
-                            parts[3].replace("**", "").replace("%", "").replace("+", "")
-                        )
-                        return_pct = float(return_str)
-
-                        # Extract duration from column 4
-                        duration_str = parts[4].replace("d", "").strip()
-                        duration_days = int(duration_str)
-
-                        # Strategy is in column 5
-                        strategy = parts[5]
-
-                        # Quality is in column 6
-                        quality = parts[6]
-
-                        # Use placeholder dates since original format doesn't include them
-                        entry_date = "N/A"
-                        exit_date = "N/A"
-
-                        trades.append(
-                            TradeData(
-                                rank=rank,
-                                ticker=ticker,
-                                strategy=strategy,
-                                entry_date=entry_date,
-                                exit_date=exit_date,
-                                return_pct=return_pct,
-                                duration_days=duration_days,
-                                quality=quality,
-                            )
-                        )
-
-                    except (ValueError, IndexError) as e:
-                        self.logger.warning(f"Could not parse trade row: {line} - {e}")
-                        continue
+        # Table format: | Rank | Ticker | P&L ($) | Return (%) | Duration | Strategy | Quality | ...
+        # Columns are located by header so reordered/extra columns still parse
+        rank_col = table.column_index("Rank")
+        ticker_col = table.column_index("Ticker")
+        return_col = table.column_index("Return")
+        duration_col = table.column_index("Duration")
+        strategy_col = table.column_index("Strategy")
+        quality_col = table.column_index("Quality")
+        entry_col = table.column_index("Entry Date", "Entry")
+        exit_col = table.column_index("Exit Date", "Exit")
+
+        def cell(row: List[str], index: Optional[int], default: str = "N/A") -> str:
+            if index is None or index >= len(row):
+                return default
+            return strip_markup(row[index])
+
+        for row in table.rows:
+            try:
+                return_str = cell(row, return_col).replace("%", "").replace("+", "")
+                trades.append(
+                    TradeData(
+                        rank=int(cell(row, rank_col)),
+                        ticker=cell(row, ticker_col),
+                        strategy=cell(row, strategy_col, ""),
+                        entry_date=cell(row, entry_col),
+                        exit_date=cell(row, exit_col),
+                        return_pct=float(return_str),
+                        duration_days=int(cell(row, duration_col).rstrip("d").strip()),
+                        quality=cell(row, quality_col, ""),
+                    )
+                )
+            except (ValueError, IndexError) as e:
+                self.logger.warning(f"Could not parse trade row: {row} - {e}")
+                continue
 
         return trades
 
-    def _extract_monthly_performance(self, content: str) -> List[MonthlyPerformance]:
-        """Extract monthly performance data."""
+    def _extract_monthly_performance(
+        self, report: MarkdownReport
+    ) -> List[MonthlyPerformance]:
+        """Extract monthly performance data from "### <Month> <Year> - ..." sections."""
         monthly_data = []
 
-        # Fixed pattern to match monthly sections - properly captures section content
-        monthly_pattern = r"###\s*(\w+)\s*(\d+)\s*-\s*[^\n]+\n(.*?)(?=###|\Z)"
-
-        for match in re.finditer(monthly_pattern, content, re.DOTALL):
+        for section, match in report.find_sections(r"^(\w+)\s*(\d+)\s*-", level=3):
             month = match.group(1)
             year = int(match.group(2))
-            section_content = match.group(3)
-
-            # Debug logging for troubleshooting
             self.logger.debug(f"Parsing monthly section: {month} {year}")
-            self.logger.debug(f"Section content length: {len(section_content)}")
-            self.logger.debug(f"Section content preview: {repr(section_content[:100])}")
 
-            # Extract metrics from the section with improved patterns
-            trades_match = re.search(r"\*\*Trades Closed\*\*:\s*(\d+)", section_content)
-            trades_closed = int(trades_match.group(1)) if trades_match else 0
-            if not trades_match:
+            trades_closed = self._number(section, "Trades Closed", r"^(\d+)", int, 0)
+            if section.get("Trades Closed", r"^(\d+)") is None:
                 self.logger.warning(
                     f"Could not extract trades closed for {month} {year}"
                 )
 
-            win_rate_match = re.search(
-                r"\*\*Win Rate\*\*:\s*([\d.]+)%?", section_content
-            )
-            win_rate = float(win_rate_match.group(1)) if win_rate_match else 0.0
-            if not win_rate_match:
+            win_rate = self._number(section, "Win Rate", r"^([\d.]+)")
+            if section.get("Win Rate", r"^([\d.]+)") is None:
                 self.logger.warning(f"Could not extract win rate for {month} {year}")
 
-            avg_return_match = re.search(
-                r"\*\*Average Return\*\*:\s*([+-]?[\d.]+)%?", section_content
-            )
-            avg_return = float(avg_return_match.group(1)) if avg_return_match else 0.0
-            if not avg_return_match:
+            avg_return = self._number(section, "Average Return", r"^([+-]?[\d.]+)")
+            if section.get("Average Return", r"^([+-]?[\d.]+)") is None:
                 self.logger.warning(
                     f"Could not extract average return for {month} {year}"
                 )
 
-            # Extract market context
-            context_match = re.search(
-                r"\*\*Market Context\*\*:\s*([^\n]*)", section_content
-            )
-            market_context = context_match.group(1).strip() if context_match else ""
+            market_context = section.get("Market Context", default="")
 
-            # Log extracted values for validation
             self.logger.debug(
                 f"Extracted: {month} {year} - Trades: {trades_closed}, Win Rate: {win_rate}%, Avg Return: {avg_return}%"
             )
@@ -287,68 +230,45 @@ class DashboardDataParser:
                     trades_closed=trades_closed,
                     win_rate=win_rate,
                     average_return=avg_return,
-                    market_context=market_context,
+                    market_context=market_context.strip(),
                 )
             )
 
         return monthly_data
 
-    def _extract_quality_distribution(self, content: str) -> List[QualityDistribution]:
-        """Extract quality distribution data."""
+    def _extract_quality_distribution(
+        self, report: MarkdownReport
+    ) -> List[QualityDistribution]:
+        """Extract quality distribution data from "### <Quality> Trades (...)" sections."""
         quality_data = []
 
-        # Pattern to match quality sections
-        quality_pattern = r"###\s*(\w+)\s*Trades\s*\((\d+)\s*trades?\s*-\s*([\d.]+)%\)"
-
-        for match in re.finditer(quality_pattern, content):
-            category = match.group(1)
-            count = int(match.group(2))
-            percentage = float(match.group(3))
-
-            # Find the section content
-            section_start = match.end()
-            section_end = content.find("###", section_start)
-            if section_end == -1:
-                section_end = content.find("---", section_start)
-            if section_end == -1:
-                section_end = len(content)
-
-            section_content = content[section_start:section_end]
-
-            # Extract win rate and average return
-            win_rate_match = re.search(
-                r"\*\*Win Rate\*\*:\s*([\d.]+)%", section_content
-            )
-            win_rate = float(win_rate_match.group(1)) if win_rate_match else 0.0
-
-            avg_return_match = re.search(
-                r"\*\*Average Return\*\*:\s*([+-]?[\d.]+)%", section_content
-            )
-            avg_return = float(avg_return_match.group(1)) if avg_return_match else 0.0
+        quality_pattern = r"^(\w+)\s*Trades\s*\((\d+)\s*trades?\s*-\s*([\d.]+)%\)"
 
+        for section, match in report.find_sections(quality_pattern, level=3):
             quality_data.append(
                 QualityDistribution(
-                    category=category,
-                    count=count,
-                    percentage=percentage,
-                    win_rate=win_rate,
-                    average_return=avg_return,
+                    category=match.group(1),
+                    count=int(match.group(2)),
+                    percentage=float(match.group(3)),
+                    win_rate=self._number(section, "Win Rate", r"^([\d.]+)%"),
+                    average_return=self._number(
+                        section, "Average Return", r"^([+-]?[\d.]+)%"
+                    ),
                 )
             )
 
         return quality_data
 
-    def _extract_metadata(self, content: str) -> Dict[str, Any]:
+    def _extract_metadata(self, report: MarkdownReport) -> Dict[str, Any]:
         """Extract metadata from the report."""
         metadata = {}
 
-        # Extract title and date range
-        title_match = re.search(r"#\s*([^\n]+)", content)
-        metadata["title"] = (
-            title_match.group(1).strip() if title_match else "Historical Performance"
-        )
+        # Title is the first heading; date range comes from a bold "**<label> | <range>**" line
+        metadata["title"] = report.title or "Historical Performance"
 
-        date_range_match = re.search(r"\*\*.*?\|\s*([^*]+)\*\*", content)
+        date_range_match = report.search(
+            r"^\*\*[^*\n|]*\|\s*([^*\n]+)\*\*\s*$", re.MULTILINE
+        )
         metadata["date_range"] = (
             date_range_match.group(1).strip() if date_range_match else ""
         )
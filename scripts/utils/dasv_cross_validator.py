@@ -12,21 +12,28 @@ Features:
 - Staleness detection and variance monitoring
 - Fail-fast quality gates with detailed reporting
 - Cross-source validation across multiple APIs
+- Sweep mode: every region and date validated concurrently from one
+  snapshot of the phase artifacts, written as a consolidated matrix
 
 Usage:
     from scripts.utils.dasv_cross_validator import DASVCrossValidator
 
     validator = DASVCrossValidator()
     result = validator.validate_full_pipeline("US_20250812")
+
+    matrix = validator.sweep(regions=["US", "EUROPE"])
+    validator.write_consistency_matrix(matrix, "consistency_matrix.json")
 """
 
 import json
-import os
+import re
 import sys
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -55,14 +62,48 @@ class CrossValidationReport:
     metadata: Dict[str, Any]
 
 
+@dataclass
+class PhaseSnapshot:
+    """Phase artifacts for many regions and dates, each file loaded once"""
+
+    artifacts: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]]
+    files_loaded: int = 0
+    load_errors: Dict[str, str] = field(default_factory=dict)
+    loaded_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def regions(self) -> List[str]:
+        return sorted({region for region, _ in self.artifacts})
+
+    @property
+    def dates(self) -> List[str]:
+        return sorted({date for _, date in self.artifacts})
+
+    def get(self, region: str, date: str) -> Dict[str, Dict[str, Any]]:
+        """Phase data for one region and date (empty if nothing was found)"""
+        return self.artifacts.get((region, date), {})
+
+
 class DASVCrossValidator:
     """
     Cross-validation framework for DASV pipeline quality assurance
     """
 
-    def __init__(self, variance_threshold: float = 0.02, staleness_hours: int = 6):
+    # Phase artifact file names used to discover region/date pairs
+    ARTIFACT_NAME_RE = re.compile(
+        r"^([A-Za-z]+)_(\d{8})_(discovery|analysis)\.json$", re.IGNORECASE
+    )
+
+    def __init__(
+        self,
+        variance_threshold: float = 0.02,
+        staleness_hours: int = 6,
+        base_dir: Optional[str] = None,
+    ):
         self.variance_threshold = variance_threshold
         self.staleness_hours = staleness_hours
+        # Root the file patterns resolve against (defaults to the working directory)
+        self.base_dir = Path(base_dir) if base_dir else None
 
         # Quality thresholds
         self.min_institutional_score = 0.9
@@ -99,6 +140,22 @@ class DASVCrossValidator:
         # Load all phase files
         phase_data = self._load_phase_files(region, date)
 
+        return self.validate_phase_data(region, date, phase_data)
+
+    def validate_phase_data(
+        self, region: str, date: str, phase_data: Dict[str, Dict[str, Any]]
+    ) -> CrossValidationReport:
+        """
+        Validate already loaded phase data for a region and date
+
+        Args:
+            region: Region code
+            date: Date in YYYYMMDD format
+            phase_data: Phase name -> loaded artifact
+
+        Returns:
+            Comprehensive cross-validation report
+        """
         # Initialize results
         phase_results = {}
         critical_issues = []
@@ -167,25 +224,318 @@ class DASVCrossValidator:
         """Load all available phase files for validation"""
         phase_data = {}
 
-        for phase, pattern in self.file_patterns.items():
-            file_path = pattern.format(region=region, date=date)
+        for phase in self.file_patterns:
+            file_path = self._resolve_phase_file(phase, region, date)
 
-            if os.path.exists(file_path):
+            if file_path is not None:
                 try:
-                    if file_path.endswith(".json"):
-                        with open(file_path, "r") as f:
-                            phase_data[phase] = json.load(f)
-                    elif file_path.endswith(".md"):
-                        with open(file_path, "r") as f:
-                            phase_data[phase] = {
-                                "content": f.read(),
-                                "file_path": file_path,
-                            }
+                    phase_data[phase] = self._read_phase_file(file_path)
                 except Exception as e:
-                    print("Warning: Could not load {file_path}: {e}")
+                    print(f"Warning: Could not load {file_path}: {e}")
 
         return phase_data
 
+    def _phase_path(self, phase: str, region: str, date: str) -> Path:
+        """Expected path of a phase artifact"""
+        path = Path(self.file_patterns[phase].format(region=region, date=date))
+        return self.base_dir / path if self.base_dir else path
+
+    def _resolve_phase_file(
+        self,
+        phase: str,
+        region: str,
+        date: str,
+        listings: Optional[Dict[Path, Dict[str, Path]]] = None,
+    ) -> Optional[Path]:
+        """
+        Locate a phase artifact, falling back to a case-insensitive name match
+
+        Outputs mix "US_20250906.md" and "americas_20250906.md" style names, so
+        the exact pattern is tried first and then the directory listing.
+        """
+        path = self._phase_path(phase, region, date)
+        if path.exists():
+            return path
+
+        listings = listings if listings is not None else {}
+        listing = listings.get(path.parent)
+        if listing is None:
+            listing = {}
+            if path.parent.is_dir():
+                for entry in path.parent.iterdir():
+                    listing.setdefault(entry.name.lower(), entry)
+            listings[path.parent] = listing
+        return listing.get(path.name.lower())
+
+    @staticmethod
+    def _read_phase_file(file_path: Path) -> Dict[str, Any]:
+        """Read one phase artifact (JSON document or markdown synthesis)"""
+        with open(file_path, "r") as f:
+            if file_path.suffix == ".json":
+                return json.load(f)
+            return {"content": f.read(), "file_path": str(file_path)}
+
+    # Sweep mode
+    def discover_region_dates(
+        self,
+        regions: Optional[Iterable[str]] = None,
+        dates: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        Find every region/date pair with a discovery or analysis artifact
+
+        Args:
+            regions: Optional region filter (case-insensitive)
+            dates: Optional YYYYMMDD date filter
+
+        Returns:
+            Sorted (REGION, YYYYMMDD) pairs
+        """
+        region_filter = {r.upper() for r in regions} if regions else None
+        date_filter = set(dates) if dates else None
+
+        pairs = set()
+        for phase in ("discovery", "analysis"):
+            directory = self._phase_path(phase, "REGION", "DATE").parent
+            if not directory.is_dir():
+                continue
+            for entry in directory.iterdir():
+                match = self.ARTIFACT_NAME_RE.match(entry.name)
+                if not match:
+                    continue
+                region, date = match.group(1).upper(), match.group(2)
+                if region_filter is not None and region not in region_filter:
+                    continue
+                if date_filter is not None and date not in date_filter:
+                    continue
+                pairs.add((region, date))
+
+        return sorted(pairs)
+
+    def load_snapshot(
+        self,
+        region_dates: Iterable[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+    ) -> PhaseSnapshot:
+        """
+        Load the phase artifacts for many region/date pairs in one pass
+
+        Paths are resolved against cached directory listings and every file
+        is read exactly once, concurrently.
+
+        Args:
+            region_dates: (region, date) pairs to load
+            max_workers: Reader threads (executor default when None)
+
+        Returns:
+            Snapshot shared by all cross-phase checks in a sweep
+        """
+        listings: Dict[Path, Dict[str, Path]] = {}
+        wanted: List[Tuple[Tuple[str, str], str, Path]] = []
+        for region, date in region_dates:
+            for phase in self.file_patterns:
+                path = self._resolve_phase_file(phase, region, date, listings)
+                if path is not None:
+                    wanted.append(((region, date), phase, path))
+
+        unique_paths = list(dict.fromkeys(path for _, _, path in wanted))
+        loaded: Dict[Path, Dict[str, Any]] = {}
+        load_errors: Dict[str, str] = {}
+
+        def read(path: Path):
+            try:
+                return path, self._read_phase_file(path), None
+            except Exception as e:
+                return path, None, str(e)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for path, data, error in executor.map(read, unique_paths):
+                if error is None:
+                    loaded[path] = data
+                else:
+                    load_errors[str(path)] = error
+
+        artifacts: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {
+            key: {} for key in dict.fromkeys(pair for pair, _, _ in wanted)
+        }
+        for key, phase, path in wanted:
+            if path in loaded:
+                artifacts[key][phase] = loaded[path]
+
+        return PhaseSnapshot(
+            artifacts=artifacts,
+            files_loaded=len(loaded),
+            load_errors=load_errors,
+        )
+
+    def sweep(
+        self,
+        regions: Optional[Iterable[str]] = None,
+        dates: Optional[Iterable[str]] = None,
+        region_dates: Optional[Iterable[Tuple[str, str]]] = None,
+        max_workers: Optional[int] = None,
+        snapshot: Optional[PhaseSnapshot] = None,
+    ) -> Dict[str, Any]:
+        """
+        Validate every region and date concurrently against one snapshot
+
+        Args:
+            regions: Optional region filter for discovered pairs
+            dates: Optional date filter for discovered pairs
+            region_dates: Explicit (region, date) pairs (skips discovery)
+            max_workers: Worker threads for loading and validation
+            snapshot: Pre-loaded snapshot to validate
+
+        Returns:
+            Consolidated consistency matrix (see build_consistency_matrix)
+        """
+        if snapshot is None:
+            if region_dates is None:
+                region_dates = self.discover_region_dates(regions, dates)
+            snapshot = self.load_snapshot(region_dates, max_workers=max_workers)
+
+        def validate(key: Tuple[str, str]):
+            region, date = key
+            try:
+                return key, self.validate_phase_data(
+                    region, date, snapshot.get(region, date)
+                )
+            except Exception as e:
+                return key, e
+
+        pairs = sorted(snapshot.artifacts)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            reports = dict(executor.map(validate, pairs))
+
+        return self.build_consistency_matrix(reports, snapshot)
+
+    def build_consistency_matrix(
+        self,
+        reports: Dict[Tuple[str, str], Any],
+        snapshot: PhaseSnapshot,
+    ) -> Dict[str, Any]:
+        """
+        Consolidate per region/date reports into one region x date matrix
+
+        Args:
+            reports: (region, date) -> CrossValidationReport or the exception
+                raised while validating it
+            snapshot: Snapshot the reports were produced from
+
+        Returns:
+            Matrix of cells (None where a region has no artifacts for a date)
+            with per-phase scores and run-wide summaries
+        """
+        regions = sorted({region for region, _ in reports})
+        dates = sorted({date for _, date in reports})
+        phases = list(self.file_patterns) + ["cross_phase"]
+        phases.remove("validation")
+
+        matrix: Dict[str, Dict[str, Optional[Dict[str, Any]]]] = {
+            region: {date: None for date in dates} for region in regions
+        }
+        phase_scores: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {
+            phase: {region: {date: None for date in dates} for region in regions}
+            for phase in phases
+        }
+        violation_counts: Counter = Counter()
+        scores = []
+        errors = {}
+
+        for (region, date), report in sorted(reports.items()):
+            if isinstance(report, Exception):
+                errors[f"{region}_{date}"] = str(report)
+                matrix[region][date] = {"error": str(report)}
+                continue
+
+            cell_phases = {}
+            for phase, result in report.phase_results.items():
+                cell_phases[phase] = {
+                    "passed": bool(result.passed),
+                    "score": round(float(result.score), 4),
+                    "violations": len(result.violations),
+                }
+                if phase in phase_scores:
+                    phase_scores[phase][region][date] = cell_phases[phase]["score"]
+                violation_counts.update(set(result.violations))
+
+            overall_score = float(report.overall_score)
+            scores.append(overall_score)
+            matrix[region][date] = {
+                "overall_passed": bool(report.overall_passed),
+                "overall_score": round(overall_score, 4),
+                "phases": cell_phases,
+                "files_validated": report.metadata["files_validated"],
+                "blocking_issues": report.blocking_issues,
+                "critical_issues": report.critical_issues,
+            }
+
+        def mean(values):
+            values = [v for v in values if v is not None]
+            return round(float(np.mean(values)), 4) if values else None
+
+        cells = [
+            (region, date, cell)
+            for region, row in matrix.items()
+            for date, cell in row.items()
+            if cell is not None and "error" not in cell
+        ]
+
+        return {
+            "metadata": {
+                "generated_at": datetime.now().isoformat(),
+                "snapshot_loaded_at": snapshot.loaded_at,
+                "files_loaded": snapshot.files_loaded,
+                "load_errors": snapshot.load_errors,
+                "variance_threshold": self.variance_threshold,
+                "staleness_hours": self.staleness_hours,
+            },
+            "regions": regions,
+            "dates": dates,
+            "matrix": matrix,
+            "phase_scores": phase_scores,
+            "summary": {
+                "validated": len(cells),
+                "passed": sum(1 for _, _, cell in cells if cell["overall_passed"]),
+                "failed": sum(1 for _, _, cell in cells if not cell["overall_passed"]),
+                "errors": errors,
+                "mean_score": mean(scores),
+                "region_scores": {
+                    region: mean(
+                        cell["overall_score"] for r, _, cell in cells if r == region
+                    )
+                    for region in regions
+                },
+                "date_scores": {
+                    date: mean(
+                        cell["overall_score"] for _, d, cell in cells if d == date
+                    )
+                    for date in dates
+                },
+                "phase_pass_rates": {
+                    phase: mean(
+                        float(cell["phases"][phase]["passed"])
+                        for _, _, cell in cells
+                        if phase in cell["phases"]
+                    )
+                    for phase in phases
+                },
+                "common_violations": [
+                    {"violation": violation, "count": count}
+                    for violation, count in violation_counts.most_common(10)
+                ],
+            },
+        }
+
+    @staticmethod
+    def write_consistency_matrix(matrix: Dict[str, Any], output_path: str) -> Path:
+        """Write a consistency matrix as JSON"""
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(matrix, f, indent=2)
+        return path
+
     def _validate_discovery_phase(
         self, discovery_data: Dict[str, Any]
     ) -> ValidationResult:
@@ -520,9 +870,9 @@ class DASVCrossValidator:
 
         # Check required fields
         required_fields = ["current_phase", "transition_probabilities", "confidence"]
-        for field in required_fields:
-            if field not in cycle_data:
-                violations.append(f"Missing business cycle field: {field}")
+        for field_name in required_fields:
+            if field_name not in cycle_data:
+                violations.append(f"Missing business cycle field: {field_name}")
 
         # Validate current phase
         current_phase = cycle_data.get("current_phase")
@@ -807,7 +1157,9 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="DASV Cross-Validation Framework")
-    parser.add_argument("region_date", help="Region and date in format REGION_YYYYMMDD")
+    parser.add_argument(
+        "region_date", nargs="?", help="Region and date in format REGION_YYYYMMDD"
+    )
     parser.add_argument(
         "--variance-threshold",
         type=float,
@@ -822,14 +1174,52 @@ def main():
     )
     parser.add_argument("--output", help="Output file for validation report")
     parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Validate all regions and dates and write a consistency matrix",
+    )
+    parser.add_argument("--regions", nargs="+", help="Regions to include in a sweep")
+    parser.add_argument("--dates", nargs="+", help="Dates (YYYYMMDD) for a sweep")
+    parser.add_argument(
+        "--base-dir", help="Project root containing data/outputs (default: cwd)"
+    )
+    parser.add_argument("--workers", type=int, help="Worker threads for a sweep")
 
     args = parser.parse_args()
 
+    if not args.sweep and not args.region_date:
+        parser.error("region_date is required unless --sweep is given")
+
     # Create validator
     validator = DASVCrossValidator(
-        variance_threshold=args.variance_threshold, staleness_hours=args.staleness_hours
+        variance_threshold=args.variance_threshold,
+        staleness_hours=args.staleness_hours,
+        base_dir=args.base_dir,
     )
 
+    if args.sweep:
+        try:
+            matrix = validator.sweep(
+                regions=args.regions, dates=args.dates, max_workers=args.workers
+            )
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(2)
+
+        summary = matrix["summary"]
+        if args.output:
+            validator.write_consistency_matrix(matrix, args.output)
+            print(
+                f"Validated {summary['validated']} region/date pairs across "
+                f"{len(matrix['regions'])} regions: {summary['passed']} passed, "
+                f"{summary['failed']} failed, mean score {summary['mean_score']}"
+            )
+        else:
+            print(json.dumps(matrix, indent=2))
+
+        sys.exit(0 if summary["failed"] == 0 and not summary["errors"] else 1)
+
     try:
         # Run validation
         report = validator.validate_full_pipeline(args.region_date)
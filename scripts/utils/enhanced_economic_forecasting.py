@@ -3,22 +3,111 @@
 Enhanced Economic Forecasting Framework
 Multi-method forecasting with scenario analysis and probabilistic outcomes
 Part of Phase 2 optimization for macro analysis system
+
+Scenarios are simulated as seeded Monte Carlo paths: every run draws its
+base/bear/bull paths from one explicit random stream, so a recorded seed
+reproduces the forecast exactly.
 """
 
 import json
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+FORECAST_INDICATORS = (
+    "gdp_growth",
+    "unemployment_rate",
+    "inflation_rate",
+    "policy_rate",
+)
+
+# Percentiles reported in fan charts
+FAN_CHART_PERCENTILES = (5, 25, 50, 75, 95)
+
+DEFAULT_SIMULATION_PATHS = 2000
+
+
+@dataclass
+class ScenarioSimulation:
+    """Simulated quarterly paths per scenario (arrays of shape paths x quarters)"""
+
+    seed: int
+    n_paths: int
+    horizon: int
+    initial: Dict[str, float]
+    paths: Dict[str, Dict[str, np.ndarray]]  # scenario -> indicator -> paths
+
+    def central_path(self, scenario: str, indicator: str) -> List[float]:
+        """Median path of a scenario, rounded for reporting"""
+        return _rounded(np.median(self.paths[scenario][indicator], axis=0))
+
+    def fan_chart(
+        self,
+        scenario: str,
+        indicator: str,
+        percentiles: Sequence[int] = FAN_CHART_PERCENTILES,
+    ) -> Dict[str, List[float]]:
+        """Per-quarter percentiles of a single scenario"""
+        values = np.percentile(self.paths[scenario][indicator], percentiles, axis=0)
+        return {
+            f"p{percentile}": _rounded(row)
+            for percentile, row in zip(percentiles, values)
+        }
+
+
+def _rounded(values: np.ndarray) -> List[float]:
+    return [round(float(value), 2) for value in values]
+
+
+def _weighted_percentiles(
+    scenario_paths: List[np.ndarray],
+    weights: np.ndarray,
+    percentiles: Sequence[int],
+) -> Dict[int, np.ndarray]:
+    """
+    Per-quarter percentiles of a weighted mixture of scenario path arrays
+
+    Each path carries its scenario weight divided by the scenario's path
+    count, so scenarios contribute in proportion to their probability.
+    """
+    values = np.concatenate(scenario_paths, axis=0)
+    path_weights = np.concatenate(
+        [
+            np.full(len(paths), weight / len(paths))
+            for paths, weight in zip(scenario_paths, weights)
+        ]
+    )
+
+    order = np.argsort(values, axis=0)
+    sorted_values = np.take_along_axis(values, order, axis=0)
+    cumulative = np.cumsum(path_weights[order], axis=0)
+    cumulative /= cumulative[-1]
+
+    columns = np.arange(values.shape[1])
+    result = {}
+    for percentile in percentiles:
+        index = (cumulative >= percentile / 100.0).argmax(axis=0)
+        result[percentile] = sorted_values[index, columns]
+    return result
+
 
 class EconomicForecastingEngine:
     """Advanced economic forecasting with multi-method approaches and scenario analysis"""
 
-    def __init__(self, region: str = "US", forecast_horizon_quarters: int = 8):
+    def __init__(
+        self,
+        region: str = "US",
+        forecast_horizon_quarters: int = 8,
+        n_paths: int = DEFAULT_SIMULATION_PATHS,
+        seed: Optional[int] = None,
+    ):
         self.region = region
         self.forecast_horizon = forecast_horizon_quarters
+        self.n_paths = n_paths
+        self.seed = seed
         self.scenario_weights = {"base": 0.50, "bear": 0.25, "bull": 0.25}
 
         # Regional economic parameters
@@ -66,12 +155,15 @@ class EconomicForecastingEngine:
             discovery_data, analysis_data
         )
 
-        # Generate scenario-based forecasts
-        scenario_forecasts = self._generate_scenario_forecasts(current_indicators)
+        # Simulate scenario paths and summarise them into scenario forecasts
+        simulation = self.simulate_scenarios(current_indicators)
+        scenario_forecasts = self._generate_scenario_forecasts(
+            current_indicators, simulation
+        )
 
-        # Create probabilistic outcomes
+        # Create probabilistic outcomes from the simulated distribution
         probabilistic_outcomes = self._calculate_probabilistic_outcomes(
-            scenario_forecasts
+            scenario_forecasts, simulation
         )
 
         # Generate forward-looking indicators
@@ -92,6 +184,11 @@ class EconomicForecastingEngine:
                 "base_date": datetime.now().isoformat(),
                 "region": self.region,
                 "forecast_confidence": forecast_confidence,
+                "simulation": {
+                    "method": "vectorized_monte_carlo",
+                    "paths_per_scenario": simulation.n_paths,
+                    "random_seed": simulation.seed,
+                },
             },
             "scenario_based_forecasts": scenario_forecasts,
             "probabilistic_outcomes": probabilistic_outcomes,
@@ -173,24 +270,19 @@ class EconomicForecastingEngine:
         }
 
     def _generate_scenario_forecasts(
-        self, indicators: Dict[str, Any]
+        self, indicators: Dict[str, Any], simulation: ScenarioSimulation
     ) -> Dict[str, Any]:
-        """Generate base/bear/bull scenario forecasts"""
+        """Generate base/bear/bull scenario forecasts (median simulated paths)"""
 
-        current_gdp = indicators["gdp_growth"]
-        current_unemployment = indicators["unemployment_rate"]
-        current_inflation = indicators["inflation_rate"]
-        current_policy_rate = indicators["policy_rate"]
         recession_prob = indicators["recession_probability"]
 
-        # Base Case Scenario (most likely)
-        base_scenario = self._generate_base_scenario(indicators)
-
-        # Bear Case Scenario (economic stress)
-        bear_scenario = self._generate_bear_scenario(indicators, recession_prob)
-
-        # Bull Case Scenario (economic acceleration)
-        bull_scenario = self._generate_bull_scenario(indicators)
+        base_scenario, bear_scenario, bull_scenario = (
+            {
+                indicator: simulation.central_path(scenario, indicator)
+                for indicator in FORECAST_INDICATORS
+            }
+            for scenario in ("base", "bear", "bull")
+        )
 
         return {
             "base_case": {
@@ -228,277 +320,265 @@ class EconomicForecastingEngine:
             },
         }
 
+    def simulate_scenarios(
+        self, indicators: Dict[str, Any], seed: Optional[int] = None
+    ) -> ScenarioSimulation:
+        """
+        Simulate base/bear/bull scenario paths in one vectorized pass
+
+        Args:
+            indicators: Current indicators from _extract_current_indicators
+            seed: Seed for this run (defaults to the engine seed; a fresh
+                seed is drawn and recorded when both are None)
+
+        Returns:
+            ScenarioSimulation with (paths x quarters) arrays per scenario
+        """
+        if seed is None:
+            seed = self.seed
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+        rng = np.random.default_rng(seed)
+
+        return ScenarioSimulation(
+            seed=seed,
+            n_paths=self.n_paths,
+            horizon=self.forecast_horizon,
+            initial={name: float(indicators[name]) for name in FORECAST_INDICATORS},
+            paths={
+                "base": self._generate_base_scenario(indicators, rng),
+                "bear": self._generate_bear_scenario(
+                    indicators, indicators["recession_probability"], rng
+                ),
+                "bull": self._generate_bull_scenario(indicators, rng),
+            },
+        )
+
     def _generate_base_scenario(
-        self, indicators: Dict[str, Any]
-    ) -> Dict[str, List[float]]:
-        """Generate base case quarterly forecasts"""
+        self, indicators: Dict[str, Any], rng: np.random.Generator
+    ) -> Dict[str, np.ndarray]:
+        """Generate base case quarterly paths (one row per simulated path)"""
 
-        gdp_path = []
-        unemployment_path = []
-        inflation_path = []
-        policy_rate_path = []
+        n_paths = self.n_paths
+        horizon = self.forecast_horizon
 
         # Starting values
-        current_gdp = indicators["gdp_growth"]
-        current_unemployment = indicators["unemployment_rate"]
-        current_inflation = indicators["inflation_rate"]
-        current_policy_rate = indicators["policy_rate"]
+        current_gdp = np.full(n_paths, float(indicators["gdp_growth"]))
+        current_unemployment = np.full(n_paths, float(indicators["unemployment_rate"]))
+        current_inflation = np.full(n_paths, float(indicators["inflation_rate"]))
+        current_policy_rate = np.full(n_paths, float(indicators["policy_rate"]))
 
         # Trend targets
         trend_growth = self.regional_params["trend_growth"]
         natural_unemployment = self.regional_params["natural_unemployment"]
         inflation_target = self.regional_params["inflation_target"]
+        neutral_rate = inflation_target + 1.0  # Approximate neutral rate
 
-        for quarter in range(self.forecast_horizon):
-            # GDP: gradual convergence to trend with some volatility
-            gdp_target = trend_growth
-            gdp_adjustment = (
-                gdp_target - current_gdp
-            ) * 0.15  # 15% quarterly adjustment
-            current_gdp += gdp_adjustment + np.random.normal(0, 0.2)
-            gdp_path.append(round(current_gdp, 2))
-
-            # Unemployment: Phillips curve relationship with some lag
-            unemployment_target = natural_unemployment
-            unemployment_adjustment = (unemployment_target - current_unemployment) * 0.1
-            # GDP impact on unemployment (Okun's law approximation)
-            gdp_impact = -(current_gdp - trend_growth) * 0.3
+        # Quarterly shocks for GDP, unemployment and inflation, drawn up front
+        shocks = rng.standard_normal((3, horizon, n_paths)) * np.array(
+            [0.2, 0.1, 0.15]
+        ).reshape(3, 1, 1)
+
+        paths = {name: np.empty((n_paths, horizon)) for name in FORECAST_INDICATORS}
+
+        for quarter in range(horizon):
+            # GDP: gradual convergence to trend (15% quarterly adjustment)
+            current_gdp += (trend_growth - current_gdp) * 0.15 + shocks[0, quarter]
+            paths["gdp_growth"][:, quarter] = current_gdp
+
+            # Unemployment: convergence to natural rate plus Okun's law impact
             current_unemployment += (
-                unemployment_adjustment + gdp_impact + np.random.normal(0, 0.1)
+                (natural_unemployment - current_unemployment) * 0.1
+                - (current_gdp - trend_growth) * 0.3
+                + shocks[1, quarter]
             )
-            current_unemployment = max(
-                2.5, min(8.5, current_unemployment)
-            )  # Dynamic bounds
-            unemployment_path.append(round(current_unemployment, 2))
+            np.clip(current_unemployment, 2.5, 8.5, out=current_unemployment)
+            paths["unemployment_rate"][:, quarter] = current_unemployment
 
             # Inflation: gradual convergence to target with some persistence
-            inflation_adjustment = (inflation_target - current_inflation) * 0.12
-            current_inflation += inflation_adjustment + np.random.normal(0, 0.15)
-            inflation_path.append(round(current_inflation, 2))
+            current_inflation += (inflation_target - current_inflation) * 0.12 + shocks[
+                2, quarter
+            ]
+            paths["inflation_rate"][:, quarter] = current_inflation
 
-            # Policy rate: Taylor rule approximation
-            neutral_rate = inflation_target + 1.0  # Approximate neutral rate
+            # Policy rate: gradual adjustment toward a Taylor rule rate
             inflation_gap = current_inflation - inflation_target
             output_gap = (current_gdp - trend_growth) / trend_growth
             taylor_rate = neutral_rate + 1.5 * inflation_gap + 0.5 * output_gap
+            current_policy_rate += (taylor_rate - current_policy_rate) * 0.2
+            np.clip(current_policy_rate, 0.0, 8.0, out=current_policy_rate)
+            paths["policy_rate"][:, quarter] = current_policy_rate
 
-            rate_adjustment = (
-                taylor_rate - current_policy_rate
-            ) * 0.2  # Gradual adjustment
-            current_policy_rate += rate_adjustment
-            current_policy_rate = max(0.0, min(8.0, current_policy_rate))  # Bounds
-            policy_rate_path.append(round(current_policy_rate, 2))
-
-        return {
-            "gdp_growth": gdp_path,
-            "unemployment_rate": unemployment_path,
-            "inflation_rate": inflation_path,
-            "policy_rate": policy_rate_path,
-        }
+        return paths
 
     def _generate_bear_scenario(
-        self, indicators: Dict[str, Any], recession_prob: float
-    ) -> Dict[str, List[float]]:
-        """Generate bear case with recession scenario"""
-
-        # Start with base scenario structure but apply stress
-        base_forecasts = self._generate_base_scenario(indicators)
-
-        # Apply recession stress in first 4 quarters if recession probability > 25%
-        recession_intensity = min(recession_prob * 2.0, 1.0)  # Scale recession impact
-
-        gdp_path = []
-        unemployment_path = []
-        inflation_path = []
-        policy_rate_path = []
-
-        for quarter, (gdp, unemployment, inflation, policy_rate) in enumerate(
-            zip(
-                base_forecasts["gdp_growth"],
-                base_forecasts["unemployment_rate"],
-                base_forecasts["inflation_rate"],
-                base_forecasts["policy_rate"],
-            )
-        ):
-            # Apply recession stress in first half of forecast
-            if quarter < 4:
-                stress_factor = recession_intensity * (
-                    1 - quarter / 4.0
-                )  # Declining stress
-
-                # GDP stress: significant contraction
-                gdp_stress = gdp - stress_factor * (
-                    3.0 + gdp
-                )  # Deeper contraction for higher growth
-                gdp_path.append(round(gdp_stress, 2))
-
-                # Unemployment stress: significant rise
-                unemployment_stress = (
-                    unemployment + stress_factor * 3.0
-                )  # Up to 3pp increase
-                unemployment_path.append(round(min(unemployment_stress, 10.0), 2))
-
-                # Inflation stress: disinflationary pressure
-                inflation_stress = inflation - stress_factor * 1.5  # Disinflation
-                inflation_path.append(round(max(inflation_stress, -1.0), 2))
-
-                # Policy rate stress: aggressive accommodation
-                policy_stress = policy_rate - stress_factor * (
-                    policy_rate - 0.25
-                )  # Toward zero
-                policy_rate_path.append(round(max(policy_stress, 0.0), 2))
-
-            else:
-                # Recovery phase: gradual improvement
-                recovery_factor = (
-                    (quarter - 4) / 4.0 * self.regional_params["recovery_speed"]
-                )
-
-                gdp_recovery = gdp + recovery_factor * 1.0  # Gradual recovery
-                gdp_path.append(round(gdp_recovery, 2))
-
-                unemployment_recovery = (
-                    unemployment - recovery_factor * 0.5
-                )  # Slow employment recovery
-                unemployment_path.append(
-                    round(
-                        max(
-                            unemployment_recovery,
-                            indicators["natural_unemployment"] - 1.0,
-                        ),
-                        2,
-                    )
-                )
+        self,
+        indicators: Dict[str, Any],
+        recession_prob: float,
+        rng: np.random.Generator,
+    ) -> Dict[str, np.ndarray]:
+        """Generate bear case paths with recession stress"""
+
+        # Start with base scenario paths and apply stress
+        base = self._generate_base_scenario(indicators, rng)
+        quarters = np.arange(self.forecast_horizon)
+
+        # Recession stress declines over the first 4 quarters, then recovery
+        recession_intensity = min(recession_prob * 2.0, 1.0)
+        stressed = quarters < 4
+        stress = np.where(stressed, recession_intensity * (1 - quarters / 4.0), 0.0)
+        recovery = np.where(
+            stressed, 0.0, (quarters - 4) / 4.0 * self.regional_params["recovery_speed"]
+        )
 
-                inflation_path.append(round(inflation, 2))  # Base inflation
-                policy_rate_path.append(round(policy_rate, 2))  # Base policy
+        gdp = base["gdp_growth"]
+        unemployment = base["unemployment_rate"]
+        inflation = base["inflation_rate"]
+        policy_rate = base["policy_rate"]
 
         return {
-            "gdp_growth": gdp_path,
-            "unemployment_rate": unemployment_path,
-            "inflation_rate": inflation_path,
-            "policy_rate": policy_rate_path,
+            # Deeper contraction for higher growth, then gradual recovery
+            "gdp_growth": np.where(
+                stressed, gdp - stress * (3.0 + gdp), gdp + recovery * 1.0
+            ),
+            # Up to 3pp increase, then slow employment recovery
+            "unemployment_rate": np.where(
+                stressed,
+                np.minimum(unemployment + stress * 3.0, 10.0),
+                np.maximum(
+                    unemployment - recovery * 0.5,
+                    indicators["natural_unemployment"] - 1.0,
+                ),
+            ),
+            # Disinflation under stress
+            "inflation_rate": np.where(
+                stressed, np.maximum(inflation - stress * 1.5, -1.0), inflation
+            ),
+            # Aggressive accommodation toward zero
+            "policy_rate": np.where(
+                stressed,
+                np.maximum(policy_rate - stress * (policy_rate - 0.25), 0.0),
+                policy_rate,
+            ),
         }
 
     def _generate_bull_scenario(
-        self, indicators: Dict[str, Any]
-    ) -> Dict[str, List[float]]:
-        """Generate bull case with accelerated growth"""
-
-        # Start with base scenario and apply positive shocks
-        base_forecasts = self._generate_base_scenario(indicators)
-
-        gdp_path = []
-        unemployment_path = []
-        inflation_path = []
-        policy_rate_path = []
-
-        for quarter, (gdp, unemployment, inflation, policy_rate) in enumerate(
-            zip(
-                base_forecasts["gdp_growth"],
-                base_forecasts["unemployment_rate"],
-                base_forecasts["inflation_rate"],
-                base_forecasts["policy_rate"],
-            )
-        ):
-            # Apply positive productivity shock
-            productivity_boost = 0.8 * (
-                1 - quarter / self.forecast_horizon
-            )  # Declining boost
-
-            # GDP boost: above-trend growth
-            gdp_boost = gdp + productivity_boost
-            gdp_path.append(round(min(gdp_boost, 5.0), 2))  # Cap at 5%
-
-            # Unemployment: faster decline to natural rate
-            unemployment_boost = unemployment - productivity_boost * 0.3
-            natural_unemployment = self.regional_params["natural_unemployment"]
-            unemployment_path.append(
-                round(max(unemployment_boost, natural_unemployment - 1.5), 2)
-            )  # Dynamic floor
-
-            # Inflation: modest increase but contained
-            inflation_boost = (
-                inflation + productivity_boost * 0.2
-            )  # Limited passthrough
-            inflation_path.append(round(min(inflation_boost, 4.0), 2))  # Cap at 4%
-
-            # Policy rate: more gradual tightening
-            policy_boost = policy_rate + productivity_boost * 0.1  # Slower tightening
-            policy_rate_path.append(round(min(policy_boost, 6.0), 2))  # Cap at 6%
+        self, indicators: Dict[str, Any], rng: np.random.Generator
+    ) -> Dict[str, np.ndarray]:
+        """Generate bull case paths with accelerated growth"""
+
+        # Start with base scenario paths and apply a declining productivity boost
+        base = self._generate_base_scenario(indicators, rng)
+        boost = 0.8 * (1 - np.arange(self.forecast_horizon) / self.forecast_horizon)
+        natural_unemployment = self.regional_params["natural_unemployment"]
 
         return {
-            "gdp_growth": gdp_path,
-            "unemployment_rate": unemployment_path,
-            "inflation_rate": inflation_path,
-            "policy_rate": policy_rate_path,
+            "gdp_growth": np.minimum(base["gdp_growth"] + boost, 5.0),  # Cap at 5%
+            "unemployment_rate": np.maximum(
+                base["unemployment_rate"] - boost * 0.3, natural_unemployment - 1.5
+            ),
+            # Limited passthrough, capped at 4%
+            "inflation_rate": np.minimum(base["inflation_rate"] + boost * 0.2, 4.0),
+            # Slower tightening, capped at 6%
+            "policy_rate": np.minimum(base["policy_rate"] + boost * 0.1, 6.0),
         }
 
     def _calculate_probabilistic_outcomes(
-        self, scenario_forecasts: Dict[str, Any]
+        self, scenario_forecasts: Dict[str, Any], simulation: ScenarioSimulation
     ) -> Dict[str, Any]:
-        """Calculate probability-weighted outcomes and confidence intervals"""
+        """Calculate probability-weighted outcomes from the simulated distribution"""
 
-        indicators = [
-            "gdp_growth",
-            "unemployment_rate",
-            "inflation_rate",
-            "policy_rate",
-        ]
+        scenarios = ("base", "bear", "bull")
+        weights = np.array([self.scenario_weights[name] for name in scenarios])
+        weights = weights / weights.sum()
         probabilistic_outcomes = {}
 
-        for indicator in indicators:
-            # Extract forecast paths
-            base_path = scenario_forecasts["base_case"]["forecasts"][indicator]
-            bear_path = scenario_forecasts["bear_case"]["forecasts"][indicator]
-            bull_path = scenario_forecasts["bull_case"]["forecasts"][indicator]
-
-            # Calculate probability-weighted path
-            weighted_path = []
-            confidence_intervals = []
-
-            for quarter in range(self.forecast_horizon):
-                base_val = base_path[quarter]
-                bear_val = bear_path[quarter]
-                bull_val = bull_path[quarter]
-
-                # Probability-weighted expected value
-                expected_val = (
-                    self.scenario_weights["base"] * base_val
-                    + self.scenario_weights["bear"] * bear_val
-                    + self.scenario_weights["bull"] * bull_val
-                )
-                weighted_path.append(round(expected_val, 2))
-
-                # Confidence intervals (10th and 90th percentiles)
-                values = [base_val, bear_val, bull_val]
-                weights = [
-                    self.scenario_weights["base"],
-                    self.scenario_weights["bear"],
-                    self.scenario_weights["bull"],
-                ]
-
-                # Simple confidence interval approximation
-                lower_bound = min(values)
-                upper_bound = max(values)
-                confidence_intervals.append(
-                    {
-                        "lower_10th": round(lower_bound, 2),
-                        "upper_90th": round(upper_bound, 2),
-                        "range_width": round(upper_bound - lower_bound, 2),
-                    }
-                )
+        for indicator in FORECAST_INDICATORS:
+            scenario_paths = [simulation.paths[name][indicator] for name in scenarios]
+
+            # Probability-weighted mixture across scenarios
+            expected_path = sum(
+                weight * paths.mean(axis=0)
+                for weight, paths in zip(weights, scenario_paths)
+            )
+            fan = _weighted_percentiles(
+                scenario_paths, weights, FAN_CHART_PERCENTILES + (10, 90)
+            )
+            lower, upper = fan.pop(10), fan.pop(90)
 
             probabilistic_outcomes[indicator] = {
-                "expected_path": weighted_path,
-                "confidence_intervals": confidence_intervals,
+                "expected_path": _rounded(expected_path),
+                "confidence_intervals": [
+                    {
+                        "lower_10th": round(float(low), 2),
+                        "upper_90th": round(float(high), 2),
+                        "range_width": round(float(high - low), 2),
+                    }
+                    for low, high in zip(lower, upper)
+                ],
+                "fan_chart": {
+                    f"p{percentile}": _rounded(values)
+                    for percentile, values in fan.items()
+                },
+                "outcome_probabilities": self._calculate_outcome_probabilities(
+                    indicator, scenario_paths, weights, simulation.initial[indicator]
+                ),
                 "scenario_dispersion": self._calculate_scenario_dispersion(
-                    base_path, bear_path, bull_path
+                    scenario_forecasts["base_case"]["forecasts"][indicator],
+                    scenario_forecasts["bear_case"]["forecasts"][indicator],
+                    scenario_forecasts["bull_case"]["forecasts"][indicator],
                 ),
             }
 
         return probabilistic_outcomes
 
+    def _calculate_outcome_probabilities(
+        self,
+        indicator: str,
+        scenario_paths: List[np.ndarray],
+        weights: np.ndarray,
+        current_value: float,
+    ) -> Dict[str, float]:
+        """Probabilities of key outcomes under the simulated scenario mixture"""
+
+        def probability(event) -> float:
+            return round(
+                float(
+                    sum(
+                        weight * np.mean(event(paths))
+                        for weight, paths in zip(weights, scenario_paths)
+                    )
+                ),
+                3,
+            )
+
+        outcomes = {
+            "higher_at_horizon": probability(
+                lambda paths: paths[:, -1] > current_value
+            ),
+            "lower_at_horizon": probability(lambda paths: paths[:, -1] < current_value),
+        }
+
+        if indicator == "gdp_growth":
+            outcomes["negative_growth_any_quarter"] = probability(
+                lambda paths: (paths < 0).any(axis=1)
+            )
+            outcomes["two_consecutive_negative_quarters"] = probability(
+                lambda paths: ((paths[:, 1:] < 0) & (paths[:, :-1] < 0)).any(axis=1)
+            )
+        elif indicator == "unemployment_rate":
+            threshold = self.regional_params["natural_unemployment"] + 1.0
+            outcomes["above_natural_rate_plus_1pp_any_quarter"] = probability(
+                lambda paths: (paths > threshold).any(axis=1)
+            )
+        elif indicator == "inflation_rate":
+            target = self.regional_params["inflation_target"]
+            outcomes["within_target_band_at_horizon"] = probability(
+                lambda paths: np.abs(paths[:, -1] - target) <= 0.5
+            )
+
+        return outcomes
+
     def _calculate_scenario_dispersion(
         self, base_path: List[float], bear_path: List[float], bull_path: List[float]
     ) -> Dict[str, float]:
@@ -738,19 +738,17 @@ class JSONSchemaGenerator:
             Tuple of (is_valid, error_messages)
         """
         try:
-            import jsonschema
+            from .schema_registry import get_schema_registry
 
             schema = self.get_schema(chart_type)
             if not schema:
                 return False, [f"Schema not found for chart type: {chart_type}"]
 
-            jsonschema.validate(instance=config, schema=schema)
-            return True, []
+            # Compiled once per schema and reused across calls
+            return get_schema_registry().validate(config, schema)
 
         except ImportError:
             return False, ["jsonschema library not available for validation"]
-        except jsonschema.exceptions.ValidationError as e:
-            return False, [str(e)]
         except Exception as e:
             return False, [f"Validation error: {str(e)}"]
 
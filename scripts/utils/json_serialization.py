@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization
+
+Shared serialization layer for analysis outputs. Handles numpy scalars and
+arrays, pandas objects, datetimes, dataclasses and objects exposing
+``to_dict()`` in a single pass:
+
+- dumps()/dumpb() and write_json() encode natively with orjson when it is
+  installed (numpy arrays and scalars never pass through Python), falling
+  back to the standard library encoder with the same type hooks
+- Compact artifacts: write_json(..., compact=True) drops indentation and a
+  ``.gz`` suffix gzip-compresses the payload; read_json() reads both
+- JSONStreamWriter writes large arrays/objects element by element without
+  materialising the whole document
+- to_serializable() converts a structure to native Python types for callers
+  that keep the result in memory
+
+Both encoders write non-finite floats (NaN, Infinity) as null and
+stringify non-native mapping keys (datetimes as ISO 8601), so output does not
+depend on whether orjson is installed.
+"""
+
+import dataclasses
+import gzip
+import json
+import math
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Optional, Tuple, Union, cast
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+PathLike = Union[str, Path]
+
+_NATIVE_TYPES = (str, int, float, bool, type(None))
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_key(key: Any) -> Any:
+    """Mapping key accepted by both encoders (str, int, float, bool or None)"""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, (datetime, date, time)):
+        return key.isoformat()
+    if isinstance(key, np.generic):
+        key = key.item()
+    if isinstance(key, _NATIVE_TYPES):
+        return key
+    return str(key)
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Fallback hook for types the JSON encoder does not handle natively
+
+    Usable as ``default=`` for both ``json.dump`` and ``orjson.dumps``.
+
+    Raises:
+        TypeError: If the object has no JSON representation
+    """
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict("records")
+    if isinstance(obj, pd.Series):
+        return {_json_key(key): value for key, value in obj.items()}
+    if isinstance(obj, (datetime, date, time, pd.Timestamp)):
+        return obj.isoformat()
+    if isinstance(obj, pd.Timedelta):
+        return obj.total_seconds()
+    if hasattr(obj, "to_dict") and callable(obj.to_dict):
+        return obj.to_dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _default_with(fallback: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """json_default, handing unsupported objects to ``fallback`` (e.g. str)"""
+    if fallback is None:
+        return json_default
+
+    def default(obj):
+        try:
+            return json_default(obj)
+        except TypeError:
+            return fallback(obj)
+
+    return default
+
+
+class NumpyJSONEncoder(json.JSONEncoder):
+    """Standard library encoder using json_default for non-native types"""
+
+    def default(self, obj):
+        try:
+            return json_default(obj)
+        except TypeError:
+            return super().default(obj)
+
+
+def _convert(obj: Any, fallback: Optional[Callable[[Any], Any]], finite: bool) -> Any:
+    if isinstance(obj, float) and finite and not math.isfinite(obj):
+        return None
+    if isinstance(obj, _NATIVE_TYPES):
+        return obj
+    if isinstance(obj, dict):
+        return {
+            _json_key(key): _convert(value, fallback, finite)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_convert(item, fallback, finite) for item in obj]
+    try:
+        converted = json_default(obj)
+    except TypeError:
+        if fallback is None:
+            raise
+        return fallback(obj)
+    return _convert(converted, fallback, finite)
+
+
+def to_serializable(obj: Any, fallback: Optional[Callable[[Any], Any]] = None) -> Any:
+    """
+    Convert a structure to native, JSON-serializable Python types
+
+    Walks dicts, lists and tuples once; every other non-native value is
+    converted with json_default (and the result walked in turn). Mapping keys
+    are normalised the same way the encoders write them.
+
+    Args:
+        obj: Structure to convert
+        fallback: Conversion for objects json_default rejects, e.g.
+            ``lambda value: value`` to pass them through (raise otherwise)
+    """
+    return _convert(obj, fallback, finite=False)
+
+
+def dumpb(
+    obj: Any,
+    indent: bool = False,
+    sort_keys: bool = False,
+    fallback: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize to UTF-8 encoded JSON bytes
+
+    Args:
+        obj: Object to serialize
+        indent: Indent with two spaces (compact separators otherwise)
+        sort_keys: Sort object keys
+        fallback: Conversion for objects json_default rejects (raise otherwise)
+    """
+    if ORJSON_AVAILABLE:
+        option = _ORJSON_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_default_with(fallback), option=option)
+        except TypeError:
+            # Non-native mapping keys (e.g. datetimes): normalise and retry
+            return orjson.dumps(_convert(obj, fallback, finite=True), option=option)
+
+    return dumps(obj, indent=indent, sort_keys=sort_keys, fallback=fallback).encode(
+        "utf-8"
+    )
+
+
+def dumps(
+    obj: Any,
+    indent: bool = True,
+    sort_keys: bool = False,
+    fallback: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Serialize to a JSON string (two-space indentation by default)
+
+    Args:
+        obj: Object to serialize
+        indent: Indent with two spaces (compact separators otherwise)
+        sort_keys: Sort object keys
+        fallback: Conversion for objects json_default rejects (raise otherwise)
+    """
+    if ORJSON_AVAILABLE:
+        return dumpb(obj, indent=indent, sort_keys=sort_keys, fallback=fallback).decode(
+            "utf-8"
+        )
+
+    def encode(value: Any, default: Optional[Callable[[Any], Any]]) -> str:
+        return json.dumps(
+            value,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+            ensure_ascii=False,
+            sort_keys=sort_keys,
+            allow_nan=False,
+            default=default,
+        )
+
+    try:
+        return encode(obj, _default_with(fallback))
+    except (TypeError, ValueError):
+        # Non-finite floats or non-native mapping keys: normalise and retry
+        return encode(_convert(obj, fallback, finite=True), None)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from a string or bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_compressed(path: Path) -> bool:
+    return path.suffix == ".gz"
+
+
+def write_json(
+    obj: Any,
+    path: PathLike,
+    compact: bool = False,
+    sort_keys: bool = False,
+    fallback: Optional[Callable[[Any], Any]] = None,
+) -> Path:
+    """
+    Write an object as JSON, atomically
+
+    Args:
+        obj: Object to serialize
+        path: Output path; a ``.gz`` suffix gzip-compresses the payload
+        compact: Drop indentation (intermediate artifacts)
+        sort_keys: Sort object keys
+        fallback: Conversion for objects json_default rejects (raise otherwise)
+
+    Returns:
+        Path written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = dumpb(obj, indent=not compact, sort_keys=sort_keys, fallback=fallback)
+    if _is_compressed(path):
+        payload = gzip.compress(payload, compresslevel=6)
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    tmp_path.replace(path)
+    return path
+
+
+def read_json(path: PathLike) -> Any:
+    """Read a JSON document written by write_json (plain or ``.gz``)"""
+    path = Path(path)
+    data = path.read_bytes()
+    if _is_compressed(path):
+        data = gzip.decompress(data)
+    return loads(data)
+
+
+class JSONStreamWriter:
+    """
+    Incremental writer for large JSON arrays or objects
+
+    Elements are serialized and written one at a time, one per line, so the
+    full payload never has to be held in memory::
+
+        with JSONStreamWriter(path) as writer:
+            for record in records:
+                writer.write(record)
+
+        with JSONStreamWriter(path, container="object") as writer:
+            writer.write_field("metadata", metadata)
+            writer.write_field("observations", observations)
+
+    A ``.gz`` suffix gzip-compresses the stream.
+    """
+
+    _BRACKETS = {"array": (b"[", b"]"), "object": (b"{", b"}")}
+
+    def __init__(self, path: PathLike, container: str = "array"):
+        if container not in self._BRACKETS:
+            raise ValueError(f"container must be 'array' or 'object': {container}")
+        self.path = Path(path)
+        self.container = container
+        self.count = 0
+        self._file: Optional[BinaryIO] = None
+
+    def __enter__(self) -> "JSONStreamWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def open(self) -> "JSONStreamWriter":
+        """Open the output file and write the opening bracket"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if _is_compressed(self.path):
+            self._file = cast(BinaryIO, gzip.open(self.path, "wb", compresslevel=6))
+        else:
+            self._file = open(self.path, "wb")
+        self._file.write(self._BRACKETS[self.container][0])
+        return self
+
+    def _write_raw(self, chunk: bytes) -> None:
+        if self._file is None:
+            raise ValueError("JSONStreamWriter is not open")
+        self._file.write(b",\n" if self.count else b"\n")
+        self._file.write(chunk)
+        self.count += 1
+
+    def write(self, item: Any) -> None:
+        """Append an element to an array stream"""
+        if self.container != "array":
+            raise ValueError("write() requires an array stream; use write_field()")
+        self._write_raw(dumpb(item))
+
+    def write_many(self, items: Iterable[Any]) -> int:
+        """Append every element of an iterable; returns the number written"""
+        start = self.count
+        for item in items:
+            self.write(item)
+        return self.count - start
+
+    def write_field(self, key: str, value: Any) -> None:
+        """Append a key/value pair to an object stream"""
+        if self.container != "object":
+            raise ValueError("write_field() requires an object stream; use write()")
+        self._write_raw(dumpb(str(key)) + b": " + dumpb(value))
+
+    def write_fields(self, items: Iterable[Tuple[str, Any]]) -> int:
+        """Append every key/value pair; returns the number written"""
+        start = self.count
+        for key, value in items:
+            self.write_field(key, value)
+        return self.count - start
+
+    def close(self) -> None:
+        """Write the closing bracket and close the file"""
+        if self._file is None:
+            return
+        if self.count:
+            self._file.write(b"\n")
+        self._file.write(self._BRACKETS[self.container][1] + b"\n")
+        self._file.close()
+        self._file = None
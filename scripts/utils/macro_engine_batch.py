@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+Macro Engine Batch Runner - Cross-Region Execution of the Analytical Engines
+
+Runs the macro analytical engines against every region's discovery payload in
+one batch instead of one analyzer per region:
+- Each engine's parameter tables are built once (per worker process) and
+  shared by lightweight per-region copies
+- Regions are analyzed in a process pool, falling back to threads when
+  processes are unavailable; each region's payload is loaded by its worker
+- Results are merged into one result set keyed by region and engine
+- Per-engine, per-region timings (plus totals and the slowest runs) make slow
+  engines visible
+- Cross-currency correlation, carry and PPP deviation matrices are computed
+  once per batch (cached per analysis date and inputs) and passed to every
+  engine in its context as "currency_matrices"; the market regime engine
+  reports the currency correlation regime from them
+
+Usage:
+    cd scripts && python -m utils.macro_engine_batch --regions US EUROPE ASIA
+"""
+
+import copy
+import json
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .economic_calendar_framework import EconomicCalendarEngine
+from .geopolitical_risk_framework import GeopoliticalRiskEngine
+from .json_serialization import write_json
+from .market_regime_framework import MarketRegimeEngine
+from .policy_transmission_framework import PolicyTransmissionEngine
+from .sector_correlation_framework import SectorCorrelationEngine
+from .vix_volatility_analyzer import VIXVolatilityAnalyzer
+
+# Add scripts directory to path for regional intelligence imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from regional_intelligence.currency_analyzer import CurrencyAnalyzer, CurrencyMatrices
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+Payload = Union[PathLike, Dict[str, Any]]
+
+DEFAULT_DISCOVERY_DIR = (
+    Path(__file__).parent.parent.parent
+    / "data"
+    / "outputs"
+    / "macro_analysis"
+    / "discovery"
+)
+
+DISCOVERY_FILE_PATTERN = re.compile(r"^([A-Za-z]+)_(\d{8})_discovery\.json$")
+
+SLOWEST_RUNS_REPORTED = 5
+
+# Region -> currency of the policy rate its discovery payload reports
+REGION_CURRENCIES = {"US": "USD", "EUROPE": "EUR"}
+
+
+def currency_inputs(
+    discovery_data: Dict[str, Any], region: str
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Spot rates (USD per unit) and policy rates from a discovery payload
+
+    Returns:
+        (spot rates from the USD major pairs, policy rate of the region's
+        currency)
+    """
+    pairs = (
+        discovery_data.get("global_economic_context", {})
+        .get("currency_dynamics", {})
+        .get("major_pairs", {})
+    )
+    spot_rates = {}
+    for name, value in pairs.items() if isinstance(pairs, dict) else ():
+        if isinstance(value, dict):
+            value = value.get("level", value.get("current_level", value.get("current")))
+        if not isinstance(value, (int, float)) or value <= 0:
+            continue
+        base, _, quote = name.upper().partition("_")
+        if quote == "USD":
+            spot_rates[base] = float(value)
+        elif base == "USD":
+            spot_rates[quote] = 1.0 / value
+
+    policy_rates = {}
+    policy_rate = (
+        discovery_data.get("monetary_policy_context", {})
+        .get("policy_stance", {})
+        .get("policy_rate")
+    )
+    if region in REGION_CURRENCIES and isinstance(policy_rate, (int, float)):
+        policy_rates[REGION_CURRENCIES[region]] = float(policy_rate)
+    return spot_rates, policy_rates
+
+
+def _vix_input(discovery_data: Dict[str, Any]) -> Dict[str, Any]:
+    """VIX observations from a discovery payload (latest composite level if
+    no series was collected)"""
+    for key in ("vix_data", "volatility_data"):
+        data = discovery_data.get(key)
+        if isinstance(data, dict) and "observations" in data:
+            return data
+
+    composite = (
+        discovery_data.get("cli_market_intelligence", {})
+        .get("volatility_analysis", {})
+        .get("global_volatility_composite", {})
+    )
+    level = composite.get("current_level") if isinstance(composite, dict) else None
+    return {"observations": [{"value": level}] if level is not None else []}
+
+
+# Engine name -> (engine class, call against a discovery payload and context)
+ENGINE_REGISTRY: Dict[str, tuple] = {
+    "market_regime": (
+        MarketRegimeEngine,
+        lambda engine, discovery, context: (
+            engine.analyze_market_regimes_and_volatility_environment(discovery, context)
+        ),
+    ),
+    "geopolitical_risk": (
+        GeopoliticalRiskEngine,
+        lambda engine, discovery, context: engine.analyze_geopolitical_risks(
+            discovery, context
+        ),
+    ),
+    "policy_transmission": (
+        PolicyTransmissionEngine,
+        lambda engine, discovery, context: (
+            engine.analyze_policy_transmission_channels(discovery, context)
+        ),
+    ),
+    "economic_calendar": (
+        EconomicCalendarEngine,
+        lambda engine, discovery, context: (
+            engine.generate_forward_economic_calendar(discovery, context, 12)
+        ),
+    ),
+    "vix_volatility": (
+        VIXVolatilityAnalyzer,
+        lambda engine, discovery, context: engine.analyze_volatility_environment(
+            _vix_input(discovery)
+        ),
+    ),
+    "sector_correlation": (
+        SectorCorrelationEngine,
+        lambda engine, discovery, context: (
+            engine.analyze_sector_correlations_and_sensitivities(discovery, context)
+        ),
+    ),
+}
+
+MACRO_ENGINES = tuple(ENGINE_REGISTRY)
+
+
+def latest_discovery_files(
+    directory: PathLike = DEFAULT_DISCOVERY_DIR,
+    regions: Optional[Sequence[str]] = None,
+    date: Optional[str] = None,
+) -> Dict[str, Path]:
+    """
+    Find the latest discovery file per region
+
+    Args:
+        directory: Directory of {REGION}_{YYYYMMDD}_discovery.json files
+        regions: Regions to include (default: every region found)
+        date: Only use files for this date (YYYYMMDD)
+
+    Returns:
+        Region (upper case) -> discovery file path
+    """
+    wanted = {region.upper() for region in regions} if regions else None
+    latest: Dict[str, tuple] = {}
+    for path in sorted(Path(directory).glob("*_discovery.json")):
+        match = DISCOVERY_FILE_PATTERN.match(path.name)
+        if not match:
+            continue
+        region, file_date = match.group(1).upper(), match.group(2)
+        if (wanted and region not in wanted) or (date and file_date != date):
+            continue
+        if region not in latest or file_date > latest[region][0]:
+            latest[region] = (file_date, path)
+    return {region: latest[region][1] for region in sorted(latest)}
+
+
+class MacroEngineBatchRunner:
+    """Run the macro engines against many regions' discovery payloads"""
+
+    def __init__(
+        self,
+        engines: Optional[Sequence[str]] = None,
+        analysis_date: Optional[str] = None,
+        seed: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+    ):
+        """
+        Args:
+            engines: Engine names to run (default: all of MACRO_ENGINES)
+            analysis_date: Analysis date passed to the engines (default: today)
+            seed: Seed for MarketRegimeEngine noise (same seed for every region)
+            max_workers: Worker count (defaults to CPU count)
+            use_processes: Analyze regions in worker processes (each builds
+                the engine parameter tables once); threads are used otherwise
+                or as a fallback
+        """
+        self.engines = tuple(engines) if engines else MACRO_ENGINES
+        unknown = [name for name in self.engines if name not in ENGINE_REGISTRY]
+        if unknown:
+            raise ValueError(
+                f"Unknown engines {unknown}; expected any of {list(MACRO_ENGINES)}"
+            )
+        self.analysis_date = analysis_date or datetime.now().strftime("%Y-%m-%d")
+        self.seed = seed
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+
+        # Parameter tables are built here once and shared by every region
+        self._prototypes = {name: ENGINE_REGISTRY[name][0]() for name in self.engines}
+
+        self.currency_analyzer = CurrencyAnalyzer()
+        self.currency_matrices: Optional[Dict[str, Any]] = None
+
+    def engine_for_region(self, name: str, region: str) -> Any:
+        """Per-region engine sharing the prototype's parameter tables"""
+        engine = copy.copy(self._prototypes[name])
+        if hasattr(engine, "region"):
+            engine.region = region.upper()
+        if isinstance(engine, MarketRegimeEngine):
+            engine.seed = self.seed
+            engine.last_seed = self.seed
+        return engine
+
+    def run_region(self, region: str, payload: Payload) -> Dict[str, Any]:
+        """
+        Run every engine against one region's discovery payload
+
+        Returns:
+            Per-engine results, timings and errors for the region
+        """
+        region = region.upper()
+        outcome: Dict[str, Any] = {
+            "region": region,
+            "results": {},
+            "timings": {},
+            "errors": {},
+            "worker_pid": os.getpid(),
+        }
+
+        try:
+            discovery_data = _load_payload(payload)
+        except Exception as e:
+            outcome["errors"]["payload"] = f"{type(e).__name__}: {e}"
+            return outcome
+
+        context: Dict[str, Any] = {
+            "region": region,
+            "analysis_date": self.analysis_date,
+        }
+        if self.currency_matrices is not None:
+            context["currency_matrices"] = self.currency_matrices
+        for name in self.engines:
+            run = ENGINE_REGISTRY[name][1]
+            start = time.perf_counter()
+            try:
+                result = run(
+                    self.engine_for_region(name, region), discovery_data, context
+                )
+            except Exception as e:
+                result = {"error": f"{type(e).__name__}: {e}"}
+            outcome["timings"][name] = time.perf_counter() - start
+            outcome["results"][name] = result
+            if isinstance(result, dict) and "error" in result:
+                outcome["errors"][name] = str(result["error"])
+        return outcome
+
+    def run(self, payloads: Mapping[str, Payload]) -> Dict[str, Any]:
+        """
+        Run every engine against every region and merge the results
+
+        Args:
+            payloads: Region -> discovery payload (dict or path to its JSON file)
+
+        Returns:
+            Merged result set with results, timings, errors and metadata
+        """
+        regions = {region.upper(): payload for region, payload in payloads.items()}
+        self.currency_matrices = self.build_currency_matrices(regions).to_dict()
+        workers = max(
+            1, min(self.max_workers or os.cpu_count() or 1, len(regions) or 1)
+        )
+        outcomes: List[Dict[str, Any]] = []
+        executor_type = "threads"
+        start = time.perf_counter()
+
+        if self.use_processes and len(regions) > 1 and workers > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker_runner,
+                    initargs=(
+                        self.engines,
+                        self.analysis_date,
+                        self.seed,
+                        self.currency_matrices,
+                    ),
+                ) as executor:
+                    outcomes = list(
+                        executor.map(
+                            _run_region_in_worker,
+                            list(regions),
+                            [_picklable(payload) for payload in regions.values()],
+                        )
+                    )
+                executor_type = "processes"
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"Process pool unavailable, using threads: {e}")
+                outcomes = []
+
+        if not outcomes and regions:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(
+                    executor.map(self.run_region, list(regions), regions.values())
+                )
+
+        return self._merge(outcomes, executor_type, workers, start)
+
+    def build_currency_matrices(
+        self, payloads: Mapping[str, Payload]
+    ) -> CurrencyMatrices:
+        """
+        Currency matrices as of the analysis date from all regions' payloads
+
+        Spot rates reported by several payloads are combined by median; each
+        region contributes its own currency's policy rate.
+
+        Returns:
+            CurrencyMatrices (cached by the analyzer per analysis date and inputs)
+        """
+        spot_levels: Dict[str, List[float]] = {}
+        policy_rates: Dict[str, float] = {}
+        for region, payload in payloads.items():
+            try:
+                spot_rates, rates = currency_inputs(
+                    _load_payload(payload), region.upper()
+                )
+            except Exception as e:
+                logger.warning(f"No currency inputs for {region}: {e}")
+                continue
+            for code, level in spot_rates.items():
+                spot_levels.setdefault(code, []).append(level)
+            policy_rates.update(rates)
+
+        return self.currency_analyzer.calculate_currency_matrices(
+            policy_rates=policy_rates,
+            spot_rates={
+                code: float(np.median(levels)) for code, levels in spot_levels.items()
+            },
+            as_of=self.analysis_date,
+        )
+
+    def run_directory(
+        self,
+        directory: PathLike = DEFAULT_DISCOVERY_DIR,
+        regions: Optional[Sequence[str]] = None,
+        date: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Run the batch over the latest discovery file for each region"""
+        files = latest_discovery_files(directory, regions, date)
+        if not files:
+            raise FileNotFoundError(f"No discovery files found in {directory}")
+        batch = self.run(files)
+        batch["metadata"]["discovery_files"] = {
+            region: str(path) for region, path in files.items()
+        }
+        return batch
+
+    def _merge(
+        self,
+        outcomes: List[Dict[str, Any]],
+        executor_type: str,
+        workers: int,
+        start: float,
+    ) -> Dict[str, Any]:
+        """Merge per-region outcomes into one result set"""
+        results: Dict[str, Dict[str, Any]] = {}
+        per_engine: Dict[str, Dict[str, float]] = {name: {} for name in self.engines}
+        errors: List[Dict[str, str]] = []
+
+        for outcome in outcomes:
+            region = outcome["region"]
+            results[region] = outcome["results"]
+            for name, seconds in outcome["timings"].items():
+                per_engine[name][region] = round(seconds, 6)
+            for name, message in outcome["errors"].items():
+                errors.append({"region": region, "engine": name, "error": message})
+
+        runs: List[Dict[str, Any]] = [
+            {"engine": name, "region": region, "seconds": seconds}
+            for name, by_region in per_engine.items()
+            for region, seconds in by_region.items()
+        ]
+        runs.sort(key=lambda run: run["seconds"], reverse=True)
+
+        return {
+            "metadata": {
+                "analysis_date": self.analysis_date,
+                "regions": [outcome["region"] for outcome in outcomes],
+                "engines": list(self.engines),
+                "executor": executor_type,
+                "workers": workers,
+                "worker_pids": sorted({outcome["worker_pid"] for outcome in outcomes}),
+                "random_seed": self.seed,
+                "total_seconds": round(time.perf_counter() - start, 6),
+                "generated_at": datetime.now().isoformat(),
+            },
+            "currency_matrices": self.currency_matrices,
+            "results": results,
+            "timings": {
+                "per_engine_region": per_engine,
+                "engine_totals": {
+                    name: round(sum(by_region.values()), 6)
+                    for name, by_region in per_engine.items()
+                },
+                "region_totals": {
+                    outcome["region"]: round(sum(outcome["timings"].values()), 6)
+                    for outcome in outcomes
+                },
+                "slowest": runs[:SLOWEST_RUNS_REPORTED],
+            },
+            "errors": errors,
+        }
+
+
+def _load_payload(payload: Payload) -> Dict[str, Any]:
+    """Discovery payload from a dict or a JSON file path"""
+    if isinstance(payload, dict):
+        return payload
+    with open(payload, "r") as f:
+        return json.load(f)
+
+
+def _picklable(payload: Payload) -> Payload:
+    """Send paths as strings so workers load payloads themselves"""
+    return str(payload) if isinstance(payload, Path) else payload
+
+
+_worker_runner: Optional[MacroEngineBatchRunner] = None
+
+
+def _init_worker_runner(
+    engines: Sequence[str],
+    analysis_date: str,
+    seed: Optional[int],
+    currency_matrices: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Build one runner (and one set of parameter tables) per worker process"""
+    global _worker_runner
+    _worker_runner = MacroEngineBatchRunner(
+        engines, analysis_date, seed, use_processes=False
+    )
+    _worker_runner.currency_matrices = currency_matrices
+
+
+def _run_region_in_worker(region: str, payload: Payload) -> Dict[str, Any]:
+    """Run one region with the worker-local runner"""
+    return _worker_runner.run_region(region, payload)
+
+
+def format_timing_report(batch: Dict[str, Any]) -> str:
+    """Text table of per-engine, per-region timings in milliseconds"""
+    metadata = batch["metadata"]
+    regions = metadata["regions"]
+    per_engine = batch["timings"]["per_engine_region"]
+    width = max([len(name) for name in per_engine] + [len("engine")]) + 2
+
+    lines = [
+        f"Macro engine batch: {len(regions)} regions, "
+        f"{len(metadata['engines'])} engines, {metadata['workers']} "
+        f"{metadata['executor']} in {metadata['total_seconds'] * 1000:.1f}ms",
+        "engine".ljust(width)
+        + "".join(f"{region:>10}" for region in regions)
+        + f"{'total':>10}",
+    ]
+    for name, by_region in per_engine.items():
+        cells = "".join(
+            (
+                f"{by_region[region] * 1000:>10.1f}"
+                if region in by_region
+                else f"{'-':>10}"
+            )
+            for region in regions
+        )
+        total = batch["timings"]["engine_totals"][name] * 1000
+        lines.append(name.ljust(width) + cells + f"{total:>10.1f}")
+    for error in batch["errors"]:
+        lines.append(f"ERROR {error['region']}/{error['engine']}: {error['error']}")
+    return "\n".join(lines)
+
+
+def main():
+    """Command-line interface for the macro engine batch runner"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Macro Engine Batch Runner")
+    parser.add_argument("--regions", nargs="+", help="Regions to analyze")
+    parser.add_argument("--date", help="Discovery date (YYYYMMDD, default: latest)")
+    parser.add_argument(
+        "--discovery-dir",
+        default=str(DEFAULT_DISCOVERY_DIR),
+        help="Directory of discovery JSON files",
+    )
+    parser.add_argument(
+        "--engines", nargs="+", choices=MACRO_ENGINES, help="Engines to run"
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes")
+    parser.add_argument(
+        "--threads", action="store_true", help="Use threads instead of processes"
+    )
+    parser.add_argument("--seed", type=int, help="Seed for regime noise")
+    parser.add_argument("--output", help="Write the merged result set to this file")
+    args = parser.parse_args()
+
+    runner = MacroEngineBatchRunner(
+        engines=args.engines,
+        seed=args.seed,
+        max_workers=args.workers,
+        use_processes=not args.threads,
+    )
+    batch = runner.run_directory(args.discovery_dir, args.regions, args.date)
+
+    print(format_timing_report(batch))
+    if args.output:
+        write_json(batch, args.output)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
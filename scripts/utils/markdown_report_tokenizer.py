@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Markdown Report Tokenizer
+
+Single-pass tokenizer for markdown analysis and performance reports:
+- YAML-style frontmatter (simple key: value pairs)
+- Section tree from ATX headings with body lines per section
+- Pipe tables with header and cell rows
+- Key/value fields ("**Key**: value", "Key: value", pipe-separated pairs)
+- Process-wide cache keyed by content hash, so several parsers reading the
+  same report share one tokenization
+
+Report parsers query the resulting MarkdownReport instead of running many
+independent regexes over the full report text.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple, Union
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+TABLE_SEPARATOR_RE = re.compile(r"^\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+LIST_MARKER_RE = re.compile(r"^\s*(?:[-*+•]|\d+\.)\s+")
+BOLD_KEY_RE = re.compile(r"\*\*([^*\n]+?)(:?)\*\*(\s*:)?\s*")
+PLAIN_KEY_RE = re.compile(r"^([A-Za-z][A-Za-z0-9&/()%'’ .\-]{0,60}?):\s+(.*)$")
+
+_pattern_cache: Dict[Tuple[str, int], Pattern] = {}
+
+
+def compile_pattern(pattern: Union[str, Pattern], flags: int = 0) -> Pattern:
+    """Compile a regex once per process"""
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    key = (pattern, flags)
+    compiled = _pattern_cache.get(key)
+    if compiled is None:
+        compiled = _pattern_cache[key] = re.compile(pattern, flags)
+    return compiled
+
+
+@lru_cache(maxsize=4096)
+def normalize_key(key: str) -> str:
+    """Normalize a field key or table header for lookups"""
+    return " ".join(key.replace("*", "").strip().rstrip(":").lower().split())
+
+
+def strip_markup(text: str) -> str:
+    """Remove bold/italic/code markers from a cell or value"""
+    return text.replace("**", "").replace("__", "").replace("`", "").strip()
+
+
+@dataclass
+class MarkdownField:
+    """A key/value pair found on a line"""
+
+    key: str
+    value: str
+    line: int
+    bold: bool
+    normalized_key: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.normalized_key = normalize_key(self.key)
+
+
+@dataclass
+class MarkdownTable:
+    """A pipe table; cells keep their original markup"""
+
+    header: List[str]
+    raw_rows: List[str] = field(repr=False)
+    line: int
+    columns: List[str] = field(init=False, repr=False)
+    _rows: Optional[List[List[str]]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        # Normalized header names used for column lookups
+        self.columns = [normalize_key(strip_markup(h)) for h in self.header]
+
+    @property
+    def rows(self) -> List[List[str]]:
+        """Body rows split into cells (split on first access)"""
+        if self._rows is None:
+            self._rows = [
+                _split_cells(row)
+                for row in self.raw_rows
+                if "--" not in row or not TABLE_SEPARATOR_RE.match(row.strip())
+            ]
+        return self._rows
+
+    def column_index(self, *names: str) -> Optional[int]:
+        """Index of the first column whose header contains any of names"""
+        wanted = [normalize_key(n) for n in names]
+        for index, column in enumerate(self.columns):
+            if any(w == column for w in wanted):
+                return index
+        for index, column in enumerate(self.columns):
+            if any(w in column for w in wanted):
+                return index
+        return None
+
+    def has_columns(self, *names: str) -> bool:
+        """True when every name matches a header column"""
+        return all(self.column_index(name) is not None for name in names)
+
+    def records(self) -> List[Dict[str, str]]:
+        """Rows as dicts keyed by normalized header"""
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in self.rows]
+
+
+@dataclass
+class MarkdownSection:
+    """A heading and the lines up to the next heading"""
+
+    level: int
+    title: str
+    line: int
+    lines: List[str] = field(default_factory=list)
+    fields: List[MarkdownField] = field(default_factory=list)
+    tables: List[MarkdownTable] = field(default_factory=list)
+    children: List["MarkdownSection"] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        """Body text of this section (excluding sub-sections)"""
+        return "\n".join(self.lines)
+
+    def walk(self) -> Iterator["MarkdownSection"]:
+        """This section and all nested sections in document order"""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def get(
+        self,
+        key: str,
+        pattern: Optional[Union[str, Pattern]] = None,
+        default=None,
+        include_children: bool = False,
+    ):
+        """First field value for key in this section (see MarkdownReport.get)"""
+        sections = self.walk() if include_children else [self]
+        fields = (f for s in sections for f in s.fields)
+        return _match_field(fields, key, pattern, default)
+
+
+def _find_field(fields, key: str, pattern: Optional[Union[str, Pattern]]):
+    """First (field, match) among fields with key whose value matches pattern"""
+    wanted = normalize_key(key)
+    regex = compile_pattern(pattern) if pattern is not None else None
+    for item in fields:
+        if item.normalized_key != wanted:
+            continue
+        if regex is None:
+            return item, None
+        match = regex.search(item.value)
+        if match:
+            return item, match
+    return None, None
+
+
+def _match_field(fields, key: str, pattern: Optional[Union[str, Pattern]], default):
+    """First value (or first pattern group) among fields matching key"""
+    item, match = _find_field(fields, key, pattern)
+    if item is None:
+        return default
+    if match is None:
+        return item.value
+    return match.group(1) if match.re.groups else match.group(0)
+
+
+@dataclass
+class MarkdownReport:
+    """Tokenized markdown report"""
+
+    content: str
+    content_hash: str
+    frontmatter: Dict[str, str]
+    root: MarkdownSection
+    sections: List[MarkdownSection]
+    fields: List[MarkdownField]
+    tables: List[MarkdownTable]
+    path: Optional[str] = None
+    _field_index: Dict[str, List[MarkdownField]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def __post_init__(self):
+        for item in self.fields:
+            self._field_index.setdefault(item.normalized_key, []).append(item)
+
+    @property
+    def lines(self) -> List[str]:
+        return self.content.split("\n")
+
+    @property
+    def title(self) -> Optional[str]:
+        """First heading title"""
+        return self.sections[0].title if self.sections else None
+
+    def get(
+        self,
+        key: str,
+        pattern: Optional[Union[str, Pattern]] = None,
+        default=None,
+    ):
+        """
+        First value for a field key anywhere in the report
+
+        Args:
+            key: Field key (case, bold markers and trailing colon ignored)
+            pattern: Optional regex applied to each value in turn; the first
+                matching value wins and its first group (or whole match) is
+                returned
+            default: Returned when no field matches
+        """
+        return _match_field(
+            self._field_index.get(normalize_key(key), []), key, pattern, default
+        )
+
+    def match(self, key: str, pattern: Union[str, Pattern]) -> Optional["re.Match"]:
+        """Regex match on the first value for key that matches pattern"""
+        _, match = _find_field(
+            self._field_index.get(normalize_key(key), []), key, pattern
+        )
+        return match
+
+    def get_all(self, key: str) -> List[str]:
+        """All values for a field key in document order"""
+        return [f.value for f in self._field_index.get(normalize_key(key), [])]
+
+    def find_sections(
+        self, title_pattern: Union[str, Pattern], level: Optional[int] = None
+    ) -> List[Tuple[MarkdownSection, "re.Match"]]:
+        """Sections whose title matches the pattern (with the match)"""
+        regex = compile_pattern(title_pattern)
+        found = []
+        for section in self.sections:
+            if level is not None and section.level != level:
+                continue
+            match = regex.search(section.title)
+            if match:
+                found.append((section, match))
+        return found
+
+    def find_section(
+        self, title_pattern: Union[str, Pattern], level: Optional[int] = None
+    ) -> Optional[MarkdownSection]:
+        """First section whose title matches the pattern"""
+        found = self.find_sections(title_pattern, level)
+        return found[0][0] if found else None
+
+    def find_table(self, *columns: str) -> Optional[MarkdownTable]:
+        """First table having all the given columns"""
+        for table in self.tables:
+            if table.has_columns(*columns):
+                return table
+        return None
+
+    def search(self, pattern: Union[str, Pattern], flags: int = 0):
+        """Regex search over the full content (for free-text phrases)"""
+        return compile_pattern(pattern, flags).search(self.content)
+
+
+def _split_cells(line: str) -> List[str]:
+    """Split a pipe table row into stripped cells"""
+    stripped = line.strip()
+    if stripped.startswith("|"):
+        stripped = stripped[1:]
+    if stripped.endswith("|"):
+        stripped = stripped[:-1]
+    return [cell.strip() for cell in stripped.split("|")]
+
+
+def _line_fields(text: str, line_number: int) -> List[MarkdownField]:
+    """Key/value fields on one non-table line"""
+    body = LIST_MARKER_RE.sub("", text, count=1).strip()
+    if not body:
+        return []
+
+    fields: List[MarkdownField] = []
+    for segment in body.split(" | "):
+        segment = segment.strip()
+        keys = [m for m in BOLD_KEY_RE.finditer(segment) if m.group(2) or m.group(3)]
+        if keys:
+            for index, match in enumerate(keys):
+                end = keys[index + 1].start() if index + 1 < len(keys) else None
+                value = segment[match.end() : end].strip().rstrip("|").strip()
+                fields.append(
+                    MarkdownField(match.group(1).strip(), value, line_number, True)
+                )
+            continue
+
+        plain = PLAIN_KEY_RE.match(segment)
+        if plain and not segment.startswith("http"):
+            fields.append(
+                MarkdownField(
+                    plain.group(1).strip(), plain.group(2).strip(), line_number, False
+                )
+            )
+    return fields
+
+
+def tokenize_markdown(content: str, path: Optional[str] = None) -> MarkdownReport:
+    """Tokenize markdown text in a single pass over its lines"""
+    lines = content.split("\n")
+    frontmatter: Dict[str, str] = {}
+    start = 0
+
+    if lines and lines[0].strip() == "---":
+        for index in range(1, len(lines)):
+            if lines[index].strip() == "---":
+                for fm_line in lines[1:index]:
+                    if ":" in fm_line:
+                        key, value = fm_line.split(":", 1)
+                        frontmatter[key.strip()] = value.strip()
+                start = index + 1
+                break
+
+    root = MarkdownSection(level=0, title="", line=0)
+    stack = [root]
+    sections: List[MarkdownSection] = []
+    fields: List[MarkdownField] = []
+    tables: List[MarkdownTable] = []
+    in_code = False
+    table_rows: List[Tuple[int, str]] = []
+
+    def flush_table():
+        if not table_rows:
+            return
+        first_line, first = table_rows[0]
+        if len(table_rows) > 1 and TABLE_SEPARATOR_RE.match(table_rows[1][1].strip()):
+            header = _split_cells(first)
+            body = table_rows[2:]
+        else:
+            header = []
+            body = table_rows
+        table = MarkdownTable(
+            header=header, raw_rows=[row for _, row in body], line=first_line
+        )
+        stack[-1].tables.append(table)
+        tables.append(table)
+        table_rows.clear()
+
+    for number in range(start, len(lines)):
+        line = lines[number]
+        stripped = line.strip()
+
+        if stripped.startswith("```"):
+            flush_table()
+            in_code = not in_code
+            stack[-1].lines.append(line)
+            continue
+        if in_code:
+            stack[-1].lines.append(line)
+            continue
+
+        if stripped.startswith("|"):
+            table_rows.append((number + 1, line))
+            stack[-1].lines.append(line)
+            continue
+        flush_table()
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            level = len(heading.group(1))
+            section = MarkdownSection(
+                level=level, title=heading.group(2).strip(), line=number + 1
+            )
+            while stack[-1].level >= level:
+                stack.pop()
+            stack[-1].children.append(section)
+            stack.append(section)
+            sections.append(section)
+            # Headings such as "### Recommendation: BUY | Conviction: 0.9"
+            line_fields = _line_fields(section.title, number + 1)
+        else:
+            stack[-1].lines.append(line)
+            line_fields = _line_fields(line, number + 1) if ":" in line else []
+
+        if line_fields:
+            stack[-1].fields.extend(line_fields)
+            fields.extend(line_fields)
+
+    flush_table()
+
+    return MarkdownReport(
+        content=content,
+        content_hash=hashlib.sha1(content.encode("utf-8")).hexdigest(),
+        frontmatter=frontmatter,
+        root=root,
+        sections=sections,
+        fields=fields,
+        tables=tables,
+        path=path,
+    )
+
+
+class MarkdownReportCache:
+    """Bounded LRU cache of tokenized reports keyed by content hash"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, MarkdownReport]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def tokenize(self, content: str, path: Optional[str] = None) -> MarkdownReport:
+        """Tokenize content, reusing a cached report for identical content"""
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        with self._lock:
+            report = self._entries.get(digest)
+            if report is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return report
+            self.misses += 1
+
+        report = tokenize_markdown(content, path)
+        with self._lock:
+            self._entries[digest] = report
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return report
+
+    def load(self, file_path: Union[str, Path]) -> MarkdownReport:
+        """Read and tokenize a report file"""
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        return self.tokenize(content, str(file_path))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_global_cache = MarkdownReportCache()
+
+
+def get_report_cache() -> MarkdownReportCache:
+    """Get the process-wide tokenized report cache"""
+    return _global_cache
+
+
+def load_report(file_path: Union[str, Path]) -> MarkdownReport:
+    """Read and tokenize a markdown report through the shared cache"""
+    return _global_cache.load(file_path)
+
+
+def parse_report_text(content: str) -> MarkdownReport:
+    """Tokenize markdown text through the shared cache"""
+    return _global_cache.tokenize(content)
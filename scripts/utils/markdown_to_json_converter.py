@@ -10,6 +10,34 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .markdown_report_tokenizer import MarkdownReport, load_report
+
+# Free-text patterns searched over the whole report (compiled once)
+CURRENT_PRICE_RE = re.compile(r"Current:\s*\$(\d+\.?\d*)")
+FAIR_VALUE_RE = re.compile(r"Fair Value Range.*?\$(\d+)\s*-\s*\$(\d+)")
+RECOMMENDATION_RE = re.compile(r"Recommendation:\s*(\w+)")
+CONVICTION_RE = re.compile(r"Conviction:\s*(\d+\.?\d*)")
+EXPECTED_RETURN_RE = re.compile(r"Expected Return.*?(\d+)%")
+CATALYST_RE = re.compile(
+    r"(\d+)\.\s*(.*?)-\s*Probability:\s*(\d+\.?\d*)\s*\|\s*Impact:\s*\$(\d+)"
+)
+PE_RATIO_RE = re.compile(r"P/E Ratio.*?(\d+\.?\d*)")
+WEIGHTED_AVERAGE_RE = re.compile(r"Weighted Average.*?\$(\d+)")
+DEBT_TO_EQUITY_RE = re.compile(r"D/E:\s*(\d+\.?\d*)")
+CURRENT_RATIO_RE = re.compile(r"Current Ratio:\s*(\d+\.?\d*)")
+FCF_RE = re.compile(r"FCF:\s*\$(\d+\.?\d*)B")
+GDP_RE = re.compile(r"GDP Growth Rate.*?([+-]?\d+\.?\d*)")
+FED_FUNDS_RE = re.compile(r"Fed Funds Rate.*?([+-]?\d+\.?\d*)")
+TIMELINE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"Timeline:\s*([^|\n]+)",
+        r"(\d+-\d+\s*month[s]?)",
+        r"(within\s+\d+\s+months?)",
+        r"(next\s+\d+-\d+\s+quarters?)",
+    ]
+]
+
 
 class MarkdownToJsonConverter:
     """Converts fundamental analysis markdown to JSON format"""
@@ -20,27 +48,22 @@ class MarkdownToJsonConverter:
     def convert_file(self, markdown_file: Path) -> Dict[str, Any]:
         """Convert markdown file to JSON structure"""
 
-        with open(markdown_file, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Extract frontmatter
-        frontmatter = self._extract_frontmatter(content)
-
-        # Extract key sections
-        _ = self._parse_sections(content)
+        # Tokenize once; sections, tables and frontmatter come from the report
+        report = load_report(markdown_file)
+        frontmatter = dict(report.frontmatter)
 
         # Extract all the data
-        catalysts = self._extract_catalysts(content)
-        risk_factors = self._extract_risk_factors(content)
-        fair_value = self._extract_fair_value(content)
-        current_price = self._extract_current_price(content)
+        catalysts = self._extract_catalysts(report)
+        risk_factors = self._extract_risk_factors(report)
+        fair_value = self._extract_fair_value(report)
+        current_price = self._extract_current_price(report)
 
         # Calculate additional fields for templates
         total_expected_value = self._calculate_total_expected_value(
             catalysts, current_price
         )
         top_risk_factor = self._get_top_risk_factor(risk_factors)
-        timeline_detail = self._extract_timeline_detail(content)
+        timeline_detail = self._extract_timeline_detail(report)
 
         # Build JSON structure
         json_data = {
@@ -48,14 +71,16 @@ class MarkdownToJsonConverter:
             "date": self._extract_date(frontmatter.get("date", "")),
             "current_price": current_price,
             "fair_value": fair_value,
-            "recommendation": self._extract_recommendation(content),
+            "recommendation": self._extract_recommendation(report),
             "catalysts": catalysts,
             "risk_factors": risk_factors,
-            "valuation_metrics": self._extract_valuation_metrics(content),
-            "financial_health": self._extract_financial_health(content),
-            "economic_sensitivity": self._extract_economic_sensitivity(content),
-            "moat_strength": self._extract_moat_strength(content),
-            "template_context": self._determine_template_context(content),
+            "valuation_metrics": self._extract_valuation_metrics(report),
+            "financial_health": self._extract_financial_health(report),
+            "economic_sensitivity": self._extract_economic_sensitivity(report),
+            "moat_strength": self._extract_moat_strength(report),
+            "template_context": self._determine_template_context(
+                fair_value, current_price, catalysts
+            ),
             "metadata": frontmatter,
             # Additional fields for template compatibility
             "total_expected_value": total_expected_value,
@@ -91,47 +116,6 @@ class MarkdownToJsonConverter:
 
         return json_data
 
-    def _extract_frontmatter(self, content: str) -> Dict[str, Any]:
-        """Extract YAML frontmatter"""
-
-        match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-        if not match:
-            return {}
-
-        frontmatter_text = match.group(1)
-        frontmatter = {}
-
-        for line in frontmatter_text.split("\n"):
-            if ":" in line:
-                key, value = line.split(":", 1)
-                frontmatter[key.strip()] = value.strip()
-
-        return frontmatter
-
-    def _parse_sections(self, content: str) -> Dict[str, str]:
-        """Parse content into sections"""
-
-        sections = {}
-        current_section = None
-        current_content: List[str] = []
-
-        lines = content.split("\n")
-
-        for line in lines:
-            if line.startswith("##") or line.startswith("#"):
-                if current_section:
-                    sections[current_section] = "\n".join(current_content)
-
-                current_section = line.strip("# ").lower().replace(" ", "_")
-                current_content = []
-            else:
-                current_content.append(line)
-
-        if current_section:
-            sections[current_section] = "\n".join(current_content)
-
-        return sections
-
     def _extract_ticker(self, title: str) -> str:
         """Extract ticker from title"""
 
@@ -146,16 +130,16 @@ class MarkdownToJsonConverter:
             return f"{match.group(1)}{match.group(2)}{match.group(3)}"
         return ""
 
-    def _extract_current_price(self, content: str) -> float:
+    def _extract_current_price(self, report: MarkdownReport) -> float:
         """Extract current price"""
 
-        match = re.search(r"Current:\s*\$(\d+\.?\d*)", content)
+        match = report.search(CURRENT_PRICE_RE)
         return float(match.group(1)) if match else 0.0
 
-    def _extract_fair_value(self, content: str) -> Dict[str, float]:
+    def _extract_fair_value(self, report: MarkdownReport) -> Dict[str, float]:
         """Extract fair value range"""
 
-        match = re.search(r"Fair Value Range.*?\$(\d+)\s*-\s*\$(\d+)", content)
+        match = report.search(FAIR_VALUE_RE)
         if match:
             return {
                 "low": float(match.group(1)),
@@ -164,45 +148,38 @@ class MarkdownToJsonConverter:
             }
         return {"low": 0.0, "high": 0.0, "mid": 0.0}
 
-    def _extract_recommendation(self, content: str) -> Dict[str, Any]:
+    def _extract_recommendation(self, report: MarkdownReport) -> Dict[str, Any]:
         """Extract investment recommendation"""
 
         recommendation = {}
 
         # Extract recommendation
-        rec_match = re.search(r"Recommendation:\s*(\w+)", content)
+        rec_match = report.search(RECOMMENDATION_RE)
         if rec_match:
             recommendation["action"] = rec_match.group(1)
 
         # Extract conviction
-        conv_match = re.search(r"Conviction:\s*(\d+\.?\d*)", content)
+        conv_match = report.search(CONVICTION_RE)
         if conv_match:
             recommendation["conviction"] = float(conv_match.group(1))
 
         # Extract expected return
-        ret_match = re.search(r"Expected Return.*?(\d+)%", content)
+        ret_match = report.search(EXPECTED_RETURN_RE)
         if ret_match:
             recommendation["expected_return"] = float(ret_match.group(1)) / 100
 
         return recommendation
 
-    def _extract_catalysts(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_catalysts(self, report: MarkdownReport) -> List[Dict[str, Any]]:
         """Extract key catalysts"""
 
         catalysts = []
 
         # Look for catalyst section
-        catalyst_section = re.search(
-            r"Key Quantified Catalysts.*?\n(.*?)(?=###|\n##|\Z)", content, re.DOTALL
-        )
+        catalyst_section = report.find_section(r"Key Quantified Catalysts")
         if catalyst_section:
-            catalyst_text = catalyst_section.group(1)
-
             # Parse numbered catalysts
-            for match in re.finditer(
-                r"(\d+)\.\s*(.*?)-\s*Probability:\s*(\d+\.?\d*)\s*\|\s*Impact:\s*\$(\d+)",
-                catalyst_text,
-            ):
+            for match in CATALYST_RE.finditer(catalyst_section.text):
                 catalysts.append(
                     {
                         "name": match.group(2).strip(),
@@ -216,97 +193,94 @@ class MarkdownToJsonConverter:
 
         return catalysts
 
-    def _extract_risk_factors(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_risk_factors(self, report: MarkdownReport) -> List[Dict[str, Any]]:
         """Extract risk factors"""
 
         risks = []
 
         # Look for risk matrix section
-        risk_section = re.search(
-            r"Risk Matrix.*?\n(.*?)(?=###|\n##|\Z)", content, re.DOTALL
-        )
+        risk_section = report.find_section(r"Risk Matrix")
         if risk_section:
-            risk_text = risk_section.group(1)
-
-            # Parse risk table
-            for line in risk_text.split("\n"):
-                if "|" in line and "Risk Factor" not in line and "---" not in line:
-                    parts = [p.strip() for p in line.split("|")]
-                    if len(parts) >= 4:
-                        try:
-                            risks.append(
-                                {
-                                    "factor": parts[1],
-                                    "probability": float(parts[2]),
-                                    "impact": int(parts[3]),
-                                    "score": float(parts[4]) if len(parts) > 4 else 0.0,
-                                }
-                            )
-                        except (ValueError, IndexError):
-                            continue
+            # Parse risk table: | Risk Factor | Probability | Impact | Risk Score | ...
+            for table in risk_section.tables:
+                for row in table.rows:
+                    if "Risk Factor" in row[0]:
+                        continue
+                    try:
+                        risks.append(
+                            {
+                                "factor": row[0],
+                                "probability": float(row[1]),
+                                "impact": int(row[2]),
+                                "score": float(row[3]) if len(row) > 3 else 0.0,
+                            }
+                        )
+                    except (ValueError, IndexError):
+                        continue
 
         return risks
 
-    def _extract_valuation_metrics(self, content: str) -> Dict[str, Any]:
+    def _extract_valuation_metrics(self, report: MarkdownReport) -> Dict[str, Any]:
         """Extract valuation metrics"""
 
         metrics = {}
 
         # Extract P/E ratio
-        pe_match = re.search(r"P/E Ratio.*?(\d+\.?\d*)", content)
+        pe_match = report.search(PE_RATIO_RE)
         if pe_match:
             metrics["pe_ratio"] = float(pe_match.group(1))
 
         # Extract weighted average fair value
-        weighted_match = re.search(r"Weighted Average.*?\$(\d+)", content)
+        weighted_match = report.search(WEIGHTED_AVERAGE_RE)
         if weighted_match:
             metrics["weighted_fair_value"] = float(weighted_match.group(1))
 
         return metrics
 
-    def _extract_financial_health(self, content: str) -> Dict[str, Any]:
+    def _extract_financial_health(self, report: MarkdownReport) -> Dict[str, Any]:
         """Extract financial health metrics"""
 
         health = {}
 
         # Extract debt-to-equity
-        de_match = re.search(r"D/E:\s*(\d+\.?\d*)", content)
+        de_match = report.search(DEBT_TO_EQUITY_RE)
         if de_match:
             health["debt_to_equity"] = float(de_match.group(1))
 
         # Extract current ratio
-        cr_match = re.search(r"Current Ratio:\s*(\d+\.?\d*)", content)
+        cr_match = report.search(CURRENT_RATIO_RE)
         if cr_match:
             health["current_ratio"] = float(cr_match.group(1))
 
         # Extract FCF
-        fcf_match = re.search(r"FCF:\s*\$(\d+\.?\d*)B", content)
+        fcf_match = report.search(FCF_RE)
         if fcf_match:
             health["free_cash_flow"] = float(fcf_match.group(1)) * 1000000000
 
         return health
 
-    def _extract_economic_sensitivity(self, content: str) -> Dict[str, Any]:
+    def _extract_economic_sensitivity(self, report: MarkdownReport) -> Dict[str, Any]:
         """Extract economic sensitivity data"""
 
         sensitivity = {}
 
         # Extract GDP correlation
-        gdp_match = re.search(r"GDP Growth Rate.*?([+-]?\d+\.?\d*)", content)
+        gdp_match = report.search(GDP_RE)
         if gdp_match:
             sensitivity["gdp_correlation"] = float(gdp_match.group(1))
 
         # Extract interest rate sensitivity
-        rate_match = re.search(r"Fed Funds Rate.*?([+-]?\d+\.?\d*)", content)
+        rate_match = report.search(FED_FUNDS_RE)
         if rate_match:
             sensitivity["interest_rate_sensitivity"] = float(rate_match.group(1))
 
         return sensitivity
 
-    def _extract_moat_strength(self, content: str) -> Dict[str, Any]:
+    def _extract_moat_strength(self, report: MarkdownReport) -> Dict[str, Any]:
         """Extract competitive moat information"""
 
         moat = {}
+        content = report.content
 
         # Extract overall moat strength (simplified)
         if "Strong" in content and "competitive" in content.lower():
@@ -321,14 +295,17 @@ class MarkdownToJsonConverter:
 
         return moat
 
-    def _determine_template_context(self, content: str) -> Dict[str, Any]:
+    def _determine_template_context(
+        self,
+        fair_value: Dict[str, float],
+        current_price: float,
+        catalysts: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
         """Determine optimal template context"""
 
         context = {}
 
         # Check for valuation disconnect (Template A)
-        fair_value = self._extract_fair_value(content)
-        current_price = self._extract_current_price(content)
 
         if fair_value["mid"] > 0 and current_price > 0:
             upside = (fair_value["mid"] - current_price) / current_price
@@ -338,7 +315,6 @@ class MarkdownToJsonConverter:
                 context["upside_potential"] = str(upside)
 
         # Check for catalyst-driven (Template B)
-        catalysts = self._extract_catalysts(content)
         if len(catalysts) >= 2:
             high_prob_catalysts = [
                 c for c in catalysts if c.get("probability", 0) > 0.7
@@ -376,19 +352,12 @@ class MarkdownToJsonConverter:
         )
         return sorted_risks[0].get("factor", "Key risk factor")
 
-    def _extract_timeline_detail(self, content: str) -> str:
+    def _extract_timeline_detail(self, report: MarkdownReport) -> str:
         """Extract timeline information"""
 
         # Look for timeline mentions
-        timeline_patterns = [
-            r"Timeline:\s*([^|\n]+)",
-            r"(\d+-\d+\s*month[s]?)",
-            r"(within\s+\d+\s+months?)",
-            r"(next\s+\d+-\d+\s+quarters?)",
-        ]
-
-        for pattern in timeline_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in TIMELINE_PATTERNS:
+            match = report.search(pattern)
             if match:
                 return match.group(1).strip()
 
@@ -22,6 +22,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 from scipy import stats
 from scipy.signal import find_peaks
 from sklearn.cluster import KMeans
@@ -29,9 +30,19 @@ from sklearn.decomposition import PCA
 from sklearn.mixture import GaussianMixture
 from sklearn.preprocessing import StandardScaler
 
+from .regime_model_store import RegimeModelStore, get_regime_model_store
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
+# Feature name -> path of its dated observations under
+# cli_comprehensive_analysis.central_bank_economic_data in discovery payloads
+DISCOVERY_REGIME_FEATURES = {
+    "gdp_growth": ("gdp_data",),
+    "unemployment_rate": ("employment_data", "unemployment_data"),
+    "inflation_rate": ("inflation_data", "cpi_data"),
+}
+
 
 @dataclass
 class MarketRegime:
@@ -98,9 +109,24 @@ class MarketRegimeEngine:
     - Tail risk regime identification for stress scenarios
     """
 
-    def __init__(self, region: str = "US"):
+    def __init__(
+        self,
+        region: str = "US",
+        seed: Optional[int] = None,
+        model_store: Optional[RegimeModelStore] = None,
+    ):
         self.region = region.upper()
 
+        # Fitted scalers and cluster/mixture models shared across runs
+        # (defaults to the process-wide store)
+        self.model_store = model_store
+
+        # Regime score and transition noise come from one explicit stream per
+        # run; a fresh seed is drawn (and reported) when none is given
+        self.seed = seed
+        self.last_seed = seed
+        self._rng = np.random.default_rng(seed)
+
         # Regime classification thresholds
         self.regime_thresholds = {
             "volatility_regimes": {
@@ -216,6 +242,11 @@ class MarketRegimeEngine:
         Returns:
             Dictionary containing complete market regime analysis
         """
+        self.last_seed = self.seed
+        if self.last_seed is None:
+            self.last_seed = int(np.random.SeedSequence().generate_state(1)[0])
+        self._rng = np.random.default_rng(self.last_seed)
+
         try:
             # Extract market data and context
             market_context = self._extract_market_context(discovery_data)
@@ -256,6 +287,16 @@ class MarketRegimeEngine:
                 current_regime, volatility_analysis, market_context
             )
 
+            # Currency correlation regime from batch cross-currency matrices
+            currency_correlation_regime = self._analyze_currency_correlation_regime(
+                analysis_data
+            )
+
+            # Classify feature history with the stored statistical models
+            statistical_classification = self._classify_regime_feature_history(
+                discovery_data, analysis_data
+            )
+
             # Generate regime-based investment implications
             investment_implications = self._generate_regime_investment_implications(
                 current_regime,
@@ -276,11 +317,13 @@ class MarketRegimeEngine:
                         liquidity_analysis
                     ),
                     "correlation_regime": correlation_regime,
+                    "currency_correlation_regime": currency_correlation_regime,
                     "regime_transition_analysis": transition_analysis,
                     "early_warning_signals": early_warning_analysis,
                     "tail_risk_assessment": tail_risk_analysis,
                     "investment_implications": investment_implications,
                 },
+                "statistical_regime_classification": statistical_classification,
                 "regime_stability_score": self._calculate_regime_stability_score(
                     current_regime, transition_analysis
                 ),
@@ -291,6 +334,7 @@ class MarketRegimeEngine:
                     correlation_regime, volatility_analysis
                 ),
                 "analysis_timestamp": datetime.now().isoformat(),
+                "random_seed": self.last_seed,
                 "model_version": "1.0",
             }
 
@@ -301,6 +345,116 @@ class MarketRegimeEngine:
                 "analysis_timestamp": datetime.now().isoformat(),
             }
 
+    def score_regime_features(
+        self, features: np.ndarray, feature_names: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Classify the latest observation of a feature history
+
+        Scalers and KMeans/GaussianMixture models come from the model store,
+        fitted once per region, feature set and training window and refitted
+        incrementally as observations are appended.
+
+        Args:
+            features: Feature history (observations x features)
+            feature_names: Ordered feature column names
+
+        Returns:
+            Cluster/mixture assignment of the latest observation with model status
+        """
+        store = self.model_store or get_regime_model_store()
+        return store.score(self.region, feature_names, features)
+
+    def _classify_regime_feature_history(
+        self, discovery_data: Dict[str, Any], analysis_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Score analysis_data["regime_features"] ({"names", "history"}) if given,
+        otherwise the monthly feature history in the discovery payload
+        """
+        regime_features = (analysis_data or {}).get("regime_features")
+        if not regime_features:
+            regime_features = self._build_regime_features(discovery_data)
+            if regime_features is None:
+                return None
+        try:
+            return self.score_regime_features(
+                np.asarray(regime_features["history"], dtype=np.float64),
+                list(regime_features["names"]),
+            )
+        except (KeyError, ValueError) as e:
+            return {"error": f"Regime feature classification failed: {e}"}
+
+    def _build_regime_features(
+        self, discovery_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Monthly GDP growth, unemployment and inflation history from discovery
+
+        Observations are aligned on calendar months. Each value is carried
+        forward for up to five months, so a quarterly GDP print covers its own
+        quarter and the following one while the next release is pending.
+        Only months with every feature present are kept.
+
+        Returns:
+            {"names", "history", "periods"}, or None if no series were found
+            or the history is shorter than the store's regime count
+        """
+        central_bank = (
+            (discovery_data or {})
+            .get("cli_comprehensive_analysis", {})
+            .get("central_bank_economic_data", {})
+        )
+
+        columns = {}
+        for name, path in DISCOVERY_REGIME_FEATURES.items():
+            series = central_bank
+            for key in path:
+                series = series.get(key, {}) if isinstance(series, dict) else {}
+            observations = (
+                series.get("observations") if isinstance(series, dict) else None
+            )
+            values = {}
+            for observation in observations or []:
+                if not isinstance(observation, dict):
+                    continue
+                value = observation.get("value")
+                month = self._observation_month(observation.get("date"))
+                if month is None or not isinstance(value, (int, float)):
+                    continue
+                values[month] = float(value)
+            if not values:
+                return None
+            columns[name] = pd.Series(values)
+
+        frame = pd.DataFrame(columns).sort_index()
+        frame = frame.reindex(
+            pd.period_range(frame.index.min(), frame.index.max(), freq="M")
+        )
+        frame = frame.ffill(limit=5).dropna()
+
+        store = self.model_store or get_regime_model_store()
+        if len(frame) < store.n_regimes:
+            return None
+        return {
+            "names": list(frame.columns),
+            "history": frame.to_numpy(dtype=np.float64).tolist(),
+            "periods": [str(period) for period in frame.index],
+        }
+
+    @staticmethod
+    def _observation_month(value: Any) -> Optional[pd.Period]:
+        """Calendar month of an observation date ("2025-08-01", "2025-08",
+        or "2025-Q2", which maps to the quarter's first month)"""
+        if not isinstance(value, str):
+            return None
+        try:
+            if "Q" in value.upper():
+                return pd.Period(value.upper(), freq="Q").asfreq("M", how="start")
+            return pd.Period(value, freq="M")
+        except (ValueError, TypeError):
+            return None
+
     def _identify_current_market_regime(
         self, market_context: Dict[str, Any], economic_context: Dict[str, Any]
     ) -> MarketRegime:
@@ -532,6 +686,49 @@ class MarketRegimeEngine:
                 "average_correlation": 0.5,
             }
 
+    def _analyze_currency_correlation_regime(
+        self, analysis_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Currency correlation regime from analysis_data["currency_matrices"]
+
+        Uses the cross-currency matrices (CurrencyMatrices.to_dict()) the
+        batch runner computes once per analysis date; None without them.
+        """
+        matrices = (analysis_data or {}).get("currency_matrices")
+        if not matrices:
+            return None
+        try:
+            currencies = list(matrices["currencies"])
+            correlation = np.array(matrices["correlation"], dtype=np.float64)
+            observed = np.array(matrices["correlation_observed"], dtype=bool)
+            carry_to_risk = np.array(matrices["carry_to_risk"], dtype=np.float64)
+        except (KeyError, TypeError, ValueError) as e:
+            return {"error": f"Currency correlation analysis failed: {e}"}
+
+        pairs = ~np.eye(len(currencies), dtype=bool) & np.isfinite(correlation)
+        if not pairs.any():
+            return None
+        average = float(np.mean(np.abs(correlation[pairs])))
+        level = self._classify_correlation_regime(average)
+
+        result: Dict[str, Any] = {
+            "as_of": matrices.get("as_of"),
+            "currencies": currencies,
+            "correlation_level": level,
+            "average_absolute_correlation": round(average, 3),
+            "observed_share": round(float(observed[pairs].mean()), 3),
+            "regime_interpretation": self._interpret_correlation_regime(level, average),
+        }
+        if np.isfinite(carry_to_risk).any():
+            i, j = np.unravel_index(np.nanargmax(carry_to_risk), carry_to_risk.shape)
+            result["best_carry_pair"] = {
+                "long": currencies[i],
+                "funding": currencies[j],
+                "carry_to_risk": round(float(carry_to_risk[i, j]), 3),
+            }
+        return result
+
     def _model_regime_transitions(
         self,
         current_regime: MarketRegime,
@@ -749,7 +946,7 @@ class MarketRegimeEngine:
             "stressed": 0.1,
             "stable": 0.8,
         }
-        return base_scores.get(regime, 0.5) + np.random.normal(0, 0.1)
+        return base_scores.get(regime, 0.5) + self._rng.normal(0, 0.1)
 
     def _calculate_regime_characteristics(
         self, regime: str, indicators: Dict, market_ctx: Dict
@@ -872,7 +1069,7 @@ class MarketRegimeEngine:
         base_probs = self.transition_matrix.get(regime, {})
         # Add small random adjustments based on conditions
         return {
-            k: max(0.01, min(0.99, v + np.random.normal(0, 0.05)))
+            k: max(0.01, min(0.99, v + self._rng.normal(0, 0.05)))
             for k, v in base_probs.items()
         }
 
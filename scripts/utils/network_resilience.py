@@ -105,18 +105,8 @@ class CircuitBreaker:
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function through circuit breaker"""
         with self.lock:
-            self.metrics.total_requests += 1
-
-            # Check if circuit should be opened
-            if self.state == CircuitBreakerState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitBreakerState.HALF_OPEN
-                    self.logger.info(f"Circuit breaker {self.name} moving to HALF_OPEN")
-                else:
-                    self.metrics.failed_requests += 1
-                    raise CircuitBreakerException(
-                        f"Circuit breaker {self.name} is OPEN"
-                    )
+            if not self.allow_request():
+                raise CircuitBreakerException(f"Circuit breaker {self.name} is OPEN")
 
             start_time = time.time()
 
@@ -136,6 +126,35 @@ class CircuitBreaker:
                 self._record_failure(execution_time, e)
                 raise
 
+    def allow_request(self) -> bool:
+        """
+        Register a request attempt and check whether it may proceed
+
+        For callers that execute the request themselves (without holding the
+        breaker lock) and report the outcome via record_success/record_failure.
+        """
+        with self.lock:
+            self.metrics.total_requests += 1
+
+            # Check if circuit should be opened
+            if self.state == CircuitBreakerState.OPEN:
+                if self._should_attempt_reset():
+                    self.state = CircuitBreakerState.HALF_OPEN
+                    self.logger.info(f"Circuit breaker {self.name} moving to HALF_OPEN")
+                else:
+                    self.metrics.failed_requests += 1
+                    return False
+
+            return True
+
+    def record_success(self, execution_time: float):
+        """Record a successful request executed outside call()"""
+        self._record_success(execution_time)
+
+    def record_failure(self, execution_time: float, exception: Exception):
+        """Record a failed request executed outside call()"""
+        self._record_failure(execution_time, exception)
+
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset"""
         if self.last_failure_time is None:
@@ -297,6 +316,10 @@ class RetryHandler:
             f"All {self.config.max_retries} retries failed"
         ) from last_exception
 
+    def get_delay(self, attempt: int) -> float:
+        """Get the backoff delay before retry attempt (1-based)"""
+        return self._calculate_delay(attempt)
+
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay for retry attempt with exponential backoff and jitter"""
         # Exponential backoff
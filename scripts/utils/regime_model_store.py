@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Regime Model Store - Fitted Scalers and Cluster/Mixture Models
+
+Persists the statistical models behind regime classification so they are
+fitted once and reused across regions and runs:
+- One StandardScaler, KMeans and GaussianMixture per region and feature set,
+  tagged with a hash of the training window they were fitted on
+- Unchanged windows are scored with the stored models
+- Windows that extend the stored one with new observations are refitted
+  incrementally: the scaler is updated with partial_fit and the clustering
+  and mixture models are re-estimated starting from the previous solution
+- Any other window (different history, dropped rows) triggers a full fit
+
+Models are pickled under data/cache/regime_models by default; the store only
+ever loads files it wrote itself.
+"""
+
+import copy
+import hashlib
+import logging
+import pickle
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.mixture import GaussianMixture
+from sklearn.preprocessing import StandardScaler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = (
+    Path(__file__).parent.parent.parent / "data" / "cache" / "regime_models"
+)
+
+PathLike = Union[str, Path]
+
+
+def window_hash(features: np.ndarray) -> str:
+    """Stable hash of a training window (shape and float64 values)"""
+    matrix = np.ascontiguousarray(features, dtype=np.float64)
+    digest = hashlib.sha256(str(matrix.shape).encode("utf-8"))
+    digest.update(matrix.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def feature_set_key(region: str, feature_names: Sequence[str]) -> str:
+    """Store key for a region and an ordered feature set"""
+    names = "|".join(feature_names)
+    digest = hashlib.sha256(names.encode("utf-8")).hexdigest()[:12]
+    return f"{region.upper()}_{digest}"
+
+
+@dataclass
+class FittedRegimeModel:
+    """Fitted scaler, clustering and mixture models for one training window"""
+
+    region: str
+    feature_names: Tuple[str, ...]
+    window_hash: str
+    n_observations: int
+    scaler: StandardScaler
+    kmeans: KMeans
+    mixture: GaussianMixture
+    fitted_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    incremental_updates: int = 0
+
+    def score(self, features: np.ndarray) -> Dict[str, Any]:
+        """
+        Score observations with the fitted models
+
+        Mixture components are ranked by their mean of the first feature in
+        original units (e.g. volatility, low to high) so ranks are comparable
+        across refits.
+        """
+        scaled = self.scaler.transform(np.atleast_2d(features))
+        probabilities = self.mixture.predict_proba(scaled)
+        component_means = self.scaler.inverse_transform(self.mixture.means_)[:, 0]
+        ranks = np.argsort(np.argsort(component_means))
+        components = probabilities.argmax(axis=1)
+
+        return {
+            "clusters": self.kmeans.predict(scaled).tolist(),
+            "mixture_components": components.tolist(),
+            "component_ranks": ranks[components].tolist(),
+            "mixture_probabilities": probabilities.round(4).tolist(),
+            "n_components": int(self.mixture.n_components),
+        }
+
+
+class RegimeModelStore:
+    """Store of fitted regime models keyed by region, feature set and window"""
+
+    def __init__(
+        self,
+        store_dir: Optional[PathLike] = DEFAULT_STORE_DIR,
+        n_regimes: int = 4,
+        random_state: int = 0,
+    ):
+        """
+        Args:
+            store_dir: Directory for pickled models (None keeps models in memory)
+            n_regimes: Clusters / mixture components per model
+            random_state: Seed for KMeans and GaussianMixture fitting
+        """
+        self.store_dir = Path(store_dir) if store_dir is not None else None
+        self.n_regimes = n_regimes
+        self.random_state = random_state
+        self._models: Dict[str, FittedRegimeModel] = {}
+        self._lock = threading.RLock()
+
+    def get_model(
+        self, region: str, feature_names: Sequence[str], features: np.ndarray
+    ) -> Tuple[FittedRegimeModel, str]:
+        """
+        Return models for a training window, fitting only what is needed
+
+        Args:
+            region: Region the features describe
+            feature_names: Ordered names of the feature columns
+            features: Training window (observations x features)
+
+        Returns:
+            (model, status) where status is "cached", "incremental" or "fitted"
+        """
+        features = self._validate(features, feature_names)
+        key = feature_set_key(region, feature_names)
+        current_hash = window_hash(features)
+
+        with self._lock:
+            model = self._models.get(key) or self._load(key)
+
+            if (
+                model is not None
+                and model.feature_names == tuple(feature_names)
+                and model.mixture.n_components == self.n_regimes
+            ):
+                if model.window_hash == current_hash:
+                    self._models[key] = model
+                    return model, "cached"
+
+                previous = model.n_observations
+                if len(features) > previous and model.window_hash == window_hash(
+                    features[:previous]
+                ):
+                    model = self._refit(model, features, current_hash)
+                    self._save(key, model)
+                    return model, "incremental"
+
+            model = self._fit(region, feature_names, features, current_hash)
+            self._save(key, model)
+            return model, "fitted"
+
+    def score(
+        self,
+        region: str,
+        feature_names: Sequence[str],
+        features: np.ndarray,
+        observations: Optional[np.ndarray] = None,
+    ) -> Dict[str, Any]:
+        """
+        Score observations (default: the latest row of the window)
+
+        Returns:
+            Cluster/mixture assignments plus model status and window metadata
+        """
+        model, status = self.get_model(region, feature_names, features)
+        if observations is None:
+            observations = np.asarray(features, dtype=np.float64)[-1:]
+        result = model.score(observations)
+        result.update(
+            {
+                "model_status": status,
+                "window_hash": model.window_hash,
+                "n_observations": model.n_observations,
+                "incremental_updates": model.incremental_updates,
+            }
+        )
+        return result
+
+    def clear(self) -> None:
+        """Drop in-memory and persisted models"""
+        with self._lock:
+            self._models.clear()
+            if self.store_dir is not None and self.store_dir.exists():
+                for path in self.store_dir.glob("*.pkl"):
+                    path.unlink()
+
+    def _validate(self, features: np.ndarray, feature_names: Sequence[str]):
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != len(feature_names):
+            raise ValueError(
+                f"Expected (observations, {len(feature_names)}) features, "
+                f"got shape {features.shape}"
+            )
+        if len(features) < self.n_regimes:
+            raise ValueError(
+                f"Need at least {self.n_regimes} observations, got {len(features)}"
+            )
+        if not np.isfinite(features).all():
+            raise ValueError("Features contain NaN or infinite values")
+        return features
+
+    def _fit(
+        self,
+        region: str,
+        feature_names: Sequence[str],
+        features: np.ndarray,
+        current_hash: str,
+    ) -> FittedRegimeModel:
+        """Fit scaler, clustering and mixture models from scratch"""
+        scaler = StandardScaler().fit(features)
+        scaled = scaler.transform(features)
+        kmeans = KMeans(
+            n_clusters=self.n_regimes, n_init=10, random_state=self.random_state
+        ).fit(scaled)
+        mixture = GaussianMixture(
+            n_components=self.n_regimes,
+            means_init=kmeans.cluster_centers_,
+            random_state=self.random_state,
+        ).fit(scaled)
+
+        logger.debug(f"Fitted regime models for {region} on {len(features)} rows")
+        return FittedRegimeModel(
+            region=region.upper(),
+            feature_names=tuple(feature_names),
+            window_hash=current_hash,
+            n_observations=len(features),
+            scaler=scaler,
+            kmeans=kmeans,
+            mixture=mixture,
+        )
+
+    def _refit(
+        self, model: FittedRegimeModel, features: np.ndarray, current_hash: str
+    ) -> FittedRegimeModel:
+        """Update models with observations appended to the stored window"""
+        previous_scaler = model.scaler
+        scaler = copy.deepcopy(previous_scaler).partial_fit(
+            features[model.n_observations :]
+        )
+        scaled = scaler.transform(features)
+
+        def rescale(points: np.ndarray) -> np.ndarray:
+            return scaler.transform(previous_scaler.inverse_transform(points))
+
+        # Start from the previous solution, mapped into the updated scaling
+        kmeans = KMeans(
+            n_clusters=self.n_regimes,
+            init=rescale(model.kmeans.cluster_centers_),
+            n_init=1,
+            random_state=self.random_state,
+        ).fit(scaled)
+        mixture = GaussianMixture(
+            n_components=self.n_regimes,
+            weights_init=model.mixture.weights_,
+            means_init=rescale(model.mixture.means_),
+            random_state=self.random_state,
+        ).fit(scaled)
+
+        logger.debug(
+            f"Incrementally refitted {model.region} regime models: "
+            f"{model.n_observations} -> {len(features)} rows"
+        )
+        return FittedRegimeModel(
+            region=model.region,
+            feature_names=model.feature_names,
+            window_hash=current_hash,
+            n_observations=len(features),
+            scaler=scaler,
+            kmeans=kmeans,
+            mixture=mixture,
+            incremental_updates=model.incremental_updates + 1,
+        )
+
+    def _path(self, key: str) -> Optional[Path]:
+        if self.store_dir is None:
+            return None
+        return self.store_dir / f"{key}.pkl"
+
+    def _load(self, key: str) -> Optional[FittedRegimeModel]:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                model = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable regime model {path}: {e}")
+            return None
+        return model if isinstance(model, FittedRegimeModel) else None
+
+    def _save(self, key: str, model: FittedRegimeModel) -> None:
+        self._models[key] = model
+        path = self._path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+
+
+_global_store: Optional[RegimeModelStore] = None
+_global_store_lock = threading.Lock()
+
+
+def get_regime_model_store() -> RegimeModelStore:
+    """Get the process-wide regime model store instance"""
+    global _global_store
+    if _global_store is None:
+        with _global_store_lock:
+            if _global_store is None:
+                _global_store = RegimeModelStore()
+    return _global_store
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Schema Registry - Compiled JSON Schema Validators
+
+Loads the DASV and aggregator schemas once and reuses compiled validators:
+- Every schema in scripts/schemas and scripts/standardized_schemas registered
+  in a shared referencing.Registry so cross-file $refs resolve offline
+- Schemas checked against their metaschema once, at compile time
+- Validators cached by schema name/path, or by content hash for in-memory schemas
+- Bulk validation of an output directory across worker processes
+
+jsonschema.validate() re-checks the schema and builds a new validator on every
+call; validating through the registry only pays that cost the first time.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urljoin
+
+from jsonschema.validators import validator_for
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT202012
+
+logger = logging.getLogger(__name__)
+
+SCRIPTS_DIR = Path(__file__).parent.parent
+DEFAULT_SCHEMA_DIRS = [SCRIPTS_DIR / "schemas", SCRIPTS_DIR / "standardized_schemas"]
+
+PathLike = Union[str, Path]
+
+
+def _format_error(error) -> str:
+    """Render a validation error with its JSON path"""
+    location = "/".join(str(part) for part in error.absolute_path)
+    return f"{location or '<root>'}: {error.message}"
+
+
+class SchemaRegistry:
+    """Registry of schemas and compiled validators for a set of schema directories"""
+
+    def __init__(self, schema_dirs: Optional[Sequence[PathLike]] = None):
+        self.schema_dirs = [Path(d) for d in (schema_dirs or DEFAULT_SCHEMA_DIRS)]
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._schema_paths: Dict[str, Path] = {}
+        self._validators: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._registry = Registry()
+        self._load_schemas()
+
+    def _load_schemas(self) -> None:
+        """Read every schema file and register it for $ref resolution"""
+        resources = []
+        for schema_dir in self.schema_dirs:
+            if not schema_dir.exists():
+                continue
+            for schema_path in sorted(schema_dir.glob("*.json")):
+                try:
+                    with open(schema_path, "r", encoding="utf-8") as f:
+                        schema = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(f"Skipping unreadable schema {schema_path}: {e}")
+                    continue
+
+                self._schemas[schema_path.stem] = schema
+                self._schema_paths[schema_path.stem] = schema_path.resolve()
+
+                resource = Resource.from_contents(
+                    schema, default_specification=DRAFT202012
+                )
+                for uri in self._resource_uris(schema, schema_path):
+                    resources.append((uri, resource))
+
+        self._registry = self._registry.with_resources(resources)
+        logger.debug(f"Registered {len(self._schemas)} schemas")
+
+    @staticmethod
+    def _resource_uris(schema: Dict[str, Any], schema_path: Path) -> List[str]:
+        """URIs a schema can be referenced by ($id, sibling file name, file URI)"""
+        uris = [
+            schema_path.resolve().as_uri(),
+            schema_path.name,
+            f"./{schema_path.name}",
+        ]
+        schema_id = schema.get("$id")
+        if schema_id:
+            # Relative refs such as "./local_data_references_schema.json" resolve
+            # against the referring schema's $id, not the target's $id
+            uris.extend([schema_id, urljoin(schema_id, schema_path.name)])
+        return uris
+
+    @property
+    def schema_names(self) -> List[str]:
+        """Names (file stems) of all registered schemas"""
+        return sorted(self._schemas)
+
+    def get_schema(self, name_or_path: PathLike) -> Dict[str, Any]:
+        """Get a registered schema by name or path"""
+        return self._schemas[self._resolve_name(name_or_path)]
+
+    def _resolve_name(self, name_or_path: PathLike) -> str:
+        """Map a schema name, file name or path to its registry name"""
+        name = (
+            Path(name_or_path).stem
+            if str(name_or_path).endswith(".json")
+            else str(name_or_path)
+        )
+        if name not in self._schemas:
+            path = Path(name_or_path)
+            if path.suffix == ".json" and path.exists():
+                self._register_file(path)
+                name = path.stem
+            else:
+                raise KeyError(f"Schema not found: {name_or_path}")
+        return name
+
+    def _register_file(self, schema_path: Path) -> None:
+        """Register a schema file that lives outside the schema directories"""
+        with open(schema_path, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+        resource = Resource.from_contents(schema, default_specification=DRAFT202012)
+        with self._lock:
+            self._schemas[schema_path.stem] = schema
+            self._schema_paths[schema_path.stem] = schema_path.resolve()
+            self._registry = self._registry.with_resources(
+                (uri, resource) for uri in self._resource_uris(schema, schema_path)
+            )
+            # Compiled validators hold the previous registry; recompile on next use
+            self._validators.clear()
+
+    def _compile(self, schema: Dict[str, Any]):
+        """Check a schema once and build a validator bound to the shared registry"""
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        return validator_cls(schema, registry=self._registry)
+
+    def get_validator(self, name_or_path: PathLike):
+        """Compiled validator for a registered schema (built on first use)"""
+        name = self._resolve_name(name_or_path)
+        validator = self._validators.get(name)
+        if validator is None:
+            with self._lock:
+                validator = self._validators.get(name)
+                if validator is None:
+                    validator = self._compile(self._schemas[name])
+                    self._validators[name] = validator
+        return validator
+
+    def validator_for_schema(self, schema: Dict[str, Any]):
+        """Compiled validator for an in-memory schema, cached by content hash"""
+        digest = hashlib.sha256(
+            json.dumps(schema, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        key = f"sha256:{digest}"
+        validator = self._validators.get(key)
+        if validator is None:
+            with self._lock:
+                validator = self._validators.get(key)
+                if validator is None:
+                    validator = self._compile(schema)
+                    self._validators[key] = validator
+        return validator
+
+    def validate(
+        self,
+        instance: Any,
+        schema: Union[PathLike, Dict[str, Any]],
+        max_errors: int = 20,
+    ) -> Tuple[bool, List[str]]:
+        """
+        Validate an instance against a schema name, path or schema dict
+
+        Returns:
+            Tuple of (is_valid, error_messages) with at most max_errors messages
+        """
+        validator = (
+            self.validator_for_schema(schema)
+            if isinstance(schema, dict)
+            else self.get_validator(schema)
+        )
+        errors = []
+        for error in validator.iter_errors(instance):
+            errors.append(_format_error(error))
+            if len(errors) >= max_errors:
+                break
+        return len(errors) == 0, errors
+
+    def infer_schema_name(self, file_path: PathLike) -> Optional[str]:
+        """
+        Infer the schema for a DASV output file from its location
+
+        data/outputs/<analysis_type>/<phase>/<file>.json maps to
+        <analysis_type>_<phase>_schema when such a schema is registered.
+        """
+        path = Path(file_path)
+        analysis_type, phase = path.parent.parent.name, path.parent.name
+        candidate = f"{analysis_type}_{phase}_schema"
+        return candidate if candidate in self._schemas else None
+
+    def validate_file(
+        self,
+        file_path: PathLike,
+        schema: Optional[PathLike] = None,
+        max_errors: int = 20,
+    ) -> Dict[str, Any]:
+        """Validate one JSON file; the schema is inferred when not given"""
+        path = Path(file_path)
+        schema_name = str(schema) if schema else self.infer_schema_name(path)
+        result: Dict[str, Any] = {
+            "file": str(path),
+            "schema": schema_name,
+            "valid": False,
+            "errors": [],
+        }
+
+        if schema_name is None:
+            result["skipped"] = True
+            result["errors"] = ["No schema could be inferred for file"]
+            return result
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                instance = json.load(f)
+            result["valid"], result["errors"] = self.validate(
+                instance, schema_name, max_errors
+            )
+        except Exception as e:
+            # Unreadable files, unknown schemas and unresolvable $refs
+            result["errors"] = [f"{type(e).__name__}: {e}"]
+        return result
+
+    def validate_directory(
+        self,
+        directory: PathLike,
+        schema: Optional[PathLike] = None,
+        pattern: str = "**/*.json",
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        max_errors: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Validate every JSON file under a directory in parallel
+
+        Args:
+            directory: Root directory to scan
+            schema: Schema for every file (inferred per file when None;
+                files without an inferable schema are reported as skipped)
+            pattern: Glob pattern relative to directory
+            max_workers: Worker count (defaults to CPU count)
+            use_processes: Validate in worker processes (each builds its own
+                registry once); threads are used otherwise or as a fallback
+            max_errors: Maximum errors reported per file
+
+        Returns:
+            Summary with counts and per-file results
+        """
+        files = sorted(Path(directory).glob(pattern))
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(files) or 1))
+        results: List[Dict[str, Any]] = []
+
+        if use_processes and len(files) > 1 and workers > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker_registry,
+                    initargs=([str(d) for d in self.schema_dirs],),
+                ) as executor:
+                    chunksize = max(1, len(files) // (workers * 4))
+                    results = list(
+                        executor.map(
+                            _validate_file_in_worker,
+                            [str(f) for f in files],
+                            [str(schema) if schema else None] * len(files),
+                            [max_errors] * len(files),
+                            chunksize=chunksize,
+                        )
+                    )
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"Process pool unavailable, using threads: {e}")
+                results = []
+
+        if not results and files:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda f: self.validate_file(f, schema, max_errors), files
+                    )
+                )
+
+        skipped = sum(1 for r in results if r.get("skipped"))
+        valid = sum(1 for r in results if r["valid"])
+        return {
+            "directory": str(directory),
+            "total_files": len(results),
+            "valid": valid,
+            "invalid": len(results) - valid - skipped,
+            "skipped": skipped,
+            "results": results,
+        }
+
+
+_worker_registry: Optional[SchemaRegistry] = None
+
+
+def _init_worker_registry(schema_dirs: Iterable[str]) -> None:
+    """Build one registry per worker process"""
+    global _worker_registry
+    _worker_registry = SchemaRegistry(list(schema_dirs))
+
+
+def _validate_file_in_worker(
+    file_path: str, schema: Optional[str], max_errors: int
+) -> Dict[str, Any]:
+    """Validate a file with the worker-local registry"""
+    return _worker_registry.validate_file(file_path, schema, max_errors)
+
+
+_global_registry: Optional[SchemaRegistry] = None
+_global_registry_lock = threading.Lock()
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """Get the process-wide schema registry instance"""
+    global _global_registry
+    if _global_registry is None:
+        with _global_registry_lock:
+            if _global_registry is None:
+                _global_registry = SchemaRegistry()
+    return _global_registry
@@ -43,7 +43,22 @@ class SchemaSelector:
         if schema_key in self._schema_cache:
             return self._schema_cache[schema_key]
 
-        # Determine schema file path
+        schema_file = self.get_schema_path_for_region(region, analysis_type)
+
+        # Load and cache schema
+        with open(schema_file, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+
+        self._schema_cache[schema_key] = schema
+        logger.info(f"Loaded schema for {region} {analysis_type}: {schema_file.name}")
+
+        return schema
+
+    def get_schema_path_for_region(
+        self, region: str, analysis_type: str = "discovery"
+    ) -> Path:
+        """Resolve the schema file for a region, falling back to the default schema"""
+        region = region.upper()
         schema_file = self._get_schema_file_path(region, analysis_type)
 
         if not schema_file.exists():
@@ -54,14 +69,7 @@ class SchemaSelector:
         if not schema_file.exists():
             raise FileNotFoundError(f"No schema found for {region} {analysis_type}")
 
-        # Load and cache schema
-        with open(schema_file, "r", encoding="utf-8") as f:
-            schema = json.load(f)
-
-        self._schema_cache[schema_key] = schema
-        logger.info(f"Loaded schema for {region} {analysis_type}: {schema_file.name}")
-
-        return schema
+        return schema_file
 
     def _get_schema_file_path(self, region: str, analysis_type: str) -> Path:
         """Get region-specific schema file path"""
@@ -228,19 +236,19 @@ def validate_data_against_regional_schema(
         tuple: (is_valid, list_of_errors)
     """
     try:
-        import jsonschema
+        from .schema_registry import get_schema_registry
     except ImportError:
         logger.warning("jsonschema not available, skipping validation")
         return True, []
 
     try:
-        schema = get_schema_for_region(region, analysis_type)
-        jsonschema.validate(data, schema)
-        return True, []
-
-    except jsonschema.ValidationError as e:
-        logger.error(f"Schema validation failed: {e.message}")
-        return False, [e.message]
+        schema_path = create_schema_selector().get_schema_path_for_region(
+            region, analysis_type
+        )
+        is_valid, errors = get_schema_registry().validate(data, schema_path)
+        if not is_valid:
+            logger.error(f"Schema validation failed: {errors[0]}")
+        return is_valid, errors
 
     except Exception as e:
         logger.error(f"Schema validation error: {e}")
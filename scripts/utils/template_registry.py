@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Template Registry - Process-Wide Jinja2 Environments
+
+Shared template environments for all Jinja2 renderers:
+- One Environment per (search path, options) combination per process
+- Persistent on-disk bytecode cache so templates compile once across runs
+- Common filter set registered once per environment
+- Environment reuse statistics
+
+Bytecode entries are keyed by template name and file path and validated
+against a hash of the template source, so edited templates are recompiled
+automatically while unchanged ones load straight from the cache. Within a
+process, Jinja's auto_reload re-checks template mtimes before reusing a
+compiled template.
+"""
+
+import logging
+import re
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_BYTECODE_CACHE_DIR = PROJECT_ROOT / "data" / "cache" / "jinja_bytecode"
+
+PathLike = Union[str, Path]
+
+
+def _strftime_filter(value: Any, fmt: str = "%Y-%m-%d") -> str:
+    """Format datetimes, dates and ISO strings; passes other values through"""
+    if isinstance(value, (datetime, date)):
+        return value.strftime(fmt)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime(fmt)
+        except ValueError:
+            return value
+    return "" if value is None else str(value)
+
+
+def _regex_search_filter(value: Any, pattern: str) -> bool:
+    """True when the pattern matches anywhere in the value"""
+    return re.search(pattern, str(value or "")) is not None
+
+
+def _currency_filter(value: Any, symbol: str = "$", decimals: int = 2) -> str:
+    """Format a number as currency (e.g. $1,234.56)"""
+    try:
+        return f"{symbol}{float(value):,.{decimals}f}"
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _percentage_filter(value: Any, decimals: int = 1, ratio: bool = False) -> str:
+    """Format a number as a percentage; ratio=True treats 0.05 as 5%"""
+    try:
+        number = float(value) * (100 if ratio else 1)
+        return f"{number:.{decimals}f}%"
+    except (TypeError, ValueError):
+        return str(value)
+
+
+COMMON_FILTERS: Dict[str, Callable[..., Any]] = {
+    "strftime": _strftime_filter,
+    "regex_search": _regex_search_filter,
+    "currency": _currency_filter,
+    "percentage": _percentage_filter,
+}
+
+
+class TemplateRegistry:
+    """Process-wide registry of compiled Jinja2 environments"""
+
+    def __init__(
+        self,
+        bytecode_cache_dir: Optional[PathLike] = None,
+        use_bytecode_cache: bool = True,
+        filters: Optional[Dict[str, Callable[..., Any]]] = None,
+    ):
+        self.bytecode_cache_dir = Path(bytecode_cache_dir or DEFAULT_BYTECODE_CACHE_DIR)
+        self.use_bytecode_cache = use_bytecode_cache
+        self.filters = dict(COMMON_FILTERS)
+        self.filters.update(filters or {})
+
+        self._bytecode_cache: Optional[FileSystemBytecodeCache] = None
+        self._environments: Dict[Tuple, Environment] = {}
+        self._lock = threading.Lock()
+        self._stats = {"environments_created": 0, "environment_hits": 0}
+
+    def _get_bytecode_cache(self) -> Optional[FileSystemBytecodeCache]:
+        """Create the on-disk bytecode cache on first use"""
+        if not self.use_bytecode_cache:
+            return None
+        if self._bytecode_cache is None:
+            try:
+                self.bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+                self._bytecode_cache = FileSystemBytecodeCache(
+                    str(self.bytecode_cache_dir), "%s.jinja.cache"
+                )
+            except OSError as e:
+                logger.warning(
+                    f"Bytecode cache disabled ({self.bytecode_cache_dir}): {e}"
+                )
+                self.use_bytecode_cache = False
+        return self._bytecode_cache
+
+    def get_environment(
+        self,
+        search_path: Union[PathLike, Sequence[PathLike]],
+        autoescape: Union[bool, Sequence[str]] = True,
+        trim_blocks: bool = False,
+        lstrip_blocks: bool = False,
+    ) -> Environment:
+        """
+        Get the shared environment for a template search path
+
+        Args:
+            search_path: Template directory or ordered list of directories
+            autoescape: True/False, or file extensions to autoescape
+                (passed to select_autoescape)
+            trim_blocks: Jinja trim_blocks option
+            lstrip_blocks: Jinja lstrip_blocks option
+
+        Returns:
+            Environment shared by every caller using the same arguments
+        """
+        paths = (
+            [search_path] if isinstance(search_path, (str, Path)) else list(search_path)
+        )
+        resolved = tuple(str(Path(p).resolve()) for p in paths)
+        escape_key = autoescape if isinstance(autoescape, bool) else tuple(autoescape)
+        key = (resolved, escape_key, trim_blocks, lstrip_blocks)
+
+        with self._lock:
+            env = self._environments.get(key)
+            if env is not None:
+                self._stats["environment_hits"] += 1
+                return env
+
+            env = Environment(
+                loader=FileSystemLoader(list(resolved)),
+                autoescape=(
+                    autoescape
+                    if isinstance(autoescape, bool)
+                    else select_autoescape(list(autoescape))
+                ),
+                trim_blocks=trim_blocks,
+                lstrip_blocks=lstrip_blocks,
+                bytecode_cache=self._get_bytecode_cache(),
+                auto_reload=True,
+            )
+            env.filters.update(self.filters)
+            self._environments[key] = env
+            self._stats["environments_created"] += 1
+            return env
+
+    def get_template(
+        self,
+        search_path: Union[PathLike, Sequence[PathLike]],
+        template_name: str,
+        **options: Any,
+    ) -> Template:
+        """Load a template through the shared environment for search_path"""
+        return self.get_environment(search_path, **options).get_template(template_name)
+
+    def register_filters(self, filters: Dict[str, Callable[..., Any]]) -> None:
+        """Add filters to the common set and to every existing environment"""
+        with self._lock:
+            self.filters.update(filters)
+            for env in self._environments.values():
+                env.filters.update(filters)
+
+    def precompile(
+        self, search_path: Union[PathLike, Sequence[PathLike]], **options: Any
+    ) -> int:
+        """Compile every template under search_path into the bytecode cache"""
+        env = self.get_environment(search_path, **options)
+        compiled = 0
+        for name in env.list_templates(
+            extensions=["j2", "jinja", "jinja2", "html", "md"]
+        ):
+            try:
+                env.get_template(name)
+                compiled += 1
+            except Exception as e:
+                logger.debug(f"Skipping template {name}: {e}")
+        return compiled
+
+    def clear_bytecode_cache(self) -> None:
+        """Remove all persisted bytecode"""
+        cache = self._get_bytecode_cache()
+        if cache is not None:
+            cache.clear()
+
+    def reset(self) -> None:
+        """Drop in-process environments (bytecode on disk is kept)"""
+        with self._lock:
+            self._environments.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Registry statistics"""
+        with self._lock:
+            return {
+                **self._stats,
+                "environments": len(self._environments),
+                "bytecode_cache_dir": (
+                    str(self.bytecode_cache_dir) if self.use_bytecode_cache else None
+                ),
+                "filters": sorted(self.filters),
+            }
+
+
+_global_registry: Optional[TemplateRegistry] = None
+_global_registry_lock = threading.Lock()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Get the process-wide template registry instance"""
+    global _global_registry
+    if _global_registry is None:
+        with _global_registry_lock:
+            if _global_registry is None:
+                _global_registry = TemplateRegistry()
+    return _global_registry
+
+
+def get_template_environment(
+    search_path: Union[PathLike, Sequence[PathLike]], **options: Any
+) -> Environment:
+    """Get a shared environment from the process-wide registry"""
+    return get_template_registry().get_environment(search_path, **options)
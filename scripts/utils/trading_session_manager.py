@@ -6,6 +6,7 @@ Provides accurate trading session timing for US stock markets with:
 - NYSE and NASDAQ regular hours (9:30 AM - 4:00 PM ET)
 - Market holiday detection
 - Cache TTL calculation based on trading session end
+- Bounded stale windows for stale-while-revalidate caching
 - Timezone handling for Eastern Time (ET)
 """
 
@@ -165,6 +166,10 @@ class TradingSessionManager:
         # Cache buffer after market close
         self.cache_buffer_minutes = 5
 
+        # Bounded staleness for stale-while-revalidate cache reads
+        self.stale_window_open_seconds = 120
+        self.stale_window_closed_seconds = 3600
+
         # Holiday cache
         self._holiday_cache: Dict[int, set] = {}
 
@@ -320,6 +325,23 @@ class TradingSessionManager:
 
         return ttl_seconds
 
+    def get_max_stale_seconds(self, dt: Optional[datetime] = None) -> int:
+        """
+        Get how long expired market data may be served while it refreshes
+
+        Prices move during the session, so the stale window is short while the
+        market is open; outside trading hours quotes are static.
+
+        Args:
+            dt: Reference datetime (defaults to current ET time)
+
+        Returns:
+            Maximum staleness in seconds beyond the cache TTL
+        """
+        if self.is_market_open(dt):
+            return self.stale_window_open_seconds
+        return self.stale_window_closed_seconds
+
     def get_market_status(self, dt: Optional[datetime] = None) -> Dict[str, any]:
         """
         Get comprehensive market status information
@@ -4,6 +4,9 @@ Unified Cache Adapter
 
 Provides a cache interface using HistoricalDataManager as the single source of truth,
 eliminating the need for a separate cache directory.
+
+Supports stale-while-revalidate reads: entries past their TTL remain servable
+for a bounded stale window and every lookup reports its freshness.
 """
 
 import logging
@@ -14,6 +17,38 @@ from historical_data_manager import DataType, HistoricalDataManager, Timeframe
 from trading_session_manager import TradingSessionManager
 
 
+def describe_freshness(
+    cached_time: datetime, ttl_seconds: int, max_stale_seconds: int
+) -> Dict[str, Any]:
+    """
+    Build freshness metadata for a cached entry
+
+    Args:
+        cached_time: When the entry was cached
+        ttl_seconds: Effective TTL for the entry
+        max_stale_seconds: How long past the TTL the entry may still be served
+
+    Returns:
+        Dict with status ("fresh", "stale" or "expired"), age and bounds
+    """
+    age_seconds = max(0.0, (datetime.now() - cached_time).total_seconds())
+    if age_seconds <= ttl_seconds:
+        status = "fresh"
+    elif age_seconds <= ttl_seconds + max_stale_seconds:
+        status = "stale"
+    else:
+        status = "expired"
+
+    return {
+        "status": status,
+        "cached_at": cached_time.isoformat(),
+        "age_seconds": round(age_seconds, 3),
+        "ttl_seconds": ttl_seconds,
+        "max_stale_seconds": max_stale_seconds,
+        "stale_by_seconds": round(max(0.0, age_seconds - ttl_seconds), 3),
+    }
+
+
 class UnifiedCache:
     """
     Adapter to use HistoricalDataManager as both cache and long-term storage.
@@ -28,6 +63,7 @@ class UnifiedCache:
         ttl_seconds: int = 900,  # 15 minutes default
         service_name: str = "unknown",
         use_trading_session_ttl: bool = True,
+        max_stale_seconds: int = 300,
     ):
         """
         Initialize UnifiedCache adapter.
@@ -37,9 +73,11 @@ class UnifiedCache:
             ttl_seconds: Time-to-live for cache entries (fallback for non-market data)
             service_name: Name of the service using this cache
             use_trading_session_ttl: Use trading session-aware TTL for market data
+            max_stale_seconds: Stale window past the TTL (fallback for non-market data)
         """
         self.hdm = historical_manager
         self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
         self.service_name = service_name
         self.use_trading_session_ttl = use_trading_session_ttl
         self.logger = self._setup_logger()
@@ -89,6 +127,39 @@ class UnifiedCache:
         # Without stored key info, we can't parse the MD5 hash
         return None, None, None
 
+    def _is_market_data(self, data_type: Optional[DataType], endpoint: str) -> bool:
+        """Check whether an entry is market data governed by trading sessions"""
+        return data_type in [
+            DataType.STOCK_DAILY_PRICES,
+            DataType.STOCK_FUNDAMENTALS,
+        ] or any(
+            term in endpoint.lower()
+            for term in ["historical", "quote", "price", "market"]
+        )
+
+    def _get_stale_window(
+        self, data_type: Optional[DataType] = None, endpoint: str = ""
+    ) -> int:
+        """
+        Get the bounded stale window (seconds past TTL) for an entry
+
+        Market data follows the trading session (short while the market is
+        open); everything else uses the static max_stale_seconds.
+        """
+        if (
+            self.use_trading_session_ttl
+            and self.trading_session_manager
+            and self._is_market_data(data_type, endpoint)
+        ):
+            try:
+                return self.trading_session_manager.get_max_stale_seconds()
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to get trading session stale window: {e}, using fallback"
+                )
+
+        return self.max_stale_seconds
+
     def _get_dynamic_ttl(
         self, data_type: Optional[DataType] = None, endpoint: str = ""
     ) -> int:
@@ -105,15 +176,7 @@ class UnifiedCache:
         # Use trading session TTL for market data
         if self.use_trading_session_ttl and self.trading_session_manager:
             # Check if this is market-related data
-            is_market_data = data_type in [
-                DataType.STOCK_DAILY_PRICES,
-                DataType.STOCK_FUNDAMENTALS,
-            ] or any(
-                term in endpoint.lower()
-                for term in ["historical", "quote", "price", "market"]
-            )
-
-            if is_market_data:
+            if self._is_market_data(data_type, endpoint):
                 try:
                     session_ttl = self.trading_session_manager.get_cache_ttl_seconds()
                     self.logger.debug(
@@ -138,23 +201,42 @@ class UnifiedCache:
         Returns:
             Cached data if found and not expired, None otherwise
         """
+        entry = self.get_entry(key, allow_stale=False)
+        return entry["data"] if entry else None
+
+    def get_entry(self, key: str, allow_stale: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a cached entry together with its freshness metadata.
+
+        Args:
+            key: Cache key (MD5 hash)
+            allow_stale: Return entries past their TTL but within the stale window
+
+        Returns:
+            Dict with "data" and "freshness" keys, or None on a miss
+        """
         # Parse key to determine data type for dynamic TTL
         symbol, data_type, endpoint = self._parse_cache_key(key)
         effective_ttl = self._get_dynamic_ttl(data_type, endpoint or "")
+        stale_window = self._get_stale_window(data_type, endpoint or "")
+        servable = ("fresh", "stale") if allow_stale else ("fresh",)
 
         # Check in-memory cache first
         if key in self._memory_cache:
             cached_entry = self._memory_cache[key]
             cached_time = datetime.fromisoformat(cached_entry["timestamp"])
+            freshness = describe_freshness(cached_time, effective_ttl, stale_window)
 
             # Check TTL using dynamic TTL
-            if datetime.now() - cached_time <= timedelta(seconds=effective_ttl):
+            if freshness["status"] in servable:
                 self.logger.debug(
-                    f"Memory cache hit for key: {key[:8]}... (TTL: {effective_ttl}s)"
+                    f"Memory cache {freshness['status']} hit for key: {key[:8]}... "
+                    f"(TTL: {effective_ttl}s)"
                 )
-                return cached_entry["data"]
-            else:
-                # Expired, remove from memory cache
+                return {"data": cached_entry["data"], "freshness": freshness}
+
+            if freshness["status"] == "expired":
+                # Beyond the stale window, remove from memory cache
                 self.logger.debug(
                     f"Memory cache expired for key: {key[:8]}... (TTL: {effective_ttl}s)"
                 )
@@ -167,8 +249,9 @@ class UnifiedCache:
 
         try:
             # Query recent data from historical storage using dynamic TTL
+            lookback = effective_ttl + (stale_window if allow_stale else 0)
             end_date = datetime.now()
-            start_date = end_date - timedelta(seconds=effective_ttl)
+            start_date = end_date - timedelta(seconds=lookback)
 
             results = self.hdm.retrieve_data(
                 symbol=symbol,
@@ -182,11 +265,13 @@ class UnifiedCache:
                 # Return the most recent result
                 latest_result = results[-1]
 
-                # Check if it's within dynamic TTL
+                # Check if it's within dynamic TTL (or the stale window)
                 result_date = datetime.fromisoformat(latest_result["date"])
-                if datetime.now() - result_date <= timedelta(seconds=effective_ttl):
+                freshness = describe_freshness(result_date, effective_ttl, stale_window)
+                if freshness["status"] in servable:
                     self.logger.debug(
-                        f"Historical cache hit for {symbol} {data_type.value} (TTL: {effective_ttl}s)"
+                        f"Historical cache {freshness['status']} hit for {symbol} "
+                        f"{data_type.value} (TTL: {effective_ttl}s)"
                     )
 
                     # Store in memory cache for faster access
@@ -198,9 +283,10 @@ class UnifiedCache:
                             "data_type": data_type,
                             "endpoint": endpoint,
                         },
+                        cached_time=result_date,
                     )
 
-                    return latest_result["data"]
+                    return {"data": latest_result["data"], "freshness": freshness}
 
         except Exception as e:
             self.logger.warning(f"Failed to retrieve from historical storage: {e}")
@@ -250,9 +336,16 @@ class UnifiedCache:
             self.logger.warning(f"Failed to process cache set operation: {e}")
 
     def _add_to_memory_cache(
-        self, key: str, data: Dict[str, Any], key_info: Dict[str, Any]
+        self,
+        key: str,
+        data: Dict[str, Any],
+        key_info: Dict[str, Any],
+        cached_time: Optional[datetime] = None,
     ) -> None:
         """Add entry to memory cache with LRU eviction"""
+        # Re-inserting a key moves it to the end of the eviction order
+        self._memory_cache.pop(key, None)
+
         # Implement simple LRU by removing oldest entry if cache is full
         if len(self._memory_cache) >= self._memory_cache_size:
             # Remove oldest entry (first in dict)
@@ -260,7 +353,7 @@ class UnifiedCache:
             del self._memory_cache[oldest_key]
 
         self._memory_cache[key] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": (cached_time or datetime.now()).isoformat(),
             "data": data,
             "key_info": key_info,
         }
@@ -318,7 +411,7 @@ class UnifiedCache:
         self.logger.info("Memory cache cleared")
 
     def cleanup_expired(self) -> None:
-        """Remove expired entries from memory cache using dynamic TTL"""
+        """Remove entries past TTL and stale window from memory cache"""
         now = datetime.now()
         expired_keys = []
 
@@ -330,8 +423,9 @@ class UnifiedCache:
             data_type = key_info.get("data_type")
             endpoint = key_info.get("endpoint", "")
             effective_ttl = self._get_dynamic_ttl(data_type, endpoint)
+            stale_window = self._get_stale_window(data_type, endpoint)
 
-            if now - cached_time > timedelta(seconds=effective_ttl):
+            if now - cached_time > timedelta(seconds=effective_ttl + stale_window):
                 expired_keys.append(key)
 
         for key in expired_keys:
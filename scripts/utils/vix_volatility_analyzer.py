@@ -15,7 +15,8 @@ Provides institutional-grade volatility intelligence for trading and risk manage
 
 import sys
 import warnings
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -27,6 +28,13 @@ from scipy.optimize import minimize
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
+# A move of this many VIX points ends the current regime run
+REGIME_SHIFT_POINTS = 3.0
+MAX_REGIME_DURATION_DAYS = 180  # Regime duration cap (6 months)
+
+# Trailing observations per point in rolling analytics (one trading year)
+DEFAULT_ROLLING_WINDOW = 252
+
 
 @dataclass
 class VolatilityRegime:
@@ -66,6 +74,105 @@ class VolatilityForecast:
     key_assumptions: List[str]  # Critical forecast assumptions
 
 
+@dataclass
+class RollingVolatilityAnalytics:
+    """Regime and mean reversion metrics for every point of a VIX history"""
+
+    window: int  # Trailing observations per point (fewer at the start)
+    vix: np.ndarray
+    regime_type: np.ndarray
+    percentile_rank: np.ndarray
+    regime_duration_days: np.ndarray
+    regime_probability: np.ndarray
+    mean_reversion_speed: np.ndarray
+    half_life_days: np.ndarray
+    stability_score: np.ndarray
+    dates: Optional[List[str]] = None
+
+    def regime_at(self, index: int = -1) -> VolatilityRegime:
+        """Snapshot regime for one point of the history"""
+        return VolatilityRegime(
+            regime_type=str(self.regime_type[index]),
+            regime_probability=float(self.regime_probability[index]),
+            vix_level=float(self.vix[index]),
+            percentile_rank=float(self.percentile_rank[index]),
+            regime_duration_days=int(self.regime_duration_days[index]),
+            mean_reversion_speed=float(self.mean_reversion_speed[index]),
+            stability_score=float(self.stability_score[index]),
+        )
+
+    def regime_transitions(self) -> List[Dict[str, Any]]:
+        """Every change of regime type, in order"""
+        changes = np.flatnonzero(self.regime_type[1:] != self.regime_type[:-1]) + 1
+        return [
+            {
+                "index": int(i),
+                "date": self.dates[i] if self.dates else None,
+                "from_regime": str(self.regime_type[i - 1]),
+                "to_regime": str(self.regime_type[i]),
+                "vix_level": float(self.vix[i]),
+            }
+            for i in changes
+        ]
+
+    def to_dict(self, recent_transitions: int = 10) -> Dict[str, Any]:
+        """Column-oriented series for charts and backtests"""
+        regimes, counts = np.unique(self.regime_type, return_counts=True)
+        transitions = self.regime_transitions()
+        return {
+            "window": self.window,
+            "observations": len(self.vix),
+            "dates": self.dates,
+            "series": {
+                "vix": self.vix.round(4).tolist(),
+                "regime_type": self.regime_type.tolist(),
+                "percentile_rank": self.percentile_rank.round(4).tolist(),
+                "regime_duration_days": self.regime_duration_days.tolist(),
+                "regime_probability": self.regime_probability.round(4).tolist(),
+                "mean_reversion_speed": self.mean_reversion_speed.round(6).tolist(),
+                "half_life_days": self.half_life_days.round(4).tolist(),
+                "stability_score": self.stability_score.round(4).tolist(),
+            },
+            "regime_distribution": {
+                str(regime): round(int(count) / len(self.vix), 4)
+                for regime, count in zip(regimes, counts)
+            },
+            "transition_count": len(transitions),
+            "recent_transitions": transitions[-recent_transitions:],
+            "latest": asdict(self.regime_at(-1)) if len(self.vix) else None,
+        }
+
+
+def _range_sums(values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Sums of values[lo[t]:hi[t]] for every t from one prefix sum"""
+    prefix = np.concatenate(([0.0], np.cumsum(values)))
+    return prefix[hi] - prefix[lo]
+
+
+def _rolling_percentile_rank(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Percentile rank of each value within its trailing window
+
+    Matches scipy.stats.percentileofscore(kind="rank"); the window is kept
+    sorted and updated with one insert and one delete per step.
+    """
+    series = values.tolist()
+    ranks = np.empty(len(series))
+    sorted_window: List[float] = []
+
+    for t, value in enumerate(series):
+        if t >= window:
+            del sorted_window[bisect_left(sorted_window, series[t - window])]
+        insort(sorted_window, value)
+        left = bisect_left(sorted_window, value)
+        right = bisect_right(sorted_window, value)
+        ranks[t] = (
+            (left + right + (1 if right > left else 0)) * 50.0 / len(sorted_window)
+        )
+
+    return ranks
+
+
 class VIXVolatilityAnalyzer:
     """
     Comprehensive VIX volatility analysis engine
@@ -123,7 +230,10 @@ class VIXVolatilityAnalyzer:
         }
 
     def analyze_volatility_environment(
-        self, vix_data: Dict[str, Any], market_data: Optional[Dict[str, Any]] = None
+        self,
+        vix_data: Dict[str, Any],
+        market_data: Optional[Dict[str, Any]] = None,
+        rolling_window: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Comprehensive volatility environment analysis
@@ -131,6 +241,8 @@ class VIXVolatilityAnalyzer:
         Args:
             vix_data: Historical VIX data with observations
             market_data: Optional market context data (S&P 500, etc.)
+            rolling_window: Also return rolling analytics over the full
+                history with this trailing window (see analyze_rolling_volatility)
 
         Returns:
             Dictionary containing complete volatility analysis
@@ -169,7 +281,7 @@ class VIXVolatilityAnalyzer:
             # Risk management metrics
             risk_metrics = self._calculate_risk_metrics(vix_series, volatility_regime)
 
-            return {
+            result = {
                 "volatility_regime": volatility_regime,
                 "current_vix_level": float(current_vix),
                 "term_structure_analysis": term_structure,
@@ -188,6 +300,15 @@ class VIXVolatilityAnalyzer:
                 ),
             }
 
+            if rolling_window:
+                result["rolling_analytics"] = self.calculate_rolling_analytics(
+                    vix_series,
+                    rolling_window,
+                    self._extract_vix_dates(vix_data, len(vix_series)),
+                ).to_dict()
+
+            return result
+
         except Exception as e:
             return {
                 "error": f"Volatility analysis failed: {str(e)}",
@@ -235,6 +356,184 @@ class VIXVolatilityAnalyzer:
             # Return default VIX series on error
             return np.array([20.0, 19.5, 21.2, 18.8, 22.1])
 
+    def _extract_vix_dates(
+        self, vix_data: Dict[str, Any], length: int
+    ) -> Optional[List[str]]:
+        """Dates aligned with _extract_vix_series (None if any are missing)"""
+        dates = [
+            obs.get("date")
+            for obs in vix_data.get("observations", [])
+            if "value" in obs and obs["value"] != "." and obs["value"] is not None
+        ]
+        if len(dates) != length or not all(dates):
+            return None
+        return [str(date) for date in dates]
+
+    def analyze_rolling_volatility(
+        self, vix_data: Dict[str, Any], window: int = DEFAULT_ROLLING_WINDOW
+    ) -> RollingVolatilityAnalytics:
+        """
+        Regime, mean reversion and stability metrics over the full history
+
+        Args:
+            vix_data: Historical VIX data with observations
+            window: Trailing observations analyzed at each point
+
+        Returns:
+            RollingVolatilityAnalytics with one value per observation
+        """
+        vix_series = self._extract_vix_series(vix_data)
+        return self.calculate_rolling_analytics(
+            vix_series, window, self._extract_vix_dates(vix_data, len(vix_series))
+        )
+
+    def calculate_rolling_analytics(
+        self,
+        vix_series: np.ndarray,
+        window: int = DEFAULT_ROLLING_WINDOW,
+        dates: Optional[List[str]] = None,
+    ) -> RollingVolatilityAnalytics:
+        """
+        Rolling regime analytics in O(n)
+
+        Point t gets the metrics _identify_volatility_regime reports for the
+        trailing window ending at t (the whole history so far while it is
+        shorter than the window). Window sums come from prefix sums of the
+        centred series, so every metric is updated in constant time per
+        point; regime duration scans at most MAX_REGIME_DURATION_DAYS lags
+        and percentile ranks use a sorted trailing window.
+        """
+        if window < 1:
+            raise ValueError(f"window must be positive, got {window}")
+        vix = np.asarray(vix_series, dtype=np.float64)
+        if dates is not None and len(dates) != len(vix):
+            raise ValueError(f"Got {len(dates)} dates for {len(vix)} observations")
+
+        index = np.arange(len(vix))
+        starts = np.maximum(0, index - window + 1)
+        lengths = index - starts + 1
+        # Centred values keep the prefix sums well conditioned
+        centred = vix - vix.mean() if len(vix) else vix
+
+        regime_type = self._classify_vix_regimes(vix)
+        speed = self._rolling_mean_reversion_speed(centred, starts, lengths)
+
+        return RollingVolatilityAnalytics(
+            window=window,
+            vix=vix,
+            regime_type=regime_type,
+            percentile_rank=_rolling_percentile_rank(vix, window),
+            regime_duration_days=self._rolling_regime_duration(vix, lengths),
+            regime_probability=self._rolling_regime_probability(
+                vix, centred, regime_type, lengths
+            ),
+            mean_reversion_speed=speed,
+            half_life_days=np.log(2) / speed,
+            stability_score=self._rolling_regime_stability(vix, centred, lengths),
+            dates=dates,
+        )
+
+    def _classify_vix_regimes(self, vix: np.ndarray) -> np.ndarray:
+        """Threshold regime for every VIX level ("normal" outside all bands)"""
+        names = list(self.vix_regime_thresholds) + ["normal"]
+        regime_type = np.full(len(vix), "normal", dtype=f"<U{max(map(len, names))}")
+        unassigned = np.ones(len(vix), dtype=bool)
+
+        for regime, (min_vix, max_vix) in self.vix_regime_thresholds.items():
+            match = unassigned & (vix >= min_vix) & (vix < max_vix)
+            regime_type[match] = regime
+            unassigned &= ~match
+
+        return regime_type
+
+    def _rolling_regime_duration(
+        self, vix: np.ndarray, lengths: np.ndarray
+    ) -> np.ndarray:
+        """Days each point's level has persisted within its window"""
+        index = np.arange(len(vix))
+        duration = np.ones(len(vix), dtype=np.int64)
+        in_regime = lengths >= 5
+
+        for lag in range(1, MAX_REGIME_DURATION_DAYS):
+            previous = vix[np.maximum(index - lag, 0)]
+            in_regime &= (lag < lengths) & (
+                np.abs(previous - vix) < REGIME_SHIFT_POINTS
+            )
+            if not in_regime.any():
+                break
+            duration += in_regime
+
+        return duration
+
+    def _rolling_regime_probability(
+        self,
+        vix: np.ndarray,
+        centred: np.ndarray,
+        regime_type: np.ndarray,
+        lengths: np.ndarray,
+    ) -> np.ndarray:
+        """Regime classification probability for every point"""
+        centers = np.empty(len(vix))
+        half_widths = np.empty(len(vix))
+        for regime, (min_vix, max_vix) in self.vix_regime_thresholds.items():
+            match = regime_type == regime
+            centers[match] = (min_vix + max_vix) / 2
+            half_widths[match] = (max_vix - min_vix) / 2
+
+        distance_from_center = np.abs(vix - centers) / half_widths
+        probability = np.maximum(0.5, 1.0 - distance_from_center * 0.3)
+
+        # Stability adjustment from the last five observations
+        index = np.arange(len(vix))
+        lo = np.maximum(0, index - 4)
+        mean = _range_sums(centred, lo, index + 1) / 5
+        variance = _range_sums(centred**2, lo, index + 1) / 5 - mean**2
+        recent_volatility = np.sqrt(np.maximum(variance, 0.0))
+        adjustment = np.maximum(0.0, 0.2 * (1.0 - recent_volatility / 5.0))
+        probability = np.where(lengths >= 5, probability + adjustment, probability)
+
+        return np.clip(probability, 0.5, 0.95)
+
+    def _rolling_mean_reversion_speed(
+        self, centred: np.ndarray, starts: np.ndarray, lengths: np.ndarray
+    ) -> np.ndarray:
+        """AR(1) mean reversion speed of every trailing window"""
+        default_speed = self.mean_reversion_params["reversion_speed"]
+        speed = np.full(len(centred), float(default_speed))
+        if len(centred) < 2:
+            return speed
+
+        # Pairs (x[j], x[j + 1]) for j in [start, t - 1] regress y on x
+        x, y = centred[:-1], centred[1:]
+        lo, hi = starts, np.arange(len(centred))
+        pairs = np.maximum(lengths - 1, 1)
+        sum_x = _range_sums(x, lo, hi)
+        sum_y = _range_sums(y, lo, hi)
+        sxx = _range_sums(x * x, lo, hi) - sum_x**2 / pairs
+        sxy = _range_sums(x * y, lo, hi) - sum_x * sum_y / pairs
+
+        fitted = (lengths >= 10) & (sxx > 1e-12)
+        beta = np.divide(sxy, sxx, out=np.zeros_like(sxx), where=fitted)
+        reverting = fitted & (beta > 0) & (beta < 1)
+        speed[reverting] = -np.log(beta[reverting])
+
+        return np.clip(speed, 0.001, 0.1)
+
+    def _rolling_regime_stability(
+        self, vix: np.ndarray, centred: np.ndarray, lengths: np.ndarray
+    ) -> np.ndarray:
+        """Coefficient-of-variation stability of the last ten observations"""
+        index = np.arange(len(vix))
+        recent = np.minimum(lengths, 10)
+        lo = index - recent + 1
+        centred_mean = _range_sums(centred, lo, index + 1) / recent
+        variance = _range_sums(centred**2, lo, index + 1) / recent - centred_mean**2
+        mean_vix = centred_mean + (vix.mean() if len(vix) else 0.0)
+
+        cv = np.sqrt(np.maximum(variance, 0.0)) / np.where(mean_vix > 0, mean_vix, 1.0)
+        stability = np.clip(np.maximum(0.0, 1.0 - cv * 2.0), 0.0, 1.0)
+        return np.where((lengths >= 5) & (mean_vix > 0), stability, 0.5)
+
     def _identify_volatility_regime(
         self, vix_series: np.ndarray, current_vix: float
     ) -> VolatilityRegime:
@@ -756,16 +1055,15 @@ class VIXVolatilityAnalyzer:
             return 1
 
         # Find regime boundaries by looking for significant changes
-        regime_threshold = 3.0  # VIX points
         days_in_regime = 1
 
         for i in range(len(vix_series) - 2, -1, -1):
-            if abs(vix_series[i] - current_vix) < regime_threshold:
+            if abs(vix_series[i] - current_vix) < REGIME_SHIFT_POINTS:
                 days_in_regime += 1
             else:
                 break
 
-        return min(days_in_regime, 180)  # Cap at 6 months
+        return min(days_in_regime, MAX_REGIME_DURATION_DAYS)
 
     def _calculate_regime_probability(
         self, current_vix: float, regime_type: str, vix_series: np.ndarray
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Base Service Resilience Unit Tests
+
+Covers circuit breaker and retry integration in BaseFinancialService:
+- Jittered backoff delays from the shared RetryHandler
+- Open circuits failing fast to the last good response or fallback
+- Client errors not tripping the circuit
+- Hedged requests fired after the p95-derived delay
+- Breaker and latency state exposed through health_check
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from services.base_financial_service import (
+    BaseFinancialService,
+    CacheConfig,
+    DataNotFoundError,
+    FinancialServiceError,
+    HistoricalStorageConfig,
+    RateLimitConfig,
+    ResilienceConfig,
+    ServiceConfig,
+    ServiceUnavailableError,
+)
+
+
+class ConcreteFinancialService(BaseFinancialService):
+    """Concrete implementation of BaseFinancialService for testing purposes"""
+
+    def _validate_response(self, data: Dict[str, Any], endpoint: str) -> Dict[str, Any]:
+        return data
+
+
+class FallbackFinancialService(ConcreteFinancialService):
+    """Service providing a degraded fallback response"""
+
+    def _get_fallback_response(self, endpoint: str) -> Dict[str, Any]:
+        return {"endpoint": endpoint, "fallback": True}
+
+
+def _response(payload=None, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload or {}
+    if status_code >= 400:
+        error = requests.exceptions.HTTPError(f"{status_code} error")
+        error.response = response
+        response.raise_for_status.side_effect = error
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+def _make_service(tmp_path, service_cls=ConcreteFinancialService, **resilience):
+    config = ServiceConfig(
+        name="resilience_test",
+        base_url="https://test-api.example.com",
+        api_key="test_api_key",
+        max_retries=3,
+        cache=CacheConfig(enabled=False, cache_dir=str(tmp_path)),
+        rate_limit=RateLimitConfig(enabled=False),
+        historical_storage=HistoricalStorageConfig(enabled=False),
+        resilience=ResilienceConfig(**resilience),
+    )
+    return service_cls(config)
+
+
+class TestCircuitBreakerIntegration:
+    """Test circuit breaking in the request path"""
+
+    def test_retries_use_jittered_backoff(self, tmp_path):
+        service = _make_service(
+            tmp_path, failure_threshold=10, backoff_initial_delay=0.4
+        )
+        service.session.get = Mock(
+            side_effect=requests.exceptions.ConnectionError("down")
+        )
+
+        with patch("services.base_financial_service.time.sleep") as sleep:
+            with pytest.raises(FinancialServiceError):
+                service._make_request_with_retry("quote", {"symbol": "AAPL"})
+
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert len(delays) == 3
+        # Jitter keeps each delay within [50%, 100%] of the exponential step
+        for attempt, delay in enumerate(delays):
+            assert 0.2 * 2**attempt <= delay <= 0.4 * 2**attempt
+
+    def test_open_circuit_stops_retrying_and_fails_fast(self, tmp_path):
+        service = _make_service(tmp_path, failure_threshold=2)
+        service.session.get = Mock(side_effect=requests.exceptions.Timeout("slow"))
+
+        with patch("services.base_financial_service.time.sleep"):
+            with pytest.raises(ServiceUnavailableError):
+                service._make_request_with_retry("quote", {"symbol": "AAPL"})
+
+            # Only the attempts before the circuit opened reached the host
+            assert service.session.get.call_count == 2
+
+            with pytest.raises(ServiceUnavailableError):
+                service._make_request_with_retry("quote", {"symbol": "MSFT"})
+            assert service.session.get.call_count == 2
+
+        status = service.health_check()["resilience"]["circuit_breaker"]
+        assert status["state"] == "open"
+        assert status["metrics"]["circuit_breaker_trips"] == 1
+
+    def test_open_circuit_serves_last_good_response(self, tmp_path):
+        service = _make_service(tmp_path, failure_threshold=1)
+        service.session.get = Mock(return_value=_response({"price": 101.5}))
+        first = service._make_request_with_retry("quote", {"symbol": "AAPL"})
+
+        service.session.get = Mock(side_effect=requests.exceptions.ConnectionError())
+        with patch("services.base_financial_service.time.sleep"):
+            again = service._make_request_with_retry("quote", {"symbol": "AAPL"})
+
+        assert again == first == {"price": 101.5}
+        assert service.session.get.call_count == 1
+
+    def test_open_circuit_uses_service_fallback(self, tmp_path):
+        service = _make_service(
+            tmp_path, service_cls=FallbackFinancialService, failure_threshold=1
+        )
+        service.session.get = Mock(side_effect=requests.exceptions.ConnectionError())
+
+        with patch("services.base_financial_service.time.sleep"):
+            result = service._make_request_with_retry("quote", {"symbol": "AAPL"})
+
+        assert result == {"endpoint": "quote", "fallback": True}
+
+    def test_client_errors_do_not_trip_circuit(self, tmp_path):
+        service = _make_service(tmp_path, failure_threshold=1)
+        service.session.get = Mock(return_value=_response(status_code=404))
+
+        for _ in range(3):
+            with pytest.raises(DataNotFoundError):
+                service._make_request_with_retry("quote", {"symbol": "NOPE"})
+
+        assert service.circuit_breaker.get_status()["state"] == "closed"
+
+    def test_circuit_breaker_can_be_disabled(self, tmp_path):
+        service = _make_service(tmp_path, circuit_breaker_enabled=False)
+        service.session.get = Mock(side_effect=requests.exceptions.ConnectionError())
+
+        with patch("services.base_financial_service.time.sleep"):
+            with pytest.raises(FinancialServiceError):
+                service._make_request_with_retry("quote", {"symbol": "AAPL"})
+
+        assert service.session.get.call_count == 4
+        assert service.health_check()["resilience"]["circuit_breaker"] is None
+
+
+class TestHedgedRequests:
+    """Test hedged requests for latency-sensitive endpoints"""
+
+    def test_slow_primary_is_hedged(self, tmp_path):
+        service = _make_service(
+            tmp_path,
+            hedging_enabled=True,
+            hedged_endpoints=["quote"],
+            hedge_default_delay_seconds=0.05,
+        )
+        calls = []
+        lock = threading.Lock()
+
+        def get(url, params=None, timeout=None):
+            with lock:
+                calls.append(time.perf_counter())
+                first = len(calls) == 1
+            time.sleep(0.5 if first else 0.01)
+            return _response({"price": 1.0 if first else 2.0})
+
+        service.session.get = Mock(side_effect=get)
+
+        start = time.perf_counter()
+        result = service._make_request_with_retry("quote", {"symbol": "AAPL"})
+
+        assert time.perf_counter() - start < 0.4
+        assert result == {"price": 2.0}
+        assert len(calls) == 2
+        hedging = service.get_resilience_status()["hedging"]
+        assert hedging["hedged_requests"] == 1
+        assert hedging["hedge_wins"] == 1
+
+    def test_fast_primary_is_not_hedged(self, tmp_path):
+        service = _make_service(
+            tmp_path, hedging_enabled=True, hedge_default_delay_seconds=0.5
+        )
+        service.session.get = Mock(return_value=_response({"price": 1.0}))
+
+        service._make_request_with_retry("quote", {"symbol": "AAPL"})
+
+        assert service.session.get.call_count == 1
+        assert service.get_resilience_status()["hedging"]["hedged_requests"] == 0
+
+    def test_hedge_delay_tracks_latency_percentile(self, tmp_path):
+        service = _make_service(
+            tmp_path,
+            hedging_enabled=True,
+            hedge_min_samples=5,
+            hedge_min_delay_seconds=0.01,
+        )
+        for latency in [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.3]:
+            service._record_latency(latency)
+
+        assert service._get_hedge_delay() == pytest.approx(0.3)
+
+    def test_hedging_limited_to_configured_endpoints(self, tmp_path):
+        service = _make_service(
+            tmp_path, hedging_enabled=True, hedged_endpoints=["quote"]
+        )
+
+        assert service._should_hedge("/v3/quote/AAPL")
+        assert not service._should_hedge("/v3/income-statement/AAPL")
+
+
+class TestResilienceHealthCheck:
+    """Test resilience state in health_check"""
+
+    def test_health_check_reports_latency(self, tmp_path):
+        service = _make_service(tmp_path)
+        service.session.get = Mock(return_value=_response({"price": 1.0}))
+
+        service._make_request_with_retry("quote", {"symbol": "AAPL"})
+        resilience = service.health_check()["resilience"]
+
+        assert resilience["latency"]["samples"] == 1
+        assert resilience["latency"]["p95_ms"] is not None
+        assert resilience["circuit_breaker"]["state"] == "closed"
+        assert resilience["hedging"]["enabled"] is False
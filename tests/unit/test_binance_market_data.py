@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Binance Market Data Unit Tests
+
+Covers the crypto market-data layer of BinanceAPIService against a local
+stub HTTP server:
+- Concurrent per-symbol market summaries with failed symbols isolated
+- Paginated klines backfill resuming from the last stored candle
+- Columnar candle store per symbol and interval
+- Array-based candle statistics
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from services.base_financial_service import (
+    CacheConfig,
+    HistoricalStorageConfig,
+    RateLimitConfig,
+    ServiceConfig,
+)
+from services.binance_api import (
+    INTERVAL_MILLISECONDS,
+    BinanceAPIService,
+    BinanceKlineStore,
+    calculate_candle_statistics,
+    klines_to_columns,
+)
+
+HOUR = INTERVAL_MILLISECONDS["1h"]
+START = 1_700_000_000_000 - 1_700_000_000_000 % HOUR
+
+
+def _kline(open_time, close):
+    return [
+        open_time,
+        f"{close - 1:.2f}",
+        f"{close + 2:.2f}",
+        f"{close - 2:.2f}",
+        f"{close:.2f}",
+        "10.5",
+        open_time + HOUR - 1,
+        "1000.0",
+        42,
+        "5.0",
+        "500.0",
+        "0",
+    ]
+
+
+class StubBinance:
+    """In-process Binance API stub recording requests and concurrency"""
+
+    def __init__(self):
+        self.klines = {}
+        self.tickers = {}
+        self.requests = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def add_candles(self, symbol, count, start=START, base=100.0):
+        rows = self.klines.setdefault(symbol, [])
+        rows.extend(_kline(start + i * HOUR, base + i) for i in range(count))
+
+    def add_ticker(self, symbol, price, change_percent, volume):
+        self.tickers[symbol] = {
+            "symbol": symbol,
+            "lastPrice": str(price),
+            "priceChange": str(price * change_percent / 100),
+            "priceChangePercent": str(change_percent),
+            "volume": str(volume),
+            "highPrice": str(price * 1.02),
+            "lowPrice": str(price * 0.98),
+        }
+
+    def handle(self, path, query):
+        with self._lock:
+            self.requests.append((path, query))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            symbol = query.get("symbol")
+            if path == "/api/v3/klines" and symbol in self.klines:
+                start = int(query.get("startTime", 0))
+                end = int(query.get("endTime", 2**62))
+                rows = [row for row in self.klines[symbol] if start <= row[0] <= end]
+                return 200, rows[: int(query.get("limit", 500))]
+            if symbol in self.tickers:
+                ticker = self.tickers[symbol]
+                if path == "/api/v3/ticker/24hr":
+                    return 200, ticker
+                if path == "/api/v3/ticker/price":
+                    return 200, {"symbol": symbol, "price": ticker["lastPrice"]}
+            return 400, {"code": -1121, "msg": "Invalid symbol."}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def stub():
+    state = StubBinance()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            status, payload = state.handle(url.path, query)
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def _service(stub, tmp_path, burst_limit=8, store_dir="klines", cache=False):
+    config = ServiceConfig(
+        name="binance_test",
+        base_url=stub.url,
+        max_retries=0,
+        cache=CacheConfig(enabled=cache, cache_dir=str(tmp_path / "cache")),
+        rate_limit=RateLimitConfig(requests_per_minute=600, burst_limit=burst_limit),
+        historical_storage=HistoricalStorageConfig(enabled=False),
+    )
+    return BinanceAPIService(config, BinanceKlineStore(tmp_path / store_dir))
+
+
+def _kline_requests(stub):
+    return [query for path, query in stub.requests if path == "/api/v3/klines"]
+
+
+class TestMarketSummary:
+    """Test concurrent market summaries"""
+
+    def test_symbols_fetched_concurrently_in_order(self, stub, tmp_path):
+        symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "ADAUSDT"]
+        for i, symbol in enumerate(symbols):
+            stub.add_ticker(symbol, 100.0 * (i + 1), [2.0, -1.0, 0.5, 0.0][i], 1000)
+        stub.delay = 0.2
+
+        start = time.perf_counter()
+        summary = _service(stub, tmp_path).get_market_summary(symbols)
+        elapsed = time.perf_counter() - start
+
+        assert stub.max_in_flight > 1
+        assert elapsed < len(symbols) * 2 * 0.2
+        assert [s["symbol"] for s in summary["symbols"]] == symbols
+        assert summary["symbols"][1]["current_price"] == 200.0
+        overview = summary["market_overview"]
+        assert overview["total_volume_24h"] == 4000.0
+        assert overview["average_change_percent_24h"] == pytest.approx(0.38)
+        assert (overview["symbols_up"], overview["symbols_down"]) == (2, 1)
+
+    def test_failed_symbols_are_isolated(self, stub, tmp_path):
+        stub.add_ticker("BTCUSDT", 65000.0, 1.5, 20)
+
+        summary = _service(stub, tmp_path).get_market_summary(["BTCUSDT", "NOPE"])
+
+        assert [s["symbol"] for s in summary["symbols"]] == ["BTCUSDT"]
+        assert summary["failed_symbols"] == ["NOPE"]
+        assert summary["market_overview"]["total_symbols"] == 1
+
+    def test_burst_limit_bounds_concurrency(self, stub, tmp_path):
+        symbols = [f"S{i}USDT" for i in range(6)]
+        for symbol in symbols:
+            stub.add_ticker(symbol, 1.0, 0.0, 1)
+        stub.delay = 0.05
+
+        _service(stub, tmp_path, burst_limit=2).get_market_summary(symbols)
+
+        assert stub.max_in_flight <= 2
+
+
+class TestKlinesBackfill:
+    """Test paginated, resumable klines backfill"""
+
+    def test_backfill_pages_through_range(self, stub, tmp_path):
+        stub.add_candles("BTCUSDT", 25)
+        end = START + 24 * HOUR
+
+        result = _service(stub, tmp_path).backfill_klines(
+            "BTCUSDT", "1h", START, end, page_limit=10
+        )
+
+        starts = [int(q["startTime"]) for q in _kline_requests(stub)]
+        assert starts == [START, START + 9 * HOUR + 1, START + 19 * HOUR + 1]
+        assert (result["status"], result["pages"]) == ("fetched", 3)
+        assert result["candles_fetched"] == 25
+        assert result["columns"]["close"].tolist() == [100.0 + i for i in range(25)]
+
+    def test_backfill_resumes_from_last_stored_candle(self, stub, tmp_path):
+        stub.add_candles("BTCUSDT", 12)
+        service = _service(stub, tmp_path)
+        service.backfill_klines("BTCUSDT", "1h", START, START + 40 * HOUR, 10)
+
+        # Later candles arrive and the last stored candle is revised
+        stub.klines["BTCUSDT"][-1] = _kline(START + 11 * HOUR, 500.0)
+        stub.add_candles("BTCUSDT", 5, start=START + 12 * HOUR, base=200.0)
+        stub.requests.clear()
+        reloaded = _service(stub, tmp_path)
+        result = reloaded.backfill_klines("BTCUSDT", "1h", START, START + 40 * HOUR, 10)
+
+        requests_made = _kline_requests(stub)
+        assert result["status"] == "resumed"
+        assert int(requests_made[0]["startTime"]) == START + 11 * HOUR
+        assert len(requests_made) == 1
+        closes = result["columns"]["close"]
+        assert len(closes) == 17
+        assert closes[11] == 500.0
+        assert closes[-1] == 204.0
+        assert np.all(np.diff(result["columns"]["open_time"]) == HOUR)
+
+    def test_closed_range_served_from_store(self, stub, tmp_path):
+        stub.add_candles("ETHUSDT", 8)
+        service = _service(stub, tmp_path)
+        service.backfill_klines("ETHUSDT", "1h", START, START + 7 * HOUR)
+        stub.requests.clear()
+
+        result = service.backfill_klines(
+            "ETHUSDT", "1h", START + HOUR, START + 4 * HOUR
+        )
+
+        assert result["status"] == "stored"
+        assert _kline_requests(stub) == []
+        assert result["columns"]["open_time"].tolist() == [
+            START + i * HOUR for i in range(1, 5)
+        ]
+
+    def test_gap_before_coverage_is_filled(self, stub, tmp_path):
+        stub.add_candles("BTCUSDT", 20)
+        service = _service(stub, tmp_path)
+        service.backfill_klines("BTCUSDT", "1h", START + 10 * HOUR, START + 19 * HOUR)
+        stub.requests.clear()
+
+        result = service.backfill_klines(
+            "BTCUSDT", "1h", START, START + 19 * HOUR, page_limit=4
+        )
+        again = service.backfill_klines("BTCUSDT", "1h", START, START + 19 * HOUR)
+
+        gap_requests = _kline_requests(stub)
+        assert int(gap_requests[0]["startTime"]) == START
+        assert all(int(q["endTime"]) < START + 10 * HOUR for q in gap_requests)
+        assert len(result["columns"]["open_time"]) == 20
+        assert again["status"] == "stored"
+
+    def test_pages_bypass_response_cache(self, stub, tmp_path):
+        stub.add_candles("BTCUSDT", 25)
+        stub.add_ticker("BTCUSDT", 65000.0, 1.5, 20)
+        service = _service(stub, tmp_path, cache=True)
+        cached = []
+        real_set = service.cache.set
+
+        def recording_set(key, data, **kwargs):
+            cached.append(key)
+            return real_set(key, data, **kwargs)
+
+        service.cache.set = recording_set
+
+        service.backfill_klines("BTCUSDT", "1h", START, START + 24 * HOUR, 10)
+        assert cached == []
+        assert service._last_good_responses == {}
+
+        service.get_24hr_ticker_stats("BTCUSDT")
+        assert len(cached) == 1
+
+    def test_store_is_per_symbol_and_interval(self, tmp_path):
+        store = BinanceKlineStore(tmp_path)
+        store.merge("btcusdt", "1m", klines_to_columns([_kline(START, 1.0)]), START)
+        store.merge("BTCUSDT", "1M", klines_to_columns([_kline(START, 2.0)]), START)
+
+        reloaded = BinanceKlineStore(tmp_path)
+
+        assert reloaded.candles("BTCUSDT", "1m")["close"].tolist() == [1.0]
+        assert reloaded.candles("BTCUSDT", "1M")["close"].tolist() == [2.0]
+        assert reloaded.get("BTCUSDT", "1m")["covered_from"] == START
+        assert reloaded.get("ETHUSDT", "1m") is None
+
+
+class TestCandleStatistics:
+    """Test array-based candle statistics"""
+
+    def test_columns_from_klines(self):
+        columns = klines_to_columns([_kline(START, 100.0), _kline(START + HOUR, 101)])
+
+        assert columns["open_time"].dtype == np.int64
+        assert columns["close_time"].tolist() == [
+            START + HOUR - 1,
+            START + 2 * HOUR - 1,
+        ]
+        assert columns["high"].tolist() == [102.0, 103.0]
+        assert len(klines_to_columns([])["close"]) == 0
+
+    def test_statistics_match_row_loop(self):
+        rng = np.random.default_rng(7)
+        closes = 100 + np.cumsum(rng.normal(0, 1, 50))
+        klines = [_kline(START + i * HOUR, close) for i, close in enumerate(closes)]
+        columns = klines_to_columns(klines)
+
+        statistics = calculate_candle_statistics(columns)
+
+        rows = [[float(value) for value in row[1:6]] for row in klines]
+        row_closes = [row[3] for row in rows]
+        assert statistics["data_points"] == 50
+        assert statistics["price_change"] == pytest.approx(
+            row_closes[-1] - row_closes[0]
+        )
+        assert statistics["highest_price"] == max(row[1] for row in rows)
+        assert statistics["lowest_price"] == min(row[2] for row in rows)
+        assert statistics["total_volume"] == pytest.approx(50 * 10.5)
+        assert statistics["vwap"] == pytest.approx(np.mean(columns["close"]))
+        returns = np.diff(columns["close"]) / columns["close"][:-1]
+        assert statistics["volatility_percent"] == pytest.approx(
+            np.std(returns, ddof=1) * 100
+        )
+        assert calculate_candle_statistics(klines_to_columns([])) == {}
+
+    def test_price_history_built_from_store(self, stub, tmp_path):
+        now_ms = int(time.time() * 1000)
+        first = now_ms - now_ms % HOUR - 30 * HOUR
+        stub.add_candles("BTCUSDT", 31, start=first)
+
+        history = _service(stub, tmp_path).get_bitcoin_price_history(1)
+
+        summary = history["summary_stats"]
+        assert summary["interval"] == "15m"
+        assert summary["data_points"] == len(history["price_history"]) > 0
+        point = history["price_history"][-1]
+        assert point["close_price"] == summary["end_price"]
+        assert isinstance(point["open_time"], int)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Content Evaluation Bulk Mode Unit Tests
+
+Covers the parallel bulk evaluation subsystem:
+- Precompiled rule set and rule-set version
+- Aggregated scorecard totals and distributions
+- Incremental skipping by content hash, rule-set version and options
+- Failed documents reported and retried on the next run
+- Process pool fan-out
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import content_evaluation_script as evaluation
+from content_evaluation_script import BulkContentEvaluator, ContentEvaluationEngine
+
+DOCUMENT = """---
+title: Example Corp (EXM) Analysis
+description: Fundamental analysis
+author: Analyst
+date: 2025-07-30
+tags: [fundamental]
+---
+# Investment Thesis
+Current P/E Ratio 18.5x with ROE 22.1% and FCF $1.2B. Confidence: 0.9
+Valuation Analysis uses DCF and Comps. Risk Assessment: Probability: 0.35
+Generated: 2025-07-30. Not financial advice.
+"""
+
+
+def _write_documents(directory: Path, count: int):
+    paths = []
+    for i in range(count):
+        path = directory / f"DOC{i}_20250730.md"
+        path.write_text(DOCUMENT + "\n" + "historical trend " * i, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def evaluator(tmp_path):
+    return BulkContentEvaluator(
+        state_file=tmp_path / "state.json", max_workers=2, use_processes=False
+    )
+
+
+class TestRuleSet:
+    """Test the precompiled rule set"""
+
+    def test_rule_set_version_is_stable_hash(self):
+        assert len(evaluation.RULE_SET_VERSION) == 12
+        assert evaluation._rule_set_version() == evaluation.RULE_SET_VERSION
+
+    def test_rule_logic_change_changes_version(self, monkeypatch):
+        def summarize_evaluation(result):
+            return {"overall_score": 0.0}
+
+        monkeypatch.setattr(evaluation, "summarize_evaluation", summarize_evaluation)
+
+        assert evaluation._rule_set_version() != evaluation.RULE_SET_VERSION
+
+    def test_keyword_rules_are_case_insensitive(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("SCENARIO Bear BULL base CASE", encoding="utf-8")
+
+        result = ContentEvaluationEngine().evaluate_content(str(path))
+
+        breakdown = result["evaluation_breakdown"]
+        assert breakdown["market_analysis_quality"]["scenario_coverage"] == 4
+
+
+class TestBulkEvaluation:
+    """Test bulk evaluation runs and scorecards"""
+
+    def test_scorecard_covers_every_document(self, evaluator, tmp_path):
+        paths = _write_documents(tmp_path, 3)
+
+        scorecard = evaluator.run(paths)
+
+        totals = scorecard["totals"]
+        assert totals["documents"] == 3
+        assert totals["evaluated"] == 3
+        assert totals["skipped"] == 0
+        assert sum(scorecard["grade_distribution"].values()) == 3
+        assert len(scorecard["documents"]) == 3
+        scores = [row["overall_score"] for row in scorecard["documents"]]
+        assert scores == sorted(scores)
+        assert scorecard["metadata"]["rule_set_version"] == evaluation.RULE_SET_VERSION
+        assert "methodology_rigor" in scorecard["category_averages"]
+
+    def test_matches_single_document_evaluation(self, evaluator, tmp_path):
+        (path,) = _write_documents(tmp_path, 1)
+
+        scorecard = evaluator.run([path])
+        single = ContentEvaluationEngine().evaluate_content(str(path))
+
+        expected = float(single["overall_assessment"]["overall_score"].split("/")[0])
+        assert scorecard["documents"][0]["overall_score"] == expected
+
+    def test_unchanged_documents_are_skipped(self, evaluator, tmp_path):
+        paths = _write_documents(tmp_path, 3)
+        first = evaluator.run(paths)
+
+        paths[1].write_text(DOCUMENT + "\nrecent update", encoding="utf-8")
+        second = evaluator.run(paths)
+
+        assert second["totals"]["evaluated"] == 1
+        assert second["totals"]["skipped"] == 2
+        assert second["totals"]["scored"] == 3
+        assert second["score_statistics"]["max"] >= first["score_statistics"]["min"]
+
+    def test_rule_set_version_change_reevaluates(
+        self, evaluator, tmp_path, monkeypatch
+    ):
+        paths = _write_documents(tmp_path, 2)
+        evaluator.run(paths)
+
+        monkeypatch.setattr(evaluation, "RULE_SET_VERSION", "changed")
+
+        assert evaluator.run(paths)["totals"]["evaluated"] == 2
+
+    def test_option_change_and_force_reevaluate(self, tmp_path):
+        paths = _write_documents(tmp_path, 2)
+        state_file = tmp_path / "state.json"
+        BulkContentEvaluator(state_file=state_file, use_processes=False).run(paths)
+
+        basic = BulkContentEvaluator(
+            evaluation_depth="basic", state_file=state_file, use_processes=False
+        )
+        assert basic.run(paths)["totals"]["evaluated"] == 2
+        assert basic.run(paths)["totals"]["skipped"] == 2
+        assert basic.run(paths, force=True)["totals"]["evaluated"] == 2
+
+    def test_failed_documents_are_reported_and_retried(self, evaluator, tmp_path):
+        paths = _write_documents(tmp_path, 1)
+        missing = tmp_path / "missing.md"
+
+        scorecard = evaluator.run(paths + [missing])
+
+        assert scorecard["totals"]["failed"] == 1
+        assert scorecard["failures"][0]["file"] == str(missing.resolve())
+        missing.write_text(DOCUMENT, encoding="utf-8")
+        assert evaluator.run(paths + [missing])["totals"]["evaluated"] == 1
+
+    def test_scorecard_and_results_written(self, tmp_path):
+        paths = _write_documents(tmp_path, 2)
+        bulk = BulkContentEvaluator(
+            state_file=tmp_path / "state.json",
+            output_dir=tmp_path / "results",
+            use_processes=False,
+        )
+
+        bulk.run(paths, scorecard_path=tmp_path / "scorecard.json")
+
+        assert (tmp_path / "scorecard.json").exists()
+        assert len(list((tmp_path / "results").glob("*_evaluation.json"))) == 2
+
+    def test_process_pool(self, tmp_path):
+        paths = _write_documents(tmp_path, 4)
+        bulk = BulkContentEvaluator(state_file=None, max_workers=2)
+
+        scorecard = bulk.run(paths)
+
+        assert scorecard["totals"]["evaluated"] == 4
+        assert scorecard["failures"] == []
+
+    def test_discover(self, tmp_path):
+        _write_documents(tmp_path, 2)
+        (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+
+        assert len(BulkContentEvaluator.discover(tmp_path)) == 2
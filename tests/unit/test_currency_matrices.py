@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Currency Matrix Unit Tests
+
+Covers CurrencyAnalyzer matrix mode:
+- Observed correlations from aligned rate series, with regime and
+  currency-group estimates where series are missing or too short
+- Carry, carry-to-risk and PPP deviation matrices
+- Matrices cached per as-of date and inputs
+- Currency correlation regime reported by MarketRegimeEngine
+- Pairwise calculate_currency_correlations() built on the same estimates
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from regional_intelligence.currency_analyzer import (
+    MATRIX_CACHE_SIZE,
+    MATRIX_CURRENCIES,
+    MIN_CORRELATION_OBSERVATIONS,
+    CurrencyAnalyzer,
+)
+from utils.market_regime_framework import MarketRegimeEngine
+from utils.regime_model_store import RegimeModelStore
+
+POLICY_RATES = {"USD": 4.33, "EUR": 2.0, "GBP": 4.0, "JPY": 0.5}
+
+
+def _rate_series(days=300, seed=7):
+    """EUR and GBP sharing a common factor, JPY independent (USD per unit)"""
+    rng = np.random.default_rng(seed)
+    common = rng.normal(0, 0.005, days)
+    return {
+        "EUR": 1.10 * np.exp(np.cumsum(common + rng.normal(0, 0.002, days))),
+        "GBP": 1.30 * np.exp(np.cumsum(common + rng.normal(0, 0.002, days))),
+        "JPY": np.exp(np.cumsum(rng.normal(0, 0.006, days))) / 150,
+    }
+
+
+@pytest.fixture
+def analyzer():
+    return CurrencyAnalyzer()
+
+
+class TestCorrelationMatrix:
+    """Test observed and estimated correlations"""
+
+    def test_observed_from_aligned_series(self, analyzer):
+        series = _rate_series()
+        matrices = analyzer.calculate_currency_matrices(series, POLICY_RATES)
+        eur, gbp = matrices.currencies.index("EUR"), matrices.currencies.index("GBP")
+
+        returns = np.diff(
+            np.log(np.column_stack([series["EUR"], series["GBP"]])), axis=0
+        )
+        assert matrices.correlation[eur, gbp] == pytest.approx(
+            np.corrcoef(returns, rowvar=False)[0, 1]
+        )
+        assert matrices.correlation[eur, gbp] > 0.8
+        assert np.allclose(matrices.correlation, matrices.correlation.T)
+        assert np.all(np.diag(matrices.correlation) == 1.0)
+        assert matrices.observations == 299
+        # The dollar moves against the basket of the other currencies
+        assert matrices.pair("USD", "EUR")["correlation"] < -0.5
+
+    def test_missing_series_use_regime_estimates(self, analyzer):
+        matrices = analyzer.calculate_currency_matrices(
+            _rate_series(), market_regime="crisis"
+        )
+        estimates = analyzer.calculate_currency_correlations(
+            list(MATRIX_CURRENCIES), "crisis"
+        )
+        aud, cad = matrices.currencies.index("AUD"), matrices.currencies.index("CAD")
+
+        assert matrices.correlation[aud, cad] == estimates[("CAD", "AUD")] == 0.9
+        assert not matrices.correlation_observed[aud, cad]
+        assert matrices.pair("EUR", "AUD")["correlation"] == -0.1
+
+    def test_short_series_not_observed(self, analyzer):
+        series = {
+            code: values[: MIN_CORRELATION_OBSERVATIONS // 2]
+            for code, values in _rate_series().items()
+        }
+
+        matrices = analyzer.calculate_currency_matrices(series)
+
+        assert not matrices.correlation_observed.any()
+        assert matrices.pair("EUR", "GBP")["correlation"] == 0.6
+
+    def test_misaligned_series_rejected(self, analyzer):
+        series = _rate_series()
+        series["JPY"] = series["JPY"][:-1]
+
+        with pytest.raises(ValueError):
+            analyzer.calculate_currency_matrices(series)
+
+    def test_pairwise_correlations_from_matrix(self, analyzer):
+        correlations = analyzer.calculate_currency_correlations(
+            ["USD", "JPY", "NZD", "SEK"]
+        )
+
+        assert correlations == {
+            ("USD", "JPY"): -0.2,
+            ("USD", "NZD"): -0.1,
+            ("USD", "SEK"): 0.1,
+            ("JPY", "NZD"): -0.1,
+            ("JPY", "SEK"): 0.1,
+            ("NZD", "SEK"): 0.1,
+        }
+        assert analyzer._estimate_default_correlation("AUD", "NOK") == 0.6
+
+
+class TestCarryAndPPP:
+    """Test carry, carry-to-risk and PPP deviation matrices"""
+
+    def test_carry_and_carry_to_risk(self, analyzer):
+        series = _rate_series()
+        matrices = analyzer.calculate_currency_matrices(series, POLICY_RATES)
+        usd_jpy = matrices.pair("USD", "JPY")
+
+        assert usd_jpy["carry"] == pytest.approx(3.83)
+        assert matrices.pair("JPY", "USD")["carry"] == pytest.approx(-3.83)
+        jpy_volatility = np.std(np.diff(np.log(series["JPY"])), ddof=1) * np.sqrt(252)
+        assert usd_jpy["carry_to_risk"] == pytest.approx(3.83 / (jpy_volatility * 100))
+        # No policy rate for CHF, so no carry
+        assert matrices.pair("CHF", "USD")["carry"] is None
+        assert matrices.currency_profile("USD")["best_funding_currency"] == "JPY"
+
+    def test_ppp_deviation_matches_single_currency_analysis(self, analyzer):
+        matrices = analyzer.calculate_currency_matrices(
+            spot_rates={"EUR": 1.08, "GBP": 1.25, "JPY": 1 / 150}
+        )
+
+        assert matrices.pair("EUR", "USD")["ppp_deviation"] == pytest.approx(
+            analyzer._calculate_ppp_deviation("EUR", 1.08), abs=0.05
+        )
+        # Yen PPP of 108 per USD makes 150 per USD about 28% undervalued
+        assert matrices.pair("JPY", "USD")["ppp_deviation"] == pytest.approx(-28.0)
+        eur_gbp = matrices.pair("EUR", "GBP")["ppp_deviation"]
+        gbp_eur = matrices.pair("GBP", "EUR")["ppp_deviation"]
+        assert (1 + eur_gbp / 100) * (1 + gbp_eur / 100) == pytest.approx(1.0)
+        assert matrices.pair("CHF", "USD")["ppp_deviation"] is None
+
+    def test_spot_defaults_to_last_series_value(self, analyzer):
+        series = _rate_series()
+
+        matrices = analyzer.calculate_currency_matrices(series)
+
+        expected = (series["EUR"][-1] / 1.15 - 1) * 100
+        assert matrices.pair("EUR", "USD")["ppp_deviation"] == pytest.approx(expected)
+
+    def test_to_dict_is_json_ready(self, analyzer):
+        data = analyzer.calculate_currency_matrices(
+            _rate_series(), POLICY_RATES, as_of="2026-10-16"
+        ).to_dict()
+
+        assert data["as_of"] == "2026-10-16"
+        assert len(data["correlation"]) == len(MATRIX_CURRENCIES)
+        assert data["carry"][0][data["currencies"].index("CHF")] is None
+
+
+class TestMatrixCache:
+    """Test caching per as-of date"""
+
+    def test_cached_per_as_of_date(self, analyzer):
+        first = analyzer.calculate_currency_matrices(
+            _rate_series(), POLICY_RATES, as_of="2026-10-16"
+        )
+        again = analyzer.calculate_currency_matrices(
+            _rate_series(), dict(POLICY_RATES), as_of="2026-10-16"
+        )
+        next_day = analyzer.calculate_currency_matrices(
+            _rate_series(seed=8), POLICY_RATES, as_of="2026-10-17"
+        )
+        refreshed = analyzer.calculate_currency_matrices(
+            _rate_series(), POLICY_RATES, as_of="2026-10-16", force_refresh=True
+        )
+
+        assert again is first
+        assert next_day is not first
+        assert refreshed is not first
+        assert refreshed.observations == first.observations
+
+    def test_different_inputs_not_served_from_cache(self, analyzer):
+        first = analyzer.calculate_currency_matrices(
+            _rate_series(), POLICY_RATES, as_of="2026-10-16"
+        )
+        without_inputs = analyzer.calculate_currency_matrices(as_of="2026-10-16")
+        other_series = analyzer.calculate_currency_matrices(
+            _rate_series(seed=8), POLICY_RATES, as_of="2026-10-16"
+        )
+        other_rates = analyzer.calculate_currency_matrices(
+            _rate_series(), {**POLICY_RATES, "USD": 9.0}, as_of="2026-10-16"
+        )
+
+        assert without_inputs is not first
+        assert without_inputs.observations == 0
+        assert other_series is not first
+        assert other_rates is not first
+        assert len(analyzer._matrix_cache) == 4
+
+    def test_cache_keeps_latest_dates(self, analyzer):
+        for day in range(1, MATRIX_CACHE_SIZE + 3):
+            analyzer.calculate_currency_matrices(as_of=f"2026-10-{day:02d}")
+
+        dates = sorted(key[0] for key in analyzer._matrix_cache)
+        assert len(dates) == MATRIX_CACHE_SIZE
+        assert dates[0] == "2026-10-03"
+
+
+class TestRegimeEngine:
+    """Test currency matrices consumed by MarketRegimeEngine"""
+
+    def test_currency_correlation_regime(self, analyzer):
+        matrices = analyzer.calculate_currency_matrices(
+            _rate_series(), POLICY_RATES, as_of="2026-10-16"
+        )
+        engine = MarketRegimeEngine(
+            "US", seed=1, model_store=RegimeModelStore(store_dir=None)
+        )
+
+        result = engine.analyze_market_regimes_and_volatility_environment(
+            {}, {"currency_matrices": matrices.to_dict()}
+        )
+
+        regime = result["market_regime_analysis"]["currency_correlation_regime"]
+        n = len(matrices.currencies)
+        pairs = ~np.eye(n, dtype=bool)
+        assert regime["average_absolute_correlation"] == pytest.approx(
+            np.mean(np.abs(matrices.correlation[pairs])), abs=1e-3
+        )
+        assert regime["observed_share"] == pytest.approx(
+            matrices.correlation_observed[pairs].mean(), abs=1e-3
+        )
+        best = regime["best_carry_pair"]
+        assert best["carry_to_risk"] == pytest.approx(
+            np.nanmax(matrices.carry_to_risk), abs=1e-3
+        )
+        i, j = np.unravel_index(
+            np.nanargmax(matrices.carry_to_risk), matrices.carry_to_risk.shape
+        )
+        assert (best["long"], best["funding"]) == (
+            matrices.currencies[i],
+            matrices.currencies[j],
+        )
+
+    def test_without_matrices(self):
+        engine = MarketRegimeEngine("US", model_store=RegimeModelStore(store_dir=None))
+
+        result = engine.analyze_market_regimes_and_volatility_environment({}, {})
+
+        assert result["market_regime_analysis"]["currency_correlation_regime"] is None
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+DASV Cross-Validator Sweep Unit Tests
+
+Covers sweep mode against the local fixture tree (tests/fixtures/dasv_sweep):
+- Region/date discovery and case-insensitive artifact resolution
+- One shared snapshot with every phase file read exactly once
+- Sweep results identical to single-pair pipeline validation
+- Consolidated region x date consistency matrix and summaries
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from utils.dasv_cross_validator import DASVCrossValidator, PhaseSnapshot
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "dasv_sweep"
+
+
+@pytest.fixture
+def validator():
+    return DASVCrossValidator(base_dir=str(FIXTURES_DIR))
+
+
+class TestSnapshot:
+    """Test region/date discovery and snapshot loading"""
+
+    def test_discover_region_dates(self, validator):
+        assert validator.discover_region_dates() == [
+            ("ASIA", "20250906"),
+            ("EUROPE", "20250814"),
+            ("US", "20250814"),
+            ("US", "20250906"),
+        ]
+        assert validator.discover_region_dates(regions=["us"]) == [
+            ("US", "20250814"),
+            ("US", "20250906"),
+        ]
+        assert validator.discover_region_dates(dates=["20250814"]) == [
+            ("EUROPE", "20250814"),
+            ("US", "20250814"),
+        ]
+
+    def test_each_file_read_once(self, validator, monkeypatch):
+        reads = []
+        original = DASVCrossValidator._read_phase_file
+        monkeypatch.setattr(
+            DASVCrossValidator,
+            "_read_phase_file",
+            staticmethod(lambda path: reads.append(path) or original(path)),
+        )
+
+        snapshot = validator.load_snapshot(validator.discover_region_dates())
+
+        assert isinstance(snapshot, PhaseSnapshot)
+        assert len(reads) == len(set(reads)) == snapshot.files_loaded == 12
+        assert snapshot.regions == ["ASIA", "EUROPE", "US"]
+        assert snapshot.dates == ["20250814", "20250906"]
+
+    def test_case_insensitive_synthesis_lookup(self, validator):
+        snapshot = validator.load_snapshot([("EUROPE", "20250814")])
+
+        synthesis = snapshot.get("EUROPE", "20250814")["synthesis"]
+        assert synthesis["file_path"].endswith("europe_20250814.md")
+        assert "synthesis" in validator._load_phase_files("EUROPE", "20250814")
+
+
+class TestSweep:
+    """Test concurrent sweeps and the consistency matrix"""
+
+    def test_sweep_matches_single_pipeline(self, validator):
+        matrix = validator.sweep(max_workers=4)
+
+        for region, date in validator.discover_region_dates():
+            report = validator.validate_full_pipeline(f"{region}_{date}")
+            cell = matrix["matrix"][region][date]
+            assert cell["overall_passed"] == report.overall_passed
+            assert cell["overall_score"] == round(float(report.overall_score), 4)
+            assert cell["blocking_issues"] == report.blocking_issues
+            assert cell["critical_issues"] == report.critical_issues
+
+    def test_matrix_layout(self, validator):
+        matrix = validator.sweep()
+
+        assert matrix["regions"] == ["ASIA", "EUROPE", "US"]
+        assert matrix["dates"] == ["20250814", "20250906"]
+        assert matrix["matrix"]["ASIA"]["20250814"] is None
+        assert matrix["matrix"]["US"]["20250906"]["overall_passed"] is True
+        europe = matrix["matrix"]["EUROPE"]["20250814"]
+        assert europe["phases"]["cross_phase"]["passed"] is False
+        assert (
+            "Business cycle phase mismatch: discovery=contraction, analysis=expansion"
+            in europe["critical_issues"]
+        )
+        assert matrix["phase_scores"]["discovery"]["ASIA"]["20250906"] is None
+        assert matrix["phase_scores"]["cross_phase"]["ASIA"]["20250906"] == 0.0
+
+    def test_summary(self, validator):
+        summary = validator.sweep()["summary"]
+
+        assert (summary["validated"], summary["passed"], summary["failed"]) == (4, 2, 2)
+        assert summary["errors"] == {}
+        assert summary["region_scores"]["US"] == pytest.approx(0.9769, abs=1e-4)
+        assert summary["phase_pass_rates"]["synthesis"] == pytest.approx(
+            2 / 3, abs=1e-4
+        )
+        assert summary["common_violations"][0]["count"] >= 1
+
+    def test_filters_and_explicit_pairs(self, validator):
+        matrix = validator.sweep(region_dates=[("US", "20250814")])
+
+        assert matrix["regions"] == ["US"]
+        assert matrix["dates"] == ["20250814"]
+        assert validator.sweep(regions=["europe"])["regions"] == ["EUROPE"]
+
+    def test_validation_errors_are_reported(self, validator, monkeypatch):
+        def fail(region, date, phase_data):
+            raise ValueError(f"broken {region}")
+
+        monkeypatch.setattr(validator, "validate_phase_data", fail)
+
+        summary = validator.sweep(regions=["ASIA"])["summary"]
+
+        assert summary["errors"] == {"ASIA_20250906": "broken ASIA"}
+        assert summary["validated"] == 0
+
+    def test_matrix_is_json_serializable(self, validator, tmp_path):
+        path = validator.write_consistency_matrix(
+            validator.sweep(), tmp_path / "out" / "matrix.json"
+        )
+
+        assert json.loads(path.read_text())["summary"]["validated"] == 4
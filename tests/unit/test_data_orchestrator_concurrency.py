@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Data Orchestrator Concurrency Unit Tests
+
+Covers concurrent provider fan-out in DataOrchestrator:
+- Providers queried in parallel under a per-call deadline
+- Early return once enough sources agree within the consistency threshold
+- Per-provider latency histograms in returned metadata
+- Multi-ticker batch validation with provider batch methods
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from services.data_orchestrator import DataOrchestrator
+
+
+class FakePriceService:
+    """Price provider with a fixed delay and quote"""
+
+    def __init__(self, prices, delay=0.0, fail=False):
+        self.prices = prices
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+        self.batch_calls = []
+
+    def get_stock_info(self, ticker):
+        self.calls.append(ticker)
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        return {"current_price": self.prices[ticker]}
+
+    def get_batch_quotes(self, tickers):
+        self.batch_calls.append(list(tickers))
+        time.sleep(self.delay)
+        return {
+            ticker: {"current_price": self.prices[ticker]}
+            for ticker in tickers
+            if ticker in self.prices
+        }
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = DataOrchestrator(max_workers=8, default_timeout_seconds=2.0)
+    yield orchestrator
+    orchestrator.close()
+
+
+def _register(orchestrator, **services):
+    for name, service in services.items():
+        orchestrator.register_service(name, service)
+    return {name: "get_stock_info" for name in services}
+
+
+class TestConcurrentValidation:
+    """Test concurrent cross-source price validation"""
+
+    def test_providers_are_called_concurrently(self, orchestrator):
+        source_methods = _register(
+            orchestrator,
+            yahoo=FakePriceService({"AAPL": 200.0}, delay=0.2),
+            fmp=FakePriceService({"AAPL": 200.5}, delay=0.2),
+            alpha=FakePriceService({"AAPL": 200.2}, delay=0.2),
+        )
+
+        start = time.perf_counter()
+        result = orchestrator.validate_cross_source_prices("AAPL", source_methods)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert list(result["price_sources"]) == ["yahoo", "fmp", "alpha"]
+        assert result["price_consistency"] is True
+        assert result["orchestration_metadata"]["early_consensus"] is False
+
+    def test_slow_provider_misses_deadline(self, orchestrator):
+        source_methods = _register(
+            orchestrator,
+            yahoo=FakePriceService({"AAPL": 200.0}),
+            slow=FakePriceService({"AAPL": 200.0}, delay=1.0),
+        )
+
+        start = time.perf_counter()
+        result = orchestrator.validate_cross_source_prices(
+            "AAPL", source_methods, timeout_seconds=0.2
+        )
+
+        assert time.perf_counter() - start < 0.6
+        assert list(result["price_sources"]) == ["yahoo"]
+        assert result["errors"]["slow"] == "Deadline exceeded"
+        assert result["orchestration_metadata"]["timed_out_sources"] == ["slow"]
+
+    def test_early_consensus_ignores_stragglers(self, orchestrator):
+        source_methods = _register(
+            orchestrator,
+            yahoo=FakePriceService({"AAPL": 200.0}),
+            fmp=FakePriceService({"AAPL": 200.4}, delay=0.05),
+            slow=FakePriceService({"AAPL": 150.0}, delay=1.0),
+        )
+
+        start = time.perf_counter()
+        result = orchestrator.validate_cross_source_prices(
+            "AAPL", source_methods, min_agreeing_sources=2
+        )
+
+        assert time.perf_counter() - start < 0.6
+        metadata = result["orchestration_metadata"]
+        assert metadata["early_consensus"] is True
+        assert metadata["skipped_sources"] == ["slow"]
+        assert "slow" not in result["errors"]
+        assert result["price_consistency"] is True
+
+    def test_disagreeing_sources_wait_for_all(self, orchestrator):
+        source_methods = _register(
+            orchestrator,
+            yahoo=FakePriceService({"AAPL": 200.0}),
+            fmp=FakePriceService({"AAPL": 220.0}),
+            alpha=FakePriceService({"AAPL": 200.5}, delay=0.1),
+        )
+
+        result = orchestrator.validate_cross_source_prices(
+            "AAPL", source_methods, min_agreeing_sources=2
+        )
+
+        assert len(result["price_sources"]) == 3
+        assert result["orchestration_metadata"]["early_consensus"] is False
+
+    def test_failures_and_unknown_services_are_reported(self, orchestrator):
+        source_methods = _register(
+            orchestrator,
+            yahoo=FakePriceService({"AAPL": 200.0}),
+            broken=FakePriceService({}, fail=True),
+        )
+        source_methods["missing"] = "get_stock_info"
+
+        result = orchestrator.validate_cross_source_prices("AAPL", source_methods)
+
+        assert result["errors"]["broken"] == "provider unavailable"
+        assert result["errors"]["missing"] == "Service missing not registered"
+        assert len(result["price_sources"]) == 1
+
+    def test_latency_histograms_in_metadata(self, orchestrator):
+        source_methods = _register(
+            orchestrator,
+            yahoo=FakePriceService({"AAPL": 200.0}),
+            fmp=FakePriceService({"AAPL": 200.0}, delay=0.12),
+        )
+
+        orchestrator.validate_cross_source_prices("AAPL", source_methods)
+        result = orchestrator.validate_cross_source_prices("AAPL", source_methods)
+
+        histograms = result["orchestration_metadata"]["latency_histograms"]
+        assert set(histograms) == {"yahoo", "fmp"}
+        assert histograms["fmp"]["count"] == 2
+        assert histograms["fmp"]["buckets"]["le_250ms"] == 2
+        assert histograms["yahoo"]["buckets"]["le_50ms"] == 2
+        assert histograms["fmp"]["p95_ms"] >= 100
+
+
+class TestBatchValidation:
+    """Test multi-ticker batch validation"""
+
+    def test_batch_uses_provider_batch_method(self, orchestrator):
+        prices = {"AAPL": 200.0, "MSFT": 400.0, "NVDA": 120.0}
+        yahoo = FakePriceService(prices, delay=0.1)
+        fmp = FakePriceService({k: v * 1.002 for k, v in prices.items()}, delay=0.1)
+        source_methods = _register(orchestrator, yahoo=yahoo, fmp=fmp)
+
+        start = time.perf_counter()
+        results = orchestrator.validate_cross_source_prices_batch(
+            list(prices), source_methods, batch_methods={"fmp": "get_batch_quotes"}
+        )
+
+        assert time.perf_counter() - start < 0.5
+        assert fmp.batch_calls == [["AAPL", "MSFT", "NVDA"]]
+        assert fmp.calls == []
+        assert sorted(yahoo.calls) == ["AAPL", "MSFT", "NVDA"]
+        for ticker in prices:
+            assert len(results[ticker]["price_sources"]) == 2
+            assert results[ticker]["price_consistency"] is True
+
+    def test_batch_reports_missing_batch_results(self, orchestrator):
+        yahoo = FakePriceService({"AAPL": 200.0, "MSFT": 400.0})
+        fmp = FakePriceService({"AAPL": 200.0})
+        source_methods = _register(orchestrator, yahoo=yahoo, fmp=fmp)
+
+        results = orchestrator.validate_cross_source_prices_batch(
+            ["AAPL", "MSFT"], source_methods, batch_methods={"fmp": "get_batch_quotes"}
+        )
+
+        assert results["MSFT"]["errors"]["fmp"] == "No batch result for MSFT"
+        assert len(results["MSFT"]["price_sources"]) == 1
+
+
+class TestConcurrentComprehensiveAnalysis:
+    """Test concurrent comprehensive analysis"""
+
+    def test_slow_service_does_not_block_others(self, orchestrator):
+        _register(
+            orchestrator,
+            yahoo=FakePriceService({"AAPL": 200.0}),
+            slow=FakePriceService({"AAPL": 200.0}, delay=1.0),
+        )
+        config = {
+            "yahoo": {"method": "get_stock_info"},
+            "slow": {"method": "get_stock_info"},
+        }
+
+        start = time.perf_counter()
+        result = orchestrator.get_comprehensive_analysis(
+            "AAPL", config, timeout_seconds=0.2
+        )
+
+        assert time.perf_counter() - start < 0.6
+        assert result["service_results"]["yahoo"]["status"] == "success"
+        assert result["service_results"]["slow"]["status"] == "error"
+        assert result["metadata"]["timed_out_services"] == ["slow"]
+        assert "yahoo" in result["metadata"]["latency_histograms"]
+
+
+class TestExecutorLifecycle:
+    """Test the shared fan-out pool"""
+
+    def test_executor_reused_and_shut_down_on_close(self, orchestrator):
+        source_methods = _register(
+            orchestrator, yahoo=FakePriceService({"AAPL": 200.0, "MSFT": 400.0})
+        )
+
+        orchestrator.validate_cross_source_prices("AAPL", source_methods)
+        executor = orchestrator._executor
+        orchestrator.validate_cross_source_prices("MSFT", source_methods)
+
+        assert orchestrator._executor is executor
+        orchestrator.close()
+        assert orchestrator._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(time.sleep, 0)
+
+        # A closed orchestrator starts a fresh pool on the next fan-out
+        result = orchestrator.validate_cross_source_prices("AAPL", source_methods)
+        assert result["price_sources"] == {"yahoo": 200.0}
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+FMP Bulk Fundamentals Unit Tests
+
+Covers the bulk layer of FMPService against a local stub HTTP server:
+- Batch quote and profile endpoints with comma-separated symbol chunks
+- Concurrent per-symbol fan-out for statements, key metrics and ratios
+- Persistent store skipping fresh periods and fetching only newly filed ones
+- One DataFrame per run with profile columns and per-symbol errors
+"""
+
+import json
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from services.base_financial_service import (
+    CacheConfig,
+    HistoricalStorageConfig,
+    RateLimitConfig,
+    ServiceConfig,
+    ValidationError,
+)
+from services.fmp import BATCH_SYMBOLS_PER_REQUEST, FMPFundamentalsStore, FMPService
+
+# Latest fiscal year whose annual filing is due (FY ends Dec 31, 90 day lag)
+LATEST_FILED_YEAR = (date.today() - timedelta(days=91)).year - 1
+
+# Value field served per dataset; every dataset also carries calendarYear
+DATASET_FIELDS = {
+    "income-statement": "revenue",
+    "balance-sheet-statement": "totalAssets",
+    "cash-flow-statement": "freeCashFlow",
+    "key-metrics": "peRatio",
+    "ratios": "currentRatio",
+}
+
+
+class StubFMP:
+    """In-process FMP API stub recording requests and concurrency"""
+
+    def __init__(self):
+        self.companies = {}
+        self.error_symbols = set()
+        self.requests = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def add_company(self, symbol, latest_year=LATEST_FILED_YEAR, years=10):
+        self.companies[symbol] = {"latest_year": latest_year, "years": years}
+
+    def handle(self, path, query):
+        with self._lock:
+            self.requests.append((path, query))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            endpoint, _, symbols = path.strip("/").partition("/")
+            if self.error_symbols.intersection(symbols.split(",")):
+                return {"message": "Limit reach. Please upgrade your plan."}
+            if endpoint in ("quote", "profile"):
+                return [
+                    self._snapshot(endpoint, symbol)
+                    for symbol in symbols.split(",")
+                    if symbol in self.companies
+                ]
+            if symbols not in self.companies:
+                return []
+            company = self.companies[symbols]
+            years = range(
+                company["latest_year"],
+                company["latest_year"] - company["years"],
+                -1,
+            )
+            field = DATASET_FIELDS[endpoint]
+            return [
+                {
+                    "date": f"{year}-12-31",
+                    "symbol": symbols,
+                    "calendarYear": str(year) if endpoint == "income-statement" else "",
+                    field: float(year - 2000) * (10 if endpoint == "ratios" else 1),
+                }
+                for year in years
+            ][: int(query["limit"])]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _snapshot(self, endpoint, symbol):
+        if endpoint == "quote":
+            return {"symbol": symbol, "price": 100.0 + len(symbol)}
+        return {
+            "symbol": symbol,
+            "companyName": f"{symbol} Inc.",
+            "sector": "Technology",
+            "industry": "Semiconductors",
+            "mktCap": 1e9,
+        }
+
+
+@pytest.fixture
+def stub():
+    state = StubFMP()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            body = json.dumps(state.handle(url.path, query)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def _service(stub, tmp_path, burst_limit=8, store_dir="store"):
+    config = ServiceConfig(
+        name="fmp_bulk_test",
+        base_url=stub.url,
+        api_key="test_fmp_key",
+        max_retries=0,
+        cache=CacheConfig(enabled=False, cache_dir=str(tmp_path / "cache")),
+        rate_limit=RateLimitConfig(requests_per_minute=600, burst_limit=burst_limit),
+        historical_storage=HistoricalStorageConfig(enabled=False),
+    )
+    return FMPService(config, FMPFundamentalsStore(tmp_path / store_dir))
+
+
+def _requests(stub, endpoint):
+    return [
+        (path, query)
+        for path, query in stub.requests
+        if path.strip("/").partition("/")[0] == endpoint
+    ]
+
+
+class TestBatchEndpoints:
+    """Test quotes and profiles from comma-separated batch requests"""
+
+    def test_quotes_chunked_per_request(self, stub, tmp_path):
+        symbols = [f"S{i:03d}" for i in range(2 * BATCH_SYMBOLS_PER_REQUEST + 5)]
+        for symbol in symbols:
+            stub.add_company(symbol)
+
+        quotes = _service(stub, tmp_path).get_bulk_quotes(symbols)
+
+        assert len(_requests(stub, "quote")) == 3
+        assert len(quotes) == len(symbols)
+        assert quotes.loc["S010", "price"] == 104.0
+        assert quotes.attrs["errors"] == {}
+
+    def test_missing_symbols_reported(self, stub, tmp_path):
+        stub.add_company("AAPL")
+
+        profiles = _service(stub, tmp_path).get_bulk_profiles(["aapl", "NOPE"])
+
+        assert profiles.index.tolist() == ["AAPL"]
+        assert profiles.loc["AAPL", "sector"] == "Technology"
+        assert "NOPE" in profiles.attrs["errors"]
+
+
+class TestBulkFundamentals:
+    """Test the concurrent fundamentals fan-out and combined table"""
+
+    def test_datasets_joined_per_symbol_and_period(self, stub, tmp_path):
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            stub.add_company(symbol)
+
+        table = _service(stub, tmp_path).get_bulk_fundamentals(
+            ["AAPL", "MSFT", "NVDA"], limit=3
+        )
+
+        assert len(table) == 9
+        assert table["symbol"].tolist()[:3] == ["AAPL"] * 3
+        assert table["date"].tolist()[:3] == [
+            f"{LATEST_FILED_YEAR - i}-12-31" for i in range(3)
+        ]
+        latest = table.iloc[0]
+        assert latest["revenue"] == LATEST_FILED_YEAR - 2000
+        assert latest["currentRatio"] == (LATEST_FILED_YEAR - 2000) * 10
+        # The income statement comes first, so its calendarYear is kept
+        assert latest["calendarYear"] == str(LATEST_FILED_YEAR)
+        assert (latest["sector"], latest["companyName"]) == (
+            "Technology",
+            "AAPL Inc.",
+        )
+        assert set(table.attrs["status"].values()) == {"fetched"}
+        assert len(_requests(stub, "profile")) == 1
+
+    def test_fan_out_is_concurrent_and_bounded(self, stub, tmp_path):
+        for i in range(4):
+            stub.add_company(f"S{i}")
+        stub.delay = 0.1
+
+        start = time.perf_counter()
+        _service(stub, tmp_path, burst_limit=4).get_bulk_fundamentals(
+            [f"S{i}" for i in range(4)], include_profile=False
+        )
+        elapsed = time.perf_counter() - start
+
+        assert len(stub.requests) == 4 * len(DATASET_FIELDS)
+        assert 1 < stub.max_in_flight <= 4
+        assert elapsed < len(stub.requests) * 0.1 / 2
+
+    def test_errors_are_isolated(self, stub, tmp_path):
+        stub.add_company("AAPL")
+
+        table = _service(stub, tmp_path).get_bulk_fundamentals(
+            ["AAPL", "NOPE"], datasets=["income-statement"]
+        )
+
+        assert set(table["symbol"]) == {"AAPL"}
+        errors = {(e["symbol"], e["dataset"]) for e in table.attrs["errors"]}
+        assert errors == {("NOPE", "income-statement"), ("NOPE", "profile")}
+
+    def test_non_list_responses_are_errors(self, stub, tmp_path):
+        for symbol in ("AAPL", "MSFT"):
+            stub.add_company(symbol)
+        stub.error_symbols.add("MSFT")
+        service = _service(stub, tmp_path)
+
+        quotes = service.get_bulk_quotes(["MSFT"])
+        table = service.get_bulk_fundamentals(
+            ["AAPL", "MSFT"], datasets=["income-statement"], include_profile=False
+        )
+
+        assert quotes.empty
+        assert "Expected a list" in quotes.attrs["errors"]["MSFT"]
+        assert set(table["symbol"]) == {"AAPL"}
+        (error,) = table.attrs["errors"]
+        assert (error["symbol"], error["error_type"]) == ("MSFT", "DataNotFoundError")
+        assert (
+            service.fundamentals_store.get("MSFT", "income-statement", "annual") is None
+        )
+
+    def test_invalid_arguments_rejected(self, stub, tmp_path):
+        service = _service(stub, tmp_path)
+
+        with pytest.raises(ValidationError):
+            service.get_bulk_fundamentals(["AAPL"], datasets=["dividends"])
+        with pytest.raises(ValidationError):
+            service.get_bulk_fundamentals(["AAPL"], period="monthly")
+
+
+class TestFundamentalsStore:
+    """Test skipping fresh periods and fetching only newly filed ones"""
+
+    def test_fresh_periods_not_refetched(self, stub, tmp_path):
+        stub.add_company("AAPL")
+        _service(stub, tmp_path).get_bulk_fundamentals(["AAPL"], include_profile=False)
+        stub.requests.clear()
+
+        # A new service instance reads the persisted store
+        table = _service(stub, tmp_path).get_bulk_fundamentals(
+            ["AAPL"], include_profile=False, max_age_seconds=0
+        )
+
+        assert stub.requests == []
+        assert set(table.attrs["status"].values()) == {"stored"}
+        assert len(table) == 4
+
+    def test_newly_filed_period_fetched_incrementally(self, stub, tmp_path):
+        stub.add_company("AAPL", latest_year=LATEST_FILED_YEAR - 1)
+        service = _service(stub, tmp_path)
+        service.get_bulk_fundamentals(
+            ["AAPL"], datasets=["income-statement"], include_profile=False
+        )
+        stub.add_company("AAPL")
+        stub.requests.clear()
+
+        table = service.get_bulk_fundamentals(
+            ["AAPL"],
+            datasets=["income-statement"],
+            include_profile=False,
+            max_age_seconds=0,
+        )
+
+        assert [query["limit"] for _, query in stub.requests] == ["2"]
+        assert table.attrs["status"] == {"AAPL:income-statement": "incremental"}
+        assert table["date"].tolist() == [
+            f"{LATEST_FILED_YEAR - i}-12-31" for i in range(4)
+        ]
+
+    def test_overdue_period_rechecked_after_max_age(self, stub, tmp_path):
+        stub.add_company("AAPL", latest_year=LATEST_FILED_YEAR - 1)
+        service = _service(stub, tmp_path)
+        kwargs = {"datasets": ["ratios"], "include_profile": False}
+        service.get_bulk_fundamentals(["AAPL"], **kwargs)
+        stub.requests.clear()
+
+        service.get_bulk_fundamentals(["AAPL"], max_age_seconds=3600, **kwargs)
+        assert stub.requests == []
+
+        service.get_bulk_fundamentals(["AAPL"], max_age_seconds=0, **kwargs)
+        assert len(stub.requests) == 1
+
+    def test_short_history_marked_complete(self, stub, tmp_path):
+        stub.add_company("NEWCO", years=2)
+        service = _service(stub, tmp_path)
+        kwargs = {"datasets": ["key-metrics"], "include_profile": False}
+        service.get_bulk_fundamentals(["NEWCO"], **kwargs)
+        stub.requests.clear()
+
+        table = service.get_bulk_fundamentals(["NEWCO"], max_age_seconds=0, **kwargs)
+
+        assert stub.requests == []
+        assert len(table) == 2
+        entry = service.fundamentals_store.get("NEWCO", "key-metrics")
+        assert entry["complete_history"] is True
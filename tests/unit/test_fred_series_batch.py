@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+FRED Series Batch Unit Tests
+
+Covers the batch series layer of FREDEconomicService against a local stub
+HTTP server:
+- Concurrent series fetches through the shared rate limiter
+- Persistent store keyed by series and vintage with incremental refreshes
+- Vectorized trend, year-over-year and volatility statistics
+- Sector, inflation and interest rate reports built from one batch
+"""
+
+import json
+import sys
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from services import base_financial_service as base_service
+from services.base_financial_service import (
+    CacheConfig,
+    HistoricalStorageConfig,
+    RateLimitConfig,
+    RateLimiter,
+    ServiceConfig,
+)
+from services.fred_economic import (
+    REVISION_LOOKBACK_DAYS,
+    FREDEconomicService,
+    FREDSeriesStore,
+    calculate_series_statistics,
+)
+
+
+def _monthly_dates(months):
+    today = date.today()
+    dates = []
+    for offset in range(months - 1, -1, -1):
+        year, month = divmod(today.year * 12 + today.month - 1 - offset, 12)
+        dates.append(date(year, month + 1, 1).isoformat())
+    return dates
+
+
+class StubFRED:
+    """In-process FRED API stub recording requests and concurrency"""
+
+    def __init__(self):
+        self.series = {}
+        self.requests = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def add_series(self, series_id, values, dates=None):
+        dates = dates or _monthly_dates(len(values))
+        self.series[series_id] = [
+            {"date": d, "value": v if v == "." else str(v)}
+            for d, v in zip(dates, values)
+        ]
+
+    def handle(self, path, query):
+        with self._lock:
+            self.requests.append((path, query))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            series_id = query.get("series_id")
+            if series_id not in self.series:
+                return 400, {"error_code": 400, "error_message": "Bad Request."}
+            if path == "/series":
+                return 200, {"seriess": [{"id": series_id, "title": series_id}]}
+            start = query.get("observation_start", "0000")
+            end = query.get("observation_end", "9999")
+            observations = [
+                obs for obs in self.series[series_id] if start <= obs["date"] <= end
+            ]
+            return 200, {"observations": observations}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def stub():
+    state = StubFRED()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            status, payload = state.handle(url.path, query)
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def _service(stub, tmp_path, burst_limit=8, store_dir="store"):
+    config = ServiceConfig(
+        name="fred_batch_test",
+        base_url=stub.url,
+        api_key="test_fred_key",
+        max_retries=0,
+        cache=CacheConfig(enabled=False, cache_dir=str(tmp_path / "cache")),
+        rate_limit=RateLimitConfig(requests_per_minute=600, burst_limit=burst_limit),
+        historical_storage=HistoricalStorageConfig(enabled=False),
+    )
+    return FREDEconomicService(config, FREDSeriesStore(tmp_path / store_dir))
+
+
+def _observation_requests(stub):
+    return [query for path, query in stub.requests if path == "/series/observations"]
+
+
+class TestBatchFetch:
+    """Test concurrent fetches"""
+
+    def test_series_fetched_concurrently(self, stub, tmp_path):
+        for i in range(6):
+            stub.add_series(f"S{i}", [1.0 + i, 2.0 + i, 3.0 + i])
+        stub.delay = 0.2
+        service = _service(stub, tmp_path)
+
+        start = time.perf_counter()
+        batch = service.get_series_batch([f"S{i}" for i in range(6)])
+        elapsed = time.perf_counter() - start
+
+        assert stub.max_in_flight > 1
+        assert elapsed < 6 * 0.2
+        assert batch["S3"]["values"].tolist() == [4.0, 5.0, 6.0]
+        assert batch["S3"]["status"] == "fetched"
+        assert all(q["api_key"] == "test_fred_key" for q in _observation_requests(stub))
+        assert not any("apikey" in q for q in _observation_requests(stub))
+
+    def test_burst_limit_bounds_concurrency(self, stub, tmp_path):
+        for i in range(6):
+            stub.add_series(f"S{i}", [1.0, 2.0])
+        stub.delay = 0.05
+
+        _service(stub, tmp_path, burst_limit=2).get_series_batch(
+            [f"S{i}" for i in range(6)]
+        )
+
+        assert stub.max_in_flight <= 2
+
+    def test_errors_are_isolated(self, stub, tmp_path):
+        stub.add_series("GOOD", [1.0, ".", 3.0])
+
+        batch = _service(stub, tmp_path).get_series_batch(["GOOD", "MISSING"])
+
+        assert "error" in batch["MISSING"]
+        assert batch["GOOD"]["values"].tolist() == [1.0, 3.0]
+        assert len(batch["GOOD"]["dates"]) == 2
+
+    def test_date_range_filters_stored_history(self, stub, tmp_path):
+        dates = _monthly_dates(12)
+        stub.add_series("RATE", list(range(12)), dates)
+
+        batch = _service(stub, tmp_path).get_series_batch(
+            ["RATE"], start_date=dates[3], end_date=dates[5]
+        )
+
+        assert batch["RATE"]["dates"] == dates[3:6]
+        assert _observation_requests(stub)[0]["observation_start"] == dates[3]
+
+
+class TestSeriesStore:
+    """Test the persistent vintage-keyed store"""
+
+    def test_fresh_series_served_from_store(self, stub, tmp_path):
+        stub.add_series("CPI", [100.0, 101.0])
+        service = _service(stub, tmp_path)
+        service.get_series_batch(["CPI"])
+
+        again = service.get_series_batch(["CPI"], max_age_seconds=3600)
+        reloaded = _service(stub, tmp_path).get_series_batch(
+            ["CPI"], max_age_seconds=3600
+        )
+
+        assert len(_observation_requests(stub)) == 1
+        assert again["CPI"]["status"] == reloaded["CPI"]["status"] == "stored"
+        assert reloaded["CPI"]["values"].tolist() == [100.0, 101.0]
+
+    def test_stale_series_refreshed_incrementally(self, stub, tmp_path):
+        dates = _monthly_dates(24)
+        stub.add_series("CPI", [100.0 + i for i in range(23)], dates[:23])
+        service = _service(stub, tmp_path)
+        service.get_series_batch(["CPI"])
+
+        # A revision to the last stored month plus one new observation
+        stub.add_series("CPI", [100.0 + i for i in range(22)] + [150.0, 151.0], dates)
+        batch = service.get_series_batch(["CPI"], max_age_seconds=0)
+
+        refresh = _observation_requests(stub)[-1]
+        last_stored = date.fromisoformat(dates[22])
+        assert batch["CPI"]["status"] == "incremental"
+        assert date.fromisoformat(refresh["observation_start"]) == (
+            last_stored.fromordinal(last_stored.toordinal() - REVISION_LOOKBACK_DAYS)
+        )
+        assert batch["CPI"]["values"][-2:].tolist() == [150.0, 151.0]
+        assert len(batch["CPI"]["values"]) == 24
+
+    def test_earlier_start_triggers_full_fetch(self, stub, tmp_path):
+        dates = _monthly_dates(12)
+        stub.add_series("GS10", [4.0] * 12, dates)
+        service = _service(stub, tmp_path)
+        service.get_series_batch(["GS10"], start_date=dates[6])
+
+        batch = service.get_series_batch(
+            ["GS10"], start_date=dates[0], max_age_seconds=3600
+        )
+
+        assert batch["GS10"]["status"] == "fetched"
+        assert len(batch["GS10"]["dates"]) == 12
+
+    def test_vintages_are_stored_separately_and_never_refetched(self, stub, tmp_path):
+        stub.add_series("GDP", [1.0, 2.0])
+        service = _service(stub, tmp_path)
+
+        first = service.get_series_batch(["GDP"], vintage_date="2024-01-15")
+        again = service.get_series_batch(
+            ["GDP"], vintage_date="2024-01-15", max_age_seconds=0
+        )
+        latest = service.get_series_batch(["GDP"])
+
+        requests_made = _observation_requests(stub)
+        assert len(requests_made) == 2
+        assert requests_made[0]["realtime_start"] == "2024-01-15"
+        assert requests_made[0]["realtime_end"] == "2024-01-15"
+        assert "realtime_start" not in requests_made[1]
+        assert (first["GDP"]["vintage"], again["GDP"]["status"]) == (
+            "2024-01-15",
+            "stored",
+        )
+        assert latest["GDP"]["vintage"] == "latest"
+        assert (tmp_path / "store" / "GDP" / "2024-01-15.json").exists()
+
+
+class TestStatistics:
+    """Test vectorized series statistics"""
+
+    def test_trend_matches_least_squares(self):
+        rng = np.random.default_rng(3)
+        values = np.cumsum(rng.normal(0.1, 1.0, 40))
+        dates = _monthly_dates(40)
+
+        statistics = calculate_series_statistics(dates, values)
+
+        assert statistics["trend_slope"] == pytest.approx(
+            np.polyfit(np.arange(40), values, 1)[0]
+        )
+        assert statistics["trend"] == (
+            "increasing" if statistics["trend_slope"] > 0 else "decreasing"
+        )
+        assert statistics["period_change"] == pytest.approx(values[-1] - values[0])
+
+    def test_yoy_and_volatility(self):
+        dates = _monthly_dates(14)
+        values = np.linspace(100.0, 113.0, 14)
+
+        statistics = calculate_series_statistics(dates, values)
+
+        # Twelve months before the latest observation is values[-13]
+        assert statistics["yoy_change"] == pytest.approx(
+            (values[-1] - values[-13]) / values[-13] * 100
+        )
+        changes = np.diff(values) / values[:-1]
+        assert statistics["volatility"] == pytest.approx(np.std(changes, ddof=1) * 100)
+
+    def test_short_series(self):
+        assert calculate_series_statistics([], [])["trend"] == "no_data"
+        single = calculate_series_statistics(["2025-01-01"], [2.0])
+        assert single["trend"] == "insufficient_data"
+        assert single["yoy_change"] is None and single["volatility"] is None
+
+
+class TestReports:
+    """Test reports built from batched series"""
+
+    def test_inflation_and_rates_reports(self, stub, tmp_path):
+        service = _service(stub, tmp_path)
+        for series_id in service.indicators["inflation"].values():
+            stub.add_series(series_id, np.linspace(300.0, 313.0, 14).round(3))
+        for series_id in service.indicators["interest_rates"].values():
+            stub.add_series(series_id, [5.0, 4.75, 4.5, 4.25])
+        stub.delay = 0.05
+
+        inflation = service.get_inflation_data("2y")
+        rates = service.get_interest_rates()
+
+        cpi = inflation["inflation_measures"]["CPI"]
+        assert cpi["yoy_change"] == pytest.approx(
+            (313.0 - 301.0) / 301.0 * 100, abs=0.01
+        )
+        assert cpi["recent_trend"] == "increasing"
+        funds = rates["interest_rates"]["Federal_Funds_Rate"]
+        assert (funds["period_change"], funds["min_in_period"]) == (-0.75, 4.25)
+        assert stub.max_in_flight > 1
+        assert len(_observation_requests(stub)) == 8
+
+    def test_one_year_inflation_has_yoy_change(self, stub, tmp_path):
+        service = _service(stub, tmp_path)
+        for series_id in service.indicators["inflation"].values():
+            stub.add_series(series_id, np.linspace(300.0, 317.0, 18).round(3))
+
+        cpi = service.get_inflation_data("1y")["inflation_measures"]["CPI"]
+
+        assert cpi["yoy_change"] == pytest.approx(
+            (317.0 - 305.0) / 305.0 * 100, abs=0.01
+        )
+        assert cpi["latest_value"] == 317.0
+
+    def test_sector_indicators_report_missing_series(self, stub, tmp_path):
+        stub.add_series("HOUST", [1300.0, 1350.0])
+        stub.add_series("MORTGAGE30US", [6.5, 6.3])
+        stub.add_series("HSN1F", [700.0, "."])
+
+        report = _service(stub, tmp_path).get_sector_indicators("housing")
+
+        assert report["indicators"]["Housing_Starts"]["latest_value"] == 1350.0
+        assert report["indicators"]["New_Home_Sales"]["observations_count"] == 1
+        assert "error" in report["indicators"]["Case_Shiller_Index"]
+        assert report["successful_indicators"] == 3
+
+    def test_economic_indicator_statistics(self, stub, tmp_path):
+        stub.add_series("UNRATE", [4.0, 4.1, 4.3])
+
+        result = _service(stub, tmp_path).get_economic_indicator("UNRATE", "1y")
+
+        assert result["statistics"]["trend"] == "increasing"
+        assert result["statistics"]["average_value"] == "4.13"
+        assert result["statistics"]["latest_value"] == "4.3"
+
+
+class TestRateLimiter:
+    """Test the thread-safe rate limiter"""
+
+    def test_concurrent_acquire_respects_limit(self, monkeypatch):
+        clock = {"now": 1000.0}
+        lock = threading.Lock()
+
+        def fake_sleep(seconds):
+            with lock:
+                clock["now"] += seconds
+
+        monkeypatch.setattr(base_service.time, "time", lambda: clock["now"])
+        monkeypatch.setattr(base_service.time, "sleep", fake_sleep)
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=3))
+
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(7)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        stamps = sorted(limiter.requests)
+        assert len(stamps) >= 1
+        for i, stamp in enumerate(stamps):
+            in_window = [s for s in stamps[i:] if s - stamp < 60]
+            assert len(in_window) <= 3
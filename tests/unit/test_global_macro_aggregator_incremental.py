@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Global Macro Aggregator Incremental Unit Tests
+
+Covers incremental regional aggregation:
+- Partials recomputed only for regions whose discovery file changed
+- Incremental output identical to a full rebuild
+- Cache invalidation on force, version mismatch and unreadable cache
+- Missing regions and cached partials left unmodified by composites
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from global_macro_aggregator import GlobalMacroAggregator
+
+DATE = "20250906"
+
+
+def _discovery(region: str, phase: str = "expansion", score: float = 1.2):
+    return {
+        "metadata": {"region": region},
+        "cli_comprehensive_analysis": {
+            "central_bank_economic_data": {
+                "gdp_data": {
+                    "observations": [
+                        {"date": f"2025-0{i + 1}-01", "value": i} for i in range(3)
+                    ]
+                },
+            },
+            "cross_source_validation": {"validation_score": 0.9},
+            "market_intelligence": {"risk_appetite": {"level": "neutral"}},
+        },
+        "economic_indicators": {
+            "composite_scores": {
+                "business_cycle_score": score,
+                "recession_probability": 0.2,
+            }
+        },
+        "business_cycle_data": {"current_phase": phase},
+        "discovery_confidence": 0.9,
+    }
+
+
+def _write(directory: Path, region: str, document):
+    pattern = GlobalMacroAggregator.REGIONAL_FILES[region]
+    (directory / pattern.format(date=DATE)).write_text(json.dumps(document))
+
+
+def _comparable(analysis):
+    analysis = json.loads(json.dumps(analysis, default=float))
+    analysis["metadata"].pop("execution_timestamp")
+    for reference in analysis["local_data_references"]["cached_economic_data"].values():
+        reference.pop("last_updated")
+    return analysis
+
+
+@pytest.fixture
+def discovery_dir(tmp_path):
+    directory = tmp_path / "discovery"
+    directory.mkdir()
+    for region in GlobalMacroAggregator.REGIONAL_FILES:
+        _write(directory, region, _discovery(region))
+    return directory
+
+
+def _aggregator(discovery_dir, tmp_path):
+    return GlobalMacroAggregator(
+        str(discovery_dir), cache_file=str(tmp_path / "partials.json"), date=DATE
+    )
+
+
+def _full_rebuild(discovery_dir, tmp_path):
+    aggregator = _aggregator(discovery_dir, tmp_path)
+    aggregator.load_regional_data()
+    return _comparable(aggregator.aggregate_global_analysis())
+
+
+class TestIncrementalLoading:
+    """Test partial caching by content hash"""
+
+    def test_cold_then_warm(self, discovery_dir, tmp_path):
+        regions = list(GlobalMacroAggregator.REGIONAL_FILES)
+
+        cold = _aggregator(discovery_dir, tmp_path).load_regional_partials()
+        warm_aggregator = _aggregator(discovery_dir, tmp_path)
+        warm = warm_aggregator.load_regional_partials()
+
+        assert cold == {region: "recomputed" for region in regions}
+        assert warm == {region: "cached" for region in regions}
+        assert warm_aggregator.regional_data == {}
+        assert (tmp_path / "partials.json").exists()
+
+    def test_only_changed_region_is_recomputed(self, discovery_dir, tmp_path):
+        _aggregator(discovery_dir, tmp_path).load_regional_partials()
+        _write(discovery_dir, "ASIA", _discovery("ASIA", "contraction", 0.4))
+
+        aggregator = _aggregator(discovery_dir, tmp_path)
+        statuses = aggregator.load_regional_partials()
+
+        assert statuses == {
+            "US": "cached",
+            "AMERICAS": "cached",
+            "EUROPE": "cached",
+            "ASIA": "recomputed",
+        }
+        assert list(aggregator.regional_data) == ["ASIA"]
+        assert _comparable(aggregator.aggregate_global_analysis()) == _full_rebuild(
+            discovery_dir, tmp_path
+        )
+
+    def test_force_recomputes_everything(self, discovery_dir, tmp_path):
+        _aggregator(discovery_dir, tmp_path).load_regional_partials()
+
+        statuses = _aggregator(discovery_dir, tmp_path).load_regional_partials(
+            force=True
+        )
+
+        assert set(statuses.values()) == {"recomputed"}
+
+    def test_version_mismatch_invalidates_cache(
+        self, discovery_dir, tmp_path, monkeypatch
+    ):
+        _aggregator(discovery_dir, tmp_path).load_regional_partials()
+        monkeypatch.setattr(GlobalMacroAggregator, "PARTIAL_VERSION", 99)
+
+        statuses = _aggregator(discovery_dir, tmp_path).load_regional_partials()
+
+        assert set(statuses.values()) == {"recomputed"}
+
+    def test_unreadable_cache_is_ignored(self, discovery_dir, tmp_path):
+        (tmp_path / "partials.json").write_text("{not json")
+
+        statuses = _aggregator(discovery_dir, tmp_path).load_regional_partials()
+
+        assert set(statuses.values()) == {"recomputed"}
+
+    def test_missing_and_failed_regions(self, discovery_dir, tmp_path):
+        (discovery_dir / f"europe_{DATE}_discovery.json").unlink()
+        (discovery_dir / f"asia_{DATE}_discovery.json").write_text("{broken")
+
+        aggregator = _aggregator(discovery_dir, tmp_path)
+        statuses = aggregator.load_regional_partials()
+
+        assert statuses["EUROPE"] == "missing"
+        assert statuses["ASIA"] == "failed"
+        assert set(aggregator.regional_partials) == {"US", "AMERICAS"}
+
+    def test_cache_pruned_to_current_files(self, discovery_dir, tmp_path):
+        _aggregator(discovery_dir, tmp_path).load_regional_partials()
+        next_date = "20250907"
+        for region, pattern in GlobalMacroAggregator.REGIONAL_FILES.items():
+            (discovery_dir / pattern.format(date=next_date)).write_text(
+                json.dumps(_discovery(region))
+            )
+
+        GlobalMacroAggregator(
+            str(discovery_dir),
+            cache_file=str(tmp_path / "partials.json"),
+            date=next_date,
+        ).load_regional_partials()
+
+        cache = json.loads((tmp_path / "partials.json").read_text())
+        assert all(next_date in name for name in cache["files"])
+        assert len(cache["files"]) == len(GlobalMacroAggregator.REGIONAL_FILES)
+
+
+class TestIncrementalAggregation:
+    """Test aggregation from cached partials"""
+
+    def test_cached_output_matches_full_rebuild(self, discovery_dir, tmp_path):
+        expected = _full_rebuild(discovery_dir, tmp_path)
+        _aggregator(discovery_dir, tmp_path).load_regional_partials()
+
+        aggregator = _aggregator(discovery_dir, tmp_path)
+        aggregator.load_regional_partials()
+
+        assert _comparable(aggregator.aggregate_global_analysis()) == expected
+
+    def test_partials_are_not_mutated(self, discovery_dir, tmp_path):
+        aggregator = _aggregator(discovery_dir, tmp_path)
+        aggregator.load_regional_partials()
+        before = json.dumps(aggregator.regional_partials, sort_keys=True)
+
+        aggregator.aggregate_global_analysis()
+        aggregator.aggregate_global_analysis()
+
+        assert json.dumps(aggregator.regional_partials, sort_keys=True) == before
+
+    def test_partials_are_trimmed(self, discovery_dir, tmp_path, monkeypatch):
+        monkeypatch.setattr(GlobalMacroAggregator, "GDP_OBSERVATION_LIMIT", 2)
+        aggregator = _aggregator(discovery_dir, tmp_path)
+        aggregator.load_regional_partials()
+
+        us = aggregator.regional_partials["US"]
+        assert len(us["gdp_observations"]) == 2
+        assert not set(GlobalMacroAggregator.REPLACED_CLI_SECTIONS) & set(
+            us["cli_comprehensive_analysis"]
+        )
+
+    def test_reassigned_regional_data_recomputes_partials(
+        self, discovery_dir, tmp_path
+    ):
+        aggregator = _aggregator(discovery_dir, tmp_path)
+        aggregator.load_regional_data()
+        aggregator.aggregate_global_analysis()
+        replacement = _discovery("US", "contraction", 0.4)
+
+        aggregator.regional_data = {"US": replacement}
+        aggregator.aggregate_global_analysis()
+
+        assert aggregator.regional_partials == {
+            "US": aggregator._extract_regional_partial("US", replacement)
+        }
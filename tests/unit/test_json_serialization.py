@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization Unit Tests
+
+Covers the shared serialization layer:
+- numpy scalars/arrays, pandas objects, datetimes and dataclasses
+- Output compatible with the standard library encoder
+- Compact and gzip-compressed artifacts round-tripping through read_json
+- Streaming writer for arrays and objects
+"""
+
+import json
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from utils import json_serialization as serialization
+from utils.json_serialization import (
+    JSONStreamWriter,
+    NumpyJSONEncoder,
+    dumps,
+    read_json,
+    to_serializable,
+    write_json,
+)
+
+
+class Phase(Enum):
+    EXPANSION = "expansion"
+
+
+@dataclass
+class Signal:
+    ticker: str
+    score: float
+    phase: Phase
+
+
+class WithToDict:
+    def to_dict(self):
+        return {"source": "to_dict", "value": np.float64(1.5)}
+
+
+def _payload():
+    return {
+        "int": np.int64(7),
+        "float": np.float32(0.5),
+        "bool": np.bool_(True),
+        "array": np.arange(3),
+        "matrix_column": np.arange(6).reshape(3, 2)[:, 0],
+        "timestamp": pd.Timestamp("2025-09-06 10:30"),
+        "datetime": datetime(2025, 9, 6, 10, 30),
+        "date": date(2025, 9, 6),
+        "frame": pd.DataFrame({"a": [1, 2], "b": [0.5, 1.5]}),
+        "series": pd.Series({"x": np.int64(1)}),
+        "signal": Signal("AAPL", 0.9, Phase.EXPANSION),
+        "custom": WithToDict(),
+        "nested": [{"values": (np.float64(1.25), None)}],
+        1: "int key",
+    }
+
+
+EXPECTED = {
+    "int": 7,
+    "float": 0.5,
+    "bool": True,
+    "array": [0, 1, 2],
+    "matrix_column": [0, 2, 4],
+    "timestamp": "2025-09-06T10:30:00",
+    "datetime": "2025-09-06T10:30:00",
+    "date": "2025-09-06",
+    "frame": [{"a": 1, "b": 0.5}, {"a": 2, "b": 1.5}],
+    "series": {"x": 1},
+    "signal": {"ticker": "AAPL", "score": 0.9, "phase": "expansion"},
+    "custom": {"source": "to_dict", "value": 1.5},
+    "nested": [{"values": [1.25, None]}],
+    "1": "int key",
+}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param and not serialization.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestConversion:
+    """Test type handling"""
+
+    def test_dumps_handles_supported_types(self, backend):
+        assert json.loads(dumps(_payload())) == EXPECTED
+
+    def test_indented_output_matches_stdlib_layout(self, backend):
+        data = {"a": [1, {"b": np.float64(2.5)}], "c": "café"}
+
+        assert dumps(data) == json.dumps(
+            data, indent=2, ensure_ascii=False, cls=NumpyJSONEncoder
+        )
+        assert dumps(data, indent=False) == '{"a":[1,{"b":2.5}],"c":"café"}'
+
+    def test_to_serializable_returns_native_types(self):
+        result = to_serializable(_payload())
+
+        assert json.loads(json.dumps(result)) == EXPECTED
+        assert type(result["int"]) is int
+        assert type(result["bool"]) is bool
+        assert result[1] == "int key"
+
+    def test_unsupported_types_raise_unless_fallback(self, backend):
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+        assert json.loads(dumps({"value": object()}, fallback=lambda o: "obj")) == {
+            "value": "obj"
+        }
+
+    def test_non_finite_floats_written_as_null(self, backend):
+        data = {"nan": float("nan"), "inf": np.float64("inf"), "v": np.array([np.nan])}
+
+        assert json.loads(dumps(data)) == {"nan": None, "inf": None, "v": [None]}
+
+    def test_datetime_keys_are_stringified(self, backend):
+        series = pd.Series(
+            [1.5, np.nan], index=pd.date_range("2025-09-05", periods=2, freq="D")
+        )
+        data = {"series": series, "by_date": {date(2025, 9, 6): 1, (1, 2): 2}}
+
+        assert json.loads(dumps(data)) == {
+            "series": {"2025-09-05T00:00:00": 1.5, "2025-09-06T00:00:00": None},
+            "by_date": {"2025-09-06": 1, "(1, 2)": 2},
+        }
+
+    def test_to_serializable_fallback_passes_through(self):
+        marker = object()
+
+        with pytest.raises(TypeError):
+            to_serializable({"value": marker})
+        result = to_serializable({"value": [marker]}, fallback=lambda value: value)
+        assert result["value"][0] is marker
+
+    def test_numpy_json_encoder(self):
+        encoded = json.dumps({"v": np.int32(3)}, cls=NumpyJSONEncoder)
+
+        assert json.loads(encoded) == {"v": 3}
+
+
+class TestFiles:
+    """Test file writers and readers"""
+
+    @pytest.mark.parametrize("name", ["out.json", "out.json.gz"])
+    @pytest.mark.parametrize("compact", [True, False])
+    def test_round_trip(self, backend, tmp_path, name, compact):
+        path = write_json(_payload(), tmp_path / "nested" / name, compact=compact)
+
+        assert read_json(path) == EXPECTED
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_compact_and_compressed_are_smaller(self, tmp_path):
+        data = {"rows": [{"value": float(i), "label": "row"} for i in range(500)]}
+
+        pretty = write_json(data, tmp_path / "pretty.json").stat().st_size
+        compact = write_json(data, tmp_path / "c.json", compact=True).stat().st_size
+        packed = write_json(data, tmp_path / "c.json.gz", compact=True).stat().st_size
+
+        assert packed < compact < pretty
+
+
+class TestStreamWriter:
+    """Test incremental JSON output"""
+
+    @pytest.mark.parametrize("name", ["stream.json", "stream.json.gz"])
+    def test_array_stream(self, backend, tmp_path, name):
+        with JSONStreamWriter(tmp_path / name) as writer:
+            writer.write({"i": np.int64(0)})
+            assert writer.write_many({"i": i} for i in range(1, 4)) == 3
+
+        assert read_json(tmp_path / name) == [{"i": i} for i in range(4)]
+
+    def test_object_stream(self, backend, tmp_path):
+        path = tmp_path / "object.json"
+        with JSONStreamWriter(path, container="object") as writer:
+            writer.write_field("metadata", {"date": date(2025, 9, 6)})
+            writer.write_fields([("values", np.arange(2))])
+
+        assert read_json(path) == {"metadata": {"date": "2025-09-06"}, "values": [0, 1]}
+
+    def test_empty_streams_are_valid(self, tmp_path):
+        with JSONStreamWriter(tmp_path / "a.json"):
+            pass
+        with JSONStreamWriter(tmp_path / "o.json", container="object"):
+            pass
+
+        assert read_json(tmp_path / "a.json") == []
+        assert read_json(tmp_path / "o.json") == {}
+
+    def test_container_mismatch(self, tmp_path):
+        with pytest.raises(ValueError):
+            JSONStreamWriter(tmp_path / "x.json", container="table")
+        with JSONStreamWriter(tmp_path / "x.json") as writer:
+            with pytest.raises(ValueError):
+                writer.write_field("key", 1)
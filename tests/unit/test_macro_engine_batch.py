@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Macro Engine Batch Runner Unit Tests
+
+Covers cross-region execution of the macro analytical engines:
+- Parameter tables built once and shared by per-region engines
+- Results matching engines constructed per region
+- Merged result set with per-engine, per-region timings
+- Process pool execution, thread fallback and error isolation
+- Currency matrices built once per batch and passed to every engine
+- Latest discovery file selection per region
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from utils import macro_engine_batch as batch_module
+from utils.macro_engine_batch import (
+    ENGINE_REGISTRY,
+    MACRO_ENGINES,
+    MacroEngineBatchRunner,
+    currency_inputs,
+    format_timing_report,
+    latest_discovery_files,
+)
+from utils.market_regime_framework import MarketRegimeEngine
+from utils.vix_volatility_analyzer import VIXVolatilityAnalyzer
+
+# Draws from the global numpy random state, so runs differ by design
+NONDETERMINISTIC_ENGINES = {"economic_calendar"}
+
+
+def _discovery(region, gdp=2.5):
+    return {
+        "metadata": {"region": region},
+        "cli_comprehensive_analysis": {
+            "central_bank_economic_data": {
+                "gdp_data": {"observations": [{"value": gdp}]},
+                "employment_data": {
+                    "unemployment_data": {"observations": [{"value": 4.2}]}
+                },
+                "inflation_data": {"cpi_data": {"observations": [{"value": 2.8}]}},
+            }
+        },
+        "cli_market_intelligence": {
+            "volatility_analysis": {
+                "global_volatility_composite": {"current_level": 17}
+            }
+        },
+    }
+
+
+def _strip_timestamps(value):
+    if isinstance(value, dict):
+        return {
+            key: _strip_timestamps(item)
+            for key, item in value.items()
+            if "timestamp" not in key
+        }
+    if isinstance(value, list):
+        return [_strip_timestamps(item) for item in value]
+    return value
+
+
+def _fresh_engine(name, region):
+    engine_class = ENGINE_REGISTRY[name][0]
+    if engine_class is MarketRegimeEngine:
+        return MarketRegimeEngine(region, seed=5)
+    if engine_class is VIXVolatilityAnalyzer:
+        return VIXVolatilityAnalyzer()
+    return engine_class(region)
+
+
+@pytest.fixture
+def payloads(tmp_path):
+    paths = {}
+    for region, gdp in (("US", 2.5), ("EUROPE", 0.9), ("ASIA", 4.1)):
+        path = tmp_path / f"{region.lower()}_20250906_discovery.json"
+        path.write_text(json.dumps(_discovery(region, gdp)))
+        paths[region] = path
+    return paths
+
+
+@pytest.fixture
+def runner():
+    return MacroEngineBatchRunner(
+        analysis_date="2025-09-06", seed=5, use_processes=False
+    )
+
+
+class TestSharedParameters:
+    """Test per-region engines built from shared prototypes"""
+
+    def test_engines_share_parameter_tables(self, runner):
+        us = runner.engine_for_region("sector_correlation", "us")
+        asia = runner.engine_for_region("sector_correlation", "asia")
+
+        assert (us.region, asia.region) == ("US", "ASIA")
+        assert us is not asia
+        assert us.sector_definitions is asia.sector_definitions
+
+    def test_tables_built_once_per_runner(self, monkeypatch, payloads):
+        calls = []
+        original = batch_module.GeopoliticalRiskEngine.__init__
+
+        def counting_init(self, *args, **kwargs):
+            calls.append(args)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(
+            batch_module.GeopoliticalRiskEngine, "__init__", counting_init
+        )
+        MacroEngineBatchRunner(use_processes=False).run(payloads)
+
+        assert len(calls) == 1
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError):
+            MacroEngineBatchRunner(engines=["market_regime", "astrology"])
+
+
+class TestBatchResults:
+    """Test the merged result set"""
+
+    def test_results_match_per_region_engines(self, runner, payloads):
+        batch = runner.run(payloads)
+
+        assert batch["errors"] == []
+        for region, path in payloads.items():
+            discovery = json.loads(path.read_text())
+            context = {
+                "region": region,
+                "analysis_date": "2025-09-06",
+                "currency_matrices": batch["currency_matrices"],
+            }
+            for name in MACRO_ENGINES:
+                result = batch["results"][region][name]
+                expected = ENGINE_REGISTRY[name][1](
+                    _fresh_engine(name, region), discovery, context
+                )
+                if name in NONDETERMINISTIC_ENGINES:
+                    assert set(result) == set(expected)
+                else:
+                    assert _strip_timestamps(result) == _strip_timestamps(expected)
+
+    def test_timings_cover_every_engine_and_region(self, runner, payloads):
+        batch = runner.run(payloads)
+        timings = batch["timings"]
+
+        assert batch["metadata"]["regions"] == ["US", "EUROPE", "ASIA"]
+        for name in MACRO_ENGINES:
+            assert set(timings["per_engine_region"][name]) == set(payloads)
+            assert timings["engine_totals"][name] == pytest.approx(
+                sum(timings["per_engine_region"][name].values()), abs=1e-5
+            )
+        slowest = [run["seconds"] for run in timings["slowest"]]
+        assert slowest == sorted(slowest, reverse=True)
+        assert len(slowest) == batch_module.SLOWEST_RUNS_REPORTED
+        assert "market_regime" in format_timing_report(batch)
+
+    def test_vix_uses_discovery_volatility_level(self, runner, payloads):
+        batch = runner.run(payloads)
+
+        assert batch["results"]["US"]["vix_volatility"]["current_vix_level"] == 17.0
+
+    def test_failures_are_isolated(self, monkeypatch, runner, payloads, tmp_path):
+        def failing(engine, discovery, context):
+            raise RuntimeError("boom")
+
+        monkeypatch.setitem(
+            ENGINE_REGISTRY,
+            "sector_correlation",
+            (ENGINE_REGISTRY["sector_correlation"][0], failing),
+        )
+        payloads["JAPAN"] = tmp_path / "missing.json"
+
+        batch = runner.run(payloads)
+        errors = {(error["region"], error["engine"]) for error in batch["errors"]}
+
+        assert ("JAPAN", "payload") in errors
+        assert ("US", "sector_correlation") in errors
+        assert batch["results"]["US"]["market_regime"]["random_seed"] == 5
+        assert "error" not in batch["results"]["US"]["policy_transmission"]
+
+
+class TestExecution:
+    """Test process pool execution and fallback"""
+
+    def test_process_pool_matches_threads(self, runner, payloads):
+        pooled = MacroEngineBatchRunner(
+            analysis_date="2025-09-06", seed=5, max_workers=2
+        ).run(payloads)
+        threaded = runner.run(payloads)
+
+        assert pooled["metadata"]["executor"] == "processes"
+        assert os.getpid() not in pooled["metadata"]["worker_pids"]
+        for region in payloads:
+            for name in set(MACRO_ENGINES) - NONDETERMINISTIC_ENGINES:
+                assert _strip_timestamps(
+                    pooled["results"][region][name]
+                ) == _strip_timestamps(threaded["results"][region][name])
+
+    def test_falls_back_to_threads(self, monkeypatch, payloads):
+        def unavailable(*args, **kwargs):
+            raise OSError("no processes")
+
+        monkeypatch.setattr(batch_module, "ProcessPoolExecutor", unavailable)
+        batch = MacroEngineBatchRunner(max_workers=2).run(payloads)
+
+        assert batch["metadata"]["executor"] == "threads"
+        assert set(batch["results"]) == set(payloads)
+
+
+class TestCurrencyMatrices:
+    """Test currency matrices shared with the engines"""
+
+    def test_inputs_from_discovery_payload(self):
+        discovery = {
+            "global_economic_context": {
+                "currency_dynamics": {
+                    "major_pairs": {
+                        "eur_usd": {"level": 1.08},
+                        "usd_jpy": {"current_level": 150.0},
+                        "gbp_usd": 1.25,
+                        "eur_gbp": {"level": 0.84},
+                        "usd_cny": "managed_range",
+                    }
+                }
+            },
+            "monetary_policy_context": {"policy_stance": {"policy_rate": 3.75}},
+        }
+
+        spot_rates, policy_rates = currency_inputs(discovery, "EUROPE")
+
+        assert spot_rates == {"EUR": 1.08, "JPY": pytest.approx(1 / 150), "GBP": 1.25}
+        assert policy_rates == {"EUR": 3.75}
+        assert currency_inputs(discovery, "ASIA")[1] == {}
+
+    def test_engines_receive_batch_matrices(self, monkeypatch, runner, payloads):
+        for region, rate in (("US", 4.33), ("EUROPE", 2.0)):
+            discovery = json.loads(payloads[region].read_text())
+            discovery["monetary_policy_context"] = {
+                "policy_stance": {"policy_rate": rate}
+            }
+            payloads[region].write_text(json.dumps(discovery))
+        seen = []
+
+        def capture(engine, discovery, context):
+            seen.append(context["currency_matrices"])
+            return {}
+
+        monkeypatch.setitem(
+            ENGINE_REGISTRY,
+            "sector_correlation",
+            (ENGINE_REGISTRY["sector_correlation"][0], capture),
+        )
+        batch = runner.run(payloads)
+        matrices = batch["currency_matrices"]
+        usd = matrices["currencies"].index("USD")
+        eur = matrices["currencies"].index("EUR")
+
+        assert len(seen) == len(payloads)
+        assert all(shared is matrices for shared in seen)
+        assert matrices["as_of"] == "2025-09-06"
+        assert matrices["carry"][usd][eur] == pytest.approx(2.33)
+        assert runner.build_currency_matrices(payloads) is (
+            runner.build_currency_matrices(payloads)
+        )
+        regime = batch["results"]["US"]["market_regime"]["market_regime_analysis"]
+        assert regime["currency_correlation_regime"]["as_of"] == "2025-09-06"
+
+
+class TestDiscoveryFiles:
+    """Test discovery file selection"""
+
+    def test_latest_file_per_region(self, tmp_path):
+        for name in (
+            "US_20250814_discovery.json",
+            "US_20250906_discovery.json",
+            "asia_20250906_discovery.json",
+            "notes.json",
+        ):
+            (tmp_path / name).write_text("{}")
+
+        latest = latest_discovery_files(tmp_path)
+        dated = latest_discovery_files(tmp_path, regions=["us"], date="20250814")
+
+        assert {region: path.name for region, path in latest.items()} == {
+            "ASIA": "asia_20250906_discovery.json",
+            "US": "US_20250906_discovery.json",
+        }
+        assert list(dated) == ["US"]
+        assert dated["US"].name == "US_20250814_discovery.json"
+
+    def test_run_directory(self, runner, payloads, tmp_path):
+        batch = runner.run_directory(tmp_path, regions=["US", "ASIA"])
+
+        assert set(batch["results"]) == {"US", "ASIA"}
+        assert set(batch["metadata"]["discovery_files"]) == {"US", "ASIA"}
+        with pytest.raises(FileNotFoundError):
+            runner.run_directory(tmp_path / "empty")
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Markdown Report Tokenizer Unit Tests
+
+Covers the shared report tokenizer and the parsers built on it:
+- Frontmatter, section tree, code fences and pipe tables
+- Bold, plain and pipe-separated key/value fields (including headings)
+- Field lookups with value patterns and table column lookups
+- Content-hash cache shared across parsers
+- Dashboard, live signals, trade history image and fundamental parsers
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from utils.markdown_report_tokenizer import (
+    MarkdownReportCache,
+    get_report_cache,
+    tokenize_markdown,
+)
+
+PERFORMANCE_REPORT = """# Historical Trading Performance
+**Portfolio**: live_signals | **Date**: 2025-07-16 | **Type**: Live Signals
+
+**Live Signals | January 1 - June 26, 2025**
+
+## Summary
+- **Total Closed Trades**: 12
+- **Win Rate**: 58.3% (7 wins, 5 losses)
+- **Total Return**: +9.40%
+- **Average Trade Duration**: 21.5 days
+- **Profit Factor**: 1.85
+- **Best Trade**: AAPL +12.00% (30 days)
+- **Active Positions**: 4
+- **Unrealized P&L**: +$1,234.50
+
+## Monthly Performance
+
+### January 2025 - Strong Start
+- **Trades Closed**: 5
+- **Win Rate**: 60.0%
+- **Average Return**: +2.10%
+- **Market Context**: Risk-on rally
+
+### February 2025 - Chop
+- **Trades Closed**: 7
+- **Win Rate**: 57.1%
+- **Average Return**: -0.40%
+
+## Quality
+
+### Excellent Trades (4 trades - 33.3%)
+- **Win Rate**: 100.0%
+- **Average Return**: +7.50%
+
+## 📋 Complete Active Positions Table
+
+| Rank | Ticker | Strategy | Entry Date | Days | Return | Trend | Risk |
+|------|--------|----------|------------|------|--------|-------|------|
+| 1 | AAPL | SMA | 2025-06-01 | 15 | +5.20% | Up | Low |
+| 2 | MSFT | EMA | 2025-06-05 | 11 | -1.10% | Down | High |
+
+## Trade History
+
+| Rank | Ticker | Strategy | Entry Date | Exit Date | Return | Duration | Quality |
+|---|---|---|---|---|---|---|---|
+| 1 | **AAPL** | SMA 10-20 | 2025-05-01 | 2025-05-31 | **+12.00%** | 30d | Excellent |
+| 2 | XYZ | EMA 5-9 | 2025-05-03 | 2025-05-15 | -7.00% | 12d | Poor |
+"""
+
+
+@pytest.fixture
+def report_file(tmp_path):
+    path = tmp_path / "report.md"
+    path.write_text(PERFORMANCE_REPORT, encoding="utf-8")
+    return path
+
+
+class TestTokenizer:
+    """Test the single-pass markdown tokenizer"""
+
+    def test_frontmatter_and_sections(self):
+        report = tokenize_markdown(
+            "---\ntitle: Apple (AAPL)\ndate: 2025-07-24\n---\n"
+            "# Title\nintro\n## A\ntext\n### A.1\n## B\n"
+        )
+
+        assert report.frontmatter == {"title": "Apple (AAPL)", "date": "2025-07-24"}
+        assert [s.title for s in report.sections] == ["Title", "A", "A.1", "B"]
+        title = report.sections[0]
+        assert [c.title for c in title.children] == ["A", "B"]
+        assert title.children[0].children[0].title == "A.1"
+        assert report.sections[1].text == "text"
+
+    def test_code_fences_are_not_tokenized(self):
+        report = tokenize_markdown(
+            "# Real\n```\n# not a heading\n| a | b |\n**Key**: value\n```\n"
+        )
+
+        assert [s.title for s in report.sections] == ["Real"]
+        assert report.tables == []
+        assert report.get("Key") is None
+
+    def test_tables(self):
+        report = tokenize_markdown(PERFORMANCE_REPORT)
+
+        table = report.find_table("Entry Date", "Exit Date")
+        assert table.header[0] == "Rank"
+        assert len(table.rows) == 2
+        assert table.rows[0][1] == "**AAPL**"
+        assert table.column_index("Return") == 5
+        assert table.records()[1]["ticker"] == "XYZ"
+        assert report.find_table("Nonexistent") is None
+
+    def test_fields(self):
+        report = tokenize_markdown(
+            "- **Win Rate**: 55.17% (16 wins)\n"
+            "- **Total Return:** +8.59%\n"
+            "• Profit Factor: 1.21\n"
+            "**Portfolio**: core | **Date**: 2025-07-16\n"
+            "### Recommendation: HOLD | Conviction: 0.88/1.0\n"
+        )
+
+        assert report.get("win rate") == "55.17% (16 wins)"
+        assert report.get("Total Return") == "+8.59%"
+        assert report.get("Profit Factor") == "1.21"
+        assert report.get("Date") == "2025-07-16"
+        assert report.get("Recommendation") == "HOLD"
+        assert report.get("Conviction", r"^([\d.]+)") == "0.88"
+
+    def test_get_with_pattern_skips_non_matching_values(self):
+        report = tokenize_markdown(
+            "- **Win Rate**: high\n- **Win Rate**: 61.5% (8 wins, 5 losses)\n"
+        )
+
+        assert report.get("Win Rate", r"^([\d.]+)%") == "61.5"
+        match = report.match("Win Rate", r"^([\d.]+)%\s*\((\d+) wins?, (\d+) loss")
+        assert match.groups() == ("61.5", "8", "5")
+        assert report.get("Missing", default="n/a") == "n/a"
+        assert report.get_all("Win Rate") == ["high", "61.5% (8 wins, 5 losses)"]
+
+    def test_section_fields_are_scoped(self):
+        report = tokenize_markdown(PERFORMANCE_REPORT)
+
+        (january, match), (february, _) = report.find_sections(
+            r"^(\w+)\s*(\d+)\s*-", level=3
+        )
+        assert match.group(1) == "January"
+        assert january.get("Trades Closed") == "5"
+        assert february.get("Market Context") is None
+
+
+class TestReportCache:
+    """Test the content-hash report cache"""
+
+    def test_identical_content_is_tokenized_once(self, tmp_path):
+        cache = MarkdownReportCache()
+        first = tmp_path / "a.md"
+        second = tmp_path / "b.md"
+        first.write_text(PERFORMANCE_REPORT, encoding="utf-8")
+        second.write_text(PERFORMANCE_REPORT, encoding="utf-8")
+
+        assert cache.load(first) is cache.load(second)
+        assert cache.get_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_changed_content_is_retokenized(self, tmp_path):
+        cache = MarkdownReportCache()
+        path = tmp_path / "a.md"
+        path.write_text("**Win Rate**: 50%", encoding="utf-8")
+        before = cache.load(path)
+        path.write_text("**Win Rate**: 60%", encoding="utf-8")
+
+        assert cache.load(path).get("Win Rate") == "60%"
+        assert before.get("Win Rate") == "50%"
+
+    def test_cache_is_bounded(self):
+        cache = MarkdownReportCache(max_entries=2)
+        for i in range(3):
+            cache.tokenize(f"# Report {i}")
+
+        assert cache.get_stats()["entries"] == 2
+
+
+class TestReportParsers:
+    """Test the report parsers built on the tokenizer"""
+
+    def test_dashboard_parser(self, report_file):
+        from utils.dashboard_parser import DashboardDataParser
+
+        data = DashboardDataParser().parse_report(report_file)
+
+        metrics = data["performance_metrics"]
+        assert metrics.total_trades == 12
+        assert metrics.win_rate == 58.3
+        assert metrics.total_return == 9.4
+        assert metrics.best_trade == "AAPL +12.00% (30 days)"
+        assert [(m.month, m.trades_closed) for m in data["monthly_performance"]] == [
+            ("January", 5),
+            ("February", 7),
+        ]
+        quality = data["quality_distribution"][0]
+        assert (quality.category, quality.count, quality.win_rate) == (
+            "Excellent",
+            4,
+            100.0,
+        )
+        assert [(t.ticker, t.return_pct, t.duration_days) for t in data["trades"]] == [
+            ("AAPL", 12.0, 30),
+            ("XYZ", -7.0, 12),
+        ]
+        assert data["metadata"]["title"] == "Historical Trading Performance"
+        assert data["metadata"]["date_range"] == "January 1 - June 26, 2025"
+
+    def test_live_signals_parser(self, report_file):
+        from live_signals_dashboard import LiveSignalsDashboard
+
+        dashboard = LiveSignalsDashboard.__new__(LiveSignalsDashboard)
+        data = dashboard.parse_live_signals_report(report_file)
+
+        assert data["metadata"] == {
+            "portfolio": "live_signals",
+            "date": "2025-07-16",
+            "type": "Live Signals",
+        }
+        assert data["portfolio_overview"]["unrealized_pnl"] == 1234.5
+        assert [p["ticker"] for p in data["positions"]] == ["AAPL", "MSFT"]
+        assert data["positions"][1]["current_return"] == -1.1
+
+    def test_trade_history_image_parser(self, report_file):
+        pytest.importorskip("plotly")
+        logging.disable(logging.CRITICAL)
+        try:
+            from generate_trade_history_images import TemplateBasedDashboardGenerator
+
+            generator = TemplateBasedDashboardGenerator.__new__(
+                TemplateBasedDashboardGenerator
+            )
+            generator.date_str = "20250716"
+            data = generator._parse_report(report_file)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        assert data["metrics"] == {
+            "win_rate": 58.3,
+            "wins": 7,
+            "losses": 5,
+            "total_return": 9.4,
+            "trade_count": 12,
+            "profit_factor": 1.85,
+        }
+        assert [(t["symbol"], t["type"]) for t in data["all_trades"]] == [
+            ("AAPL", "table"),
+            ("XYZ", "table"),
+        ]
+        assert data["all_trades"][1]["entry_date"] == "2025-05-03"
+
+    def test_parsers_share_one_tokenization(self, report_file):
+        from live_signals_dashboard import LiveSignalsDashboard
+
+        cache = get_report_cache()
+        cache.clear()
+        dashboard = LiveSignalsDashboard.__new__(LiveSignalsDashboard)
+        dashboard.parse_live_signals_report(report_file)
+        dashboard.parse_live_signals_report(report_file)
+
+        assert cache.get_stats()["misses"] == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_markdown_to_json_converter(self, tmp_path):
+        from utils.markdown_to_json_converter import MarkdownToJsonConverter
+
+        path = tmp_path / "AAPL_20250724.md"
+        path.write_text(
+            "---\ntitle: Apple Inc. (AAPL) Analysis\ndate: 2025-07-24\n---\n"
+            "# Apple\n"
+            "### Recommendation: BUY | Conviction: 0.9/1.0\n"
+            "- **Fair Value Range**: $200 - $260 (Current: $180.50)\n"
+            "## Risk\n"
+            "### Risk Matrix (Probability × Impact Methodology)\n"
+            "| Risk Factor | Probability | Impact (1-5) | Risk Score |\n"
+            "|---|---|---|---|\n"
+            "| Regulation | 0.30 | 4 | 1.20 |\n"
+            "| Supply chain | 0.50 | 3 | 1.50 |\n",
+            encoding="utf-8",
+        )
+
+        data = MarkdownToJsonConverter().convert_file(path)
+
+        assert data["ticker"] == "AAPL"
+        assert data["date"] == "20250724"
+        assert data["current_price"] == 180.5
+        assert data["fair_value"] == {"low": 200.0, "high": 260.0, "mid": 230.0}
+        assert data["recommendation"] == {"action": "BUY", "conviction": 0.9}
+        assert [r["factor"] for r in data["risk_factors"]] == [
+            "Regulation",
+            "Supply chain",
+        ]
+        assert data["top_risk_factor"] == "Supply chain"
+        assert data["template_context"]["template_preference"] == "A_valuation"
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Market Data Snapshot Unit Tests
+
+Covers RealTimeMarketDataService.get_market_snapshot():
+- One concurrent fetch per source for all requested indicators
+- Preferred and fallback sources fetched in parallel
+- Configuration fallbacks and per-source freshness
+- One time-consistent cached snapshot shared with get_current_* methods
+"""
+
+import sys
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from services import real_time_market_data as rt
+from services.fred_economic import calculate_series_statistics
+from services.real_time_market_data import (
+    SNAPSHOT_INDICATORS,
+    RealTimeMarketDataService,
+)
+
+
+def _months(count):
+    today = date.today()
+    dates = []
+    for offset in range(count - 1, -1, -1):
+        year, month = divmod(today.year * 12 + today.month - 1 - offset, 12)
+        dates.append(date(year, month + 1, 1).isoformat())
+    return dates
+
+
+# Monthly histories (oldest first) served by the fake FRED service
+FRED_HISTORY = {
+    "FEDFUNDS": [5.33, 5.33, 4.83],
+    "WALCL": [7_100_000.0, 7_050_000.0],
+    "DCOILWTICO": [70.1, 68.4],
+    "DHHNGSP": [2.5, 3.1],
+    "DEXUSEU": [1.10, 1.12],
+    "DEXJPUS": [150.0, 146.2],
+    "DEXUSUK": [1.30, 1.31],
+    "VIXCLS": [14.0, 21.5],
+    "GDPC1": [22000.0 + 50 * i for i in range(13)],
+    "PCE": [19000.0 + 40 * i for i in range(13)],
+    "GPDI": [4000.0] * 13,
+    "UNRATE": [4.1, 4.2],
+    "PAYEMS": [159_000.0, 159_142.0],
+    "CIVPART": [62.6, 62.7],
+    "UMCSENT": [68.0, 71.5],
+}
+
+
+class FakeConfig:
+    """Configuration manager returning defaults"""
+
+    def get_data_source_reliability(self, source_name):
+        return 0.9
+
+    def get_market_data_fallback(self, data_type, default_value=None):
+        return default_value
+
+
+class FakeFRED:
+    """FRED service answering get_series_batch from FRED_HISTORY"""
+
+    def __init__(self):
+        self.calls = []
+        self.delay = 0.0
+
+    def get_series_batch(self, series_ids, start_date=None):
+        self.calls.append(list(series_ids))
+        time.sleep(self.delay)
+        batch = {}
+        for series_id in series_ids:
+            values = FRED_HISTORY[series_id]
+            dates = _months(len(values))
+            batch[series_id] = {
+                "series_id": series_id,
+                "status": "fetched",
+                "dates": dates,
+                "values": values,
+                "statistics": calculate_series_statistics(dates, values),
+            }
+        return batch
+
+
+@pytest.fixture
+def fred():
+    return FakeFRED()
+
+
+@pytest.fixture
+def service(monkeypatch, fred):
+    monkeypatch.setattr(rt, "create_fred_economic_service", lambda env: fred)
+    monkeypatch.setattr(rt, "create_alpha_vantage_service", lambda env: object())
+    monkeypatch.setattr(rt, "create_eia_energy_service", lambda env: object())
+    return RealTimeMarketDataService(FakeConfig())
+
+
+class TestSnapshot:
+    """Test snapshot gathering and source resolution"""
+
+    def test_all_indicators_from_one_fetch_per_source(self, service, fred):
+        snapshot = service.get_market_snapshot()
+
+        assert set(snapshot.indicators) == set(SNAPSHOT_INDICATORS)
+        assert len(snapshot.data_points) == sum(
+            len(points) for points in SNAPSHOT_INDICATORS.values()
+        )
+        assert len(fred.calls) == 1
+        # Fallback series are fetched alongside the preferred sources
+        assert {"DCOILWTICO", "VIXCLS", "DEXUSEU"} <= set(fred.calls[0])
+        assert snapshot.data_points["fed_funds_rate"].value == 4.83
+        assert snapshot.data_points["wti_crude_price"].source == "eia"
+        assert snapshot.data_points["eur_usd"].source == "alpha_vantage"
+        assert snapshot.real_time_coverage == 1.0
+        assert snapshot.source_freshness["fred"]["status"] == "live"
+        assert snapshot.source_freshness["fred"]["series_status"]["UNRATE"] == (
+            "fetched"
+        )
+
+    def test_values_derived_from_fred_arrays(self, service):
+        points = service.get_market_snapshot().data_points
+
+        assert points["balance_sheet_size"].value == pytest.approx(7050.0)
+        assert points["payroll_change"].value == pytest.approx(142_000.0)
+        assert points["gdp_growth_rate"].value == pytest.approx(600 / 22000 * 100)
+        assert points["investment_growth"].value == 0.0
+        assert points["consumer_confidence"].value == 71.5
+        assert points["unemployment_rate"].timestamp.date().isoformat() == (
+            _months(1)[0]
+        )
+
+    def test_fallback_sources_run_in_parallel(self, service, fred, monkeypatch):
+        def slow_failure():
+            time.sleep(0.3)
+            raise ConnectionError("EIA down")
+
+        monkeypatch.setattr(service, "_fetch_eia_prices", slow_failure)
+        fred.delay = 0.3
+
+        start = time.perf_counter()
+        snapshot = service.get_market_snapshot(["wti_crude_price", "natural_gas_price"])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.55
+        assert snapshot.data_points["wti_crude_price"].source == "fred"
+        assert snapshot.data_points["wti_crude_price"].value == 68.4
+        assert snapshot.source_freshness["eia"]["status"] == "failed"
+        assert "EIA down" in snapshot.source_freshness["eia"]["error"]
+        assert set(snapshot.source_freshness) == {"eia", "fred"}
+
+    def test_unavailable_sources_use_configuration(self, service):
+        service.source_status["alpha_vantage"].is_available = False
+
+        snapshot = service.get_market_snapshot(["vix_level", "vstoxx_level"])
+
+        assert snapshot.data_points["vix_level"].source == "fred"
+        vstoxx = snapshot.data_points["vstoxx_level"]
+        assert (vstoxx.source, vstoxx.value, vstoxx.is_real_time) == (
+            "config_fallback",
+            18.2,
+            False,
+        )
+        assert snapshot.source_freshness["alpha_vantage"]["status"] == "unavailable"
+        assert snapshot.real_time_coverage == 0.5
+
+    def test_unknown_indicator_rejected(self, service):
+        with pytest.raises(ValueError):
+            service.get_market_snapshot(["fed_funds_rate", "gold_price"])
+
+
+class TestSnapshotCache:
+    """Test the shared, time-consistent snapshot cache"""
+
+    def test_subsets_served_from_cached_snapshot(self, service, fred):
+        full = service.get_market_snapshot()
+        subset = service.get_market_snapshot(["vix_level", "gdp_data"])
+
+        assert len(fred.calls) == 1
+        assert subset.as_of == full.as_of
+        assert set(subset.indicators) == {"vix_level", "gdp_data"}
+        assert set(subset.source_freshness) == {"alpha_vantage", "fred"}
+
+    def test_missing_indicator_refetches_whole_snapshot(self, service, fred):
+        first = service.get_market_snapshot(["fed_funds_rate"])
+        second = service.get_market_snapshot(["employment_data"])
+        third = service.get_market_snapshot(["fed_funds_rate"])
+
+        assert len(fred.calls) == 2
+        assert "FEDFUNDS" in fred.calls[1] and "PAYEMS" in fred.calls[1]
+        assert second.as_of > first.as_of
+        assert third.as_of == second.as_of
+
+    def test_force_refresh_and_expiry(self, service, fred):
+        service.get_market_snapshot(["fed_funds_rate"])
+        service.get_market_snapshot(["fed_funds_rate"], force_refresh=True)
+        service._snapshot.as_of -= service.cache_ttl
+        service.get_market_snapshot(["fed_funds_rate"])
+
+        assert len(fred.calls) == 3
+
+    def test_per_indicator_methods_share_snapshot(self, service):
+        snapshot = service.get_market_snapshot()
+
+        assert service.get_current_fed_funds_rate() is (
+            snapshot.indicators["fed_funds_rate"]
+        )
+        assert service.get_current_employment_data() is (
+            snapshot.indicators["employment_data"]
+        )
+        assert service.get_current_consumer_confidence_data("US") is (
+            snapshot.indicators["consumer_confidence_us"]
+        )
+
+    def test_concurrent_callers_share_one_build(self, service, fred):
+        fred.delay = 0.1
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(service.get_market_snapshot())
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(fred.calls) == 1
+        assert len({snapshot.as_of for snapshot in results}) == 1
+
+    def test_refresh_all_market_data_uses_snapshot(self, service):
+        summary = service.refresh_all_market_data()
+
+        assert summary["real_time_coverage"] == 1.0
+        assert summary["data_points"]["eur_usd"].value == 1.0892
+        assert summary["source_freshness"]["eia"]["status"] == "live"
+        assert "snapshot_as_of" in summary
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Portfolio Equity Engine Unit Tests
+
+Covers the vectorized daily portfolio series:
+- Equivalence with the previous per-day equity curve loop
+- Drawdown from running equity peak
+- Open position and exposure counts (entry inclusive, exit exclusive)
+- Benchmark cumulative and excess returns
+- Live signals benchmark comparison wrapper
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts" / "benchmarks"))
+
+from benchmark_portfolio_engine import (
+    generate_synthetic_trades,
+    legacy_equity_curve,
+)
+from trade_history.portfolio_engine import PortfolioEquityEngine
+
+
+def _trades(rows):
+    df = pd.DataFrame(
+        rows,
+        columns=[
+            "Entry_Timestamp",
+            "Exit_Timestamp",
+            "PnL",
+            "Position_Size",
+            "Avg_Entry_Price",
+        ],
+    )
+    df["Entry_Timestamp"] = pd.to_datetime(df["Entry_Timestamp"])
+    df["Exit_Timestamp"] = pd.to_datetime(df["Exit_Timestamp"])
+    return df
+
+
+@pytest.fixture
+def engine():
+    return PortfolioEquityEngine(initial_capital=10000)
+
+
+class TestPortfolioEquityEngine:
+    """Test daily equity, drawdown and exposure series"""
+
+    def test_matches_legacy_loop(self, engine):
+        trades = generate_synthetic_trades(300, years=1, seed=7)
+
+        series = engine.build(trades, "2018-01-01")
+        legacy = legacy_equity_curve(trades)
+
+        assert series.index.equals(legacy.index)
+        np.testing.assert_allclose(
+            series["Portfolio"].to_numpy(), legacy.to_numpy(), atol=1e-9
+        )
+
+    def test_pnl_booked_on_exit_day(self, engine):
+        trades = _trades(
+            [
+                ["2025-04-01 10:00", "2025-04-03 15:30", 100.0, 10, 50.0],
+                ["2025-04-02 10:00", "2025-04-03 09:30", 50.0, 5, 20.0],
+                ["2025-04-02 10:00", "2025-04-05 09:30", -200.0, 5, 20.0],
+            ]
+        )
+
+        series = engine.build(trades, "2025-04-01")
+
+        assert list(series["Realized_PnL"]) == [0.0, 0.0, 150.0, 0.0, -200.0]
+        assert series["Cumulative_PnL"].iloc[-1] == pytest.approx(-50.0)
+        assert series["Portfolio"].iloc[-1] == pytest.approx(-0.5)
+
+    def test_drawdown_from_running_peak(self, engine):
+        trades = _trades(
+            [
+                ["2025-04-01", "2025-04-02", 1000.0, 1, 1.0],
+                ["2025-04-01", "2025-04-03", -1100.0, 1, 1.0],
+            ]
+        )
+
+        series = engine.build(trades, "2025-04-01")
+
+        assert series["Drawdown_Pct"].iloc[1] == 0.0
+        assert series["Drawdown_Pct"].iloc[2] == pytest.approx(-1100 / 11000 * 100)
+
+    def test_open_positions_and_exposure(self, engine):
+        trades = _trades(
+            [
+                ["2025-04-01", "2025-04-03", 10.0, 10, 50.0],
+                ["2025-04-02", "2025-04-04", 10.0, 5, 20.0],
+            ]
+        )
+        open_trade = _trades([["2025-04-03", None, 0.0, 2, 100.0]])
+        trades = pd.concat([trades, open_trade], ignore_index=True)
+
+        series = engine.build(trades, "2025-04-01", end_date="2025-04-05")
+
+        assert list(series["Open_Positions"]) == [1, 2, 2, 1, 1]
+        assert list(series["Exposure"]) == [500.0, 600.0, 300.0, 200.0, 200.0]
+
+    def test_exits_before_start_ignored(self, engine):
+        trades = _trades(
+            [
+                ["2025-03-01", "2025-03-15", 999.0, 1, 1.0],
+                ["2025-04-01", "2025-04-02", 25.0, 1, 1.0],
+            ]
+        )
+
+        series = engine.build(trades, "2025-04-01")
+
+        assert series["Cumulative_PnL"].iloc[-1] == pytest.approx(25.0)
+
+    def test_benchmark_excess_returns(self, engine):
+        trades = _trades([["2025-04-01", "2025-04-03", 100.0, 1, 1.0]])
+        prices = pd.Series(
+            [100.0, 102.0, 104.0],
+            index=pd.to_datetime(["2025-03-31", "2025-04-01", "2025-04-03"]),
+        )
+
+        series = engine.build(trades, "2025-04-01", benchmark_prices={"SPY": prices})
+
+        assert list(series["SPY"]) == pytest.approx([0.0, 0.0, 2 / 102 * 100])
+        assert series["Excess_vs_SPY"].iloc[-1] == pytest.approx(1.0 - 2 / 102 * 100)
+
+
+class TestLiveSignalsWrapper:
+    """Test the live signals benchmark comparison entry point"""
+
+    def test_calculate_portfolio_equity_curve(self):
+        import generate_live_signals_benchmark_comparison as comparison
+
+        trades = _trades(
+            [
+                ["2025-04-01", "2025-04-02", 100.0, 1, 1.0],
+                ["2025-04-02", "2025-04-04", 300.0, 1, 1.0],
+            ]
+        )
+
+        returns = comparison.calculate_portfolio_equity_curve(trades)
+
+        assert returns.index[0] == pd.Timestamp(comparison.START_DATE)
+        assert list(returns) == pytest.approx([0.0, 1.0, 1.0, 4.0])
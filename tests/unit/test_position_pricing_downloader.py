@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Position Pricing Downloader Unit Tests
+
+Covers batch pricing and vectorized PnL for open positions using recorded
+Yahoo Finance responses (tests/fixtures/position_pricing):
+- Single grouped download for all open-position tickers
+- Concurrent per-ticker fallback for tickers missing from the grouped response
+- Reuse of the local data/raw/stocks price store
+- Aligned PnL matrix matching row-by-row PnL expectations
+"""
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from download_position_pricing import PositionPricingDownloader
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "position_pricing"
+END_DATE = date(2025, 6, 13)
+
+
+def _recorded_frame(records, timezone):
+    """Rebuild a yfinance-style OHLCV frame from recorded response rows"""
+    frame = pd.DataFrame(records)
+    frame.index = pd.DatetimeIndex(
+        pd.to_datetime(frame.pop("Date")), name="Date"
+    ).tz_localize(timezone)
+    return frame
+
+
+def _load_fixture(name):
+    with open(FIXTURES_DIR / name, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def grouped_response():
+    """Recorded grouped yf.download response (group_by='ticker')"""
+    fixture = _load_fixture("yf_download_grouped.json")
+    frames = {
+        ticker: _recorded_frame(records, fixture["timezone"])
+        for ticker, records in fixture["responses"].items()
+    }
+    return pd.concat(frames, axis=1)
+
+
+@pytest.fixture
+def mstr_history():
+    """Recorded yf.Ticker('MSTR').history response"""
+    fixture = _load_fixture("yf_ticker_history_MSTR.json")
+    return _recorded_frame(fixture["responses"]["MSTR"], fixture["timezone"])
+
+
+@pytest.fixture
+def positions():
+    return [
+        {
+            "ticker": "AAPL",
+            "entry_date": date(2025, 6, 3),
+            "entry_price": 200.0,
+            "position_size": 2.0,
+            "direction": "Long",
+            "position_uuid": "AAPL_SMA_20_50_2025-06-03",
+        },
+        {
+            "ticker": "NIO",
+            "entry_date": date(2025, 6, 2),
+            "entry_price": 3.5,
+            "position_size": 100.0,
+            "direction": "Short",
+            "position_uuid": "NIO_EMA_5_21_2025-06-02",
+        },
+        {
+            "ticker": "MSTR",
+            "entry_date": date(2025, 6, 9),
+            "entry_price": 380.0,
+            "position_size": 1.0,
+            "direction": "Long",
+            "position_uuid": "MSTR_SMA_10_30_2025-06-09",
+        },
+        {
+            "ticker": "AAPL",
+            "entry_date": date(2025, 6, 10),
+            "entry_price": 202.0,
+            "position_size": 1.0,
+            "direction": "Long",
+            "position_uuid": "AAPL_EMA_8_21_2025-06-10",
+        },
+    ]
+
+
+@pytest.fixture
+def downloader(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return PositionPricingDownloader("test_portfolio", base_data_path=str(tmp_path))
+
+
+def _mock_ticker(history_frame):
+    ticker = MagicMock()
+    ticker.history.return_value = history_frame.copy()
+    return ticker
+
+
+class TestBatchPriceDownload:
+    """Test grouped download, concurrent fallback and local store reuse"""
+
+    def test_grouped_download_with_concurrent_fallback(
+        self, downloader, positions, grouped_response, mstr_history
+    ):
+        with patch(
+            "yfinance.download", return_value=grouped_response
+        ) as download, patch(
+            "yfinance.Ticker", return_value=_mock_ticker(mstr_history)
+        ) as ticker_cls:
+            frames = downloader.fetch_position_prices(positions, end_date=END_DATE)
+
+        # One grouped request for every pending ticker
+        download.assert_called_once()
+        assert sorted(download.call_args.kwargs["tickers"]) == ["AAPL", "MSTR", "NIO"]
+        assert download.call_args.kwargs["group_by"] == "ticker"
+
+        # Only the ticker missing from the grouped response falls back
+        ticker_cls.assert_called_once_with("MSTR")
+
+        assert set(frames) == {"AAPL", "NIO", "MSTR"}
+        # Earliest AAPL entry drives the AAPL range
+        assert frames["AAPL"]["Date"].min() == date(2025, 6, 3)
+        assert frames["NIO"]["Date"].min() == date(2025, 6, 2)
+        assert frames["MSTR"]["Date"].min() == date(2025, 6, 9)
+        assert frames["AAPL"]["Date"].max() == END_DATE
+
+    def test_local_store_serves_covered_ranges(
+        self, downloader, positions, grouped_response, tmp_path
+    ):
+        fixture = _load_fixture("yf_download_grouped.json")
+        store_dir = tmp_path / "raw" / "stocks" / "AAPL"
+        store_dir.mkdir(parents=True)
+        pd.DataFrame(fixture["responses"]["AAPL"]).rename(columns=str.lower).to_csv(
+            store_dir / "daily.csv", index=False
+        )
+
+        with patch(
+            "yfinance.download", return_value=grouped_response[["NIO"]]
+        ) as download:
+            frames = downloader.download_batch_prices(
+                {"AAPL": date(2025, 6, 3), "NIO": date(2025, 6, 2)}, END_DATE
+            )
+
+        assert download.call_args.kwargs["tickers"] == ["NIO"]
+        assert len(frames["AAPL"]) == 9
+        assert frames["AAPL"]["Close"].iloc[0] == pytest.approx(
+            fixture["responses"]["AAPL"][1]["Close"]
+        )
+
+    def test_stale_local_store_requests_only_the_tail(
+        self, downloader, grouped_response, tmp_path
+    ):
+        fixture = _load_fixture("yf_download_grouped.json")
+        store_dir = tmp_path / "raw" / "stocks" / "AAPL"
+        store_dir.mkdir(parents=True)
+        stored = pd.DataFrame(fixture["responses"]["AAPL"][:5])
+        stored.rename(columns=str.lower).to_csv(store_dir / "daily.csv", index=False)
+
+        with patch(
+            "yfinance.download", return_value=grouped_response[["AAPL"]]
+        ) as download:
+            frames = downloader.download_batch_prices(
+                {"AAPL": date(2025, 6, 2)}, END_DATE
+            )
+
+        assert download.call_args.kwargs["start"] == "2025-06-07"
+        assert list(frames["AAPL"]["Date"]) == [
+            date.fromisoformat(r["Date"]) for r in fixture["responses"]["AAPL"]
+        ]
+
+
+class TestVectorizedPnL:
+    """Test aligned PnL matrix against row-by-row expectations"""
+
+    def test_pnl_matches_row_by_row(
+        self, downloader, positions, grouped_response, mstr_history
+    ):
+        with patch("yfinance.download", return_value=grouped_response), patch(
+            "yfinance.Ticker", return_value=_mock_ticker(mstr_history)
+        ):
+            frames = downloader.fetch_position_prices(positions, end_date=END_DATE)
+
+        pnl_df = downloader.calculate_position_pnl_timeseries(positions, frames)
+
+        expected = []
+        for position in positions:
+            direction = 1 if position["direction"] == "Long" else -1
+            frame = frames[position["ticker"]]
+            for _, row in frame[frame["Date"] >= position["entry_date"]].iterrows():
+                expected.append(
+                    (
+                        row["Date"],
+                        position["position_uuid"],
+                        (row["Close"] - position["entry_price"])
+                        * position["position_size"]
+                        * direction,
+                    )
+                )
+
+        actual = list(
+            zip(pnl_df["Date"], pnl_df["Position_UUID"], pnl_df["PnL"].round(8))
+        )
+        assert sorted(actual) == sorted(
+            (d, uuid, round(pnl, 8)) for d, uuid, pnl in expected
+        )
+        assert list(pnl_df.columns) == [
+            "Date",
+            "Ticker",
+            "Price",
+            "PnL",
+            "Position_Size",
+            "Entry_Date",
+            "Entry_Price",
+            "Direction",
+            "Position_UUID",
+        ]
+        assert pnl_df["Date"].is_monotonic_increasing
+
+        # Individual price files are written per ticker
+        pricing_dir = downloader.pricing_output_path
+        assert sorted(p.name for p in pricing_dir.glob("*.csv")) == [
+            "AAPL_daily_prices.csv",
+            "MSTR_daily_prices.csv",
+            "NIO_daily_prices.csv",
+        ]
+
+    def test_positions_without_prices_are_skipped(self, downloader, positions):
+        frames = {
+            "NIO": pd.DataFrame(
+                {
+                    "Date": [date(2025, 6, 2), date(2025, 6, 3)],
+                    "Open": [3.4, 3.5],
+                    "High": [3.6, 3.6],
+                    "Low": [3.3, 3.4],
+                    "Close": [3.5, 3.4],
+                    "Volume": [1000, 1200],
+                }
+            )
+        }
+
+        pnl_df = downloader.calculate_position_pnl_timeseries(positions, frames)
+
+        assert list(pnl_df["Ticker"].unique()) == ["NIO"]
+        assert list(pnl_df["PnL"].round(6)) == [0.0, 10.0]
+
+    def test_no_price_data_returns_empty_frame(self, downloader, positions):
+        assert downloader.calculate_position_pnl_timeseries(positions, {}).empty
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Regime Model Store Unit Tests
+
+Covers fitted-model reuse for regime classification on synthetic features:
+- Models fitted once per region, feature set and training window
+- Incremental refits when observations are appended
+- Full refits for rewritten windows, persistence across store instances
+- MarketRegimeEngine scoring through the store
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from utils import regime_model_store
+from utils.market_regime_framework import MarketRegimeEngine
+from utils.regime_model_store import RegimeModelStore, feature_set_key, window_hash
+
+FEATURES = ["volatility", "correlation", "credit_spread"]
+
+
+def _features(rows: int, seed: int = 0) -> np.ndarray:
+    """Four well separated regimes in (volatility, correlation, spread) space"""
+    rng = np.random.default_rng(seed)
+    centers = np.array([[12, 0.3, 1.0], [20, 0.5, 1.5], [30, 0.7, 2.5], [45, 0.9, 4.0]])
+    labels = np.arange(rows) % len(centers)
+    return centers[labels] + rng.normal(0, [1.0, 0.02, 0.1], size=(rows, 3))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RegimeModelStore(store_dir=tmp_path / "models", n_regimes=4)
+
+
+class TestModelReuse:
+    """Test fitted, cached and incremental models"""
+
+    def test_fit_then_cached(self, store):
+        features = _features(200)
+
+        model, status = store.get_model("us", FEATURES, features)
+        again, second_status = store.get_model("US", FEATURES, features)
+
+        assert (status, second_status) == ("fitted", "cached")
+        assert again is model
+        assert model.region == "US"
+        assert model.n_observations == 200
+        assert model.window_hash == window_hash(features)
+
+    def test_appended_observations_refit_incrementally(self, store):
+        history = _features(240)
+        store.get_model("US", FEATURES, history[:200])
+
+        model, status = store.get_model("US", FEATURES, history)
+
+        assert status == "incremental"
+        assert model.n_observations == 240
+        assert model.incremental_updates == 1
+        np.testing.assert_allclose(model.scaler.mean_, history.mean(axis=0))
+        np.testing.assert_allclose(model.scaler.scale_, history.std(axis=0))
+
+    def test_rewritten_window_is_fully_refitted(self, store):
+        store.get_model("US", FEATURES, _features(200, seed=0))
+
+        _, status = store.get_model("US", FEATURES, _features(220, seed=1))
+
+        assert status == "fitted"
+
+    def test_keys_separate_regions_and_feature_sets(self, store):
+        features = _features(120)
+        store.get_model("US", FEATURES, features)
+
+        assert store.get_model("EUROPE", FEATURES, features)[1] == "fitted"
+        reordered = FEATURES[::-1]
+        assert store.get_model("US", reordered, features[:, ::-1])[1] == "fitted"
+        assert feature_set_key("US", FEATURES) != feature_set_key("US", reordered)
+
+    def test_models_persist_across_instances(self, store, tmp_path):
+        features = _features(160)
+        store.get_model("US", FEATURES, features)
+
+        reloaded = RegimeModelStore(store_dir=tmp_path / "models", n_regimes=4)
+        _, status = reloaded.get_model("US", FEATURES, features)
+
+        assert status == "cached"
+        assert len(list((tmp_path / "models").glob("*.pkl"))) == 1
+        reloaded.clear()
+        assert not list((tmp_path / "models").glob("*.pkl"))
+
+    def test_invalid_features(self, store):
+        with pytest.raises(ValueError):
+            store.get_model("US", FEATURES, np.zeros((10, 2)))
+        with pytest.raises(ValueError):
+            store.get_model("US", FEATURES, np.zeros((2, 3)))
+        bad = _features(20)
+        bad[3, 1] = np.nan
+        with pytest.raises(ValueError):
+            store.get_model("US", FEATURES, bad)
+
+
+class TestScoring:
+    """Test regime scoring with stored models"""
+
+    def test_latest_observation_is_scored(self, store):
+        features = _features(200)
+
+        result = store.score("US", FEATURES, features)
+
+        assert result["model_status"] == "fitted"
+        assert len(result["clusters"]) == 1
+        assert sum(result["mixture_probabilities"][0]) == pytest.approx(1.0, abs=1e-3)
+
+    def test_component_ranks_follow_first_feature(self, store):
+        features = _features(200)
+        calm = np.array([[12, 0.3, 1.0]])
+        stressed = np.array([[45, 0.9, 4.0]])
+
+        calm_rank = store.score("US", FEATURES, features, calm)["component_ranks"]
+        stress_rank = store.score("US", FEATURES, features, stressed)["component_ranks"]
+
+        assert calm_rank == [0]
+        assert stress_rank == [3]
+
+    def test_engine_scores_through_store(self, store):
+        engine = MarketRegimeEngine("us", seed=1, model_store=store)
+        history = _features(200)
+
+        result = engine.analyze_market_regimes_and_volatility_environment(
+            {}, {"regime_features": {"names": FEATURES, "history": history.tolist()}}
+        )
+
+        classification = result["statistical_regime_classification"]
+        assert classification["model_status"] == "fitted"
+        assert engine.score_regime_features(history, FEATURES)["model_status"] == (
+            "cached"
+        )
+
+    def test_engine_without_features(self, store):
+        engine = MarketRegimeEngine("US", model_store=store)
+
+        result = engine.analyze_market_regimes_and_volatility_environment({}, {})
+
+        assert result["statistical_regime_classification"] is None
+
+    def test_engine_builds_features_from_discovery(self, store):
+        engine = MarketRegimeEngine("US", seed=1, model_store=store)
+        months = ["2025-05-01", "2025-06-01", "2025-07-01", "2025-08-01"]
+        discovery = {
+            "cli_comprehensive_analysis": {
+                "central_bank_economic_data": {
+                    "gdp_data": {
+                        "observations": [
+                            {"date": "2025-Q2", "value": 2.8},
+                            {"date": "2025-Q1", "value": 1.6},
+                        ]
+                    },
+                    "employment_data": {
+                        "unemployment_data": {
+                            "observations": [
+                                {"date": month, "value": 3.6 + 0.1 * i}
+                                for i, month in enumerate(months)
+                            ]
+                        }
+                    },
+                    "inflation_data": {
+                        "cpi_data": {
+                            "observations": [
+                                {"date": month[:7], "value": 3.4 - 0.2 * i}
+                                for i, month in enumerate(months)
+                            ]
+                            + [{"date": "n/a", "value": 9.9}]
+                        }
+                    },
+                }
+            }
+        }
+
+        features = engine._build_regime_features(discovery)
+        result = engine.analyze_market_regimes_and_volatility_environment(discovery, {})
+
+        assert features["names"] == [
+            "gdp_growth",
+            "unemployment_rate",
+            "inflation_rate",
+        ]
+        assert features["periods"] == ["2025-05", "2025-06", "2025-07", "2025-08"]
+        assert [row[0] for row in features["history"]] == [2.8] * 4
+        classification = result["statistical_regime_classification"]
+        assert classification["model_status"] == "fitted"
+        assert classification["n_observations"] == 4
+
+        del discovery["cli_comprehensive_analysis"]["central_bank_economic_data"][
+            "gdp_data"
+        ]
+        assert engine._build_regime_features(discovery) is None
+
+    def test_engine_reports_bad_features(self, store):
+        engine = MarketRegimeEngine("US", model_store=store)
+
+        result = engine.analyze_market_regimes_and_volatility_environment(
+            {}, {"regime_features": {"names": FEATURES, "history": [[1, 2]]}}
+        )
+
+        assert "error" in result["statistical_regime_classification"]
+
+    def test_process_wide_store(self, monkeypatch):
+        monkeypatch.setattr(regime_model_store, "_global_store", None)
+
+        assert (
+            regime_model_store.get_regime_model_store()
+            is regime_model_store.get_regime_model_store()
+        )
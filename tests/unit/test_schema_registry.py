@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Schema Registry Unit Tests
+
+Covers compiled JSON schema validation:
+- Schema loading and cross-file $ref resolution
+- Validator compilation once per schema
+- In-memory schema validators cached by content
+- Schema inference and parallel directory validation
+- Callers wired to the shared registry
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from utils.schema_registry import SchemaRegistry, get_schema_registry
+
+ITEM_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$id": "https://example.com/schemas/item.json",
+    "type": "object",
+    "required": ["name"],
+    "properties": {"name": {"type": "string"}},
+}
+
+REPORT_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$id": "https://example.com/schemas/demo_discovery.json",
+    "type": "object",
+    "required": ["items"],
+    "properties": {"items": {"type": "array", "items": {"$ref": "./item_schema.json"}}},
+}
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    schemas = tmp_path / "schemas"
+    schemas.mkdir()
+    (schemas / "item_schema.json").write_text(json.dumps(ITEM_SCHEMA))
+    (schemas / "demo_discovery_schema.json").write_text(json.dumps(REPORT_SCHEMA))
+    return schemas
+
+
+@pytest.fixture
+def registry(schema_dir):
+    return SchemaRegistry([schema_dir])
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    discovery = tmp_path / "outputs" / "demo" / "discovery"
+    discovery.mkdir(parents=True)
+    for i in range(6):
+        items = [{"name": f"item{i}"}] if i % 2 == 0 else [{"name": i}]
+        (discovery / f"report_{i}.json").write_text(json.dumps({"items": items}))
+    (discovery / "broken.json").write_text("{not json")
+    (tmp_path / "outputs" / "unrelated.json").write_text("{}")
+    return tmp_path / "outputs"
+
+
+class TestSchemaRegistry:
+    """Test schema loading, compilation and validation"""
+
+    def test_cross_file_ref_resolved(self, registry):
+        valid, errors = registry.validate(
+            {"items": [{"name": "a"}]}, "demo_discovery_schema"
+        )
+        assert valid and errors == []
+
+        valid, errors = registry.validate({"items": [{}]}, "demo_discovery_schema")
+        assert not valid
+        assert errors == ["items/0: 'name' is a required property"]
+
+    def test_validator_compiled_once(self, registry):
+        with patch.object(
+            registry, "_compile", wraps=registry._compile
+        ) as compile_schema:
+            for _ in range(5):
+                registry.validate({"items": []}, "demo_discovery_schema")
+            registry.validate({"items": []}, "demo_discovery_schema.json")
+
+        assert compile_schema.call_count == 1
+
+    def test_in_memory_schema_cached_by_content(self, registry):
+        first = registry.validator_for_schema(dict(ITEM_SCHEMA))
+        second = registry.validator_for_schema(dict(ITEM_SCHEMA))
+
+        assert first is second
+        assert registry.validate({"name": 1}, ITEM_SCHEMA)[0] is False
+
+    def test_max_errors(self, registry):
+        _, errors = registry.validate(
+            {"items": [{}, {}, {}]}, "demo_discovery_schema", max_errors=2
+        )
+        assert len(errors) == 2
+
+    def test_registering_file_recompiles_validators(self, registry, tmp_path):
+        schema = {"$ref": "outside_schema.json"}
+        stale = registry.validator_for_schema(schema)
+        outside = tmp_path / "elsewhere" / "outside_schema.json"
+        outside.parent.mkdir()
+        outside.write_text(json.dumps({"type": "object", "required": ["id"]}))
+
+        registry.get_validator(outside)
+
+        assert registry.validator_for_schema(schema) is not stale
+        assert registry.validate({}, schema) == (
+            False,
+            ["<root>: 'id' is a required property"],
+        )
+
+    def test_unknown_schema(self, registry):
+        with pytest.raises(KeyError):
+            registry.get_validator("missing_schema")
+
+    def test_infer_schema_name(self, registry, output_dir):
+        report = output_dir / "demo" / "discovery" / "report_0.json"
+
+        assert registry.infer_schema_name(report) == "demo_discovery_schema"
+        assert registry.infer_schema_name(output_dir / "unrelated.json") is None
+
+
+class TestDirectoryValidation:
+    """Test bulk validation of output directories"""
+
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_validate_directory(self, registry, output_dir, use_processes):
+        summary = registry.validate_directory(
+            output_dir, max_workers=2, use_processes=use_processes
+        )
+
+        assert summary["total_files"] == 8
+        assert summary["valid"] == 3
+        assert summary["invalid"] == 4
+        assert summary["skipped"] == 1
+
+        by_name = {Path(r["file"]).name: r for r in summary["results"]}
+        assert by_name["broken.json"]["errors"][0].startswith("JSONDecodeError")
+        assert by_name["report_1.json"]["errors"] == [
+            "items/0/name: 1 is not of type 'string'"
+        ]
+
+    def test_explicit_schema(self, registry, output_dir):
+        summary = registry.validate_directory(
+            output_dir / "demo",
+            schema="demo_discovery_schema",
+            use_processes=False,
+        )
+
+        assert summary["skipped"] == 0
+        assert summary["valid"] == 3
+
+
+class TestRepositorySchemas:
+    """Test the shipped schemas and wired callers"""
+
+    def test_repository_schemas_compile(self):
+        registry = get_schema_registry()
+
+        assert "macro_analysis_discovery_schema" in registry.schema_names
+        assert "dasv_discover_standard_schema" in registry.schema_names
+        for name in registry.schema_names:
+            registry.get_validator(name)
+
+    def test_local_data_references_ref_resolves(self):
+        registry = get_schema_registry()
+        _, errors = registry.validate(
+            {"local_data_references": {}},
+            "fundamental_analysis_discovery_schema",
+            max_errors=100,
+        )
+
+        assert (
+            "local_data_references: 'search_methodology' is a required property"
+            in errors
+        )
+
+    def test_regional_schema_validation(self):
+        from utils.schema_selector import validate_data_against_regional_schema
+
+        valid, errors = validate_data_against_regional_schema({}, "EUROPE")
+
+        assert not valid
+        assert "<root>: 'metadata' is a required property" in errors
+
+    def test_chart_config_validation(self):
+        from utils.json_schema_generator import create_json_schema_generator
+
+        generator = create_json_schema_generator()
+        valid, errors = generator.validate_chart_config({}, "TradeData")
+
+        assert not valid
+        assert errors
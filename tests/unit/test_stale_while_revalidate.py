@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Stale-While-Revalidate Cache Unit Tests
+
+Covers bounded-stale cache reads for market data:
+- Freshness metadata from FileBasedCache and UnifiedCache lookups
+- Stale windows driven by TradingSessionManager
+- Stale responses served immediately with one de-duplicated background refresh
+- Strictly fresh reads on request, including on an open circuit
+"""
+
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import Mock
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from services.base_financial_service import (
+    BaseFinancialService,
+    CacheConfig,
+    FileBasedCache,
+    HistoricalStorageConfig,
+    RateLimitConfig,
+    ServiceConfig,
+    ServiceUnavailableError,
+)
+from utils.historical_data_manager import DataType
+from utils.trading_session_manager import TradingSessionManager
+from utils.unified_cache import UnifiedCache
+
+
+class ConcreteFinancialService(BaseFinancialService):
+    """Concrete implementation of BaseFinancialService for testing purposes"""
+
+    def _validate_response(self, data: Dict[str, Any], endpoint: str) -> Dict[str, Any]:
+        return data
+
+
+def _write_cache_entry(cache: FileBasedCache, key: str, data, age_seconds: float):
+    """Write a cache file as if it had been stored age_seconds ago"""
+    cached_time = datetime.now() - timedelta(seconds=age_seconds)
+    with open(cache._get_cache_path(key), "w") as f:
+        json.dump({"timestamp": cached_time.isoformat(), "data": data}, f)
+
+
+@pytest.fixture
+def cache_config(tmp_path):
+    return CacheConfig(cache_dir=str(tmp_path), ttl_seconds=60, max_stale_seconds=120)
+
+
+@pytest.fixture
+def service(cache_config):
+    config = ServiceConfig(
+        name="swr_test",
+        base_url="https://test-api.example.com",
+        cache=cache_config,
+        rate_limit=RateLimitConfig(enabled=False),
+        historical_storage=HistoricalStorageConfig(enabled=False),
+    )
+    return ConcreteFinancialService(config)
+
+
+def _response(payload):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestFileBasedCacheFreshness:
+    """Test bounded-stale reads from the file-based cache"""
+
+    def test_fresh_entry(self, cache_config):
+        cache = FileBasedCache(cache_config, "swr_test")
+        cache.set("key", {"price": 1.0})
+
+        entry = cache.get_entry("key")
+
+        assert entry["data"] == {"price": 1.0}
+        assert entry["freshness"]["status"] == "fresh"
+        assert entry["freshness"]["ttl_seconds"] == 60
+
+    def test_stale_entry_kept_but_hidden_from_strict_get(self, cache_config):
+        cache = FileBasedCache(cache_config, "swr_test")
+        _write_cache_entry(cache, "key", {"price": 1.0}, age_seconds=90)
+
+        assert cache.get("key") is None
+        assert cache._get_cache_path("key").exists()
+
+        entry = cache.get_entry("key")
+        assert entry["freshness"]["status"] == "stale"
+        assert entry["freshness"]["stale_by_seconds"] == pytest.approx(30, abs=1)
+
+    def test_entry_beyond_stale_window_is_removed(self, cache_config):
+        cache = FileBasedCache(cache_config, "swr_test")
+        _write_cache_entry(cache, "key", {"price": 1.0}, age_seconds=200)
+
+        assert cache.get_entry("key") is None
+        assert not cache._get_cache_path("key").exists()
+
+    def test_stale_window_disabled(self, tmp_path):
+        config = CacheConfig(
+            cache_dir=str(tmp_path), ttl_seconds=60, stale_while_revalidate=False
+        )
+        cache = FileBasedCache(config, "swr_test")
+        _write_cache_entry(cache, "key", {"price": 1.0}, age_seconds=90)
+
+        assert cache.get_entry("key") is None
+
+
+class TestUnifiedCacheFreshness:
+    """Test trading-session driven stale windows in UnifiedCache"""
+
+    def _cache(self, session_manager):
+        cache = UnifiedCache(
+            historical_manager=Mock(),
+            ttl_seconds=60,
+            service_name="swr_test",
+            use_trading_session_ttl=True,
+            max_stale_seconds=30,
+        )
+        cache.trading_session_manager = session_manager
+        return cache
+
+    def _seed(self, cache, age_seconds):
+        cache._add_to_memory_cache(
+            "key",
+            {"price": 1.0},
+            {
+                "symbol": "AAPL",
+                "data_type": DataType.STOCK_FUNDAMENTALS,
+                "endpoint": "quote",
+            },
+            cached_time=datetime.now() - timedelta(seconds=age_seconds),
+        )
+        cache.hdm.retrieve_data.return_value = []
+
+    def test_market_data_uses_session_stale_window(self):
+        session = Mock(spec=TradingSessionManager)
+        session.get_cache_ttl_seconds.return_value = 60
+        session.get_max_stale_seconds.return_value = 120
+        cache = self._cache(session)
+        self._seed(cache, age_seconds=150)
+
+        assert cache.get("key") is None
+        entry = cache.get_entry("key")
+        assert entry["freshness"]["status"] == "stale"
+        assert entry["freshness"]["max_stale_seconds"] == 120
+
+    def test_expired_beyond_session_window(self):
+        session = Mock(spec=TradingSessionManager)
+        session.get_cache_ttl_seconds.return_value = 60
+        session.get_max_stale_seconds.return_value = 10
+        cache = self._cache(session)
+        self._seed(cache, age_seconds=150)
+
+        assert cache.get_entry("key") is None
+        assert "key" not in cache._memory_cache
+
+    def test_session_stale_window_shorter_while_market_open(self):
+        manager = TradingSessionManager()
+        manager.is_market_open = Mock(return_value=True)
+        assert manager.get_max_stale_seconds() == manager.stale_window_open_seconds
+
+        manager.is_market_open = Mock(return_value=False)
+        assert manager.get_max_stale_seconds() == manager.stale_window_closed_seconds
+        assert manager.stale_window_open_seconds < manager.stale_window_closed_seconds
+
+
+class TestStaleWhileRevalidate:
+    """Test stale serving and background revalidation in the request path"""
+
+    def _seed_stale(self, service, endpoint, params, data):
+        cache_key = service._generate_cache_key(endpoint, params)
+        _write_cache_entry(service.cache, cache_key, data, age_seconds=90)
+        return cache_key
+
+    def test_stale_value_returned_immediately_and_refreshed(self, service):
+        params = {"symbol": "AAPL"}
+        cache_key = self._seed_stale(service, "quote", params, {"price": 1.0})
+
+        def slow_get(url, params=None, timeout=None):
+            time.sleep(0.3)
+            return _response({"price": 2.0})
+
+        service.session.get = Mock(side_effect=slow_get)
+
+        start = time.perf_counter()
+        result = service._make_request_with_retry("quote", params)
+
+        assert time.perf_counter() - start < 0.2
+        assert result == {"price": 1.0}
+        assert service.last_response_freshness["status"] == "stale"
+
+        service.wait_for_refreshes(timeout=5)
+        assert service.session.get.call_count == 1
+        assert service.cache.get(cache_key) == {"price": 2.0}
+
+        assert service._make_request_with_retry("quote", params) == {"price": 2.0}
+        assert service.last_response_freshness["status"] == "fresh"
+
+    def test_concurrent_stale_reads_share_one_refresh(self, service):
+        params = {"symbol": "MSFT"}
+        self._seed_stale(service, "quote", params, {"price": 1.0})
+
+        def slow_get(url, params=None, timeout=None):
+            time.sleep(0.3)
+            return _response({"price": 2.0})
+
+        service.session.get = Mock(side_effect=slow_get)
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    service._make_request_with_retry("quote", params)
+                )
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        service.wait_for_refreshes(timeout=5)
+
+        assert results == [{"price": 1.0}] * 8
+        assert service.session.get.call_count == 1
+
+    def test_require_fresh_blocks_on_fetch(self, service):
+        params = {"symbol": "TSLA"}
+        self._seed_stale(service, "quote", params, {"price": 1.0})
+        service.session.get = Mock(return_value=_response({"price": 2.0}))
+
+        result = service._make_request_with_retry("quote", params, require_fresh=True)
+
+        assert result == {"price": 2.0}
+        assert service.last_response_freshness["status"] == "live"
+        assert service._refreshes_in_flight == {}
+
+    def test_open_circuit_never_serves_stale_to_require_fresh(self, service):
+        params = {"symbol": "AMD"}
+        self._seed_stale(service, "quote", params, {"price": 1.0})
+        service.circuit_breaker.allow_request = Mock(return_value=False)
+
+        with pytest.raises(ServiceUnavailableError):
+            service._make_request_with_retry("quote", params, require_fresh=True)
+
+        # Callers accepting bounded staleness still get the stale entry
+        assert service._make_request_with_retry("quote", params) == {"price": 1.0}
+        service.wait_for_refreshes(timeout=5)
+
+    def test_config_without_stale_serving_never_serves_last_good(self, tmp_path):
+        config = ServiceConfig(
+            name="swr_strict",
+            base_url="https://test-api.example.com",
+            cache=CacheConfig(
+                cache_dir=str(tmp_path),
+                ttl_seconds=60,
+                max_stale_seconds=120,
+                stale_while_revalidate=False,
+            ),
+            rate_limit=RateLimitConfig(enabled=False),
+            historical_storage=HistoricalStorageConfig(enabled=False),
+        )
+        service = ConcreteFinancialService(config)
+        params = {"symbol": "NVDA"}
+        cache_key = service._generate_cache_key("quote", params)
+        service._last_good_responses[cache_key] = {"price": 1.0}
+        service.circuit_breaker.allow_request = Mock(return_value=False)
+
+        with pytest.raises(ServiceUnavailableError):
+            service._make_request_with_retry("quote", params)
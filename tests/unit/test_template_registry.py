@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Template Registry Unit Tests
+
+Covers the process-wide Jinja2 template registry:
+- Environment sharing per search path and options
+- Persistent bytecode cache reuse and invalidation on template edits
+- Common filter registration
+- Renderers wired to the shared registry
+"""
+
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from utils.template_registry import (
+    TemplateRegistry,
+    get_template_environment,
+    get_template_registry,
+)
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "hello.j2").write_text("Hello {{ name }}")
+    return templates
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return TemplateRegistry(bytecode_cache_dir=tmp_path / "bytecode")
+
+
+class TestTemplateRegistry:
+    """Test environment sharing and bytecode caching"""
+
+    def test_environment_shared_per_path_and_options(self, registry, template_dir):
+        env = registry.get_environment(template_dir, autoescape=True)
+
+        assert registry.get_environment(str(template_dir), autoescape=True) is env
+        assert registry.get_environment(template_dir, autoescape=False) is not env
+        assert registry.get_stats()["environments_created"] == 2
+        assert registry.get_stats()["environment_hits"] == 1
+
+    def test_bytecode_cache_persisted_and_reused(self, tmp_path, template_dir):
+        cache_dir = tmp_path / "bytecode"
+        first = TemplateRegistry(bytecode_cache_dir=cache_dir)
+        assert first.get_template(template_dir, "hello.j2").render(name="A") == "Hello A"
+        assert len(list(cache_dir.glob("*.jinja.cache"))) == 1
+
+        # A new registry (as in a fresh process) loads bytecode without compiling
+        second = TemplateRegistry(bytecode_cache_dir=cache_dir)
+        env = second.get_environment(template_dir)
+        env.compile = None  # would raise if the template were recompiled
+        assert env.get_template("hello.j2").render(name="B") == "Hello B"
+
+    def test_edited_template_recompiled(self, registry, template_dir):
+        template_file = template_dir / "hello.j2"
+        env = registry.get_environment(template_dir)
+        assert env.get_template("hello.j2").render(name="A") == "Hello A"
+
+        template_file.write_text("Hi {{ name }}")
+        stat = template_file.stat()
+        os.utime(template_file, (stat.st_atime, stat.st_mtime + 5))
+
+        assert env.get_template("hello.j2").render(name="A") == "Hi A"
+
+    def test_common_filters_registered(self, registry, template_dir):
+        env = registry.get_environment(template_dir)
+        template = env.from_string(
+            "{{ ts|strftime('%Y-%m-%d') }} {{ iso|strftime('%H:%M') }} "
+            "{{ 'abc123'|regex_search('[0-9]+') }} {{ 1234.5|currency }} "
+            "{{ 0.052|percentage(1, true) }}"
+        )
+
+        rendered = template.render(
+            ts=datetime(2025, 4, 1, 9, 30), iso="2025-04-01T14:05:00Z"
+        )
+
+        assert rendered == "2025-04-01 14:05 True $1,234.50 5.2%"
+
+    def test_register_filters_updates_existing_environments(
+        self, registry, template_dir
+    ):
+        env = registry.get_environment(template_dir)
+        registry.register_filters({"shout": lambda v: str(v).upper()})
+
+        assert env.from_string("{{ 'x'|shout }}").render() == "X"
+
+    def test_bytecode_cache_disabled(self, tmp_path, template_dir):
+        registry = TemplateRegistry(
+            bytecode_cache_dir=tmp_path / "bytecode", use_bytecode_cache=False
+        )
+        registry.get_template(template_dir, "hello.j2").render(name="A")
+
+        assert not (tmp_path / "bytecode").exists()
+        assert registry.get_stats()["bytecode_cache_dir"] is None
+
+    def test_precompile(self, registry, template_dir):
+        (template_dir / "other.j2").write_text("{{ 1 + 1 }}")
+
+        assert registry.precompile(template_dir) == 2
+
+
+class TestRendererIntegration:
+    """Test renderers share the process-wide environment"""
+
+    def test_global_registry_singleton(self, template_dir):
+        assert get_template_registry() is get_template_registry()
+        assert get_template_environment(template_dir) is get_template_environment(
+            template_dir
+        )
+
+    def test_twitter_renderers_share_environment(self):
+        from twitter_template_renderer import TwitterTemplateRenderer
+
+        first = TwitterTemplateRenderer()
+        second = TwitterTemplateRenderer()
+
+        assert first.jinja_env is second.jinja_env
+        assert "strftime" in first.jinja_env.filters
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Trade History Pipeline Unit Tests
+
+Covers the in-process DASV trade history pipeline including:
+- Typed trade frame loading and record conversion
+- Vectorized validation checks against row-by-row expectations
+- Vectorized active position summaries
+- End-to-end in-memory phase handoff with audit JSON outputs
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from trade_history.trade_frame import (
+    coerce_trade_frame,
+    load_trade_frame,
+    trade_frame_to_records,
+)
+from trade_history_analyze import AtomicAnalysisTool
+from trade_history_discover import TradeHistoryDiscovery
+from trade_history_pipeline import TradeHistoryPipeline
+from trade_history_synthesize import AtomicSynthesisTool
+from trade_history_validate import TradingPerformanceValidator
+
+LIVE_SIGNALS_CSV = (
+    Path(__file__).parent.parent.parent
+    / "frontend"
+    / "public"
+    / "data"
+    / "trade-history"
+    / "live_signals.csv"
+)
+
+
+@pytest.fixture
+def trade_frame():
+    """Typed trade frame from the checked-in live signals trade history"""
+    return load_trade_frame(LIVE_SIGNALS_CSV)
+
+
+class TestTradeFrame:
+    """Test typed trade frame loading"""
+
+    def test_numeric_and_window_columns_are_typed(self, trade_frame):
+        assert trade_frame["PnL"].dtype == np.float64
+        assert trade_frame["Return"].dtype == np.float64
+        assert str(trade_frame["Short_Window"].dtype) == "Int64"
+
+    def test_records_use_native_types_and_none_for_missing(self, trade_frame):
+        records = trade_frame_to_records(trade_frame)
+
+        assert len(records) == len(trade_frame)
+        for record in records:
+            assert isinstance(record["Ticker"], str)
+            assert record["PnL"] is None or isinstance(record["PnL"], float)
+            assert isinstance(record["Short_Window"], int)
+            assert record["Exit_Efficiency"] is None or isinstance(
+                record["Exit_Efficiency"], float
+            )
+
+    def test_unparseable_numeric_values_become_none(self):
+        frame = pd.DataFrame({"PnL": ["1.5", "n/a"], "Ticker": ["A", None]})
+        records = trade_frame_to_records(coerce_trade_frame(frame))
+
+        assert records == [{"PnL": 1.5, "Ticker": "A"}, {"PnL": None, "Ticker": None}]
+
+
+class TestVectorizedValidation:
+    """Test vectorized validator checks against row-by-row expectations"""
+
+    def _validator(self, frame):
+        validator = TradingPerformanceValidator("test_portfolio")
+        validator.csv_data = frame
+        return validator
+
+    def test_return_calculations_match_row_by_row(self, trade_frame):
+        expected_checked = 0
+        expected_inconsistent = 0
+        for _, row in trade_frame.iterrows():
+            if (
+                pd.notna(row["Avg_Entry_Price"])
+                and pd.notna(row["Avg_Exit_Price"])
+                and row["Avg_Entry_Price"] != 0
+            ):
+                expected = (row["Avg_Exit_Price"] - row["Avg_Entry_Price"]) / row[
+                    "Avg_Entry_Price"
+                ]
+                if abs(expected - row["Return"]) > 0.001:
+                    expected_inconsistent += 1
+                expected_checked += 1
+
+        results = self._validator(trade_frame)._validate_return_calculations()[
+            "validation_results"
+        ]
+
+        assert results["total_trades_checked"] == expected_checked
+        assert results["inconsistencies_found"] == expected_inconsistent
+
+    def test_signal_coherence_counts(self):
+        frame = pd.DataFrame(
+            {
+                "PnL": [10.0, 5.0, -3.0, np.nan],
+                "Max_Favourable_Excursion": [0.1, 0.3, 0.2, 0.1],
+                "Max_Adverse_Excursion": [-0.2, 0.1, 0.5, 0.0],
+                "Exit_Efficiency_Fixed": [0.5, 1.5, np.nan, -20.0],
+            }
+        )
+
+        results = self._validator(frame)._validate_signal_effectiveness_coherence()[
+            "validation_results"
+        ]
+
+        # 2 profitable trades + 4 exit efficiency checks
+        assert results["total_checks"] == 6
+        # Row 0 MFE < |MAE|, row 1 and row 3 exit efficiency out of bounds
+        assert results["coherence_issues"] == 3
+
+    def test_signal_coherence_without_optional_columns(self):
+        frame = pd.DataFrame({"PnL": [1.0, -1.0]})
+
+        results = self._validator(frame)._validate_signal_effectiveness_coherence()[
+            "validation_results"
+        ]
+
+        assert results["total_checks"] == 3
+        assert results["coherence_issues"] == 0
+
+
+class TestActivePositionSummary:
+    """Test vectorized active position summaries"""
+
+    def test_summarize_active_positions(self):
+        active = pd.DataFrame(
+            {
+                "Ticker": ["AAPL", "MSFT"],
+                "Strategy_Type": ["SMA", "EMA"],
+                "Entry_Timestamp": ["2025-01-02 00:00:00", "2025-02-03 00:00:00"],
+                "Days_Since_Entry": [12.0, np.nan],
+                "Current_Unrealized_PnL": [0.05, -0.02],
+            }
+        )
+
+        positions = AtomicSynthesisTool("test_portfolio")._summarize_active_positions(
+            active
+        )
+
+        assert positions == [
+            {
+                "ticker": "AAPL",
+                "strategy": "SMA",
+                "entry_date": "2025-01-02 00:00:00",
+                "days_held": 12.0,
+                "unrealized_pnl": 0.05,
+            },
+            {
+                "ticker": "MSFT",
+                "strategy": "EMA",
+                "entry_date": "2025-02-03 00:00:00",
+                "days_held": 0.0,
+                "unrealized_pnl": -0.02,
+            },
+        ]
+
+    def test_summarize_missing_columns_uses_defaults(self):
+        positions = AtomicSynthesisTool("test_portfolio")._summarize_active_positions(
+            pd.DataFrame({"Ticker": ["NVDA"]})
+        )
+
+        assert positions == [
+            {
+                "ticker": "NVDA",
+                "strategy": "N/A",
+                "entry_date": "N/A",
+                "days_held": 0.0,
+                "unrealized_pnl": 0.0,
+            }
+        ]
+
+    def test_summarize_empty_positions(self):
+        assert (
+            AtomicSynthesisTool("test_portfolio")._summarize_active_positions(
+                pd.DataFrame()
+            )
+            == []
+        )
+
+
+class TestTradeHistoryPipeline:
+    """Test in-process DASV execution with in-memory handoff"""
+
+    @pytest.fixture
+    def isolated_dirs(self, tmp_path, monkeypatch):
+        """Redirect every phase output directory into a temporary tree"""
+        monkeypatch.chdir(tmp_path)
+        outputs = tmp_path / "outputs"
+
+        def redirect(cls, phase):
+            original_init = cls.__init__
+
+            def init(self, name):
+                original_init(self, name)
+                self.output_dir = outputs / phase
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                if hasattr(self, "fundamental_dir"):
+                    self.fundamental_dir = outputs / "fundamental_analysis"
+
+            monkeypatch.setattr(cls, "__init__", init)
+
+        redirect(TradeHistoryDiscovery, "discovery")
+        redirect(AtomicAnalysisTool, "analysis")
+        redirect(AtomicSynthesisTool, "synthesis")
+
+        # Keep discovery offline and independent of local analysis outputs
+        monkeypatch.setattr(
+            TradeHistoryDiscovery, "collect_market_context", lambda self: {}
+        )
+        monkeypatch.setattr(
+            TradeHistoryDiscovery,
+            "integrate_fundamental_analysis",
+            lambda self, inventory: {},
+        )
+        monkeypatch.setattr(
+            TradeHistoryDiscovery, "perform_market_research", lambda self: {}
+        )
+        monkeypatch.setattr(
+            TradeHistoryDiscovery,
+            "resolve_portfolio_file",
+            lambda self: LIVE_SIGNALS_CSV,
+        )
+        return outputs
+
+    def test_pipeline_reads_csv_once_and_writes_audit_files(self, isolated_dirs):
+        real_read_csv = pd.read_csv
+        with patch("pandas.read_csv", side_effect=real_read_csv) as read_csv:
+            result = TradeHistoryPipeline("live_signals").execute()
+
+        assert read_csv.call_count == 1
+        assert result["phases_executed"] == [
+            "discover",
+            "analyze",
+            "synthesize",
+            "validate",
+        ]
+        assert set(result["phase_timings"]) == set(result["phases_executed"])
+
+        for phase in ("discover", "analyze", "synthesize"):
+            audit_file = Path(result["phase_files"][phase])
+            assert audit_file.exists()
+            with open(audit_file, "r", encoding="utf-8") as f:
+                assert json.load(f) == json.loads(
+                    json.dumps(result["phase_outputs"][phase])
+                )
+
+        synthesis = result["phase_outputs"]["synthesize"]
+        assert (
+            synthesis["data_sources"]["discovery_file"]
+            == result["phase_files"]["discover"]
+        )
+        assert (
+            synthesis["key_metrics"]["portfolio_overview"]["total_trades"]
+            == result["phase_outputs"]["discover"]["portfolio_summary"]["total_trades"]
+        )
+
+        validation_dir = Path("data/outputs/trade_history/validation")
+        assert list(validation_dir.glob("live_signals_VALIDATION_REPORT_*.json"))
+
+    def test_partial_phase_run_includes_prerequisites(self, isolated_dirs):
+        result = TradeHistoryPipeline("live_signals").execute(["analyze"])
+
+        assert result["phases_executed"] == ["discover", "analyze"]
+        assert "synthesize" not in result["phase_outputs"]
+
+    def test_unknown_phase_rejected(self):
+        with pytest.raises(ValueError):
+            TradeHistoryPipeline("live_signals").execute(["report"])
+
+    def test_discovery_records_explicit_csv_file(self, isolated_dirs, tmp_path):
+        csv_file = tmp_path / "elsewhere" / "custom.csv"
+        csv_file.parent.mkdir()
+        csv_file.write_bytes(LIVE_SIGNALS_CSV.read_bytes())
+
+        with patch.object(
+            TradeHistoryDiscovery,
+            "resolve_portfolio_file",
+            side_effect=FileNotFoundError("not in data/raw"),
+        ):
+            result = TradeHistoryPipeline("custom", csv_file=csv_file).execute(
+                ["discover"]
+            )
+
+        discovery = result["phase_outputs"]["discover"]
+        assert discovery["discovery_metadata"]["data_source"] == str(csv_file)
+        assert discovery["authoritative_trade_data"]["csv_file_path"] == str(csv_file)
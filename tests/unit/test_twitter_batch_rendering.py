@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Twitter Batch Rendering Unit Tests
+
+Covers batch mode for Twitter content generation:
+- Manifest loading (JSON and CSV)
+- Concurrent rendering with shared renderer and per-batch source loading
+- Per-job failures recorded without stopping the batch
+- render_twitter_post.py batch rendering from strategy metadata
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import render_twitter_post
+from twitter_command_processor import TwitterCommandProcessor
+
+
+@pytest.fixture
+def processor(tmp_path):
+    analysis_dir = tmp_path / "data" / "outputs" / "fundamental_analysis"
+    analysis_dir.mkdir(parents=True)
+    (analysis_dir / "AAPL_20250618.md").write_text(
+        "---\nticker: AAPL\nconfidence: 0.9\n---\n# AAPL analysis"
+    )
+    (analysis_dir / "MSFT_20250618.md").write_text("# MSFT analysis")
+    return TwitterCommandProcessor(base_path=tmp_path)
+
+
+class TestBatchManifest:
+    """Test manifest loading"""
+
+    def test_json_manifest(self, processor, tmp_path):
+        manifest = tmp_path / "jobs.json"
+        manifest.write_text(
+            json.dumps({"jobs": [{"ticker": "AAPL", "date": "20250618"}]})
+        )
+
+        assert processor.load_batch_manifest(manifest) == [
+            {"ticker": "AAPL", "date": "20250618"}
+        ]
+
+    def test_csv_manifest(self, processor, tmp_path):
+        manifest = tmp_path / "jobs.csv"
+        manifest.write_text(
+            "ticker,date,template\nAAPL,20250618,C_moat\nMSFT,20250618,\n"
+        )
+
+        assert processor.load_batch_manifest(manifest) == [
+            {"ticker": "AAPL", "date": "20250618", "template": "C_moat"},
+            {"ticker": "MSFT", "date": "20250618"},
+        ]
+
+
+class TestProcessBatch:
+    """Test concurrent batch rendering"""
+
+    def test_batch_renders_and_summarizes(self, processor, tmp_path):
+        jobs = [
+            {"ticker": "aapl", "date": "20250618"},
+            {"ticker": "AAPL", "date": "2025-06-18", "template": "C_moat"},
+            {"ticker": "MSFT", "date": "20250618", "template": "E_financial"},
+            {"ticker": "NOPE", "date": "20250618"},
+            {"ticker": "AAPL", "date": "bad"},
+        ]
+        summary_path = tmp_path / "summary.json"
+
+        summary = processor.process_batch(
+            jobs, max_workers=3, summary_path=summary_path
+        )
+
+        assert summary["total_jobs"] == 5
+        assert summary["succeeded"] == 3
+        assert summary["failed"] == 2
+        assert [job["job_index"] for job in summary["jobs"]] == list(range(5))
+        assert "not found" in summary["jobs"][3]["error"]
+        assert "Invalid date format" in summary["jobs"][4]["error"]
+
+        outputs = tmp_path / "data" / "outputs" / "twitter" / "fundamental_analysis"
+        assert (outputs / "AAPL_20250618.md").exists()
+        assert (outputs / "AAPL_20250618_C_moat.md").exists()
+        assert summary["jobs"][1]["template_path"].endswith("C_moat.j2")
+
+        written = json.loads(summary_path.read_text())
+        assert written["succeeded"] == 3
+
+    def test_source_documents_loaded_once(self, processor, tmp_path):
+        jobs = [
+            {"ticker": "AAPL", "date": "20250618", "template": variant}
+            for variant in ["A_valuation", "B_catalyst", "C_moat", "E_financial"]
+        ]
+
+        with patch.object(
+            processor,
+            "_load_fundamental_analysis_data",
+            wraps=processor._load_fundamental_analysis_data,
+        ) as loader:
+            summary = processor.process_batch(
+                jobs, max_workers=4, summary_path=tmp_path / "summary.json"
+            )
+
+        assert summary["succeeded"] == 4
+        assert summary["source_documents_loaded"] == 1
+        assert loader.call_count == 1
+
+    def test_unknown_content_type(self, processor, tmp_path):
+        summary = processor.process_batch(
+            [{"ticker": "AAPL", "date": "20250618", "content_type": "blog"}],
+            summary_path=tmp_path / "summary.json",
+        )
+
+        assert summary["failed"] == 1
+        assert "Unknown content type" in summary["jobs"][0]["error"]
+
+
+class TestRenderTwitterPostBatch:
+    """Test batch rendering of strategy posts from metadata"""
+
+    def _write_metadata(self, metadata_dir, ticker, date):
+        metadata = {
+            "ticker": ticker,
+            "timestamp": "2025-06-18T09:00:00",
+            "date": date,
+            "live_signal": True,
+            "strategy_details": {
+                "type": "SMA",
+                "short_window": 52,
+                "long_window": 54,
+                "period": 10,
+            },
+            "performance_metrics": {
+                key: 1.0
+                for key in [
+                    "net_performance",
+                    "win_rate",
+                    "total_trades",
+                    "avg_win",
+                    "avg_loss",
+                    "reward_risk_ratio",
+                    "max_drawdown",
+                    "buy_hold_drawdown",
+                    "sharpe",
+                    "sortino",
+                    "exposure",
+                    "avg_trade_length",
+                    "expectancy",
+                ]
+            },
+            "seasonality": {
+                "current_month": "June",
+                "current_month_performance": 70,
+                "best_months": "March",
+                "worst_months": "September",
+            },
+            "market_data": {
+                "current_price": 10,
+                "target_price": 12,
+                "pe_ratio": 20,
+                "sector": "Technology",
+            },
+        }
+        (metadata_dir / f"{ticker}_{date}_metadata.json").write_text(
+            json.dumps(metadata)
+        )
+
+    def test_batch_renders_posts(self, tmp_path):
+        self._write_metadata(tmp_path, "AAPL", "20250618")
+        self._write_metadata(tmp_path, "MSFT", "20250618")
+        jobs = [
+            {"ticker": "AAPL", "date": "20250618"},
+            {"ticker": "msft", "date": "20250618"},
+            {"ticker": "NVDA", "date": "20250618"},
+        ]
+
+        summary = render_twitter_post.render_twitter_posts_batch(
+            jobs, max_workers=2, metadata_dir=tmp_path
+        )
+
+        assert summary["succeeded"] == 2
+        assert summary["jobs"][2]["error"].startswith("FileNotFoundError")
+        rendered = (tmp_path / "rendered" / "MSFT_20250618.md").read_text()
+        assert rendered.startswith("📈 $MSFT dual SMA (52/54)")
+        assert (tmp_path / "rendered" / "batch_summary.json").exists()
+
+    def test_inline_template_compiled_once(self, tmp_path):
+        self._write_metadata(tmp_path, "AAPL", "20250618")
+
+        first = render_twitter_post._get_template()
+        render_twitter_post.render_twitter_post(
+            "AAPL", "20250618", metadata_dir=tmp_path
+        )
+
+        assert render_twitter_post._get_template() is first
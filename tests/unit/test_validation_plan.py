@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Validation Plan Unit Tests
+
+Covers the compiled rule engine in UnifiedValidationFramework:
+- Plans compiled once per content type and invalidated on criteria changes
+- Plan results identical to per-rule dispatch
+- Shared per-document context for derived values
+- Batch validation across many documents
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from unified_validation_framework import (
+    UnifiedValidationFramework,
+    ValidationContext,
+    ValidationPlan,
+)
+
+GOOD_POST = (
+    "🚨 $AAPL trades 23% below fair value after the DCF refresh this quarter\n\n"
+    "Risk: volatile margins\n\n"
+    "📋 Full analysis: https://www.colemorton.com/blog/aapl-analysis/\n\n"
+    "#AAPL #Investing\n\n⚠️ Not financial advice."
+)
+BAD_POST = "**Guaranteed returns** with no risk, you should buy now"
+
+
+def _strip_timestamps(result):
+    result = dict(result)
+    result.pop("metadata")
+    result.pop("methodology_notes")
+    return result
+
+
+@pytest.fixture
+def framework():
+    return UnifiedValidationFramework()
+
+
+class TestPlanCompilation:
+    """Test plan compilation and caching"""
+
+    def test_plan_is_compiled_once_per_content_type(self, framework):
+        plan = framework.compile_plan("fundamental")
+
+        assert isinstance(plan, ValidationPlan)
+        assert framework.compile_plan("fundamental") is plan
+        assert framework.compile_plan("strategy") is not plan
+        assert plan.categories == tuple(framework.common_criteria)
+        assert len(plan.steps) == sum(
+            len(criteria) for criteria in framework.common_criteria.values()
+        )
+
+    def test_clear_plans_picks_up_new_criteria(self, framework):
+        framework.validate_content(GOOD_POST, "fundamental", {})
+        framework.common_criteria["content_structure"]["always_fails"] = lambda *args: {
+            "score": 0.0,
+            "issues": ["Custom rule failed"],
+        }
+        framework.clear_plans()
+
+        result = framework.validate_content(GOOD_POST, "fundamental", {})
+
+        breakdown = result["validation_breakdown"]["content_structure"]
+        assert breakdown["always_fails"]["issues"] == ["Custom rule failed"]
+
+    def test_realtime_override_is_used(self):
+        class OfflineFramework(UnifiedValidationFramework):
+            def _validate_realtime_context(self, content, content_type, metadata):
+                return {"realtime_context": {"offline": {"score": 0.0, "issues": []}}}
+
+        result = OfflineFramework().validate_content(GOOD_POST, "sector", {})
+
+        assert result["validation_breakdown"]["realtime_context"] == {
+            "offline": {"score": 0.0, "issues": []}
+        }
+
+
+class TestPlanExecution:
+    """Test compiled plan results"""
+
+    @pytest.mark.parametrize(
+        "content_type", ["fundamental", "strategy", "sector", "trade_history", "x"]
+    )
+    @pytest.mark.parametrize("content", [GOOD_POST, BAD_POST, ""])
+    def test_matches_per_rule_dispatch(self, framework, content, content_type):
+        source_data = {"source_available": False}
+        expected = framework._validate_common_criteria(
+            content, content_type, source_data
+        )
+        expected.update(
+            framework._validate_content_specific(content, content_type, source_data)
+        )
+        expected.update(
+            framework._validate_realtime_context(content, content_type, None)
+        )
+
+        result = framework.validate_content(content, content_type, source_data)
+
+        assert result["validation_breakdown"] == expected
+        assert result["overall_assessment"] == (
+            framework._calculate_overall_assessment(expected)
+        )
+        assert result["actionable_recommendations"] == (
+            framework._generate_recommendations(expected, {})
+        )
+
+    def test_rule_methods_work_without_context(self, framework):
+        disclaimers = framework._validate_disclaimers("Do Your Own Research", "x", {})
+        cta = framework._validate_call_to_action("no link", "x", {})
+        hook = framework._validate_hook_effectiveness("🚀 short", "x", {})
+
+        assert disclaimers["disclaimer_found"] is True
+        assert cta["issues"] == ["No clear call to action found"]
+        assert hook["issues"] == ["Hook too short - may not be engaging"]
+
+    def test_context_computes_derived_values_once(self):
+        context = ValidationContext("🚀 $AAPL\nRisk LOSS", "fundamental")
+
+        assert context.emoji_count == 1
+        assert context.hook == "🚀 $AAPL"
+        assert context.count_keywords(("risk", "loss", "gain")) == 2
+        assert context.lines is context.lines
+        assert context.content_lower is context.content_lower
+
+
+class TestValidateMany:
+    """Test batch validation"""
+
+    def test_results_in_document_order(self, framework):
+        documents = [
+            {"content": GOOD_POST, "content_type": "fundamental"},
+            {"content": BAD_POST},
+            {"content": GOOD_POST, "source_data": {"source_available": False}},
+        ]
+
+        results = framework.validate_many(documents, content_type="strategy")
+
+        assert [r["metadata"]["content_type"] for r in results] == [
+            "fundamental",
+            "strategy",
+            "strategy",
+        ]
+        single = framework.validate_content(
+            GOOD_POST, "strategy", {"source_available": False}
+        )
+        assert _strip_timestamps(results[2]) == _strip_timestamps(single)
+        assert set(framework._plans) == {"fundamental", "strategy"}
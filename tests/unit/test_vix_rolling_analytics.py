@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+VIX Rolling Analytics Unit Tests
+
+Covers full-history volatility analytics in VIXVolatilityAnalyzer:
+- Rolling metrics equal to the snapshot regime identification on every
+  trailing window
+- Regime transitions, dates and the column-oriented export
+- Rolling mode in analyze_volatility_environment
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from utils.vix_volatility_analyzer import (
+    RollingVolatilityAnalytics,
+    VIXVolatilityAnalyzer,
+    _rolling_percentile_rank,
+)
+
+FLOAT_FIELDS = (
+    "percentile_rank",
+    "regime_probability",
+    "mean_reversion_speed",
+    "stability_score",
+)
+
+
+def _vix_history(days=600, seed=7):
+    rng = np.random.default_rng(seed)
+    vix = [18.0]
+    for _ in range(days - 1):
+        step = 0.03 * (19.5 - vix[-1]) + rng.normal(0, 1.3)
+        vix.append(max(9.0, vix[-1] + step + rng.binomial(1, 0.01) * 15))
+    return np.array(vix)
+
+
+@pytest.fixture
+def analyzer():
+    return VIXVolatilityAnalyzer()
+
+
+class TestSnapshotEquivalence:
+    """Test rolling metrics against the per-point snapshot"""
+
+    @pytest.mark.parametrize("window", [3, 30, 252, 1000])
+    def test_every_point_matches_snapshot(self, analyzer, window):
+        vix = _vix_history()
+
+        rolling = analyzer.calculate_rolling_analytics(vix, window)
+
+        for t in range(len(vix)):
+            expected = analyzer._identify_volatility_regime(
+                vix[max(0, t - window + 1) : t + 1], vix[t]
+            )
+            actual = rolling.regime_at(t)
+            assert actual.regime_type == expected.regime_type
+            assert actual.regime_duration_days == expected.regime_duration_days
+            for field in FLOAT_FIELDS:
+                assert getattr(actual, field) == pytest.approx(
+                    getattr(expected, field), rel=1e-7, abs=1e-9
+                ), (t, field)
+
+    def test_percentile_rank_with_ties(self):
+        from scipy import stats
+
+        values = np.array([20.0, 20.0, 15.0, 20.0, 25.0, 15.0])
+
+        ranks = _rolling_percentile_rank(values, 4)
+
+        for t in range(len(values)):
+            window = values[max(0, t - 3) : t + 1]
+            assert ranks[t] == pytest.approx(stats.percentileofscore(window, values[t]))
+
+    def test_half_life_from_speed(self, analyzer):
+        rolling = analyzer.calculate_rolling_analytics(_vix_history(100), 50)
+
+        np.testing.assert_allclose(
+            rolling.half_life_days, np.log(2) / rolling.mean_reversion_speed
+        )
+        assert (rolling.mean_reversion_speed[:9] == 0.015).all()
+
+    def test_invalid_arguments(self, analyzer):
+        with pytest.raises(ValueError):
+            analyzer.calculate_rolling_analytics(_vix_history(20), 0)
+        with pytest.raises(ValueError):
+            analyzer.calculate_rolling_analytics(_vix_history(20), 5, ["2025-01-01"])
+
+
+class TestHistoryOutput:
+    """Test transitions, dates and exports"""
+
+    def test_regime_transitions(self, analyzer):
+        vix = np.array([11.0, 11.5, 14.0, 14.0, 25.0, 13.0])
+
+        transitions = analyzer.calculate_rolling_analytics(vix, 5).regime_transitions()
+
+        assert [(t["from_regime"], t["to_regime"]) for t in transitions] == [
+            ("low", "normal"),
+            ("normal", "elevated"),
+            ("elevated", "normal"),
+        ]
+        assert [t["index"] for t in transitions] == [2, 4, 5]
+
+    def test_rolling_volatility_from_observations(self, analyzer):
+        observations = [
+            {"date": f"2025-01-{day:02d}", "value": str(value)}
+            for day, value in zip(range(1, 31), _vix_history(30))
+        ]
+        observations.insert(3, {"date": "2025-01-03b", "value": "."})
+
+        rolling = analyzer.analyze_rolling_volatility(
+            {"observations": observations}, window=10
+        )
+
+        assert isinstance(rolling, RollingVolatilityAnalytics)
+        assert len(rolling.vix) == 30
+        assert rolling.dates[0] == "2025-01-01" and rolling.dates[-1] == "2025-01-30"
+        assert "2025-01-03b" not in rolling.dates
+
+    def test_dates_dropped_when_incomplete(self, analyzer):
+        vix_data = {
+            "observations": [{"date": "2025-01-01", "value": 15}, {"value": 16}]
+        }
+
+        assert analyzer.analyze_rolling_volatility(vix_data).dates is None
+
+    def test_environment_rolling_mode(self, analyzer):
+        vix_data = {"observations": [{"value": value} for value in _vix_history(300)]}
+
+        snapshot = analyzer.analyze_volatility_environment(vix_data)
+        result = analyzer.analyze_volatility_environment(vix_data, rolling_window=60)
+        rolling = result["rolling_analytics"]
+
+        assert "rolling_analytics" not in snapshot
+        assert rolling["observations"] == 300
+        assert len(rolling["series"]["regime_type"]) == 300
+        assert sum(rolling["regime_distribution"].values()) == pytest.approx(1.0)
+        assert rolling["latest"]["vix_level"] == result["current_vix_level"]
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Yahoo Finance Ingestion Worker Unit Tests
+
+Covers the queued historical storage writer of YahooFinanceAPIService:
+- Request latency independent of storage and trigger checks
+- Coalescing of queued work per ticker and endpoint
+- Batched worker passes with flush/drain semantics
+- Synchronous writes when background collection is disabled
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from services import yahoo_finance
+from services.base_financial_service import (
+    CacheConfig,
+    HistoricalStorageConfig,
+    ServiceConfig,
+)
+from services.yahoo_finance import (
+    DEFAULT_INGESTION_BATCH_SIZE,
+    YahooFinanceAPIService,
+)
+from utils.historical_data_manager import Timeframe
+
+
+class FakeYahoo:
+    """Underlying yahoo_finance_service answering instantly"""
+
+    def __init__(self):
+        self.price = 100.0
+
+    def get_stock_info(self, ticker):
+        return {"symbol": ticker, "current_price": self.price}
+
+    def get_historical_data(self, ticker, period, interval="1d"):
+        return {
+            "symbol": ticker,
+            "interval": interval,
+            "data": [{"Date": "2026-01-02", "Close": self.price, "Volume": 10}],
+        }
+
+
+class RecordingStorage:
+    """Storage and trigger hooks recording calls, optionally slow or gated"""
+
+    def __init__(self):
+        self.stored = []
+        self.triggered = []
+        self.delay = 0.0
+        self.gate = threading.Event()
+        self.gate.set()
+        self.writing = threading.Event()
+        self._lock = threading.Lock()
+
+    def store(self, data, endpoint, params, timeframe=Timeframe.DAILY):
+        self.writing.set()
+        self.gate.wait(5)
+        time.sleep(self.delay)
+        with self._lock:
+            self.stored.append((endpoint, data, timeframe))
+        return True
+
+    def trigger(self, data, endpoint, params):
+        time.sleep(self.delay)
+        with self._lock:
+            self.triggered.append(endpoint)
+
+
+@pytest.fixture
+def storage():
+    return RecordingStorage()
+
+
+def _service(storage, background=True):
+    config = ServiceConfig(
+        name="yahoo_ingestion_test",
+        base_url="https://query1.finance.yahoo.com",
+        cache=CacheConfig(enabled=False),
+        historical_storage=HistoricalStorageConfig(
+            enabled=False, background_collection=background
+        ),
+    )
+    service = YahooFinanceAPIService(config)
+    service.yf_service = FakeYahoo()
+    service.store_historical_data = storage.store
+    service._trigger_collection_if_needed = storage.trigger
+    return service
+
+
+def _block_worker(service, storage):
+    """Occupy the worker with one gated write"""
+    storage.gate.clear()
+    service.get_stock_info("BLOCK")
+    assert storage.writing.wait(5)
+
+
+class TestRequestPath:
+    """Test that requests do not wait for storage"""
+
+    def test_response_returned_before_storage(self, storage):
+        storage.delay = 0.3
+        service = _service(storage)
+
+        start = time.perf_counter()
+        result = service.get_stock_info("AAPL")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.15
+        assert result["symbol"] == "AAPL"
+        assert service.flush_ingestion(timeout=5)
+        assert [endpoint for endpoint, _, _ in storage.stored] == ["stock_info_AAPL"]
+        assert storage.triggered == ["stock_info_AAPL"]
+
+    def test_weekly_data_stored_without_trigger(self, storage):
+        service = _service(storage)
+
+        service.get_historical_data_weekly("MSFT", "5y")
+        service.flush_ingestion(timeout=5)
+
+        assert storage.stored[0][0] == "historical_weekly_MSFT_5y"
+        assert storage.stored[0][2] == Timeframe.WEEKLY
+        assert storage.triggered == []
+
+    def test_storage_failures_counted(self, storage):
+        service = _service(storage)
+
+        def failing_store(*args, **kwargs):
+            raise OSError("disk full")
+
+        service.store_historical_data = failing_store
+        result = service.get_historical_data("AAPL", "1y")
+        service.flush_ingestion(timeout=5)
+
+        assert result["data"][0]["Close"] == 100.0
+        assert service.ingestion.stats["failed"] == 1
+        assert storage.triggered == ["historical_AAPL_1y"]
+
+    def test_synchronous_when_background_collection_disabled(self, storage):
+        service = _service(storage, background=False)
+
+        service.get_stock_info("AAPL")
+
+        assert len(storage.stored) == 1
+        assert service.ingestion.pending == 0
+
+
+class TestQueue:
+    """Test coalescing, batching and flush/drain"""
+
+    def test_duplicate_work_coalesced_per_ticker(self, storage):
+        service = _service(storage)
+        _block_worker(service, storage)
+
+        for price in (101.0, 102.0, 103.0):
+            service.yf_service.price = price
+            service.get_stock_info("AAPL")
+        service.get_historical_data("AAPL", "1y")
+        service.get_stock_info("MSFT")
+        storage.gate.set()
+        service.flush_ingestion(timeout=5)
+
+        endpoints = [endpoint for endpoint, _, _ in storage.stored]
+        assert sorted(endpoints) == sorted(
+            [
+                "stock_info_BLOCK",
+                "stock_info_AAPL",
+                "historical_AAPL_1y",
+                "stock_info_MSFT",
+            ]
+        )
+        aapl = next(data for e, data, _ in storage.stored if e == "stock_info_AAPL")
+        assert aapl["current_price"] == 103.0
+        assert service.ingestion.stats["coalesced"] == 2
+        assert service.ingestion.stats["written"] == 4
+
+    def test_queued_work_written_in_batches(self, storage):
+        service = _service(storage)
+        _block_worker(service, storage)
+
+        for i in range(DEFAULT_INGESTION_BATCH_SIZE + 8):
+            service.get_stock_info(f"T{i:03d}")
+        assert service.ingestion.pending == DEFAULT_INGESTION_BATCH_SIZE + 8
+        storage.gate.set()
+        service.flush_ingestion(timeout=5)
+
+        assert service.ingestion.stats["batches"] == 3
+        assert len(storage.stored) == DEFAULT_INGESTION_BATCH_SIZE + 9
+
+    def test_flush_times_out_while_blocked(self, storage):
+        service = _service(storage)
+        _block_worker(service, storage)
+
+        assert service.flush_ingestion(timeout=0.1) is False
+        storage.gate.set()
+        assert service.flush_ingestion(timeout=5) is True
+
+    def test_drain_writes_pending_and_stops_worker(self, storage):
+        service = _service(storage)
+        _block_worker(service, storage)
+        service.get_stock_info("AAPL")
+        storage.gate.set()
+
+        assert service.ingestion.drain(timeout=5)
+        assert service.ingestion._thread is None
+        assert len(storage.stored) == 2
+
+        service.get_stock_info("MSFT")
+        service.flush_ingestion(timeout=5)
+        assert len(storage.stored) == 3
+        service.ingestion.drain(timeout=5)
+
+    def test_exit_hook_registered_once_across_restarts(self, storage, monkeypatch):
+        registered = []
+        monkeypatch.setattr(yahoo_finance.atexit, "register", registered.append)
+        service = _service(storage)
+
+        for ticker in ("AAPL", "MSFT", "NVDA"):
+            service.get_stock_info(ticker)
+            assert service.ingestion.drain(timeout=5)
+
+        assert registered == [service.ingestion.drain]